@@ -4,6 +4,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from sqlmodel import SQLModel
 
 from core.db.session import engine, init_db
+from core.services.write_behind import get_write_behind
 from .routers import sessions, game
 from .deps import get_db
 
@@ -52,6 +53,12 @@ async def startup_event():
     init_db()
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Write any game states still waiting in the write-behind queue."""
+    get_write_behind().shutdown()
+
+
 if __name__ == "__main__":
     import uvicorn
 
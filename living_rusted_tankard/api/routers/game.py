@@ -1,15 +1,21 @@
 """API endpoints for the integrated game with all phase systems."""
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, HTTPException, status
 from pydantic import BaseModel
 from typing import Dict, Any, Optional
+import logging
 import uuid
 
-from core.game_state import GameState
+from core.session_pool import get_session_pool
+from core.session_store import get_session_store
+from core.services.write_behind import queue_save
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-# Store game sessions in memory (in production, use database)
-game_sessions: Dict[str, GameState] = {}
+# Sessions live in the bounded store shared with the main API; idle ones
+# spill to disk and come back on their next request
+game_sessions = get_session_store()
 
 
 class CommandRequest(BaseModel):
@@ -26,16 +32,19 @@ class GameResponse(BaseModel):
 
 
 @router.post("/game/new-session", response_model=GameResponse)
-def create_new_game_session():
+def create_new_game_session(background_tasks: BackgroundTasks):
     """Create a new integrated game session with all phase systems."""
     session_id = str(uuid.uuid4())
 
-    # Create new GameState with all integrated systems
-    game_state = GameState()
-    game_sessions[session_id] = game_state
+    # Take a pre-built GameState with all integrated systems
+    game_sessions.expire()
+    game_state = get_session_pool().acquire(session_id)
+    game_sessions.put(session_id, game_state)
 
     # Get initial state
     initial_look = game_state.process_command("look")
+    # Snapshot after the response is sent, off the request path
+    background_tasks.add_task(queue_save, game_state)
 
     return GameResponse(
         success=True,
@@ -53,19 +62,23 @@ def create_new_game_session():
 
 
 @router.post("/game/command", response_model=GameResponse)
-def process_game_command(request: CommandRequest):
+def process_game_command(request: CommandRequest, background_tasks: BackgroundTasks):
     """Process a command in the integrated game."""
-    if not request.session_id or request.session_id not in game_sessions:
+    game_sessions.expire()
+    game_state = game_sessions.get(request.session_id) if request.session_id else None
+    if game_state is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Game session not found. Please create a new session.",
         )
 
-    game_state = game_sessions[request.session_id]
-
     try:
         # Process command through integrated game state
         result = game_state.process_command(request.command)
+        game_sessions.touch(request.session_id, game_state)
+        if result.get("success"):
+            game_state.mark_dirty()
+            background_tasks.add_task(queue_save, game_state)
 
         # Get current game state for response
         current_state = {
@@ -99,12 +112,13 @@ def process_game_command(request: CommandRequest):
 @router.get("/game/sessions/{session_id}/state", response_model=Dict[str, Any])
 def get_game_state(session_id: str):
     """Get the current state of a game session."""
-    if session_id not in game_sessions:
+    game_state = game_sessions.get(session_id)
+    if game_state is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Game session not found"
         )
-
-    game_state = game_sessions[session_id]
+    # Availability without building the subsystems just to report on them
+    subsystems = game_state.get_subsystem_report()
 
     return {
         "session_id": session_id,
@@ -126,36 +140,42 @@ def get_game_state(session_id: str):
             ],
         },
         "systems": {
-            "phase2_available": hasattr(game_state, "atmosphere_manager"),
-            "phase3_available": hasattr(game_state, "npc_psychology"),
-            "phase4_available": hasattr(game_state, "narrative_orchestrator"),
+            "phase2_available": subsystems["atmosphere_manager"] != "unavailable",
+            "phase3_available": subsystems["npc_psychology"] != "unavailable",
+            "phase4_available": (
+                subsystems["narrative_orchestrator"] != "unavailable"
+            ),
         },
+        "parser": game_state.get_parse_stats(),
     }
 
 
 @router.delete("/game/sessions/{session_id}")
 def delete_game_session(session_id: str):
     """Delete a game session."""
-    if session_id not in game_sessions:
+    if not game_sessions.remove(session_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Game session not found"
         )
 
-    del game_sessions[session_id]
     return {"message": f"Session {session_id} deleted successfully"}
 
 
 @router.get("/game/sessions")
 def list_active_sessions():
-    """List all active game sessions."""
-    return {
-        "active_sessions": len(game_sessions),
-        "sessions": [
+    """List all active game sessions (spilled ones without live details)."""
+    sessions = []
+    for session in game_sessions.list_sessions():
+        game_state = session["game_state"]
+        sessions.append(
             {
-                "session_id": session_id,
-                "player_gold": game_state.player.gold,
-                "game_time": game_state.clock.get_current_time().total_hours,
+                "session_id": session["session_id"],
+                "player_gold": game_state.player.gold if game_state else None,
+                "game_time": (
+                    game_state.clock.get_current_time().total_hours
+                    if game_state
+                    else None
+                ),
             }
-            for session_id, game_state in game_sessions.items()
-        ],
-    }
+        )
+    return {"active_sessions": len(game_sessions), "sessions": sessions}
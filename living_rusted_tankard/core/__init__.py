@@ -1,11 +1,19 @@
 """Core game systems for The Living Rusted Tankard - A tavern management text adventure."""
 
-# Only import the modules that don't cause circular imports
-from .clock import GameClock, GameTime
-from .game_state import GameState
-from .player import PlayerState
-from .npc import NPC, NPCManager, NPCType
-from .economy import Economy
+import importlib
+
+# Package-level names are imported on first access (PEP 562), so importing
+# one submodule such as core.clock does not pull in the whole game
+_LAZY_ATTRIBUTES = {
+    "GameClock": ".clock",
+    "GameTime": ".clock",
+    "GameState": ".game_state",
+    "PlayerState": ".player",
+    "NPC": ".npc",
+    "NPCManager": ".npc",
+    "NPCType": ".npc",
+    "Economy": ".economy",
+}
 
 # Define __all__ to control what's imported with `from core import *`
 __all__ = [
@@ -18,3 +26,16 @@ __all__ = [
     "NPCType",
     "Economy",
 ]
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -18,6 +18,8 @@ from typing import Dict, List, Optional, Any
 import time
 import logging
 
+from .. import time_source
+
 from .personality import Personality
 from .needs import PhysiologicalNeeds, Drive, NeedType
 from .emotions import EmotionalState, EmotionType
@@ -60,7 +62,7 @@ class DeepAgent:
     current_activity: Optional[str] = None
 
     # Timing
-    last_update: float = field(default_factory=time.time)
+    last_update: float = field(default_factory=time_source.time)
     game_time: float = 0.0  # Game time in hours
 
     def cognitive_cycle(self, game_state: Dict[str, Any]) -> Optional[Action]:
@@ -75,7 +77,7 @@ class DeepAgent:
         Returns:
             Next action to perform, or None if waiting/thinking
         """
-        current_time = time.time()
+        current_time = time_source.time()
         hours_passed = (current_time - self.last_update) / 3600.0
 
         # 1. UPDATE INTERNAL STATE
@@ -619,7 +621,7 @@ class DeepAgent:
             goals=goals,
             current_location=data.get("current_location", "main_hall"),
             current_activity=data.get("current_activity"),
-            last_update=data.get("last_update", time.time()),
+            last_update=data.get("last_update", time_source.time()),
             game_time=data.get("game_time", 0.0),
         )
 
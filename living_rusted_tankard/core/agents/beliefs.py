@@ -14,7 +14,8 @@ believe to be true, not objective reality.
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any
 from enum import Enum
-import time
+
+from .. import time_source
 
 
 class BeliefType(Enum):
@@ -51,8 +52,8 @@ class Belief:
     contradicting_evidence: List[str] = field(default_factory=list)
 
     # Metadata
-    formed_at: float = field(default_factory=time.time)
-    last_updated: float = field(default_factory=time.time)
+    formed_at: float = field(default_factory=time_source.time)
+    last_updated: float = field(default_factory=time_source.time)
     update_count: int = 0
 
     def update_confidence(self, evidence: str, supports: bool, weight: float = 0.1) -> None:
@@ -75,7 +76,7 @@ class Belief:
             confidence_decrease = weight * self.confidence * 0.5
             self.confidence = max(0.0, self.confidence - confidence_decrease)
 
-        self.last_updated = time.time()
+        self.last_updated = time_source.time()
         self.update_count += 1
 
     def is_strong(self, threshold: float = 0.7) -> bool:
@@ -88,7 +89,7 @@ class Belief:
 
     def get_age_hours(self) -> float:
         """Get age of belief in hours."""
-        return (time.time() - self.formed_at) / 3600.0
+        return (time_source.time() - self.formed_at) / 3600.0
 
     def to_dict(self) -> Dict:
         """Serialize for saving."""
@@ -145,23 +146,23 @@ class TheoryOfMind:
     # Confidence in this model (0.0-1.0)
     model_confidence: float = 0.3  # Start uncertain
 
-    last_updated: float = field(default_factory=time.time)
+    last_updated: float = field(default_factory=time_source.time)
 
     def update_perceived_goal(self, goal: str, confidence: float = 0.6) -> None:
         """Update belief about target's goal."""
         if goal not in self.perceived_goals:
             self.perceived_goals.append(goal)
-        self.last_updated = time.time()
+        self.last_updated = time_source.time()
 
     def update_perceived_trait(self, trait: str, strength: float) -> None:
         """Update belief about target's trait."""
         self.perceived_traits[trait] = strength
-        self.last_updated = time.time()
+        self.last_updated = time_source.time()
 
     def update_perceived_emotion(self, emotion: str, intensity: float) -> None:
         """Update belief about target's current emotion."""
         self.perceived_emotions[emotion] = intensity
-        self.last_updated = time.time()
+        self.last_updated = time_source.time()
 
     def predict_behavior(self, situation: str) -> str:
         """
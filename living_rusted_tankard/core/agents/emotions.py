@@ -16,9 +16,10 @@ Based on:
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 from enum import Enum
-import time
 import math
 
+from .. import time_source
+
 
 class EmotionType(Enum):
     """Primary emotions (Plutchik's model)."""
@@ -56,30 +57,30 @@ class Emotion:
     emotion_type: EmotionType
     intensity: float = 0.0  # 0.0-1.0
     decay_rate: float = 0.1  # How quickly it fades (per hour)
-    last_updated: float = field(default_factory=time.time)
+    last_updated: float = field(default_factory=time_source.time)
 
     # What triggered this emotion
     trigger: Optional[str] = None
-    trigger_time: float = field(default_factory=time.time)
+    trigger_time: float = field(default_factory=time_source.time)
 
     def update(self, hours_passed: float) -> None:
         """Decay emotion over time."""
         decay = self.decay_rate * hours_passed
         self.intensity = max(0.0, self.intensity - decay)
-        self.last_updated = time.time()
+        self.last_updated = time_source.time()
 
     def intensify(self, amount: float, trigger: Optional[str] = None) -> None:
         """Increase emotion intensity."""
         self.intensity = min(1.0, self.intensity + amount)
         if trigger:
             self.trigger = trigger
-            self.trigger_time = time.time()
-        self.last_updated = time.time()
+            self.trigger_time = time_source.time()
+        self.last_updated = time_source.time()
 
     def diminish(self, amount: float) -> None:
         """Decrease emotion intensity."""
         self.intensity = max(0.0, self.intensity - amount)
-        self.last_updated = time.time()
+        self.last_updated = time_source.time()
 
     def is_active(self, threshold: float = 0.1) -> bool:
         """Check if emotion is significantly active."""
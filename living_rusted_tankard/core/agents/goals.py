@@ -16,6 +16,8 @@ from typing import Dict, List, Optional, Any, Callable
 from enum import Enum
 import time
 
+from .. import time_source
+
 
 class GoalStatus(Enum):
     """Status of a goal."""
@@ -76,7 +78,7 @@ class Goal:
     subgoals: List[str] = field(default_factory=list)  # goal_ids
 
     # Metadata
-    created_at: float = field(default_factory=time.time)
+    created_at: float = field(default_factory=time_source.time)
     started_at: Optional[float] = None
     completed_at: Optional[float] = None
 
@@ -87,23 +89,23 @@ class Goal:
         """Mark goal as actively being pursued."""
         if self.status == GoalStatus.PENDING:
             self.status = GoalStatus.ACTIVE
-            self.started_at = time.time()
+            self.started_at = time_source.time()
 
     def achieve(self) -> None:
         """Mark goal as achieved."""
         self.status = GoalStatus.ACHIEVED
-        self.completed_at = time.time()
+        self.completed_at = time_source.time()
         self.progress = 1.0
 
     def fail(self) -> None:
         """Mark goal as failed."""
         self.status = GoalStatus.FAILED
-        self.completed_at = time.time()
+        self.completed_at = time_source.time()
 
     def abandon(self) -> None:
         """Mark goal as abandoned."""
         self.status = GoalStatus.ABANDONED
-        self.completed_at = time.time()
+        self.completed_at = time_source.time()
 
     def block(self) -> None:
         """Mark goal as blocked."""
@@ -238,7 +240,7 @@ class Plan:
     actions: List[Action] = field(default_factory=list)
 
     # Plan metadata
-    created_at: float = field(default_factory=time.time)
+    created_at: float = field(default_factory=time_source.time)
     confidence: float = 0.5  # 0.0-1.0, confidence this plan will work
 
     # Execution state
@@ -18,6 +18,8 @@ from enum import Enum
 import time
 import hashlib
 
+from .. import time_source
+
 
 class MemoryType(Enum):
     """Types of memories."""
@@ -45,7 +47,7 @@ class Memory:
     content: str
 
     # Context
-    timestamp: float = field(default_factory=time.time)
+    timestamp: float = field(default_factory=time_source.time)
     location: Optional[str] = None
     participants: List[str] = field(default_factory=list)  # Other agents involved
 
@@ -56,7 +58,7 @@ class Memory:
     # Significance
     importance: float = 0.5  # 0.0-1.0, how important this memory is
     access_count: int = 0  # How many times recalled
-    last_accessed: float = field(default_factory=time.time)
+    last_accessed: float = field(default_factory=time_source.time)
 
     # Connections to other memories
     related_memories: List[str] = field(default_factory=list)  # IDs of related memories
@@ -64,14 +66,14 @@ class Memory:
     def access(self) -> None:
         """Access this memory (affects recall likelihood)."""
         self.access_count += 1
-        self.last_accessed = time.time()
+        self.last_accessed = time_source.time()
 
         # Accessing a memory slightly increases its importance
         self.importance = min(1.0, self.importance + 0.01)
 
     def get_age_hours(self) -> float:
         """Get age of memory in hours."""
-        return (time.time() - self.timestamp) / 3600.0
+        return (time_source.time() - self.timestamp) / 3600.0
 
     def get_recency_score(self) -> float:
         """
@@ -79,7 +81,7 @@ class Memory:
 
         Recent memories are more accessible.
         """
-        hours_since_access = (time.time() - self.last_accessed) / 3600.0
+        hours_since_access = (time_source.time() - self.last_accessed) / 3600.0
 
         # Exponential decay with half-life of 24 hours
         half_life = 24.0
@@ -202,7 +204,7 @@ class EpisodicMemory:
 
     def recall_recent(self, hours: float = 24.0, limit: int = 10) -> List[Memory]:
         """Recall memories from the last N hours."""
-        cutoff_time = time.time() - (hours * 3600)
+        cutoff_time = time_source.time() - (hours * 3600)
 
         recent = [m for m in self.memories if m.timestamp >= cutoff_time]
 
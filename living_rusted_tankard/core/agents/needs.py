@@ -13,7 +13,8 @@ that pushes the agent toward goal formation.
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 from enum import Enum
-import time
+
+from .. import time_source
 
 
 class NeedType(Enum):
@@ -56,18 +57,18 @@ class Need:
     urgency_threshold: float = 0.3  # Below this, becomes urgent
     critical_threshold: float = 0.1  # Below this, dominates behavior
 
-    last_updated: float = field(default_factory=time.time)
+    last_updated: float = field(default_factory=time_source.time)
 
     def update(self, hours_passed: float) -> None:
         """Update need level based on time passage."""
         decay = self.decay_rate * hours_passed
         self.level = max(0.0, self.level - decay)
-        self.last_updated = time.time()
+        self.last_updated = time_source.time()
 
     def satisfy(self, amount: float) -> None:
         """Satisfy the need by some amount."""
         self.level = min(1.0, self.level + amount)
-        self.last_updated = time.time()
+        self.last_updated = time_source.time()
 
     def is_urgent(self) -> bool:
         """Check if need is urgent."""
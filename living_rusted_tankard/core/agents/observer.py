@@ -16,6 +16,8 @@ import time
 import json
 from pathlib import Path
 
+from .. import time_source
+
 from .agent import DeepAgent
 
 
@@ -84,7 +86,7 @@ class AgentObserver:
         self.snapshot_interval = 10  # Snapshot every 10 decisions
 
         # Session start
-        self.session_start = time.time()
+        self.session_start = time_source.time()
 
     def record_decision(
         self,
@@ -97,7 +99,7 @@ class AgentObserver:
         state = self.agent.get_internal_state_summary()
 
         trace = DecisionTrace(
-            timestamp=time.time(),
+            timestamp=time_source.time(),
             game_time=self.agent.game_time,
             active_needs=state["urgent_needs"],
             emotional_state=state["emotional_state"],
@@ -120,12 +122,12 @@ class AgentObserver:
         """Record the outcome of a decision."""
         if 0 <= trace_index < len(self.decision_traces):
             self.decision_traces[trace_index].outcome = outcome
-            self.decision_traces[trace_index].outcome_timestamp = time.time()
+            self.decision_traces[trace_index].outcome_timestamp = time_source.time()
 
     def take_snapshot(self) -> Dict[str, Any]:
         """Take a complete snapshot of agent state."""
         snapshot = {
-            "timestamp": time.time(),
+            "timestamp": time_source.time(),
             "game_time": self.agent.game_time,
             "state": self.agent.get_internal_state_summary(),
             "full_state": self.agent.to_dict(),
@@ -305,7 +307,7 @@ class AgentObserver:
             "agent_name": self.agent.name,
             "agent_id": self.agent.agent_id,
             "session_start": self.session_start,
-            "session_end": time.time(),
+            "session_end": time_source.time(),
             "total_decisions": len(self.decision_traces),
             "decision_traces": [trace.to_dict() for trace in self.decision_traces],
             "state_snapshots": self.state_snapshots,
@@ -17,7 +17,8 @@ she's driven by genuine desperation and a harsh worldview.
 """
 
 from typing import Dict, Any
-import time
+
+from .. import time_source
 
 from .agent import DeepAgent
 from .personality import Personality, Value
@@ -315,7 +316,7 @@ def create_raven() -> DeepAgent:
         goal_type=GoalType.SURVIVAL,
         priority=1.0,
         success_condition="Have 10 gold by week's end",
-        deadline=time.time() + (7 * 24 * 3600),
+        deadline=time_source.time() + (7 * 24 * 3600),
         motivated_by=["survival"],
     )
 
@@ -14,7 +14,8 @@ This is what a truly alive NPC looks like.
 """
 
 from typing import Dict, Any
-import time
+
+from .. import time_source
 
 from .agent import DeepAgent
 from .personality import Personality, Value, create_personality_archetype
@@ -263,7 +264,7 @@ def create_sarah() -> DeepAgent:
         goal_type=GoalType.SURVIVAL,
         priority=1.0,
         success_condition="Have at least 30 gold",
-        deadline=time.time() + (30 * 24 * 3600),  # 30 days from now
+        deadline=time_source.time() + (30 * 24 * 3600),  # 30 days from now
         motivated_by=["survival", "achievement"],
     )
 
@@ -273,7 +274,7 @@ def create_sarah() -> DeepAgent:
         goal_type=GoalType.ACHIEVEMENT,
         priority=0.9,
         success_condition="Debt reduced to 0",
-        deadline=time.time() + (60 * 24 * 3600),  # 60 days
+        deadline=time_source.time() + (60 * 24 * 3600),  # 60 days
         motivated_by=["survival", "autonomy"],
     )
 
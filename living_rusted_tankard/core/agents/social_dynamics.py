@@ -15,9 +15,10 @@ This is where individual agents become a society.
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any, Tuple
 from enum import Enum
-import time
 import random
 
+from .. import time_source
+
 from .agent import DeepAgent
 from .emotions import EmotionType
 
@@ -78,7 +79,7 @@ class Relationship:
     ) -> None:
         """Record an interaction and update relationship values."""
         self.interactions.append({
-            "timestamp": time.time(),
+            "timestamp": time_source.time(),
             "type": interaction_type,
             "description": description,
             "affinity_change": affinity_change,
@@ -95,7 +96,7 @@ class Relationship:
         familiarity_gain = 0.05 * (1.0 - self.familiarity)  # Diminishing returns
         self.familiarity = min(1.0, self.familiarity + familiarity_gain)
 
-        self.last_interaction_time = time.time()
+        self.last_interaction_time = time_source.time()
 
         # Update relationship type based on values
         self._update_relationship_type()
@@ -286,7 +287,7 @@ class SocialNetwork:
     ) -> None:
         """Add gossip to the network."""
         self.gossip.append({
-            "timestamp": time.time(),
+            "timestamp": time_source.time(),
             "spreader_id": spreader_id,
             "subject_id": subject_id,
             "content": content,
@@ -451,7 +452,7 @@ class ConversationExchange:
     speaker_id: str
     content: str
     emotional_tone: str  # From speaker's dominant emotion
-    timestamp: float = field(default_factory=time.time)
+    timestamp: float = field(default_factory=time_source.time)
 
 
 @dataclass
@@ -469,7 +470,7 @@ class Conversation:
     participants: List[str]  # Agent IDs
     topic: str
     exchanges: List[ConversationExchange] = field(default_factory=list)
-    started_at: float = field(default_factory=time.time)
+    started_at: float = field(default_factory=time_source.time)
     ended_at: Optional[float] = None
     is_active: bool = True
 
@@ -498,11 +499,11 @@ class Conversation:
     def end_conversation(self) -> None:
         """Mark conversation as ended."""
         self.is_active = False
-        self.ended_at = time.time()
+        self.ended_at = time_source.time()
 
     def get_duration(self) -> float:
         """Get conversation duration in seconds."""
-        end = self.ended_at if self.ended_at else time.time()
+        end = self.ended_at if self.ended_at else time_source.time()
         return end - self.started_at
 
     def get_summary(self) -> str:
@@ -4,16 +4,15 @@ Uses Ollama with gemma2:2b to create an autonomous character that players can wa
 """
 
 import asyncio
-import json
 import time
 import random
 from typing import Dict, Any, Optional, AsyncGenerator, List
-import requests
-import aiohttp
 import logging
 from dataclasses import dataclass
 from enum import Enum
 
+from .ollama_transport import get_ollama_transport
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,9 +21,9 @@ def get_available_ollama_models(
 ) -> List[str]:
     """Get list of available models from Ollama."""
     try:
-        response = requests.get(f"{ollama_url}/api/tags", timeout=5)
-        response.raise_for_status()
-        data = response.json()
+        data = get_ollama_transport(ollama_url).get_json(
+            "/api/tags", timeout=5, retries=0
+        )
         return [model["name"] for model in data.get("models", [])]
     except Exception as e:
         logger.warning(f"Failed to get Ollama models: {e}")
@@ -78,7 +77,7 @@ class AIPlayer:
         self.game_state = {}
         self.is_active = False
         self.thinking_delay = 2.0  # Seconds to "think" before acting
-        self._session: Optional[aiohttp.ClientSession] = None
+        self.transport = get_ollama_transport(ollama_url)
 
         # Personality-based behavior patterns with VALID game commands
         self.personality_traits = {
@@ -212,42 +211,28 @@ RECENT ACTIONS:
 
 What do you want to do next?"""
 
-            # Get session with proper resource management
-            session = await self._get_session()
-
-            # Stream the LLM response using aiohttp with proper cleanup
-            async with session.post(
-                f"{self.ollama_url}/api/generate",
-                json={
+            # Stream the LLM response over the shared connection pool
+            generated_text = ""
+            async for chunk in self.transport.astream_json(
+                "/api/generate",
+                {
                     "model": self.model,
                     "prompt": prompt,
                     "stream": True,
                     "options": {"temperature": 0.8, "top_p": 0.9, "max_tokens": 50},
                 },
-            ) as response:
-                if response.status != 200:
-                    yield "look around"
-                    return
-
-                generated_text = ""
-                async for line in response.content:
-                    if line:
-                        try:
-                            line_text = line.decode("utf-8").strip()
-                            if line_text:
-                                chunk = json.loads(line_text)
-                                if "response" in chunk:
-                                    token = chunk["response"]
-                                    generated_text += token
-                                    yield token
-                                if chunk.get("done", False):
-                                    break
-                        except (json.JSONDecodeError, UnicodeDecodeError):
-                            continue
-
-                # Clean up the generated command
-                if not generated_text.strip():
-                    yield "look around"
+                model=self.model,
+            ):
+                if "response" in chunk:
+                    token = chunk["response"]
+                    generated_text += token
+                    yield token
+                if chunk.get("done", False):
+                    break
+
+            # Clean up the generated command
+            if not generated_text.strip():
+                yield "look around"
 
         except Exception as e:
             logger.error(f"Error generating AI action: {e}")
@@ -268,35 +253,28 @@ RECENT ACTIONS:
 
 What do you want to do next?"""
 
-            # Get session with proper resource management
-            session = await self._get_session()
-
-            async with session.post(
-                f"{self.ollama_url}/api/generate",
-                json={
+            result = await self.transport.apost_json(
+                "/api/generate",
+                {
                     "model": self.model,
                     "prompt": prompt,
                     "stream": False,
                     "options": {"temperature": 0.8, "top_p": 0.9, "max_tokens": 50},
                 },
-            ) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    action = result.get("response", "").strip()
+                model=self.model,
+            )
+            action = result.get("response", "").strip()
 
-                    # Clean up the action - remove quotes, extra text
-                    action = action.replace('"', "").replace("'", "").strip()
+            # Clean up the action - remove quotes, extra text
+            action = action.replace('"', "").replace("'", "").strip()
 
-                    # Take only the first line if multiple lines
-                    action = action.split("\n")[0].strip()
+            # Take only the first line if multiple lines
+            action = action.split("\n")[0].strip()
 
-                    if not action:
-                        action = "look around"
+            if not action:
+                action = "look around"
 
-                    return action
-                else:
-                    logger.error(f"LLM request failed: {response.status}")
-                    return "look around"
+            return action
 
         except Exception as e:
             logger.error(f"Error generating AI action: {e}")
@@ -367,19 +345,12 @@ What do you want to do next?"""
 
         return "\n".join(context_parts) if context_parts else "You are in the tavern."
 
-    async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create an HTTP session with proper resource management."""
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=30)
-            )
-        return self._session
-
     async def close(self):
-        """Clean up HTTP session resources."""
-        if self._session and not self._session.closed:
-            await self._session.close()
-            self._session = None
+        """Release resources.
+
+        Connections belong to the shared Ollama transport and are closed with
+        ``shutdown_ollama_transports()``, so there is nothing to release here.
+        """
 
     async def __aenter__(self):
         """Async context manager entry."""
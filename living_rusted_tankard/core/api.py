@@ -5,17 +5,18 @@ This module provides a REST API interface to interact with the game state
 and serves the web interface.
 """
 
-from fastapi import FastAPI, HTTPException, Depends, status, Request
+from fastapi import FastAPI, HTTPException, Depends, status, Request, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, HTMLResponse
+from fastapi.responses import JSONResponse, HTMLResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from starlette.background import BackgroundTask
 from pydantic import BaseModel
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 import uuid
 import os
+import json
 import time
-import requests
 from pathlib import Path
 import logging
 
@@ -23,6 +24,7 @@ from .game_state import GameState
 from .event_formatter import EventFormatter
 from .enhanced_llm_game_master import EnhancedLLMGameMaster as LLMGameMaster
 from .items import ITEM_DEFINITIONS, load_item_definitions
+from .config import CONFIG
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -57,17 +59,37 @@ if not templates_dir.exists():
 
 templates = Jinja2Templates(directory=str(templates_dir))
 
-# In-memory storage for game sessions with timestamps
-sessions: Dict[str, dict] = {}
-SESSION_TIMEOUT = 30 * 60  # 30 minutes in seconds
 
-# Initialize the LLM Game Master and Async Pipeline
-llm_gm = LLMGameMaster()
+# The LLM Game Master and async pipeline are built on first use, not at import
+_llm_gm: Optional[LLMGameMaster] = None
 
-# Initialize async LLM pipeline for non-blocking processing
+
+def get_llm_game_master() -> LLMGameMaster:
+    """Get the LLM Game Master shared by all sessions."""
+    global _llm_gm
+    if _llm_gm is None:
+        _llm_gm = LLMGameMaster()
+    return _llm_gm
+
+
+# Async LLM pipeline for non-blocking processing
 from .async_llm_pipeline import get_pipeline, initialize_pipeline, shutdown_pipeline
+from .session_executor import get_session_executor
+from .session_pool import get_session_pool
+from .session_store import get_session_store
+from .static_data import get_static_data
+from .ollama_transport import get_ollama_transport, shutdown_ollama_transports
+from .db.session import init_db
+from .services.write_behind import get_write_behind, queue_save
+
+# Blocking GameState work runs off the event loop, one call per session at a time
+session_executor = get_session_executor()
 
-async_llm_pipeline = get_pipeline()
+# New sessions take pre-built GameStates instead of building them inline
+session_pool = get_session_pool()
+
+# Game sessions with timestamps; idle ones spill to disk past the memory budget
+sessions = get_session_store()
 
 # Include AI Player routes
 try:
@@ -102,6 +124,15 @@ async def startup_event():
         load_item_definitions()
     logger.info(f"Loaded {len(ITEM_DEFINITIONS)} item definitions")
 
+    # Pre-build worlds for the first players
+    session_pool.start()
+
+    # Tables for the write-behind saves
+    try:
+        init_db()
+    except Exception as e:
+        logger.error(f"Failed to initialize the database: {e}")
+
 
 @app.on_event("shutdown")
 async def shutdown_event():
@@ -113,22 +144,18 @@ async def shutdown_event():
     except Exception as e:
         logger.error(f"Error shutting down async LLM pipeline: {e}")
 
+    session_executor.shutdown(wait=True)
+    session_pool.shutdown()
+    # Write whatever the write-behind queue still holds
+    get_write_behind().shutdown()
+    sessions.close()
+    await shutdown_ollama_transports()
+
 
 # Clean up expired sessions periodically
 def cleanup_sessions():
-    """Remove expired sessions"""
-    current_time = time.time()
-    expired_sessions = []
-
-    for session_id, session_data in sessions.items():
-        if current_time - session_data["last_activity"] > SESSION_TIMEOUT:
-            expired_sessions.append(session_id)
-
-    for session_id in expired_sessions:
-        logger.info(f"Removing expired session: {session_id}")
-        del sessions[session_id]
-
-    return len(expired_sessions)
+    """Remove expired sessions (only timer wheel slots that came due)."""
+    return sessions.expire()
 
 
 # Models
@@ -137,22 +164,32 @@ class CommandRequest(BaseModel):
 
     input: str
     session_id: Optional[str] = None
+    # Last snapshot version the client holds; the reply then carries a patch
+    since_version: Optional[str] = None
 
 
 class CommandResponse(BaseModel):
-    """Response model for the /command endpoint."""
+    """Response model for the /command endpoint.
+
+    ``game_state`` holds the full snapshot, or is None when ``state_patch``
+    carries JSON patch operations against the requested ``since_version``.
+    """
 
     output: str
     session_id: str
-    game_state: Dict[str, Any]
+    game_state: Optional[Dict[str, Any]] = None
+    state_version: Optional[str] = None
+    state_patch: Optional[List[Dict[str, Any]]] = None
     events: List[Dict[str, Any]] = []
 
 
 class StateResponse(BaseModel):
-    """Response model for the /state endpoint."""
+    """Response model for the /state endpoint (see CommandResponse)."""
 
     session_id: str
-    game_state: Dict[str, Any]
+    game_state: Optional[Dict[str, Any]] = None
+    state_version: Optional[str] = None
+    state_patch: Optional[List[Dict[str, Any]]] = None
     events: List[Dict[str, Any]] = []
 
 
@@ -162,12 +199,11 @@ def get_or_create_session(session_id: Optional[str] = None) -> tuple[GameState,
     # Clean up expired sessions
     cleanup_sessions()
 
-    current_time = time.time()
-
-    if session_id and session_id in sessions:
-        # Update last activity time
-        sessions[session_id]["last_activity"] = current_time
-        return sessions[session_id]["game_state"], session_id
+    if session_id:
+        # Counts as activity; a spilled session is restored here
+        game_state = sessions.get(session_id)
+        if game_state is not None:
+            return game_state, session_id
 
     # Create new session
     new_session_id = str(uuid.uuid4())
@@ -176,12 +212,8 @@ def get_or_create_session(session_id: Optional[str] = None) -> tuple[GameState,
 
     if not ITEM_DEFINITIONS:
         load_item_definitions()
-    game_state = GameState()
-    sessions[new_session_id] = {
-        "game_state": game_state,
-        "last_activity": current_time,
-        "created_at": current_time,
-    }
+    game_state = session_pool.acquire(new_session_id)
+    sessions.put(new_session_id, game_state)
     logger.info(f"Created new game session: {new_session_id}")
     return game_state, new_session_id
 
@@ -199,12 +231,206 @@ async def ai_demo(request: Request):
     return templates.TemplateResponse("ai_player_demo.html", {"request": request})
 
 
+async def _generate_narrative(
+    user_input: str, game_state: GameState, session_id: str
+) -> Tuple[str, Optional[str], List[Dict[str, Any]]]:
+    """Get narration and an optional command for the input without blocking the loop.
+
+    The caller holds the session's turn, so the prompt never sees another
+    request's command half applied. A request that times out is withdrawn
+    from the pipeline rather than left reading the state after the turn.
+    """
+    async_llm_pipeline = get_pipeline()
+    try:
+        request_id = await async_llm_pipeline.process_request_async(
+            user_input, game_state, session_id
+        )
+        response = await async_llm_pipeline.get_response(request_id)
+        if response is None:
+            raise RuntimeError("async pipeline returned no response")
+
+        logger.debug(
+            f"Processed via async pipeline: command='{response.command}', actions={len(response.actions or [])}"
+        )
+        return response.content, response.command, response.actions or []
+    except Exception as e:
+        logger.error(f"Error in async pipeline, falling back to direct LLM: {e}")
+        # Fallback to direct LLM processing, still off the event loop
+        return await session_executor.call(
+            get_llm_game_master().process_input,
+            user_input,
+            game_state,
+            session_id,
+        )
+
+
+def _run_mechanics(
+    game_state: GameState,
+    user_input: str,
+    command_to_execute: Optional[str],
+    since_version: Optional[str] = None,
+    use_llm_parser: bool = True,
+) -> Tuple[Optional[Dict[str, Any]], Dict[str, Any], List[Dict[str, Any]]]:
+    """Execute the identified command and capture the resulting state.
+
+    This touches GameState and blocks, so it is always run through the
+    session executor. Returns (command result or None, state fields for
+    the response, events).
+    """
+    result = None
+    if command_to_execute:
+        logger.info(
+            f"LLM identified command: '{command_to_execute}' from input: '{user_input}'"
+        )
+        # Process the identified command through the regular game logic
+        result = game_state.process_command(
+            command_to_execute, use_llm_parser=use_llm_parser
+        )
+        logger.debug(f"Command result: {result}")
+        if result and result.get("success"):
+            game_state.mark_dirty()
+
+    # Get any events that were generated
+    events = []
+    if hasattr(game_state, "event_formatter") and hasattr(
+        game_state.event_formatter, "get_recent_events"
+    ):
+        events = game_state.event_formatter.get_recent_events() or []
+
+    return result, _state_fields(game_state, since_version), events
+
+
+async def _save_session(game_state: GameState, session_id: str) -> None:
+    """Queue a changed session for the database once the response is out.
+
+    It runs as the session's next turn, so the snapshot never sees a
+    command halfway through.
+    """
+    if game_state.needs_save():
+        await session_executor.run(session_id, queue_save, game_state)
+
+
+def _state_fields(
+    game_state: GameState, since_version: Optional[str] = None
+) -> Dict[str, Any]:
+    """Snapshot response fields: full state, or a patch since a version."""
+    state = game_state.get_snapshot_since(since_version)
+    return {
+        "game_state": state.get("snapshot"),
+        "state_version": state["version"],
+        "state_patch": state.get("patch"),
+    }
+
+
+def _merge_narrative(
+    result: Optional[Dict[str, Any]], narrative_response: str, user_input: str
+) -> Dict[str, Any]:
+    """Combine the mechanical command result with the LLM narration."""
+    if result is not None:
+        merged = dict(result)
+        # Use the command result but enhance it with the narrative response
+        if result.get("success", False):
+            # Only replace the message if the command was successful
+            merged["message"] = narrative_response
+        else:
+            # If command failed, append LLM response to explain
+            merged["message"] = f"{result.get('message', '')} {narrative_response}"
+        return merged
+
+    # We have two cases here:
+    # 1. Examining an object with pre-defined facts (the LLM will generate a description)
+    # 2. A completely open-ended input that doesn't map to a specific command
+
+    # For objects with special handling, check if the input is examining something
+    examining_object = None
+    input_lower = user_input.lower()
+    if (
+        input_lower.startswith("look at ")
+        or input_lower.startswith("look ")
+        or input_lower.startswith("examine ")
+    ):
+        parts = (
+            input_lower.replace("look at ", "")
+            .replace("look ", "")
+            .replace("examine ", "")
+            .strip()
+            .split()
+        )
+        if len(parts) > 0:
+            examining_object = parts[0]
+
+    # Log what we're doing
+    if examining_object:
+        logger.info(
+            f"Special handling for examining object: '{examining_object}' from input: '{user_input}'"
+        )
+    else:
+        logger.info(f"Using narrative response for input: '{user_input}'")
+
+    # In either case, use the narrative response directly
+    return {
+        "success": True,
+        "message": narrative_response,
+        "recent_events": [],
+    }
+
+
+def _action_events(action_results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Convert successful narrative action results into events."""
+    events = []
+    for action_result in action_results or []:
+        if action_result.get("success"):
+            events.append(
+                {
+                    "type": "action_result",
+                    "action_type": action_result.get("action_type", "unknown"),
+                    "message": action_result.get("message", "Action completed"),
+                    "data": action_result,
+                }
+            )
+    return events
+
+
+def _initial_events(game_state: GameState) -> List[Dict[str, Any]]:
+    """Welcome events for a freshly created session."""
+    if hasattr(game_state, "events") and game_state.events:
+        # Convert GameEvent objects to dictionaries
+        initial_events = [
+            {"message": event.message, "event_type": event.event_type}
+            for event in game_state.events
+        ]
+        logger.info(f"New session created with {len(initial_events)} initial events")
+        return initial_events
+    return []
+
+
+def _memory_events(session_id: str) -> List[Dict[str, Any]]:
+    """Report memories created during this interaction."""
+    llm_gm = get_llm_game_master()
+    memories_created = 0
+    if hasattr(llm_gm, "session_memories") and session_id in llm_gm.session_memories:
+        # Count memories created in the last few seconds (indicating new memories from this interaction)
+        current_time = time.time()
+        memories_created = sum(
+            1
+            for memory in llm_gm.session_memories[session_id]
+            if current_time - memory.get("timestamp", 0) < 5
+        )
+    if memories_created > 0:
+        return [{"type": "memory", "count": memories_created}]
+    return []
+
+
 # API Endpoints
 @app.post("/command", response_model=CommandResponse)
-async def process_command(command: CommandRequest):
+async def process_command(command: CommandRequest, background_tasks: BackgroundTasks):
     """
     Process a game command and return the result.
 
+    LLM work is awaited through the async pipeline and game mechanics run
+    in the per-session executor, so a slow model call never blocks other
+    requests on the event loop.
+
     Args:
         command: The command request containing input text and optional session ID
 
@@ -221,149 +447,49 @@ async def process_command(command: CommandRequest):
             command.session_id is None or command.session_id not in sessions
         )
 
-        # Get or create game session
-        game_state, session_id = get_or_create_session(command.session_id)
+        # Get or create game session; a pool miss or a spilled session
+        # means real work, so it runs off the event loop
+        game_state, session_id = await session_executor.call(
+            get_or_create_session, command.session_id
+        )
 
         # If it's a new session, we want to include the welcome message in the response
         # even if the command doesn't produce a response
-        initial_events = []
-        if is_new_session:
-            if hasattr(game_state, "events") and game_state.events:
-                # Convert GameEvent objects to dictionaries
-                initial_events = [
-                    {"message": event.message, "event_type": event.event_type}
-                    for event in game_state.events
-                ]
-                logger.info(
-                    f"New session created with {len(initial_events)} initial events"
-                )
+        initial_events = _initial_events(game_state) if is_new_session else []
 
-        # Process the input through the async LLM pipeline (with sync fallback)
-        try:
-            (
-                narrative_response,
-                command_to_execute,
-                action_results,
-            ) = async_llm_pipeline.process_request_sync(
-                command.input, game_state, session_id
-            )
-            logger.debug(
-                f"Processed via async pipeline: command='{command_to_execute}', actions={len(action_results or [])}"
-            )
-        except Exception as e:
-            logger.error(f"Error in async pipeline, falling back to direct LLM: {e}")
-            # Fallback to direct LLM processing
+        # Narration and mechanics both see the session to themselves
+        async with session_executor.turn(session_id):
+            # Process the input through the async LLM pipeline
             (
                 narrative_response,
                 command_to_execute,
                 action_results,
-            ) = llm_gm.process_input(command.input, game_state, session_id)
+            ) = await _generate_narrative(command.input, game_state, session_id)
 
-        # Check if the LLM identified a specific command to execute
-        if command_to_execute:
-            logger.info(
-                f"LLM identified command: '{command_to_execute}' from input: '{command.input}'"
+            # Run the mechanics and build the snapshot
+            mechanics_result, state, events = await session_executor.call(
+                _run_mechanics,
+                game_state,
+                command.input,
+                command_to_execute,
+                None if is_new_session else command.since_version,
+                # Fused turns already parsed the command along with the narration
+                not CONFIG.FUSED_LLM_TURNS,
             )
-            # Process the identified command through the regular game logic
-            result = game_state.process_command(command_to_execute)
-            logger.debug(f"Command result: {result}")
-
-            # Use the command result but enhance it with the narrative response
-            if result.get("success", False):
-                # Only replace the message if the command was successful
-                result["message"] = narrative_response
-            else:
-                # If command failed, append LLM response to explain
-                result["message"] = f"{result.get('message', '')} {narrative_response}"
-        else:
-            # We have two cases here:
-            # 1. Examining an object with pre-defined facts (the LLM will generate a description)
-            # 2. A completely open-ended input that doesn't map to a specific command
-
-            # For objects with special handling, check if the input is examining something
-            examining_object = None
-            input_lower = command.input.lower()
-            if (
-                input_lower.startswith("look at ")
-                or input_lower.startswith("look ")
-                or input_lower.startswith("examine ")
-            ):
-                parts = (
-                    input_lower.replace("look at ", "")
-                    .replace("look ", "")
-                    .replace("examine ", "")
-                    .strip()
-                    .split()
-                )
-                if len(parts) > 0:
-                    examining_object = parts[0]
-
-            # Log what we're doing
-            if examining_object:
-                logger.info(
-                    f"Special handling for examining object: '{examining_object}' from input: '{command.input}'"
-                )
-            else:
-                logger.info(f"Using narrative response for input: '{command.input}'")
-
-            # In either case, use the narrative response directly
-            result = {
-                "success": True,
-                "message": narrative_response,
-                "recent_events": [],
-            }
-
-        # Get any events that were generated
-        events = []
-        if hasattr(game_state, "event_formatter") and hasattr(
-            game_state.event_formatter, "get_recent_events"
-        ):
-            events = game_state.event_formatter.get_recent_events()
+        result = _merge_narrative(mechanics_result, narrative_response, command.input)
 
         # Include initial events for new sessions
-        if is_new_session and initial_events:
-            events = initial_events + (events or [])
-
-        # Add action results as events
-        if action_results:
-            for action_result in action_results:
-                if action_result.get("success"):
-                    events.append(
-                        {
-                            "type": "action_result",
-                            "action_type": action_result.get("action_type", "unknown"),
-                            "message": action_result.get("message", "Action completed"),
-                            "data": action_result,
-                        }
-                    )
+        events = initial_events + events + _action_events(action_results)
 
         # Update session last activity time
-        sessions[session_id]["last_activity"] = time.time()
-
-        # Check if any memories were created during this interaction
-        memories_created = 0
-        if (
-            hasattr(llm_gm, "session_memories")
-            and session_id in llm_gm.session_memories
-        ):
-            # Count memories created in the last few seconds (indicating new memories from this interaction)
-            current_time = time.time()
-            memories_created = sum(
-                1
-                for memory in llm_gm.session_memories[session_id]
-                if current_time - memory.get("timestamp", 0) < 5
-            )
+        sessions.touch(session_id, game_state)
+        background_tasks.add_task(_save_session, game_state, session_id)
 
         return CommandResponse(
             output=result.get("message", ""),
             session_id=session_id,
-            game_state=game_state.get_snapshot(),
-            events=events
-            + (
-                [{"type": "memory", "count": memories_created}]
-                if memories_created > 0
-                else []
-            ),
+            events=events + _memory_events(session_id),
+            **state,
         )
     except Exception as e:
         logger.error(f"Error processing command: {str(e)}", exc_info=True)
@@ -373,27 +499,145 @@ async def process_command(command: CommandRequest):
         )
 
 
+@app.post("/command/stream")
+async def process_command_stream(command: CommandRequest):
+    """
+    Process a game command and stream the outcome as server-sent events.
+
+    Frames: ``session`` right away, ``narrative_token`` for each piece of
+    narration as the model writes it, ``result`` with the mechanical
+    command result and game state as soon as the model has named the
+    command (usually before narration finishes), ``narrative`` with the
+    final merged narration, and ``complete``. If streaming fails the
+    narration is generated in one piece instead.
+    """
+    is_new_session = command.session_id is None or command.session_id not in sessions
+    game_state, session_id = await session_executor.call(
+        get_or_create_session, command.session_id
+    )
+
+    def frame(payload: Dict[str, Any]) -> str:
+        return f"data: {json.dumps(payload, default=str)}\n\n"
+
+    async def run_mechanics(command_to_execute: Optional[str]):
+        mechanics_result, state, events = await session_executor.call(
+            _run_mechanics,
+            game_state,
+            command.input,
+            command_to_execute,
+            None if is_new_session else command.since_version,
+        )
+        result_frame = frame(
+            {
+                "type": "result",
+                "command": command_to_execute,
+                "success": (mechanics_result or {}).get("success", True),
+                "message": (mechanics_result or {}).get("message", ""),
+                "events": events,
+                **state,
+            }
+        )
+        return mechanics_result, result_frame
+
+    async def generate():
+        try:
+            yield frame(
+                {
+                    "type": "session",
+                    "session_id": session_id,
+                    "events": _initial_events(game_state) if is_new_session else [],
+                }
+            )
+
+            # The next request for this session waits until this one is applied
+            async with session_executor.turn(session_id):
+                mechanics_ran = False
+                mechanics_result = None
+                try:
+                    response = None
+                    async for event in get_pipeline().stream_request(
+                        command.input, game_state, session_id
+                    ):
+                        if event["type"] == "token":
+                            yield frame({"type": "narrative_token", "text": event["text"]})
+                        elif event["type"] == "command" and not mechanics_ran:
+                            # Run the game mechanics while the narration continues
+                            mechanics_result, result_frame = await run_mechanics(
+                                event["command"]
+                            )
+                            mechanics_ran = True
+                            yield result_frame
+                        elif event["type"] == "done":
+                            response = event["response"]
+
+                    if response is None:
+                        raise RuntimeError("narration stream ended without a response")
+                    narrative_response = response.content
+                    command_to_execute = response.command
+                    action_results = response.actions or []
+                except Exception as e:
+                    logger.error(f"Error streaming narration, generating in one go: {e}")
+                    (
+                        narrative_response,
+                        command_to_execute,
+                        action_results,
+                    ) = await _generate_narrative(command.input, game_state, session_id)
+
+                if not mechanics_ran:
+                    mechanics_result, result_frame = await run_mechanics(command_to_execute)
+                    yield result_frame
+
+                result = _merge_narrative(
+                    mechanics_result, narrative_response, command.input
+                )
+                yield frame({"type": "narrative", "text": result.get("message", "")})
+
+                sessions.touch(session_id, game_state)
+            yield frame(
+                {
+                    "type": "complete",
+                    "events": _action_events(action_results)
+                    + _memory_events(session_id),
+                }
+            )
+
+        except Exception as e:
+            logger.error(f"Error in command stream: {e}", exc_info=True)
+            yield frame({"type": "error", "message": str(e)})
+
+    return StreamingResponse(
+        generate(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+        },
+        # Snapshot for the database once the stream has finished
+        background=BackgroundTask(_save_session, game_state, session_id),
+    )
+
+
 @app.get("/state/{session_id}", response_model=StateResponse)
-async def get_game_state(session_id: str):
+async def get_game_state(session_id: str, since_version: Optional[str] = None):
     """
     Get the current game state for a session.
 
     Args:
         session_id: The session ID to get state for
+        since_version: Snapshot version the client already has; if it is
+            still known, only a patch against it is returned
 
     Returns:
         StateResponse with the current game state and events
     """
-    if session_id not in sessions:
+    # Counts as activity; a spilled session is restored here, off the loop
+    game_state = await session_executor.call(sessions.get, session_id)
+    if game_state is None:
         logger.warning(f"Session not found: {session_id}")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Session not found"
         )
 
-    # Update session last activity time
-    sessions[session_id]["last_activity"] = time.time()
-    game_state = sessions[session_id]["game_state"]
-
     # Get any events that were generated
     events = []
     if hasattr(game_state, "event_formatter") and hasattr(
@@ -402,28 +646,37 @@ async def get_game_state(session_id: str):
         events = game_state.event_formatter.get_recent_events()
 
     return StateResponse(
-        session_id=session_id, game_state=game_state.get_snapshot(), events=events
+        session_id=session_id,
+        events=events,
+        **_state_fields(game_state, since_version),
     )
 
 
 # Session management endpoints
 @app.get("/sessions")
 async def list_sessions():
-    """List all active game sessions."""
+    """List all active game sessions; spilled ones report no subsystems."""
     session_info = []
-    for session_id, session_data in sessions.items():
+    for session_data in sessions.list_sessions():
+        game_state = session_data["game_state"]
         session_info.append(
             {
-                "session_id": session_id,
+                "session_id": session_data["session_id"],
                 "created_at": session_data["created_at"],
                 "last_activity": session_data["last_activity"],
                 "age_seconds": time.time() - session_data["created_at"],
+                "in_memory": game_state is not None,
+                "subsystems": game_state.get_subsystem_report() if game_state else None,
             }
         )
 
     return {"total_sessions": len(sessions), "sessions": session_info}
 
 
+def _reset_game_state(session_id: str) -> None:
+    sessions.put(session_id, session_pool.acquire(session_id))
+
+
 @app.post("/sessions/{session_id}/reset")
 async def reset_session(session_id: str):
     """Reset a game session to its initial state."""
@@ -432,13 +685,9 @@ async def reset_session(session_id: str):
             status_code=status.HTTP_404_NOT_FOUND, detail="Session not found"
         )
 
-    current_time = time.time()
-    game_state = GameState()
-    sessions[session_id] = {
-        "game_state": game_state,
-        "last_activity": current_time,
-        "created_at": current_time,
-    }
+    # A fresh world is real work and the store may spill, so it runs off
+    # the loop, after any command still running for the session
+    await session_executor.run(session_id, _reset_game_state, session_id)
 
     return {
         "success": True,
@@ -450,13 +699,11 @@ async def reset_session(session_id: str):
 @app.delete("/sessions/{session_id}")
 async def delete_session(session_id: str):
     """Delete a game session."""
-    if session_id not in sessions:
+    if not sessions.remove(session_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Session not found"
         )
 
-    del sessions[session_id]
-
     return {"success": True, "message": "Session deleted successfully"}
 
 
@@ -464,6 +711,7 @@ async def delete_session(session_id: str):
 @app.post("/llm-config")
 async def update_llm_config(request: Request):
     """Update LLM Game Master configuration."""
+    llm_gm = get_llm_game_master()
     data = await request.json()
 
     # Update Ollama URL if provided
@@ -483,16 +731,16 @@ async def update_llm_config(request: Request):
 
     # Test connection to Ollama
     try:
-        test_url = f"{llm_gm.ollama_url}/api/version"
-        logger.info(f"Testing Ollama connection at {test_url}")
-        response = requests.get(test_url, timeout=5)
-        response.raise_for_status()
+        transport = get_ollama_transport(llm_gm.ollama_url)
+        logger.info(f"Testing Ollama connection at {transport.base_url}")
+        await transport.aget_json(
+            "/api/version", timeout=5, retries=0, use_breaker=False
+        )
 
         # Check if the model is available
-        models_url = f"{llm_gm.ollama_url}/api/tags"
-        models_response = requests.get(models_url, timeout=5)
-        models_response.raise_for_status()
-        models_data = models_response.json()
+        models_data = await transport.aget_json(
+            "/api/tags", timeout=5, retries=0, use_breaker=False
+        )
 
         # Get model names from response
         available_models = [
@@ -528,7 +776,7 @@ async def health_check():
     expired_count = cleanup_sessions()
 
     # Get LLM service status
-    llm_status = llm_gm.get_service_status()
+    llm_status = get_llm_game_master().get_service_status()
 
     # Determine overall health
     overall_status = "healthy" if llm_status["is_healthy"] else "degraded"
@@ -537,6 +785,9 @@ async def health_check():
         "status": overall_status,
         "active_sessions": len(sessions),
         "expired_sessions_removed": expired_count,
+        "session_pool": session_pool.get_stats(),
+        "session_store": sessions.get_stats(),
+        "static_data": get_static_data().get_timings(),
         "llm_service": {
             "status": "healthy" if llm_status["is_healthy"] else "unhealthy",
             "model": llm_status["model"],
@@ -552,6 +803,7 @@ async def health_check():
 @app.get("/llm-status")
 async def llm_status():
     """Get detailed LLM service status."""
+    llm_gm = get_llm_game_master()
     status = llm_gm.get_service_status()
 
     # Test connection if requested
@@ -581,6 +833,7 @@ async def llm_status():
 @app.get("/async-llm-status")
 async def async_llm_status():
     """Get async LLM pipeline status and statistics."""
+    async_llm_pipeline = get_pipeline()
     try:
         stats = async_llm_pipeline.get_stats()
         is_healthy = async_llm_pipeline.is_healthy()
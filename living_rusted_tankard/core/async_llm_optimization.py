@@ -9,15 +9,24 @@ This module provides:
 """
 
 import asyncio
-import aiohttp
+import httpx
 import json
 import time
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Iterable
 from dataclasses import dataclass
 import hashlib
 from collections import defaultdict
-import threading
+
+from .cache_keys import (
+    DEFAULT_CONTEXT_FEATURES,
+    FeatureSetStats,
+    feature_set_label,
+    state_fingerprint,
+    validate_features,
+)
+from .ollama_transport import CircuitOpenError, get_ollama_transport
+from .lru_cache import LRUCache, estimate_size
 
 logger = logging.getLogger(__name__)
 
@@ -33,13 +42,33 @@ class CachedContext:
 
 
 class AsyncContextCache:
-    """Asynchronous context cache with TTL and LRU eviction."""
+    """Asynchronous context cache with TTL and LRU eviction.
+
+    The game state part of the key is built from ``features`` (names from
+    ``core.cache_keys.STATE_FEATURES``).
+    """
 
-    def __init__(self, max_size: int = 100, ttl: int = 300):
+    def __init__(
+        self,
+        max_size: int = 100,
+        ttl: int = 300,
+        features: Iterable[str] = DEFAULT_CONTEXT_FEATURES,
+    ):
         self.max_size = max_size
         self.ttl = ttl
-        self.cache: Dict[str, CachedContext] = {}
-        self._lock = threading.RLock()
+        self.cache = LRUCache(
+            max_entries=max_size,
+            ttl_seconds=ttl,
+            size_of=lambda cached: estimate_size(cached.content),
+        )
+        self.feature_stats = FeatureSetStats()
+        self.set_features(features)
+
+    def set_features(self, features: Iterable[str]) -> None:
+        """Change which game state features go into the key (clears the cache)."""
+        self.features = validate_features(features)
+        self.feature_label = feature_set_label(self.features)
+        self.cache.clear()
 
     def _generate_cache_key(self, session_id: str, game_state_hash: str) -> str:
         """Generate cache key from session and game state."""
@@ -47,80 +76,40 @@ class AsyncContextCache:
 
     def _hash_game_state(self, game_state) -> str:
         """Generate hash from game state for caching."""
-        try:
-            # Create a simplified hash based on key game state elements
-            state_elements = [
-                str(getattr(game_state.player, "gold", 0)),
-                str(getattr(game_state.player, "tiredness", 0)),
-                str(getattr(game_state.player, "has_room", False)),
-                str(getattr(game_state.clock, "current_time_hours", 0)),
-                str(len(getattr(game_state, "events", []))),
-            ]
-
-            # Add NPC states
-            if hasattr(game_state, "npc_manager"):
-                try:
-                    present_npcs = game_state.npc_manager.get_present_npcs()
-                    state_elements.extend([npc.id for npc in present_npcs])
-                except (AttributeError, TypeError) as e:
-                    logger.debug(f"Could not get NPC states for hashing: {e}")
-                    pass
-
-            combined = "|".join(state_elements)
-            return hashlib.md5(combined.encode()).hexdigest()[:16]
-        except Exception as e:
-            logger.warning(f"Error hashing game state: {e}")
-            return str(time.time())[:16]
+        combined = state_fingerprint(game_state, self.features)
+        return hashlib.md5(combined.encode()).hexdigest()[:16]
 
     def get(self, session_id: str, game_state) -> Optional[str]:
         """Get cached context if available and valid."""
-        with self._lock:
-            state_hash = self._hash_game_state(game_state)
-            cache_key = self._generate_cache_key(session_id, state_hash)
-
-            if cache_key in self.cache:
-                cached = self.cache[cache_key]
-
-                # Check TTL
-                if time.time() - cached.timestamp <= self.ttl:
-                    cached.access_count += 1
-                    logger.debug(f"Context cache hit for {session_id}")
-                    return cached.content
-                else:
-                    # Expired, remove from cache
-                    del self.cache[cache_key]
-                    logger.debug(f"Context cache expired for {session_id}")
+        state_hash = self._hash_game_state(game_state)
+        cache_key = self._generate_cache_key(session_id, state_hash)
 
+        cached = self.cache.get(cache_key)
+        self.feature_stats.record(self.feature_label, cached is not None)
+        if cached is None:
             return None
 
+        cached.access_count += 1
+        logger.debug(f"Context cache hit for {session_id}")
+        return cached.content
+
     def set(self, session_id: str, game_state, context: str) -> None:
         """Cache context with TTL."""
-        with self._lock:
-            state_hash = self._hash_game_state(game_state)
-            cache_key = self._generate_cache_key(session_id, state_hash)
-
-            # Evict oldest entries if cache is full
-            if len(self.cache) >= self.max_size:
-                self._evict_oldest()
-
-            self.cache[cache_key] = CachedContext(
-                content=context, timestamp=time.time(), hash_key=state_hash
-            )
-            logger.debug(f"Context cached for {session_id}")
-
-    def _evict_oldest(self) -> None:
-        """Evict oldest cache entries to make room."""
-        if not self.cache:
-            return
-
-        # Sort by timestamp and remove oldest 25%
-        sorted_items = sorted(self.cache.items(), key=lambda x: x[1].timestamp)
+        state_hash = self._hash_game_state(game_state)
+        cache_key = self._generate_cache_key(session_id, state_hash)
 
-        evict_count = max(1, len(sorted_items) // 4)
-        for i in range(evict_count):
-            del self.cache[sorted_items[i][0]]
+        self.cache.set(
+            cache_key,
+            CachedContext(content=context, timestamp=time.time(), hash_key=state_hash),
+        )
+        logger.debug(f"Context cached for {session_id}")
 
-        logger.debug(f"Evicted {evict_count} old cache entries")
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss/eviction counters for the context cache."""
+        stats = self.cache.get_stats()
+        stats["features"] = self.feature_label
+        stats["by_feature_set"] = self.feature_stats.get_stats()
+        return stats
 
 
 class AsyncLLMOptimizer:
@@ -135,27 +124,20 @@ class AsyncLLMOptimizer:
         self.model = model
         self.context_cache = AsyncContextCache()
         self.request_stats = defaultdict(int)
-        self._session = None
-
-    async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session."""
-        if self._session is None or self._session.closed:
-            timeout = aiohttp.ClientTimeout(total=30)
-            self._session = aiohttp.ClientSession(timeout=timeout)
-        return self._session
+        self.transport = get_ollama_transport(ollama_url)
 
     async def close(self):
-        """Close aiohttp session."""
-        if self._session and not self._session.closed:
-            await self._session.close()
+        """Release this optimizer's resources.
+
+        The transport is shared with every other Ollama caller, so its
+        connections stay open; ``shutdown_ollama_transports()`` closes them
+        when the application shuts down.
+        """
 
     async def make_async_request(
         self, messages: List[Dict], session_id: str
     ) -> Dict[str, Any]:
         """Make asynchronous request to LLM service."""
-        session = await self._get_session()
-        api_url = f"{self.ollama_url}/api/chat"
-
         data = {
             "model": self.model,
             "messages": messages,
@@ -170,29 +152,25 @@ class AsyncLLMOptimizer:
         start_time = time.time()
 
         try:
-            async with session.post(api_url, json=data) as response:
-                if response.status != 200:
-                    raise aiohttp.ClientError(
-                        f"HTTP {response.status}: {await response.text()}"
-                    )
-
-                response_data = await response.json()
+            response_data = await self.transport.apost_json(
+                "/api/chat", data, model=self.model
+            )
 
-                if (
-                    "message" not in response_data
-                    or "content" not in response_data["message"]
-                ):
-                    raise ValueError("Invalid response format from LLM")
+            if (
+                "message" not in response_data
+                or "content" not in response_data["message"]
+            ):
+                raise ValueError("Invalid response format from LLM")
 
-                self.request_stats["successful_requests"] += 1
-                self.request_stats["total_response_time"] += time.time() - start_time
+            self.request_stats["successful_requests"] += 1
+            self.request_stats["total_response_time"] += time.time() - start_time
 
-                return response_data
+            return response_data
 
-        except asyncio.TimeoutError:
+        except httpx.TimeoutException:
             self.request_stats["timeout_errors"] += 1
             raise Exception("Request timed out")
-        except aiohttp.ClientError as e:
+        except (httpx.HTTPError, CircuitOpenError) as e:
             self.request_stats["connection_errors"] += 1
             raise Exception(f"Connection error: {e}")
         except Exception as e:
@@ -219,19 +197,28 @@ class AsyncLLMOptimizer:
         else:
             stats["average_response_time"] = 0
 
+        stats["transport"] = self.transport.get_stats()
+
         # Add cache stats
         stats["cache_size"] = len(self.context_cache.cache)
         stats["cache_max_size"] = self.context_cache.max_size
+        stats["context_cache"] = self.context_cache.get_stats()
 
         return stats
 
 
 class BackgroundHealthMonitor:
-    """Background health monitoring with async checks."""
+    """Background health monitoring with async checks.
+
+    Each check also opens or closes the shared transport's circuit breaker
+    when the server is down, or marks just this model unavailable when the
+    server is up without it, so requests fail fast either way.
+    """
 
     def __init__(self, ollama_url: str, model: str, check_interval: int = 60):
         self.ollama_url = ollama_url
         self.model = model
+        self.transport = get_ollama_transport(ollama_url)
         self.check_interval = check_interval
         self.is_healthy = True
         self.last_check = 0
@@ -272,31 +259,29 @@ class BackgroundHealthMonitor:
         self.last_check = time.time()
 
         try:
-            timeout = aiohttp.ClientTimeout(total=5)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.get(f"{self.ollama_url}/api/tags") as response:
-                    if response.status != 200:
-                        raise aiohttp.ClientError(f"HTTP {response.status}")
-
-                    data = await response.json()
-                    available_models = [
-                        model["name"] for model in data.get("models", [])
-                    ]
-                    model_available = any(
-                        self.model in model_name for model_name in available_models
-                    )
-
-                    if model_available:
-                        self.is_healthy = True
-                        self.consecutive_failures = 0
-                        logger.debug(f"Health check passed - {self.model} available")
-                    else:
-                        self.is_healthy = False
-                        logger.warning(f"Model {self.model} not available")
+            data = await self.transport.aget_json(
+                "/api/tags", timeout=5, retries=0, use_breaker=False
+            )
+            available_models = [model["name"] for model in data.get("models", [])]
+            model_available = any(
+                self.model in model_name for model_name in available_models
+            )
+
+            if model_available:
+                self.is_healthy = True
+                self.consecutive_failures = 0
+                self.transport.breaker.reset()
+                self.transport.mark_model_available(self.model)
+                logger.debug(f"Health check passed - {self.model} available")
+            else:
+                self.is_healthy = False
+                self.transport.mark_model_unavailable(self.model)
+                logger.warning(f"Model {self.model} not available")
 
         except Exception as e:
             self.consecutive_failures += 1
             self.is_healthy = False
+            self.transport.breaker.force_open()
             logger.warning(
                 f"Health check failed ({self.consecutive_failures} consecutive): {e}"
             )
@@ -308,6 +293,7 @@ class BackgroundHealthMonitor:
             "consecutive_failures": self.consecutive_failures,
             "last_check": self.last_check,
             "check_interval": self.check_interval,
+            "circuit": self.transport.breaker.get_status(),
         }
 
 
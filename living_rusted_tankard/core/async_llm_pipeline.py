@@ -3,7 +3,10 @@ Enhanced Asynchronous LLM Pipeline for The Living Rusted Tankard.
 
 This module provides non-blocking LLM processing with:
 - Queue-based request processing to prevent UI blocking
+- Priority scheduling with per-session fairness, deadlines and preemption
 - Response caching for similar interactions
+- Single-flight coalescing of identical in-flight requests per session
+- Token streaming with early command extraction
 - Background processing capabilities
 - Graceful degradation with fallback responses
 - Integration with existing LLM systems
@@ -19,14 +22,35 @@ import logging
 import time
 import uuid
 import threading
-from typing import Dict, List, Any, Optional, Callable, Tuple
-from dataclasses import dataclass
+from collections import OrderedDict, defaultdict, deque
+from typing import (
+    AsyncIterator,
+    Dict,
+    List,
+    Any,
+    Optional,
+    Callable,
+    Tuple,
+    Deque,
+    Set,
+    Awaitable,
+    Iterable,
+)
+from dataclasses import dataclass, field, replace
 from enum import Enum
 from concurrent.futures import ThreadPoolExecutor
 import json
 
 from .async_llm_optimization import AsyncLLMOptimizer
 from .enhanced_llm_game_master import EnhancedLLMGameMaster
+from .cache_keys import (
+    DEFAULT_RESPONSE_FEATURES,
+    FeatureSetStats,
+    feature_set_label,
+    response_cache_key,
+    validate_features,
+)
+from .lru_cache import LRUCache
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +76,8 @@ class LLMRequest:
     created_at: float
     callback: Optional[Callable[[str, Optional[str], List[Dict]], None]] = None
     context: Optional[Dict[str, Any]] = None
+    deadline: Optional[float] = None  # Absolute time after which queued work is shed
+    stream: Optional[asyncio.Queue] = None  # Receives token/command events
 
     def __post_init__(self):
         if self.created_at == 0:
@@ -74,64 +100,67 @@ class LLMResponse:
 
 
 class ResponseCache:
-    """Cache for LLM responses to reduce redundant calls."""
+    """Cache for LLM responses to reduce redundant calls.
 
-    def __init__(self, max_size: int = 500, ttl_seconds: int = 300):
+    Keys combine the canonical (intent, target) form of the input with the
+    configured game state features; see ``core.cache_keys``.
+
+    Only narration is stored. A hit carries no command, so turns that
+    produced a command or actions must not be cached: a repeat "buy ale"
+    would be narrated without the purchase happening.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 500,
+        ttl_seconds: int = 300,
+        max_bytes: Optional[int] = 4 * 1024 * 1024,
+        features: Iterable[str] = DEFAULT_RESPONSE_FEATURES,
+    ):
         self.max_size = max_size
         self.ttl_seconds = ttl_seconds
-        self.cache: Dict[str, Dict[str, Any]] = {}
+        self.cache = LRUCache(
+            max_entries=max_size, ttl_seconds=ttl_seconds, max_bytes=max_bytes
+        )
+        self.feature_stats = FeatureSetStats()
+        self.set_features(features)
 
-    def _generate_cache_key(self, user_input: str, game_context: str) -> str:
-        """Generate cache key for input and context."""
-        import hashlib
+    def set_features(self, features: Iterable[str]) -> None:
+        """Change which game state features go into the key.
 
-        combined = f"{user_input.lower().strip()}|{game_context}"
-        return hashlib.md5(combined.encode()).hexdigest()
+        Entries written under the old feature set can no longer be hit, so
+        the cache is cleared. Hit-rate counters are kept per feature set.
+        """
+        self.features = validate_features(features)
+        self.feature_label = feature_set_label(self.features)
+        self.cache.clear()
 
-    def get(self, user_input: str, game_context: str) -> Optional[str]:
+    def _generate_cache_key(self, user_input: str, game_state: Any) -> str:
+        """Generate cache key for input and game state."""
+        return response_cache_key(user_input, game_state, self.features)
+
+    def get(self, user_input: str, game_state: Any) -> Optional[str]:
         """Get cached response if available and valid."""
-        cache_key = self._generate_cache_key(user_input, game_context)
-
-        if cache_key in self.cache:
-            entry = self.cache[cache_key]
-            if time.time() - entry["timestamp"] <= self.ttl_seconds:
-                entry["hits"] += 1
-                logger.debug(f"Response cache hit for input: {user_input[:50]}...")
-                return entry["response"]
-            else:
-                # Expired, remove
-                del self.cache[cache_key]
+        cache_key = self._generate_cache_key(user_input, game_state)
 
-        return None
+        response = self.cache.get(cache_key)
+        self.feature_stats.record(self.feature_label, response is not None)
+        if response is not None:
+            logger.debug(f"Response cache hit for input: {user_input[:50]}...")
+        return response
 
-    def set(self, user_input: str, game_context: str, response: str) -> None:
+    def set(self, user_input: str, game_state: Any, response: str) -> None:
         """Cache a response."""
-        cache_key = self._generate_cache_key(user_input, game_context)
-
-        # Evict old entries if cache is full
-        if len(self.cache) >= self.max_size:
-            self._evict_oldest()
-
-        self.cache[cache_key] = {
-            "response": response,
-            "timestamp": time.time(),
-            "hits": 0,
-        }
+        cache_key = self._generate_cache_key(user_input, game_state)
+        self.cache.set(cache_key, response)
         logger.debug(f"Cached response for input: {user_input[:50]}...")
 
-    def _evict_oldest(self) -> None:
-        """Remove oldest cache entries."""
-        if not self.cache:
-            return
-
-        # Sort by timestamp and remove oldest 25%
-        sorted_items = sorted(self.cache.items(), key=lambda x: x[1]["timestamp"])
-
-        evict_count = max(1, len(sorted_items) // 4)
-        for i in range(evict_count):
-            del self.cache[sorted_items[i][0]]
-
-        logger.debug(f"Evicted {evict_count} old response cache entries")
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss/eviction counters for the response cache."""
+        stats = self.cache.get_stats()
+        stats["features"] = self.feature_label
+        stats["by_feature_set"] = self.feature_stats.get_stats()
+        return stats
 
 
 class FallbackResponseGenerator:
@@ -175,6 +204,363 @@ class FallbackResponseGenerator:
         return base_response + time_context
 
 
+def _default_queue_budgets() -> Dict[RequestPriority, float]:
+    """Default maximum queueing time (seconds) per priority before shedding."""
+    return {
+        RequestPriority.URGENT: 5.0,
+        RequestPriority.HIGH: 8.0,
+        RequestPriority.NORMAL: 15.0,
+        RequestPriority.LOW: 60.0,
+    }
+
+
+@dataclass
+class SchedulerConfig:
+    """Tuning knobs for the LLM request scheduler."""
+
+    num_workers: int = 4
+    max_queue_size: int = 200  # Admission control: requests beyond this are refused
+    max_in_flight_per_session: int = 1  # Fairness: concurrent requests per session
+    low_priority_max_workers: Optional[int] = None  # Defaults to num_workers - 1
+    preempt_low_priority: bool = True
+    queue_budgets: Dict[RequestPriority, float] = field(
+        default_factory=_default_queue_budgets
+    )
+
+    @property
+    def low_priority_limit(self) -> int:
+        """Number of workers LOW requests may occupy at once."""
+        if self.low_priority_max_workers is not None:
+            return max(1, self.low_priority_max_workers)
+        return max(1, self.num_workers - 1)
+
+
+class RequestScheduler:
+    """Priority-aware scheduler that runs LLM requests on a pool of workers.
+
+    Queued requests are grouped by priority and, within each priority, by
+    session. Workers always serve the highest non-empty priority and rotate
+    through sessions round-robin, so a chatty session cannot starve others.
+
+    Requests that wait past their deadline are shed and resolved with the
+    fallback result instead of being sent to the model, both when a worker
+    looks for work and when a full queue is about to refuse a newcomer. When every worker is
+    busy, a HIGH/URGENT arrival cancels a running LOW request, which is put
+    back at the front of its queue. The executor thread behind a preempted
+    request finishes in the background and its result is discarded.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[LLMRequest], Awaitable[Any]],
+        fallback: Callable[[LLMRequest, str], Any],
+        config: Optional[SchedulerConfig] = None,
+    ):
+        self.handler = handler
+        self.fallback = fallback
+        self.config = config or SchedulerConfig()
+
+        self._queues: Dict[RequestPriority, "OrderedDict[str, Deque[LLMRequest]]"] = {
+            priority: OrderedDict() for priority in RequestPriority
+        }
+        self._pending: Dict[str, Tuple[LLMRequest, asyncio.Future]] = {}
+        self._running: Dict[str, Tuple[LLMRequest, asyncio.Task]] = {}
+        self._preempted: Set[str] = set()
+        self._in_flight_by_session: Dict[str, int] = defaultdict(int)
+        self._queued = 0
+        self._low_running = 0
+
+        self._wakeup: Optional[asyncio.Condition] = None
+        self._workers: List[asyncio.Task] = []
+
+        self._stats: Dict[str, Any] = defaultdict(int)
+        self._total_queue_wait = 0.0
+
+    @property
+    def is_running(self) -> bool:
+        return bool(self._workers)
+
+    def qsize(self) -> int:
+        """Number of requests waiting for a worker."""
+        return self._queued
+
+    async def start(self) -> None:
+        """Spawn the worker tasks on the running event loop."""
+        if self._workers:
+            return
+
+        self._wakeup = asyncio.Condition()
+        self._workers = [
+            asyncio.create_task(self._worker(i)) for i in range(self.config.num_workers)
+        ]
+        logger.info(f"Request scheduler started with {self.config.num_workers} workers")
+
+    async def stop(self) -> None:
+        """Cancel workers and resolve anything still pending with a fallback."""
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.cancel()
+        for _, task in list(self._running.values()):
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+        for request, future in list(self._pending.values()):
+            if not future.done():
+                future.set_result(self.fallback(request, "scheduler stopped"))
+        self._pending.clear()
+        self._running.clear()
+        for sessions in self._queues.values():
+            sessions.clear()
+        self._queued = 0
+
+    async def submit(self, request: LLMRequest) -> asyncio.Future:
+        """Queue a request and return a future resolved with its result."""
+        future = asyncio.get_running_loop().create_future()
+        self._stats["submitted"] += 1
+
+        if request.deadline is None:
+            budget = self.config.queue_budgets.get(request.priority)
+            if budget is not None:
+                request.deadline = request.created_at + budget
+
+        if self._queued >= self.config.max_queue_size:
+            # Dead work must not cost a live request its place
+            self._shed_expired()
+        if self._queued >= self.config.max_queue_size and not self._evict_low_for(
+            request
+        ):
+            self._stats["rejected"] += 1
+            future.set_result(self.fallback(request, "queue full"))
+            return future
+
+        self._pending[request.id] = (request, future)
+        self._enqueue(request)
+        self._maybe_preempt(request)
+
+        async with self._wakeup:
+            self._wakeup.notify()
+        return future
+
+    def _enqueue(self, request: LLMRequest, front: bool = False) -> None:
+        sessions = self._queues[request.priority]
+        queue = sessions.get(request.session_id)
+        if queue is None:
+            queue = sessions[request.session_id] = deque()
+        if front:
+            queue.appendleft(request)
+            sessions.move_to_end(request.session_id, last=False)
+        else:
+            queue.append(request)
+        self._queued += 1
+
+    def _evict_low_for(self, request: LLMRequest) -> bool:
+        """Make room for a non-LOW request by dropping the newest queued LOW one."""
+        if request.priority == RequestPriority.LOW:
+            return False
+
+        sessions = self._queues[RequestPriority.LOW]
+        if not sessions:
+            return False
+
+        session_id = next(reversed(sessions))
+        queue = sessions[session_id]
+        victim = queue.pop()
+        if not queue:
+            del sessions[session_id]
+        self._queued -= 1
+        self._stats["evicted"] += 1
+        self._resolve(victim, self.fallback(victim, "preempted by higher priority"))
+        return True
+
+    def cancel(self, request_id: str) -> bool:
+        """Withdraw a queued or running request; it resolves with the fallback.
+
+        A running handler is cancelled at its next await, so work it has not
+        reached yet (caching, memory) never happens.
+        """
+        entry = self._pending.get(request_id)
+        if entry is None:
+            return False
+        request = entry[0]
+        self._stats["cancelled"] += 1
+
+        running = self._running.get(request_id)
+        if running is not None:
+            # Not re-queued even if it was being preempted
+            self._preempted.discard(request_id)
+            running[1].cancel()
+            return True
+
+        sessions = self._queues[request.priority]
+        queue = sessions.get(request.session_id, ())
+        for index, queued in enumerate(queue):
+            if queued is request:
+                del queue[index]
+                self._queued -= 1
+                if not queue:
+                    del sessions[request.session_id]
+                break
+        self._resolve(request, self.fallback(request, "cancelled"))
+        return True
+
+    def _maybe_preempt(self, request: LLMRequest) -> None:
+        """Cancel a running LOW request if interactive work has no free worker."""
+        if (
+            not self.config.preempt_low_priority
+            or request.priority.value < RequestPriority.HIGH.value
+            or len(self._running) < self.config.num_workers
+        ):
+            return
+
+        for request_id, (running, task) in self._running.items():
+            if (
+                running.priority == RequestPriority.LOW
+                and request_id not in self._preempted
+            ):
+                self._preempted.add(request_id)
+                task.cancel()
+                return
+
+    def _next_request(self) -> Optional[LLMRequest]:
+        """Pick the next runnable request, shedding expired ones on the way."""
+        now = time.time()
+        for priority in sorted(RequestPriority, key=lambda p: p.value, reverse=True):
+            sessions = self._queues[priority]
+            if not sessions:
+                continue
+            if (
+                priority == RequestPriority.LOW
+                and self._low_running >= self.config.low_priority_limit
+            ):
+                continue
+
+            for session_id in list(sessions):
+                queue = sessions[session_id]
+
+                self._shed_head(queue, now)
+                if not queue:
+                    del sessions[session_id]
+                    continue
+
+                limit = self.config.max_in_flight_per_session
+                if self._in_flight_by_session[session_id] >= limit:
+                    continue
+
+                request = queue.popleft()
+                self._queued -= 1
+                # Rotate this session to the back for round-robin fairness
+                del sessions[session_id]
+                if queue:
+                    sessions[session_id] = queue
+                return request
+
+        return None
+
+    def _shed_head(self, queue: Deque[LLMRequest], now: float) -> None:
+        """Resolve the expired requests at the head of one session queue.
+
+        Requests in one session/priority share a budget, so expired entries
+        are always at the head of the deque.
+        """
+        while queue and queue[0].deadline is not None and queue[0].deadline < now:
+            expired = queue.popleft()
+            self._queued -= 1
+            self._stats["shed"] += 1
+            self._resolve(expired, self.fallback(expired, "deadline exceeded"))
+
+    def _shed_expired(self) -> None:
+        """Shed expired requests from every queue."""
+        now = time.time()
+        for sessions in self._queues.values():
+            for session_id in list(sessions):
+                self._shed_head(sessions[session_id], now)
+                if not sessions[session_id]:
+                    del sessions[session_id]
+
+    async def _worker(self, worker_id: int) -> None:
+        while True:
+            async with self._wakeup:
+                request = self._next_request()
+                while request is None:
+                    await self._wakeup.wait()
+                    request = self._next_request()
+
+            try:
+                await self._run(request)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Scheduler worker {worker_id} error: {e}")
+
+            async with self._wakeup:
+                self._wakeup.notify_all()
+
+    async def _run(self, request: LLMRequest) -> None:
+        session_id = request.session_id
+        is_low = request.priority == RequestPriority.LOW
+        self._in_flight_by_session[session_id] += 1
+        if is_low:
+            self._low_running += 1
+
+        self._total_queue_wait += time.time() - request.created_at
+        self._stats["dispatched"] += 1
+
+        task = asyncio.ensure_future(self.handler(request))
+        self._running[request.id] = (request, task)
+        try:
+            try:
+                await asyncio.wait({task})
+            except asyncio.CancelledError:
+                task.cancel()
+                raise
+
+            if task.cancelled():
+                if request.id in self._preempted:
+                    self._stats["preempted"] += 1
+                    self._enqueue(request, front=True)
+                else:
+                    self._resolve(request, self.fallback(request, "cancelled"))
+            elif task.exception() is not None:
+                self._stats["failed"] += 1
+                self._resolve(request, self.fallback(request, str(task.exception())))
+            else:
+                self._stats["completed"] += 1
+                self._resolve(request, task.result())
+        finally:
+            self._running.pop(request.id, None)
+            self._preempted.discard(request.id)
+            self._in_flight_by_session[session_id] -= 1
+            if self._in_flight_by_session[session_id] <= 0:
+                del self._in_flight_by_session[session_id]
+            if is_low:
+                self._low_running -= 1
+
+    def _resolve(self, request: LLMRequest, result: Any) -> None:
+        entry = self._pending.pop(request.id, None)
+        if entry and not entry[1].done():
+            entry[1].set_result(result)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue depth, throughput and shedding counters."""
+        stats = dict(self._stats)
+        dispatched = stats.get("dispatched", 0)
+        stats.update(
+            {
+                "workers": len(self._workers),
+                "queued": self._queued,
+                "running": len(self._running),
+                "queued_by_priority": {
+                    priority.name: sum(len(q) for q in sessions.values())
+                    for priority, sessions in self._queues.items()
+                },
+                "average_queue_wait": (
+                    self._total_queue_wait / dispatched if dispatched else 0.0
+                ),
+            }
+        )
+        return stats
+
+
 class AsyncLLMPipeline:
     """Enhanced asynchronous LLM processing pipeline."""
 
@@ -182,9 +568,14 @@ class AsyncLLMPipeline:
         self,
         ollama_url: str = "http://localhost:11434",
         model: str = "long-gemma:latest",
+        scheduler_config: Optional[SchedulerConfig] = None,
+        result_ttl: float = 60.0,
     ):
         self.ollama_url = ollama_url
         self.model = model
+        # How long a finished response waits for get_response() before it
+        # is dropped; callback-only callers never collect theirs
+        self.result_ttl = result_ttl
 
         # Core components
         self.async_optimizer = AsyncLLMOptimizer(ollama_url, model)
@@ -192,10 +583,16 @@ class AsyncLLMPipeline:
         self.response_cache = ResponseCache()
         self.fallback_generator = FallbackResponseGenerator()
 
-        # Request queue with priority handling
-        self.request_queue: asyncio.PriorityQueue = None
+        # Request scheduling with priorities, fairness and deadlines
+        self.scheduler_config = scheduler_config or SchedulerConfig()
+        self.scheduler = RequestScheduler(
+            self._handle_request, self._fallback_response, self.scheduler_config
+        )
         self.active_requests: Dict[str, LLMRequest] = {}
-        self.processing_task: Optional[asyncio.Task] = None
+        self._results: Dict[str, asyncio.Future] = {}
+        # Single-flight: response cache key -> (priority, future) of the
+        # request currently generating that response
+        self._inflight: Dict[str, Tuple[RequestPriority, asyncio.Future]] = {}
 
         # Thread safety
         self._lock = threading.RLock()
@@ -205,6 +602,7 @@ class AsyncLLMPipeline:
         self._stats = {
             "total_requests": 0,
             "cached_responses": 0,
+            "coalesced_responses": 0,
             "fallback_responses": 0,
             "successful_responses": 0,
             "failed_requests": 0,
@@ -212,8 +610,12 @@ class AsyncLLMPipeline:
             "queue_size": 0,
         }
 
-        # Background task management
-        self.executor = ThreadPoolExecutor(max_workers=2)
+        # Background task management. Extra threads absorb executor work
+        # abandoned by preempted LOW requests so they cannot block new work.
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.scheduler_config.num_workers
+            + self.scheduler_config.low_priority_limit
+        )
         self.is_running = False
 
     def _add_active_request(self, request_id: str, request: LLMRequest) -> None:
@@ -249,42 +651,29 @@ class AsyncLLMPipeline:
                             value if isinstance(value, (int, float)) else 1
                         )
 
-    def get_stats(self) -> Dict[str, Any]:
-        """Thread-safe method to get current statistics."""
-        with self._stats_lock:
-            stats_copy = self._stats.copy()
-            # Add current queue size
-            if self.request_queue:
-                stats_copy["queue_size"] = self.request_queue.qsize()
-            return stats_copy
-
     async def start(self) -> None:
         """Start the async pipeline."""
         if self.is_running:
             return
 
-        self.request_queue = asyncio.PriorityQueue()
         self.is_running = True
 
-        # Start background processing task
-        self.processing_task = asyncio.create_task(self._process_requests())
+        # Start scheduler workers
+        await self.scheduler.start()
         logger.info("Async LLM Pipeline started")
 
     async def stop(self) -> None:
         """Stop the async pipeline and clean up resources."""
         self.is_running = False
 
-        if self.processing_task:
-            self.processing_task.cancel()
-            try:
-                await self.processing_task
-            except asyncio.CancelledError:
-                pass
+        await self.scheduler.stop()
 
         # Clean up active requests
         with self._lock:
             active_count = len(self.active_requests)
             self.active_requests.clear()
+            self._results.clear()
+            self._inflight.clear()
             if active_count > 0:
                 logger.info(f"Cleaned up {active_count} active requests")
 
@@ -302,8 +691,12 @@ class AsyncLLMPipeline:
         game_state: Any,
         session_id: str,
         priority: RequestPriority = RequestPriority.NORMAL,
+        callback: Optional[Callable[[str, Optional[str], List[Dict]], None]] = None,
     ) -> str:
-        """Process a request asynchronously and return request ID for tracking."""
+        """Process a request asynchronously and return request ID for tracking.
+
+        The result is collected with ``get_response(request_id)``.
+        """
         if not self.is_running:
             await self.start()
 
@@ -315,66 +708,249 @@ class AsyncLLMPipeline:
             game_state=game_state,
             priority=priority,
             created_at=time.time(),
+            callback=callback,
         )
 
         # Check cache first
         try:
-            from .time_display import get_time_context_for_llm
-
-            time_context = get_time_context_for_llm(game_state.clock.current_time_hours)
-            cached_response = self.response_cache.get(user_input, time_context)
+            cached_response = self.response_cache.get(user_input, game_state)
 
             if cached_response:
                 self._update_stats(cached_responses=1)
-                return cached_response
+                future = asyncio.get_running_loop().create_future()
+                future.set_result(
+                    LLMResponse(
+                        request_id=request_id,
+                        session_id=session_id,
+                        content=cached_response,
+                        actions=[],
+                        was_cached=True,
+                    )
+                )
+                self._track_result(request_id, future)
+                return request_id
         except Exception as e:
             logger.debug(f"Error checking cache: {e}")
 
-        # Queue the request
-        # Priority queue uses (priority, item) tuples, lower numbers = higher priority
-        priority_value = 5 - priority.value  # Invert so URGENT=1, HIGH=2, etc.
-        await self.request_queue.put((priority_value, time.time(), request))
+        # Join an identical request of this session that is already being
+        # generated, as long as it will be served at least as urgently
+        cache_key = self._single_flight_key(user_input, game_state, session_id)
+
+        leader = self._inflight.get(cache_key) if cache_key else None
+        if leader is not None and leader[0].value >= priority.value:
+            self._track_result(request_id, self._follow(request, leader[1]))
+            return request_id
 
         self._add_active_request(request_id, request)
         self._update_stats(total_requests=1)
 
+        # Hand the request to the scheduler; the future resolves with an
+        # LLMResponse (a fallback one if the request is shed or rejected)
+        future = await self.scheduler.submit(request)
+        self._track_result(request_id, future)
+
+        if cache_key and not future.done():
+            self._inflight[cache_key] = (priority, future)
+            future.add_done_callback(
+                lambda done, key=cache_key: self._release_inflight(key, done)
+            )
+
         return request_id
 
-    async def get_response(
-        self, request_id: str, timeout: float = 30.0
-    ) -> Optional[LLMResponse]:
-        """Get the response for a request (blocking until ready or timeout)."""
-        start_time = time.time()
+    async def stream_request(
+        self,
+        user_input: str,
+        game_state: Any,
+        session_id: str,
+        priority: RequestPriority = RequestPriority.NORMAL,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Process a request and yield narration while it is generated.
+
+        Yields ``{"type": "token", "text": ...}`` and ``{"type": "command",
+        "command": ...}`` events, then ``{"type": "done", "response":
+        LLMResponse}``. Cached, coalesced and fallback responses arrive as a
+        single token. Scheduling, caching and single-flight work as in
+        ``process_request_async``.
+        """
+        if not self.is_running:
+            await self.start()
 
-        while time.time() - start_time < timeout:
-            if request_id not in self.active_requests:
-                # Request completed, check if we have a response
-                # In a full implementation, we'd store completed responses
-                # For now, we'll return None to indicate completion
-                return None
+        request = LLMRequest(
+            id=str(uuid.uuid4()),
+            session_id=session_id,
+            user_input=user_input,
+            game_state=game_state,
+            priority=priority,
+            created_at=time.time(),
+            stream=asyncio.Queue(),
+        )
 
-            await asyncio.sleep(0.1)
+        try:
+            cached_response = self.response_cache.get(user_input, game_state)
+        except Exception as e:
+            logger.debug(f"Error checking cache: {e}")
+            cached_response = None
+
+        if cached_response:
+            self._update_stats(cached_responses=1)
+            yield {"type": "token", "text": cached_response}
+            yield {
+                "type": "done",
+                "response": LLMResponse(
+                    request_id=request.id,
+                    session_id=session_id,
+                    content=cached_response,
+                    actions=[],
+                    was_cached=True,
+                ),
+            }
+            return
 
-        # Timeout - generate fallback
-        request = self._get_active_request(request_id)
-        if request:
-            fallback_content = self.fallback_generator.generate_fallback(
-                request.user_input,
-                {"current_time": "evening"},  # Could get from game_state
-            )
+        cache_key = self._single_flight_key(user_input, game_state, session_id)
 
-            # Clean up
-            self._remove_active_request(request_id)
+        leader = self._inflight.get(cache_key) if cache_key else None
+        if leader is not None and leader[0].value >= priority.value:
+            future = self._follow(request, leader[1])
+        else:
+            self._add_active_request(request.id, request)
+            self._update_stats(total_requests=1)
+            future = await self.scheduler.submit(request)
+            if cache_key and not future.done():
+                self._inflight[cache_key] = (priority, future)
+                future.add_done_callback(
+                    lambda done, key=cache_key: self._release_inflight(key, done)
+                )
 
-            self._update_stats(fallback_responses=1)
+        queue = request.stream
+        streamed_text = False
+        sent_command = False
+        getter = None
+        try:
+            while not future.done():
+                getter = asyncio.ensure_future(queue.get())
+                await asyncio.wait(
+                    {getter, future}, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not getter.done():
+                    break
+                event = getter.result()
+                streamed_text = streamed_text or event["type"] == "token"
+                sent_command = sent_command or event["type"] == "command"
+                yield event
+        finally:
+            if getter is not None and not getter.done():
+                getter.cancel()
+
+        while not queue.empty():
+            event = queue.get_nowait()
+            streamed_text = streamed_text or event["type"] == "token"
+            sent_command = sent_command or event["type"] == "command"
+            yield event
+
+        response = future.result()
+        if response.command and not sent_command:
+            yield {"type": "command", "command": response.command}
+        if response.content and not streamed_text:
+            yield {"type": "token", "text": response.content}
+        yield {"type": "done", "response": response}
+
+    def _single_flight_key(
+        self, user_input: str, game_state: Any, session_id: str
+    ) -> Optional[str]:
+        """Response cache key scoped to one session.
 
-            return LLMResponse(
-                request_id=request_id,
-                session_id=request.session_id,
-                content=fallback_content,
-                was_fallback=True,
-                processing_time=timeout,
+        A leader's response carries the command parsed from its session's
+        history, so it is only ever shared with the same session.
+        """
+        try:
+            cache_key = response_cache_key(
+                user_input, game_state, self.response_cache.features
+            )
+        except Exception as e:
+            logger.debug(f"Error building single-flight key: {e}")
+            return None
+        return f"{session_id}:{cache_key}"
+
+    def _follow(self, request: LLMRequest, leader: asyncio.Future) -> asyncio.Future:
+        """Resolve ``request`` with a copy of the leader's response."""
+        follower = asyncio.get_running_loop().create_future()
+        self._add_active_request(request.id, request)
+        self._update_stats(coalesced_responses=1)
+
+        def _copy(done: asyncio.Future) -> None:
+            if follower.done():
+                return
+            if done.cancelled() or done.exception() is not None:
+                follower.set_result(
+                    self._fallback_response(request, "coalesced request failed")
+                )
+                return
+
+            self._remove_active_request(request.id)
+            response = done.result()
+            follower.set_result(
+                replace(
+                    response,
+                    request_id=request.id,
+                    session_id=request.session_id,
+                    processing_time=time.time() - request.created_at,
+                )
             )
+            if request.callback:
+                try:
+                    request.callback(
+                        response.content, response.command, response.actions or []
+                    )
+                except Exception as e:
+                    logger.error(f"Error in callback for request {request.id}: {e}")
+
+        leader.add_done_callback(_copy)
+        return follower
+
+    def _track_result(self, request_id: str, future: asyncio.Future) -> None:
+        """Hold a response for get_response() until ``result_ttl`` after it is ready."""
+        self._results[request_id] = future
+        loop = asyncio.get_running_loop()
+
+        def _expire(done: asyncio.Future) -> None:
+            loop.call_later(self.result_ttl, self._drop_result, request_id, done)
+
+        future.add_done_callback(_expire)
+
+    def _drop_result(self, request_id: str, future: asyncio.Future) -> None:
+        if self._results.get(request_id) is future:
+            del self._results[request_id]
+
+    def _release_inflight(self, cache_key: str, future: asyncio.Future) -> None:
+        """Forget a finished single-flight leader."""
+        entry = self._inflight.get(cache_key)
+        if entry is not None and entry[1] is future:
+            del self._inflight[cache_key]
+
+    async def get_response(
+        self, request_id: str, timeout: float = 30.0
+    ) -> Optional[LLMResponse]:
+        """Get the response for a request (blocking until ready or timeout)."""
+        future = self._results.get(request_id)
+        if future is None:
+            return None
+
+        try:
+            response = await asyncio.wait_for(asyncio.shield(future), timeout)
+            self._results.pop(request_id, None)
+            return response
+        except asyncio.TimeoutError:
+            pass
+
+        # Timeout - withdraw the work, since the caller stops guarding the
+        # game state it reads, and answer with a fallback
+        self._results.pop(request_id, None)
+        request = self._remove_active_request(request_id)
+        self.scheduler.cancel(request_id)
+        if request:
+            fallback = self._fallback_response(request, "response timeout")
+            fallback.processing_time = timeout
+            return fallback
 
         return None
 
@@ -384,10 +960,7 @@ class AsyncLLMPipeline:
         """Synchronous wrapper for backward compatibility with existing API."""
         try:
             # Check cache first
-            from .time_display import get_time_context_for_llm
-
-            time_context = get_time_context_for_llm(game_state.clock.current_time_hours)
-            cached_response = self.response_cache.get(user_input, time_context)
+            cached_response = self.response_cache.get(user_input, game_state)
 
             if cached_response:
                 self._update_stats(cached_responses=1)
@@ -400,8 +973,9 @@ class AsyncLLMPipeline:
             )
             processing_time = time.time() - start_time
 
-            # Cache the response
-            self.response_cache.set(user_input, time_context, response)
+            # Cache pure narration; a hit would not replay a command
+            if not command and not actions:
+                self.response_cache.set(user_input, game_state, response)
 
             # Update stats
             self._update_stats(successful_responses=1)
@@ -452,53 +1026,32 @@ class AsyncLLMPipeline:
                 self._update_stats(fallback_responses=1)
                 return fallback_response, None, []
 
-    async def _process_requests(self) -> None:
-        """Background task to process queued requests."""
-        while self.is_running:
-            try:
-                # Get request from queue with timeout
-                try:
-                    priority, timestamp, request = await asyncio.wait_for(
-                        self.request_queue.get(), timeout=1.0
-                    )
-                except asyncio.TimeoutError:
-                    continue
-
-                # Process the request
-                await self._handle_request(request)
-
-                # Mark task as done
-                self.request_queue.task_done()
-
-            except Exception as e:
-                logger.error(f"Error in request processing loop: {e}")
-                await asyncio.sleep(1.0)
-
-    async def _handle_request(self, request: LLMRequest) -> None:
-        """Handle a single request asynchronously."""
+    async def _handle_request(self, request: LLMRequest) -> LLMResponse:
+        """Handle a single request asynchronously (called by scheduler workers)."""
         start_time = time.time()
 
         try:
-            # Use the enhanced LLM in a thread to avoid blocking
-            loop = asyncio.get_event_loop()
-            response, command, actions = await loop.run_in_executor(
-                self.executor,
-                self.enhanced_llm.process_input,
-                request.user_input,
-                request.game_state,
-                request.session_id,
-            )
+            if request.stream is not None:
+                response, command, actions = await self._stream_from_llm(request)
+            else:
+                # Use the enhanced LLM in a thread to avoid blocking
+                loop = asyncio.get_event_loop()
+                response, command, actions = await loop.run_in_executor(
+                    self.executor,
+                    self.enhanced_llm.process_input,
+                    request.user_input,
+                    request.game_state,
+                    request.session_id,
+                )
 
             processing_time = time.time() - start_time
 
-            # Cache the response
+            # Cache pure narration; a hit would not replay a command
             try:
-                from .time_display import get_time_context_for_llm
-
-                time_context = get_time_context_for_llm(
-                    request.game_state.clock.current_time_hours
-                )
-                self.response_cache.set(request.user_input, time_context, response)
+                if not command and not actions:
+                    self.response_cache.set(
+                        request.user_input, request.game_state, response
+                    )
             except Exception as e:
                 logger.debug(f"Error caching response: {e}")
 
@@ -532,24 +1085,73 @@ class AsyncLLMPipeline:
 
             self._update_stats(successful_responses=1)
             self._update_average_processing_time(processing_time)
+            self._remove_active_request(request.id)
+
+            return LLMResponse(
+                request_id=request.id,
+                session_id=request.session_id,
+                content=response,
+                command=command,
+                actions=actions or [],
+                processing_time=processing_time,
+            )
 
         except Exception as e:
             logger.error(f"Error processing request {request.id}: {e}")
+            self._update_stats(failed_requests=1)
 
             # Generate fallback response
-            fallback_response = self.fallback_generator.generate_fallback(
-                request.user_input, request.context
-            )
+            fallback = self._fallback_response(request, str(e))
 
             if request.callback:
-                request.callback(fallback_response, None, [])
+                request.callback(fallback.content, None, [])
 
-            self._update_stats(failed_requests=1)
-            self._update_stats(fallback_responses=1)
+            return fallback
 
-        finally:
-            # Clean up
-            self._remove_active_request(request.id)
+    async def _stream_from_llm(
+        self, request: LLMRequest
+    ) -> Tuple[str, Optional[str], List[Dict[str, Any]]]:
+        """Forward token and command events to the request's stream queue."""
+        done = None
+        async for event in self.enhanced_llm.process_input_stream(
+            request.user_input, request.game_state, request.session_id
+        ):
+            if event["type"] == "done":
+                done = event
+            else:
+                request.stream.put_nowait(event)
+
+        if done is None:
+            raise RuntimeError("LLM stream ended without a result")
+        return done["content"], done["command"], done["actions"]
+
+    def _fallback_response(self, request: LLMRequest, reason: str) -> LLMResponse:
+        """Build a fallback response for a failed, shed or rejected request."""
+        context = dict(request.context or {})
+        if "current_time" not in context:
+            try:
+                from .time_display import get_time_context_for_llm
+
+                context["current_time"] = get_time_context_for_llm(
+                    request.game_state.clock.current_time_hours
+                )
+            except Exception:
+                context["current_time"] = "evening"
+
+        self._remove_active_request(request.id)
+        self._update_stats(fallback_responses=1)
+
+        return LLMResponse(
+            request_id=request.id,
+            session_id=request.session_id,
+            content=self.fallback_generator.generate_fallback(
+                request.user_input, context
+            ),
+            actions=[],
+            was_fallback=True,
+            processing_time=time.time() - request.created_at,
+            error=reason,
+        )
 
     def _update_average_processing_time(self, processing_time: float) -> None:
         """Update average processing time statistic (thread-safe)."""
@@ -557,14 +1159,19 @@ class AsyncLLMPipeline:
 
     def get_stats(self) -> Dict[str, Any]:
         """Get pipeline statistics (thread-safe)."""
-        # Use the thread-safe method from the parent class
-        stats = super().get_stats()
+        with self._stats_lock:
+            stats = self._stats.copy()
+        stats["queue_size"] = self.scheduler.qsize()
+        stats["scheduler"] = self.scheduler.get_stats()
+        stats["in_flight_keys"] = len(self._inflight)
+        stats["uncollected_results"] = len(self._results)
 
         # Add additional pipeline-specific stats
         with self._lock:
             stats["active_requests"] = len(self.active_requests)
 
         stats["cache_size"] = len(self.response_cache.cache)
+        stats["response_cache"] = self.response_cache.get_stats()
 
         # Calculate cache hit rate
         total_requests = stats["total_requests"]
@@ -582,8 +1189,8 @@ class AsyncLLMPipeline:
                 return False
 
             # Check if we're not overwhelmed
-            queue_size = self.request_queue.qsize() if self.request_queue else 0
-            if queue_size > 50:  # Arbitrary threshold
+            queue_size = self.scheduler.qsize()
+            if queue_size > self.scheduler_config.max_queue_size // 2:
                 return False
 
             # Check error rate
@@ -1,8 +1,10 @@
 from typing import Dict, Any, Optional, List, Union, Tuple, TYPE_CHECKING
 from enum import Enum
 from pydantic import BaseModel, Field
-import json
 from pathlib import Path
+from types import MappingProxyType
+
+from .static_data import get_static_data
 
 if TYPE_CHECKING:
     from .player import PlayerState
@@ -69,6 +71,54 @@ class Bounty(BaseModel):
         return all(obj.is_completed for obj in self.objectives)
 
 
+def parse_bounty_definitions(data: Dict[str, Any]) -> MappingProxyType:
+    """Build Bounty definitions from bounties.json (shared, read-only)."""
+    definitions = {}
+    for bounty_data in data.get("bounties", []):
+        loaded_objectives = []
+        for i, obj_data in enumerate(bounty_data.get("objectives", [])):
+            # For definitions, is_active is based on being the first objective,
+            # unless specified otherwise (though typically only first is active initially).
+            is_active_from_json = obj_data.get("is_active", i == 0)
+            loaded_objectives.append(
+                BountyObjective(
+                    id=obj_data.get(
+                        "id", f"obj_{bounty_data['id']}_{i+1}"
+                    ),  # Ensure objective ID
+                    description=obj_data["description"],
+                    type=obj_data.get("type", "generic"),
+                    target_id=obj_data.get("target_id"),
+                    required_progress=obj_data.get("required_progress", 1),
+                    current_progress=obj_data.get(
+                        "current_progress", 0
+                    ),  # Usually 0 for definition
+                    is_completed=obj_data.get(
+                        "is_completed", False
+                    ),  # Usually False for definition
+                    is_active=is_active_from_json,
+                )
+            )
+        bounty_data["objectives"] = loaded_objectives
+
+        if (
+            "reputation_requirement" in bounty_data
+            and bounty_data["reputation_requirement"]
+        ):
+            bounty_data["reputation_requirement"] = ReputationRequirement(
+                **bounty_data["reputation_requirement"]
+            )
+        else:
+            bounty_data["reputation_requirement"] = None
+
+        bounty = Bounty(**bounty_data)
+        # Ensure the first objective is marked active if none are explicitly set
+        if bounty.objectives and not any(obj.is_active for obj in bounty.objectives):
+            bounty.objectives[0].is_active = True
+
+        definitions[bounty.id] = bounty
+    return MappingProxyType(definitions)
+
+
 class BountyManager(BaseModel):
     # managed_bounties_state will store instances of Bounty which now include current_objective_index
     # and the full state of objectives (current_progress, is_completed, is_active)
@@ -82,6 +132,7 @@ class BountyManager(BaseModel):
         super().__init__(**data)
         self._data_dir = Path(data_dir)
         self._bounty_definitions = {}  # Initialize _bounty_definitions
+        self._owned_definitions = set()  # Ids copied out of the shared definitions
         self._load_bounties()
 
     def _load_bounties(self) -> None:
@@ -90,59 +141,29 @@ class BountyManager(BaseModel):
             print(f"Warning: Bounties data file not found at {bounties_file}")
             return
         try:
-            with open(bounties_file, "r") as f:
-                data = json.load(f)
-            for bounty_data in data.get("bounties", []):
-                loaded_objectives = []
-                for i, obj_data in enumerate(bounty_data.get("objectives", [])):
-                    # For definitions, is_active is based on being the first objective,
-                    # unless specified otherwise (though typically only first is active initially).
-                    is_active_from_json = obj_data.get("is_active", i == 0)
-                    loaded_objectives.append(
-                        BountyObjective(
-                            id=obj_data.get(
-                                "id", f"obj_{bounty_data['id']}_{i+1}"
-                            ),  # Ensure objective ID
-                            description=obj_data["description"],
-                            type=obj_data.get("type", "generic"),
-                            target_id=obj_data.get("target_id"),
-                            required_progress=obj_data.get("required_progress", 1),
-                            current_progress=obj_data.get(
-                                "current_progress", 0
-                            ),  # Usually 0 for definition
-                            is_completed=obj_data.get(
-                                "is_completed", False
-                            ),  # Usually False for definition
-                            is_active=is_active_from_json,
-                        )
-                    )
-                bounty_data["objectives"] = loaded_objectives
-
-                if (
-                    "reputation_requirement" in bounty_data
-                    and bounty_data["reputation_requirement"]
-                ):
-                    bounty_data["reputation_requirement"] = ReputationRequirement(
-                        **bounty_data["reputation_requirement"]
-                    )
-                else:
-                    bounty_data["reputation_requirement"] = None
-
-                bounty = Bounty(**bounty_data)
-                # Ensure the first objective is marked active if none are explicitly set
-                if bounty.objectives and not any(
-                    obj.is_active for obj in bounty.objectives
-                ):
-                    bounty.objectives[0].is_active = True
-
-                self._bounty_definitions[bounty.id] = bounty
+            # Definitions are shared across sessions; this manager copies one
+            # before changing it (see _own_definition)
+            self._bounty_definitions = dict(
+                get_static_data().load(bounties_file, parse_bounty_definitions)
+            )
         except Exception as e:
             print(f"Error loading bounty definitions from {bounties_file}: {e}")
 
+    def _own_definition(self, bounty_id: str) -> Optional[Bounty]:
+        """This manager's private copy of a shared bounty definition."""
+        bounty_def = self._bounty_definitions.get(bounty_id)
+        if bounty_def is not None and bounty_id not in self._owned_definitions:
+            bounty_def = self._bounty_definitions[bounty_id] = bounty_def.copy(
+                deep=True
+            )
+            self._owned_definitions.add(bounty_id)
+        return bounty_def
+
     def get_bounty(self, bounty_id: str) -> Optional[Bounty]:
         if bounty_id in self.managed_bounties_state:
             return self.managed_bounties_state[bounty_id]
-        return self._bounty_definitions.get(bounty_id)
+        # Callers may change what they get, so never hand out the shared one
+        return self._own_definition(bounty_id)
 
     def _check_reputation_requirement(
         self, player_state: "PlayerState", requirement: Optional[ReputationRequirement]
@@ -187,7 +208,7 @@ class BountyManager(BaseModel):
         return notice_board_bounties
 
     def post_bounty(self, bounty_id: str) -> bool:
-        bounty_def = self._bounty_definitions.get(bounty_id)
+        bounty_def = self._own_definition(bounty_id)
         if bounty_def:
             bounty_def.is_posted = True
             managed_bounty = self.managed_bounties_state.get(bounty_id)
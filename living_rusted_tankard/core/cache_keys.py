@@ -0,0 +1,119 @@
+"""
+Cache key construction for LLM response and context caches.
+
+A key is made of two parts:
+
+- the canonical ``(intent, target)`` form of the player's input (see
+  ``core.command_normalizer``), so paraphrases share an entry;
+- a configurable set of named game state features. Fewer or coarser
+  features raise the hit rate, more features guard against serving
+  narration that no longer matches the world.
+
+``FeatureSetStats`` records hits and misses per feature set so different
+configurations can be compared on real traffic.
+"""
+
+import hashlib
+import logging
+import threading
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from .command_normalizer import canonicalize
+from .fantasy_calendar import TavernCalendar
+
+logger = logging.getLogger(__name__)
+
+
+def _hours(game_state) -> float:
+    return float(game_state.clock.current_time_hours)
+
+
+def _present_npcs(game_state) -> Tuple[str, ...]:
+    manager = getattr(game_state, "npc_manager", None)
+    if manager is None:
+        return ()
+    return tuple(sorted(npc.id for npc in manager.get_present_npcs()))
+
+
+STATE_FEATURES: Dict[str, Callable[[Any], Any]] = {
+    "time_of_day": lambda gs: TavernCalendar.get_time_period(_hours(gs))[0].value,
+    "hour": lambda gs: int(_hours(gs)),
+    "day": lambda gs: int(_hours(gs) // 24),
+    "location": lambda gs: gs.room_manager.current_room_id,
+    "present_npcs": _present_npcs,
+    "gold": lambda gs: gs.player.gold,
+    "tiredness": lambda gs: gs.player.tiredness,
+    "has_room": lambda gs: gs.player.has_room,
+}
+
+# Narration for the same request reads the same within a time period, in the
+# same room, with the same company
+DEFAULT_RESPONSE_FEATURES = ("time_of_day", "location", "present_npcs")
+
+# Context strings carry player stats, so those stay in the key
+DEFAULT_CONTEXT_FEATURES = ("gold", "tiredness", "has_room", "hour", "present_npcs")
+
+
+def validate_features(features: Iterable[str]) -> Tuple[str, ...]:
+    """Return the feature names as a tuple, rejecting unknown ones."""
+    features = tuple(features)
+    unknown = [name for name in features if name not in STATE_FEATURES]
+    if unknown:
+        raise ValueError(f"Unknown cache key features: {', '.join(unknown)}")
+    return features
+
+
+def feature_set_label(features: Iterable[str]) -> str:
+    """Stable display name for a feature set."""
+    return "+".join(features) or "none"
+
+
+def state_fingerprint(game_state, features: Iterable[str]) -> str:
+    """Serialize the selected state features of ``game_state``.
+
+    A feature that cannot be read from this state is recorded as ``?``
+    rather than failing the lookup.
+    """
+    parts = []
+    for name in features:
+        try:
+            value = STATE_FEATURES[name](game_state)
+        except Exception as e:
+            logger.debug(f"Could not read cache key feature {name}: {e}")
+            value = "?"
+        parts.append(f"{name}={value}")
+    return "|".join(parts)
+
+
+def response_cache_key(user_input: str, game_state, features: Iterable[str]) -> str:
+    """Hash of the canonical input and the selected state features."""
+    intent, target = canonicalize(user_input)
+    combined = f"{intent}:{target or ''}|{state_fingerprint(game_state, features)}"
+    return hashlib.md5(combined.encode()).hexdigest()
+
+
+class FeatureSetStats:
+    """Hit/miss counters per feature set label."""
+
+    def __init__(self):
+        self._counts: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, label: str, hit: bool) -> None:
+        with self._lock:
+            counts = self._counts.setdefault(label, {"hits": 0, "misses": 0})
+            counts["hits" if hit else "misses"] += 1
+
+    def get_stats(self, label: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """Counters and hit rate for every feature set seen (or just one)."""
+        with self._lock:
+            stats = {}
+            for name, counts in self._counts.items():
+                if label is not None and name != label:
+                    continue
+                lookups = counts["hits"] + counts["misses"]
+                stats[name] = {
+                    **counts,
+                    "hit_rate": counts["hits"] / lookups if lookups else 0.0,
+                }
+            return stats
@@ -1,10 +1,12 @@
-from typing import Callable, Optional, Dict, List, Any, Union, Tuple, Type
-import time
+from typing import Callable, Optional, Dict, List, Any, Union, Tuple, Type, Set
+import math
 import heapq
 from datetime import datetime, timedelta
 from pydantic import BaseModel, Field
 from pydantic.fields import FieldInfo
 
+from . import time_source
+
 from .event_bus import EventBus, Event, EventType
 from .callable_registry import register_callback, get_callback
 
@@ -92,7 +94,7 @@ class GameTime(BaseModel):
 
     def to_real_time(self) -> datetime:
         """Convert to a real datetime (using current date)."""
-        now = datetime.now()
+        now = time_source.now()
         days = int(self.hours // 24)
         hours = self.hours % 24
         return now + timedelta(days=days, hours=hours)
@@ -111,7 +113,7 @@ class GameTime(BaseModel):
             GameTime instance
         """
         if start_time is None:
-            start_time = datetime.now()
+            start_time = time_source.now()
 
         delta = dt - start_time
         return cls(hours=delta.total_seconds() / 3600)
@@ -158,6 +160,16 @@ class GameClock(BaseModel):
     last_day_field: int = Field(default=0, exclude=True)
     last_hour_field: int = Field(default=0, exclude=True)
     last_minute_field: int = Field(default=0, exclude=True)
+    # Runtime index over scheduled_events_data: a heap of (time, seq, event id)
+    event_heap: List[Tuple[float, int, str]] = Field(default_factory=list, exclude=True)
+    # Batched events fire once per advance, so they never make advance_time stop
+    batched_event_heap: List[Tuple[float, int, str]] = Field(
+        default_factory=list, exclude=True
+    )
+    events_by_id: Dict[str, Dict[str, Any]] = Field(default_factory=dict, exclude=True)
+    indexed_events: Optional[List[Dict[str, Any]]] = Field(None, exclude=True)
+    event_seq: int = Field(default=0, exclude=True)
+    batched_callback_ids: Set[str] = Field(default_factory=set, exclude=True)
 
     class Config:
         # Allow extra attributes for backward compatibility
@@ -172,7 +184,7 @@ class GameClock(BaseModel):
 
     def __init__(self, **data: Any):
         super().__init__(**data)
-        self.last_tick = time.monotonic()
+        self.last_tick = time_source.monotonic()
         self.last_day_field = self.time.day
         self.last_hour_field = int(self.time.hour_of_day)
         self.last_minute_field = int((self.time.hour_of_day % 1) * 60)
@@ -199,16 +211,49 @@ class GameClock(BaseModel):
 
     def _rebuild_runtime_scheduled_events(self):
         """
-        Rebuilds the runtime scheduled events list (which would use actual callbacks)
-        from scheduled_events_data (which stores callback names).
-        This method is conceptual for now if scheduled_events_data is directly manipulated
-        by Pydantic's dict/model_dump.
-        For now, scheduled_events_data will BE the source of truth for serialization.
-        The actual runtime execution will use get_callback.
+        Rebuilds the runtime event heap from scheduled_events_data.
+        scheduled_events_data stays the source of truth for serialization; the heap
+        only orders it by due time so scheduling and firing are O(log n).
+        Callbacks are still retrieved from the registry when an event fires.
         """
-        # No actual runtime list of callables is stored persistently in this design.
-        # Callbacks are retrieved from registry on-the-fly in _process_scheduled_events.
-        pass
+        self.events_by_id = {}
+        self.event_heap = []
+        self.batched_event_heap = []
+        for event_data in self.scheduled_events_data:
+            self._index_event(event_data)
+        self.indexed_events = self.scheduled_events_data
+
+    def _sync_event_index(self) -> None:
+        """Rebuild the heap if scheduled_events_data was replaced wholesale."""
+        if self.indexed_events is not self.scheduled_events_data:
+            self._rebuild_runtime_scheduled_events()
+
+    def _index_event(self, event_data: Dict[str, Any]) -> None:
+        self.events_by_id[event_data["id"]] = event_data
+        heap = self.batched_event_heap if event_data.get("batched") else self.event_heap
+        heapq.heappush(heap, (event_data["time"], self.event_seq, event_data["id"]))
+        self.event_seq += 1
+
+    def _is_live_entry(self, entry: Tuple[float, int, str]) -> bool:
+        event_data = self.events_by_id.get(entry[2])
+        return event_data is not None and event_data["time"] == entry[0]
+
+    def _compact_events(self) -> None:
+        """Drop fired and cancelled events once they outnumber the live ones."""
+        live = len(self.events_by_id)
+        if len(self.scheduled_events_data) > 2 * live + 32:
+            self.scheduled_events_data[:] = self._live_scheduled_events()
+        for heap in (self.event_heap, self.batched_event_heap):
+            if len(heap) > 2 * live + 32:
+                heap[:] = [entry for entry in heap if self._is_live_entry(entry)]
+                heapq.heapify(heap)
+
+    def _live_scheduled_events(self) -> List[Dict[str, Any]]:
+        return [
+            event_data
+            for event_data in self.scheduled_events_data
+            if self.events_by_id.get(event_data["id"]) is event_data
+        ]
 
     @property
     def event_bus(self) -> EventBus:  # Provide access to the event_bus_field attribute
@@ -286,16 +331,22 @@ class GameClock(BaseModel):
     def model_dump(self, **kwargs) -> Dict[str, Any]:
         """Serialize GameClock state."""
         # Exclude runtime-only or complex objects that are handled separately
+        # (on_time_advanced is the hook GameState sets as an extra attribute)
         kwargs.setdefault(
-            "exclude", {"on_time_advanced_handler"}
+            "exclude", {"on_time_advanced_handler", "on_time_advanced"}
         )  # Already excluded by Field option
 
-        data = super().model_dump(**kwargs)
+        try:
+            data = super().model_dump(**kwargs)
+        except AttributeError:
+            # Fallback for older Pydantic versions
+            data = self.dict(**kwargs)
         # scheduled_events_data is already handled by Pydantic if it's a regular field.
         # If it's PrivateAttr, we need to explicitly add it.
+        self._sync_event_index()
         data[
             "_scheduled_events_data"
-        ] = self.scheduled_events_data  # Use old name for compatibility
+        ] = self._live_scheduled_events()  # Use old name for compatibility
         return data
 
     @classmethod
@@ -304,17 +355,23 @@ class GameClock(BaseModel):
         # If scheduled_events_data is a PrivateAttr, Pydantic won't populate it automatically from obj
         # We need to handle it manually or ensure it's part of the main model fields.
         # For now, assume scheduled_events_data is a regular field that Pydantic handles.
-        instance = super().model_validate(obj, **kwargs)
+        try:
+            instance = super().model_validate(obj, **kwargs)
+        except AttributeError:
+            # Fallback for older Pydantic versions
+            instance = cls.parse_obj(obj)
 
         # If _scheduled_events_data was a PrivateAttr and not directly in obj for Pydantic:
         if isinstance(obj, dict) and "_scheduled_events_data" in obj:
             instance.scheduled_events_data = obj["_scheduled_events_data"]
+        instance._rebuild_runtime_scheduled_events()
 
-        instance.last_tick = time.monotonic()  # Reset runtime timer
+        instance.last_tick = time_source.monotonic()  # Reset runtime timer
         instance.event_bus_field = EventBus()  # New event bus
         instance.day_callbacks = {}  # Reset callbacks, to be re-registered by systems
         instance.hour_callbacks = {}
         instance.minute_callbacks = {}
+        instance.batched_callback_ids = set()
 
         # Re-initialize last known time details based on loaded time
         instance.last_day_field = instance.time.day
@@ -326,10 +383,10 @@ class GameClock(BaseModel):
     def update(self) -> None:
         """Advance time based on real time passed."""
         if self.paused:
-            self.last_tick = time.monotonic()  # Prevent large delta when unpausing
+            self.last_tick = time_source.monotonic()  # Prevent large delta when unpausing
             return
 
-        current_real_time = time.monotonic()
+        current_real_time = time_source.monotonic()
         delta_real_time = current_real_time - self.last_tick
         self.last_tick = current_real_time
 
@@ -361,7 +418,7 @@ class GameClock(BaseModel):
     def resume(self) -> None:
         """Resume the game clock."""
         self.paused = False
-        self.last_tick = time.monotonic()  # Reset tick to prevent jump
+        self.last_tick = time_source.monotonic()  # Reset tick to prevent jump
 
     def set_time_scale(self, scale: float) -> None:
         """Set the time scale factor.
@@ -379,6 +436,7 @@ class GameClock(BaseModel):
         name: str = "",
         repeats: bool = False,
         interval: float = 0.0,
+        batched: bool = False,
         **kwargs,
     ) -> str:
         """Schedule an event to occur after a delay in game hours.
@@ -389,6 +447,8 @@ class GameClock(BaseModel):
             name: Optional name for the event
             repeats: Whether the event should repeat
             interval: If repeating, time between occurrences in hours
+            batched: If repeating, call the callback once per clock advance with
+                count=<occurrences due> instead of once per occurrence
             **kwargs: Additional arguments to pass to the callback
 
         Returns:
@@ -411,13 +471,12 @@ class GameClock(BaseModel):
             "callback_name": callback_name,  # Store the name
             "repeat": repeats,
             "interval": interval,
+            "batched": batched,
             "kwargs": kwargs or {},
         }
+        self._sync_event_index()
         self.scheduled_events_data.append(event_data)
-
-        # Sort events by time to ensure they're processed in order
-        # This is important if _process_scheduled_events iterates and pops
-        self.scheduled_events_data.sort(key=lambda e: e["time"])
+        self._index_event(event_data)
 
         return event_id
 
@@ -430,144 +489,151 @@ class GameClock(BaseModel):
         Returns:
             True if the event was found and cancelled, False otherwise
         """
-        original_len = len(self.scheduled_events_data)
-        self.scheduled_events_data = [
-            event for event in self.scheduled_events_data if event["id"] != event_id
-        ]
-        return len(self.scheduled_events_data) < original_len
-
-    def on_day_change(self, callback: Callable[[int], None]) -> Callable:
+        self._sync_event_index()
+        if self.events_by_id.pop(event_id, None) is None:
+            return False
+        # Its heap entry is skipped when popped; the list is compacted lazily
+        self._compact_events()
+        return True
+
+    def on_day_change(
+        self, callback: Callable[..., None], batched: bool = False
+    ) -> Callable:
         """Register a callback for when the day changes.
 
         Args:
             callback: Function to call when the day changes
                 Receives the new day number
+            batched: Instead of one call per day crossed, call once per clock
+                advance as callback(day, count)
 
         Returns:
             Function to unregister the callback
         """
-        from uuid import uuid4  # Keep local import for utility
+        return self._register_time_callback(self.day_callbacks, callback, batched)
 
-        callback_id = str(uuid4())
-        self.day_callbacks[callback_id] = callback
-
-        def unregister():
-            self.day_callbacks.pop(callback_id, None)
-
-        return unregister
-
-    def on_hour_change(self, callback: Callable[[int], None]) -> Callable:
+    def on_hour_change(
+        self, callback: Callable[..., None], batched: bool = False
+    ) -> Callable:
         """Register a callback for when the hour changes.
 
         Args:
             callback: Function to call when the hour changes
                 Receives the new hour (0-23)
+            batched: Instead of one call per hour crossed, call once per clock
+                advance as callback(hour, count)
 
         Returns:
             Function to unregister the callback
         """
-        from uuid import uuid4  # Keep local import
-
-        callback_id = str(uuid4())
-        self.hour_callbacks[callback_id] = callback
-
-        def unregister():
-            self.hour_callbacks.pop(callback_id, None)
+        return self._register_time_callback(self.hour_callbacks, callback, batched)
 
-        return unregister
-
-    def on_minute_change(self, callback: Callable[[int], None]) -> Callable:
+    def on_minute_change(
+        self, callback: Callable[..., None], batched: bool = False
+    ) -> Callable:
         """Register a callback for when the minute changes.
 
         Args:
             callback: Function to call when the minute changes
                 Receives the new minute (0-59)
+            batched: Instead of one call per minute crossed, call once per clock
+                advance as callback(minute, count)
 
         Returns:
             Function to unregister the callback
         """
-        from uuid import uuid4  # Keep local import
+        return self._register_time_callback(self.minute_callbacks, callback, batched)
+
+    def _register_time_callback(
+        self,
+        callbacks: Dict[str, Callable[..., None]],
+        callback: Callable[..., None],
+        batched: bool,
+    ) -> Callable:
+        from uuid import uuid4  # Keep local import for utility
 
         callback_id = str(uuid4())
-        self.minute_callbacks[callback_id] = callback
+        callbacks[callback_id] = callback
+        if batched:
+            self.batched_callback_ids.add(callback_id)
 
         def unregister():
-            self.minute_callbacks.pop(callback_id, None)
+            callbacks.pop(callback_id, None)
+            self.batched_callback_ids.discard(callback_id)
 
         return unregister
 
-    def _process_scheduled_events(self) -> None:
+    def _process_scheduled_events(self, include_batched: bool = True) -> None:
         """Process any scheduled events that are due."""
-        current_clock_time = self.time.hours
+        self._sync_event_index()
+        self._fire_due_events(self.event_heap)
+        if include_batched:
+            self._fire_due_events(self.batched_event_heap)
+        self._compact_events()
 
-        # Iterate safely for modification
-        new_scheduled_events_data = []
-        processed_any = False
+    def _fire_due_events(self, heap: List[Tuple[float, int, str]]) -> None:
+        current_clock_time = self.time.hours
 
-        for event_data in self.scheduled_events_data:
-            if current_clock_time >= event_data["time"]:
-                processed_any = True
-                try:
-                    callback_func = get_callback(event_data["callback_name"])
-                    callback_func(**event_data["kwargs"])
-
-                    if event_data["repeat"]:
-                        event_data["time"] += event_data["interval"]
-                        new_scheduled_events_data.append(
-                            event_data
-                        )  # Re-add if repeating
-                    # else: it's removed by not re-adding
-                except Exception as e:
-                    print(
-                        f"Error processing event '{event_data.get('name', 'Unnamed')}': {e}"
-                    )
-                    # Decide if a failing repeating event should be rescheduled or not
-                    # For now, if it fails, it's not rescheduled.
+        # Events scheduled by the callbacks below wait for the next pass
+        seq_limit = self.event_seq
+        deferred = []
+
+        while heap and heap[0][0] <= current_clock_time:
+            entry = heapq.heappop(heap)
+            if not self._is_live_entry(entry):
+                continue  # Cancelled, or superseded by a reschedule
+            if entry[1] >= seq_limit:
+                deferred.append(entry)
+                continue
+
+            event_data = self.events_by_id[entry[2]]
+            occurrences = 1
+            if event_data["repeat"] and event_data["interval"] > 0:
+                # Catch up on every occurrence a long advance skipped
+                occurrences += int(
+                    (current_clock_time - event_data["time"]) // event_data["interval"]
+                )
             else:
-                new_scheduled_events_data.append(event_data)  # Keep if not yet due
+                del self.events_by_id[entry[2]]
 
-        if processed_any:
-            # Re-sort if any repeating events were re-added
-            self.scheduled_events_data = sorted(
-                new_scheduled_events_data, key=lambda e: e["time"]
-            )
-        else:
-            self.scheduled_events_data = new_scheduled_events_data
+            try:
+                callback_func = get_callback(event_data["callback_name"])
+                if event_data.get("batched"):
+                    callback_func(count=occurrences, **event_data["kwargs"])
+                else:
+                    for _ in range(occurrences):
+                        callback_func(**event_data["kwargs"])
+            except Exception as e:
+                print(
+                    f"Error processing event '{event_data.get('name', 'Unnamed')}': {e}"
+                )
+                # A failing repeating event is not rescheduled
+                self.events_by_id.pop(entry[2], None)
+                continue
+
+            if entry[2] in self.events_by_id:
+                event_data["time"] += occurrences * event_data["interval"]
+                self._index_event(event_data)
+
+        for entry in deferred:
+            heapq.heappush(heap, entry)
 
     def _process_time_callbacks(self) -> None:
         """Process time-based callbacks (day, hour, minute changes)."""
         current_hour_val = int(self.time.hour_of_day)
         current_minute_val = int((self.time.hour_of_day % 1) * 60)
 
-        day_changed = False
         if self.time.day != self.last_day_field:
             self.last_day_field = self.time.day
-            day_changed = True
-            for callback_id, callback_func in list(self.day_callbacks.items()):
-                try:
-                    callback_func(self.time.day)
-                except Exception as e:
-                    print(f"Error in day change callback (id: {callback_id}): {e}")
+            self._call_per_boundary(self.day_callbacks, self.time.day, "day")
 
-        hour_changed = False
         if current_hour_val != self.last_hour_field:
             self.last_hour_field = current_hour_val
-            hour_changed = True
-            for callback_id, callback_func in list(self.hour_callbacks.items()):
-                try:
-                    callback_func(current_hour_val)
-                except Exception as e:
-                    print(f"Error in hour change callback (id: {callback_id}): {e}")
+            self._call_per_boundary(self.hour_callbacks, current_hour_val, "hour")
 
-        minute_changed = False
         if current_minute_val != self.last_minute_field:
             self.last_minute_field = current_minute_val
-            minute_changed = True
-            for callback_id, callback_func in list(self.minute_callbacks.items()):
-                try:
-                    callback_func(current_minute_val)
-                except Exception as e:
-                    print(f"Error in minute change callback (id: {callback_id}): {e}")
+            self._call_per_boundary(self.minute_callbacks, current_minute_val, "minute")
 
             # Dispatch general time update event (e.g. every minute)
             self.event_bus_field.dispatch(
@@ -584,6 +650,18 @@ class GameClock(BaseModel):
         # The specific on_time_advanced_handler is usually for the main GameState update loop.
         # Let's assume advance_time handles calling this directly.
 
+    def _call_per_boundary(
+        self, callbacks: Dict[str, Callable[[int], None]], value: int, unit: str
+    ) -> None:
+        """Call the non-batched callbacks for one crossed boundary."""
+        for callback_id, callback_func in list(callbacks.items()):
+            if callback_id in self.batched_callback_ids:
+                continue  # Called once per advance by _process_batched_callbacks
+            try:
+                callback_func(value)
+            except Exception as e:
+                print(f"Error in {unit} change callback (id: {callback_id}): {e}")
+
     def advance(self, hours: float) -> None:
         """Advance time by the specified number of hours.
 
@@ -605,13 +683,25 @@ class GameClock(BaseModel):
             return
 
         old_time_hours = self.time.hours
-        self.time.hours += hours
+        target_hours = old_time_hours + hours
 
-        # Process scheduled events before time callbacks, as events might trigger further state changes
-        self._process_scheduled_events()
+        # Step through the skipped interval, stopping only at scheduled events and
+        # at boundaries that have per-boundary subscribers
+        while True:
+            stop, at_boundary = self._next_stop(target_hours)
+            self.time.hours = stop
+
+            # Scheduled events run before time callbacks, as they may change state
+            self._process_scheduled_events(include_batched=stop >= target_hours)
+
+            if stop >= target_hours:
+                break
+            if at_boundary:
+                self._process_time_callbacks()
 
         # Process general time-based callbacks (day/hour/minute changes)
         self._process_time_callbacks()
+        self._process_batched_callbacks(old_time_hours, target_hours)
 
         # Explicitly call the GameState's on_time_advanced handler if it's set
         if self.on_time_advanced_handler:
@@ -633,6 +723,61 @@ class GameClock(BaseModel):
             )
         )
 
+    def _next_stop(self, target_hours: float) -> Tuple[float, bool]:
+        """Find the next time advance_time must stop at on its way to target_hours."""
+        now = self.time.hours
+        stop = target_hours
+        if self.event_heap and now < self.event_heap[0][0] < stop:
+            stop = self.event_heap[0][0]
+
+        at_boundary = False
+        for callbacks, minutes_per_step in (
+            (self.day_callbacks, 24 * 60),
+            (self.hour_callbacks, 60),
+            (self.minute_callbacks, 1),
+        ):
+            if not any(cid not in self.batched_callback_ids for cid in callbacks):
+                continue
+            step = math.floor(now * 60 / minutes_per_step + 1e-9) + 1
+            boundary = step * minutes_per_step / 60
+            if boundary <= stop:
+                stop, at_boundary = boundary, True
+        return stop, at_boundary
+
+    def _process_batched_callbacks(self, old_hours: float, new_hours: float) -> None:
+        """Call batched time callbacks once with how many boundaries were crossed."""
+        if not self.batched_callback_ids:
+            return
+
+        old_minutes = math.floor(old_hours * 60 + 1e-9)
+        new_minutes = math.floor(new_hours * 60 + 1e-9)
+        for callbacks, count, value in (
+            (
+                self.day_callbacks,
+                new_minutes // 1440 - old_minutes // 1440,
+                self.time.day,
+            ),
+            (
+                self.hour_callbacks,
+                new_minutes // 60 - old_minutes // 60,
+                int(self.time.hour_of_day),
+            ),
+            (
+                self.minute_callbacks,
+                new_minutes - old_minutes,
+                int((self.time.hour_of_day % 1) * 60),
+            ),
+        ):
+            if count <= 0:
+                continue
+            for callback_id, callback_func in list(callbacks.items()):
+                if callback_id not in self.batched_callback_ids:
+                    continue
+                try:
+                    callback_func(value, count)
+                except Exception as e:
+                    print(f"Error in batched time callback (id: {callback_id}): {e}")
+
     # _fire_time_based_events seems to be duplicative of _process_time_callbacks
     # and the direct call to on_time_advanced_handler. It is removed to simplify.
 
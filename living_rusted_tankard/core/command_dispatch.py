@@ -0,0 +1,126 @@
+"""
+Table-driven command dispatch.
+
+Each command is a ``CommandSpec``: a name of one or more words, a handler
+called as ``handler(game_state, args)``, and an argument schema (how many
+words may follow the name, and the usage shown when they do not fit).
+``CommandRegistry.dispatch`` looks up the longest registered phrase at the
+start of the input, so dispatch costs a few dict lookups however many
+commands exist. Handler tables that already use the ``(game_state, args)``
+signature, such as ``BOUNTY_COMMAND_HANDLERS``, register as they are.
+
+A handler may return None to decline its input, which the caller then
+treats as an unknown command.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from .fuzzy_index import BKTree
+
+_SUGGESTION_CACHE_SIZE = 1024
+
+Handler = Callable[[Any, List[str]], Optional[Dict[str, Any]]]
+
+
+@dataclass(frozen=True)
+class CommandSpec:
+    """A command name, its handler and the arguments it takes."""
+
+    name: str
+    handler: Handler
+    min_args: int = 0
+    max_args: Optional[int] = None
+    usage: str = ""
+
+    def accepts(self, args: Sequence[str]) -> bool:
+        return len(args) >= self.min_args and (
+            self.max_args is None or len(args) <= self.max_args
+        )
+
+
+class CommandRegistry:
+    """Command names and aliases mapped to their specs."""
+
+    def __init__(self):
+        self._specs: Dict[str, CommandSpec] = {}
+        self._longest = 1
+        self._suggestions: Optional[BKTree] = None
+        self._suggested: Dict[Tuple[str, Optional[int]], Optional[str]] = {}
+
+    def register(
+        self,
+        name: str,
+        handler: Handler,
+        *,
+        min_args: int = 0,
+        max_args: Optional[int] = None,
+        usage: str = "",
+        aliases: Sequence[str] = (),
+    ) -> CommandSpec:
+        """Register a command under its name and any aliases."""
+        spec = CommandSpec(name, handler, min_args, max_args, usage or name)
+        for key in (name, *aliases):
+            self._add(key, spec)
+        return spec
+
+    def register_table(self, handlers: Mapping[str, Handler]) -> None:
+        """Register a ``{name: handler(game_state, args)}`` table."""
+        for name, handler in handlers.items():
+            self.register(name, handler)
+
+    def alias(self, alias: str, name: str) -> None:
+        """Make ``alias`` dispatch to the command registered as ``name``."""
+        self._add(alias, self._specs[name])
+
+    def _add(self, key: str, spec: CommandSpec) -> None:
+        self._specs[key] = spec
+        self._longest = max(self._longest, len(key.split()))
+        self._suggestions = None
+        self._suggested.clear()
+
+    def get(self, name: str) -> Optional[CommandSpec]:
+        return self._specs.get(name)
+
+    def resolve(self, words: Sequence[str]) -> Optional[Tuple[CommandSpec, List[str]]]:
+        """Find the command for a list of words, with the words left as arguments.
+
+        The longest phrase whose schema accepts the remaining words wins. If
+        phrases matched but none accepted its arguments, the longest of them
+        is returned so the caller can show its usage.
+        """
+        rejected = None
+        for length in range(min(self._longest, len(words)), 0, -1):
+            spec = self._specs.get(" ".join(words[:length]))
+            if spec is None:
+                continue
+            args = list(words[length:])
+            if spec.accepts(args):
+                return spec, args
+            rejected = rejected or (spec, args)
+        return rejected
+
+    def dispatch(self, game_state: Any, command: str) -> Optional[Dict[str, Any]]:
+        """Run a command, or return None if no registered command takes it."""
+        found = self.resolve(command.split())
+        if found is None:
+            return None
+        spec, args = found
+        if not spec.accepts(args):
+            return {"success": False, "message": f"Usage: {spec.usage}"}
+        return spec.handler(game_state, args)
+
+    def suggest(self, word: str, max_distance: Optional[int] = None) -> Optional[str]:
+        """The registered command word closest to a misspelled one.
+
+        Answers are remembered until the next registration, since players
+        tend to mistype the same few words.
+        """
+        key = (word, max_distance)
+        if key not in self._suggested:
+            if self._suggestions is None:
+                self._suggestions = BKTree(name.split()[0] for name in self._specs)
+            if len(self._suggested) >= _SUGGESTION_CACHE_SIZE:
+                self._suggested.clear()
+            self._suggested[key] = self._suggestions.closest(word, max_distance)
+        return self._suggested[key]
@@ -0,0 +1,223 @@
+"""
+Deterministic command grammar.
+
+Most player input is already a canonical command ("look", "buy ale",
+"interact gene talk"). ``CommandGrammar`` resolves those with a token trie
+built from the command vocabulary, so ``GameState.process_command`` only
+hands input to the LLM parser when the grammar cannot place it.
+
+Templates are written the way the in-game command list shows them. Words
+are literals and ``<name>`` is a one-word slot; ``<name...>`` takes the rest
+of the input. Slots named in ``NUMBER_SLOTS`` only accept numbers, and
+slots with a vocabulary (NPC ids, item ids, rooms, jobs) score lower for
+words the game does not know.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Container, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .command_normalizer import FILLER_WORDS, fix_command
+
+# Everything the "commands" command lists, in display order
+COMMAND_VOCABULARY: List[str] = [
+    # Basic commands
+    "look",
+    "wait",
+    "wait <hours>",
+    "status",
+    "inventory",
+    "help",
+    "commands",
+    # Movement
+    "move <room>",
+    # Economic
+    "buy <item>",
+    "use <item>",
+    "gamble <amount>",
+    "games",
+    "gambling stats",
+    # Jobs and work
+    "jobs",
+    "work <job>",
+    # Social and NPCs
+    "npcs",
+    "interact <npc> <action>",
+    # Bounties and quests
+    "bounties",
+    "read notice board",
+    "accept bounty <id>",
+    # Room management
+    "rent room",
+    "rent room with chest",
+    "store <item> <qty>",
+    "retrieve <item> <qty>",
+    "check storage",
+    # Sleep and time
+    "sleep",
+    "sleep <hours>",
+    "ask about sleep",
+    # System
+    "quit",
+    "exit",
+]
+
+# Canonical forms the command list leaves out
+EXTRA_TEMPLATES: List[str] = [
+    "yes",
+    "no",
+    "look around",
+    "wait <hours> hours",
+    "sleep <hours> hours",
+    "interact <npc> talk <topic...>",
+    "play <game> <amount>",
+    "play <game> <amount> <guess>",
+]
+
+NUMBER_SLOTS = frozenset({"hours", "amount", "qty"})
+
+# Score for a word in a vocabulary slot that the game does not recognise
+UNKNOWN_WORD_CONFIDENCE = 0.6
+
+# Matches below this go to the LLM parser instead
+DEFAULT_MIN_CONFIDENCE = 0.75
+
+_NUMBER = re.compile(r"^\d+(?:\.\d+)?$")
+_PUNCTUATION = re.compile(r"[^\w\s.'-]")
+
+
+@dataclass
+class GrammarMatch:
+    """A command the grammar resolved, with how sure it is."""
+
+    command: str
+    template: str
+    confidence: float
+
+
+class _Node:
+    __slots__ = ("literals", "slots", "rest_slot", "template")
+
+    def __init__(self):
+        self.literals: Dict[str, "_Node"] = {}
+        self.slots: Dict[str, "_Node"] = {}
+        self.rest_slot: Optional[Tuple[str, str]] = None
+        self.template: Optional[str] = None
+
+
+class CommandGrammar:
+    """Token trie over command templates, with parse hit-rate counters."""
+
+    def __init__(
+        self,
+        templates: Optional[Iterable[str]] = None,
+        min_confidence: float = DEFAULT_MIN_CONFIDENCE,
+    ):
+        self.min_confidence = min_confidence
+        self.stats: Dict[str, int] = {"grammar": 0, "miss": 0, "llm": 0}
+        self._root = _Node()
+        if templates is None:
+            templates = COMMAND_VOCABULARY + EXTRA_TEMPLATES
+        for template in templates:
+            self.add_template(template)
+
+    def add_template(self, template: str) -> None:
+        """Add a command template such as ``"buy <item>"``."""
+        node = self._root
+        for word in template.split():
+            if word.startswith("<") and word.endswith("...>"):
+                node.rest_slot = (word[1:-4], template)
+                return
+            if word.startswith("<"):
+                node = node.slots.setdefault(word[1:-1], _Node())
+            else:
+                node = node.literals.setdefault(word, _Node())
+        node.template = template
+
+    @staticmethod
+    def tokenize(text: str) -> List[str]:
+        """Lower-case, drop punctuation and filler words, apply spelling fixes."""
+        text = _PUNCTUATION.sub(" ", text.lower())
+        words = [word.strip(".'") for word in text.split()]
+        text = " ".join(word for word in words if word and word not in FILLER_WORDS)
+        return fix_command(text).split()
+
+    def match(
+        self,
+        text: str,
+        vocabulary: Optional[Mapping[str, Container[str]]] = None,
+    ) -> Optional[GrammarMatch]:
+        """Return the best-scoring template match for text, if any."""
+        tokens = self.tokenize(text)
+        if not tokens:
+            return None
+        found = self._walk(self._root, tokens, 0, 1.0, vocabulary or {})
+        if not found:
+            return None
+        template, confidence = found
+        return GrammarMatch(" ".join(tokens), template, confidence)
+
+    def resolve(
+        self,
+        text: str,
+        vocabulary: Optional[Mapping[str, Container[str]]] = None,
+    ) -> Optional[GrammarMatch]:
+        """Return a match confident enough to skip the LLM, counting the outcome."""
+        found = self.match(text, vocabulary)
+        if found and found.confidence >= self.min_confidence:
+            self.stats["grammar"] += 1
+            return found
+        self.stats["miss"] += 1
+        return None
+
+    def get_stats(self) -> Dict[str, float]:
+        """Parse counts and the share of commands resolved without the LLM."""
+        total = self.stats["grammar"] + self.stats["miss"]
+        return {
+            **self.stats,
+            "hit_rate": self.stats["grammar"] / total if total else 0.0,
+        }
+
+    def _walk(
+        self,
+        node: _Node,
+        tokens: List[str],
+        position: int,
+        confidence: float,
+        vocabulary: Mapping[str, Container[str]],
+    ) -> Optional[Tuple[str, float]]:
+        if position == len(tokens):
+            return (node.template, confidence) if node.template else None
+
+        token = tokens[position]
+        best = None
+        literal = node.literals.get(token)
+        if literal:
+            best = self._walk(literal, tokens, position + 1, confidence, vocabulary)
+            if best and best[1] == confidence:
+                return best
+
+        for slot, child in node.slots.items():
+            score = self._score_slot(slot, token, vocabulary)
+            if score is None:
+                continue
+            found = self._walk(
+                child, tokens, position + 1, confidence * score, vocabulary
+            )
+            if found and (not best or found[1] > best[1]):
+                best = found
+
+        if node.rest_slot and (not best or confidence > best[1]):
+            best = (node.rest_slot[1], confidence)
+        return best
+
+    @staticmethod
+    def _score_slot(
+        slot: str, token: str, vocabulary: Mapping[str, Container[str]]
+    ) -> Optional[float]:
+        if slot in NUMBER_SLOTS:
+            return 1.0 if _NUMBER.match(token) else None
+        known = vocabulary.get(slot)
+        if known is None or token in known:
+            return 1.0
+        return UNKNOWN_WORD_CONFIDENCE
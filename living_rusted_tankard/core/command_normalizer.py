@@ -0,0 +1,220 @@
+"""
+Shared command normalization tables.
+
+The spelling fixes and phrase rewrites applied by
+``GameState._preprocess_command`` and the regex patterns used by the
+fallback command parser live here so the LLM response cache can reduce
+free-form input to the same canonical ``(intent, target)`` form. That lets
+"talk to the barkeep", "talk to barkeep" and "speak with the barkeep" share
+a single cache entry.
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+# Corrections for common misspellings of the command verb
+QUICK_FIXES: Dict[str, str] = {
+    "gambl": "gamble",
+    "gmable": "gamble",
+    "inv": "inventory",
+    "inven": "inventory",
+    "stat": "status",
+    "stats": "status",
+    "hlep": "help",
+    "halp": "help",
+    "mve": "move",
+    "mvoe": "move",
+    "wiat": "wait",
+    "waitt": "wait",
+    "bounty": "bounties",
+    "job": "jobs",
+    "game": "games",
+    "npc": "npcs",
+}
+
+# Room name fixes for move commands
+ROOM_FIXES: Dict[str, str] = {
+    "upstair": "upstairs",
+    "downstair": "downstairs",
+    "celler": "cellar",
+    "seller": "cellar",
+    "kitchen": "tavern_main",
+    "bar": "tavern_main",
+}
+
+# Item name fixes for buy/use commands
+ITEM_FIXES: Dict[str, str] = {
+    "beer": "ale",
+    "drink": "ale",
+    "food": "bread",
+    "potion": "ale",
+}
+
+# Regex patterns for the fallback parser: (pattern, action, default_target)
+COMMAND_PATTERNS: Dict[str, List[Tuple[str, str, Optional[str]]]] = {
+    "look": [
+        (r"^look(?: at| around)?$", "look", "room"),
+        (r"^look at (\w+)$", "look", None),
+        (r"^examine (\w+)$", "examine", None),
+    ],
+    "go": [
+        (r"^go to (\w+)$", "go", None),
+        (r"^walk to (\w+)$", "go", None),
+        (r"^enter (\w+)$", "enter", None),
+    ],
+    "talk": [
+        (r"^talk to (\w+)$", "talk", None),
+        (r"^speak with (\w+)$", "talk", None),
+        (r"^ask (\w+) about (\w+)$", "ask", None),
+    ],
+    "interact": [
+        (r"^take (\w+)$", "take", None),
+        (r"^get (\w+)$", "take", None),
+        (r"^use (\w+)(?: on (\w+))?$", "use", None),
+    ],
+    "meta": [
+        (r"^inventory$", "inventory", None),
+        (r"^help$", "help", None),
+        (r"^quit$", "quit", None),
+        (r"^exit$", "quit", None),
+    ],
+}
+
+# Game verbs and parser actions that mean the same thing for caching
+INTENT_ALIASES: Dict[str, str] = {
+    "examine": "look",
+    "enter": "go",
+    "move": "go",
+    "speak": "talk",
+    "chat": "talk",
+}
+
+# Parser actions that the game spells as a different command
+ACTION_COMMANDS: Dict[str, str] = {
+    "talk": "interact",
+    "ask": "interact",
+    "go": "move",
+    "take": "take",
+    "examine": "look",
+    "check": "look",
+}
+
+# Words that never change what the player asked for
+FILLER_WORDS = frozenset({"the", "a", "an", "some", "please", "my"})
+
+_COMPILED_PATTERNS = [
+    (re.compile(pattern), action, default_target)
+    for patterns in COMMAND_PATTERNS.values()
+    for pattern, action, default_target in patterns
+]
+_PUNCTUATION = re.compile(r"[^\w\s']")
+_LEADING_PREPOSITIONS = ("to ", "with ", "at ")
+
+
+def fix_command(command: str) -> str:
+    """Apply spelling fixes and phrase rewrites to a lower-cased command.
+
+    This is the state-independent part of ``GameState._preprocess_command``.
+    """
+    parts = command.split()
+    if parts and parts[0] in QUICK_FIXES:
+        parts[0] = QUICK_FIXES[parts[0]]
+        command = " ".join(parts)
+
+    # Fix specific patterns
+    if command.startswith("go to "):
+        command = command.replace("go to ", "move ")
+    elif command.startswith("go "):
+        command = command.replace("go ", "move ")
+    elif command.startswith("talk to "):
+        npc = command.replace("talk to ", "")
+        command = f"interact {npc} talk"
+    elif command.startswith("check "):
+        if "invent" in command:
+            command = "inventory"
+        elif "stat" in command:
+            command = "status"
+
+    # Fix room names in move commands
+    if command.startswith("move "):
+        parts = command.split()
+        if len(parts) >= 2 and parts[1] in ROOM_FIXES:
+            parts[1] = ROOM_FIXES[parts[1]]
+            command = " ".join(parts)
+
+    # Fix item names in buy/use commands
+    if command.startswith(("buy ", "use ")):
+        parts = command.split()
+        if len(parts) >= 2 and parts[1] in ITEM_FIXES:
+            parts[1] = ITEM_FIXES[parts[1]]
+            command = " ".join(parts)
+
+    return command
+
+
+def command_from_intent(intent: Dict[str, Any]) -> Optional[str]:
+    """Turn a parsed ``{"action", "target", "extras"}`` intent into a command.
+
+    Returns None when the intent has no usable action.
+    """
+    action = str(intent.get("action") or "").lower()
+    if not action or action == "unknown":
+        return None
+
+    action = ACTION_COMMANDS.get(action, action)
+    target = intent.get("target", "") or ""  # Handle None targets
+    # Clean up target - remove articles like "the", "a", "an"
+    target_words = target.split()
+    if target_words and target_words[0].lower() in ["the", "a", "an"]:
+        target = " ".join(target_words[1:])
+    extras = intent.get("extras") or {}
+
+    if action == "interact" and target:
+        command = f"interact {target} talk"
+        if "topic" in extras:
+            command += f" {extras['topic']}"
+        return command
+    return f"{action} {target}".strip()
+
+
+def canonicalize(user_input: str) -> Tuple[str, Optional[str]]:
+    """Reduce player input to an ``(intent, target)`` tuple.
+
+    Punctuation and filler words are dropped first, then the parser's regex
+    patterns are tried; anything they don't cover goes through
+    ``fix_command`` and is split into verb and remainder.
+    """
+    text = _PUNCTUATION.sub(" ", user_input.lower())
+    text = " ".join(word for word in text.split() if word not in FILLER_WORDS)
+    if not text:
+        return ("wait", None)
+
+    for pattern, action, default_target in _COMPILED_PATTERNS:
+        match = pattern.match(text)
+        if match:
+            groups = [group for group in match.groups() if group]
+            target = " ".join(groups) if groups else default_target
+            return _finish(action, target)
+
+    command = fix_command(text)
+    verb, _, rest = command.partition(" ")
+
+    # "interact <npc> talk" is how the game spells conversation
+    if verb == "interact" and rest.endswith(" talk"):
+        return _finish("talk", rest[: -len(" talk")])
+
+    for preposition in _LEADING_PREPOSITIONS:
+        if rest.startswith(preposition):
+            rest = rest[len(preposition) :]
+            break
+    return _finish(verb, rest or None)
+
+
+def _finish(action: str, target: Optional[str]) -> Tuple[str, Optional[str]]:
+    intent = INTENT_ALIASES.get(action, action)
+    if target:
+        if intent == "go":
+            target = ROOM_FIXES.get(target, target)
+        elif intent in ("buy", "use"):
+            target = ITEM_FIXES.get(target, target)
+    return (intent, target)
@@ -43,12 +43,19 @@ class GameConfig:
     AI_THINKING_DELAY: float = 2.0  # Seconds between AI actions
     AI_MAX_ACTIONS_PER_SESSION: int = 50
     LLM_REQUEST_TIMEOUT: int = 30
+    FUSED_LLM_TURNS: bool = True  # One LLM call returns command and narration
+    OLLAMA_KEEP_ALIVE: str = "30m"  # Model stays loaded this long after play
 
     # Server Configuration
     DEFAULT_GAME_PORT: int = 8888
     AI_OBSERVER_PORT: int = 8889
     MAX_CONCURRENT_SESSIONS: int = 100
     SESSION_TIMEOUT_HOURS: int = 24
+    MAX_LIVE_SESSIONS: int = 100  # GameStates kept in memory before spilling
+    SESSION_IDLE_TIMEOUT_MINUTES: int = 30
+    SESSION_SPILL_PATH: str = "session_spill.db"
+    WRITE_BEHIND_FLUSH_SECONDS: float = 2.0  # Max delay before a save hits the DB
+    WRITE_BEHIND_BATCH_SIZE: int = 50  # Pending saves that force an early flush
 
     # Time Configuration
     HOURS_PER_DAY: int = 24
@@ -59,6 +66,7 @@ class GameConfig:
     # Debug Configuration
     LOG_LEVEL: str = "INFO"
     ENABLE_DEBUG_MODE: bool = False
+    WATCH_STATIC_DATA: bool = False  # Re-parse data/*.json when it changes
 
     @classmethod
     def from_env(cls) -> "GameConfig":
@@ -1,22 +1,68 @@
 """Database session management."""
 
-from typing import Generator, Optional
+from typing import Any, Dict, Generator, Optional
 from sqlmodel import SQLModel, Session, create_engine
+from sqlalchemy import event
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool, StaticPool
 import os
 from pathlib import Path
 
 # Database URL - using SQLite for simplicity
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./taverna.db")
 
+# SQL logging is opt-in; echoing every statement costs more than the query
+DATABASE_ECHO = os.getenv("DATABASE_ECHO", "").lower() in ("true", "1", "yes", "on")
+DATABASE_POOL_SIZE = int(os.getenv("DATABASE_POOL_SIZE", "5"))
+DATABASE_MAX_OVERFLOW = int(os.getenv("DATABASE_MAX_OVERFLOW", "10"))
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+
+
+def engine_options(url: str) -> Dict[str, Any]:
+    """Pool and connection settings for a database URL.
+
+    File-backed SQLite would otherwise open a fresh connection per session,
+    and an in-memory database must share a single connection to be visible
+    to more than one session.
+    """
+    if not url.startswith("sqlite"):
+        return {
+            "pool_size": DATABASE_POOL_SIZE,
+            "max_overflow": DATABASE_MAX_OVERFLOW,
+            "pool_pre_ping": True,
+        }
+
+    options: Dict[str, Any] = {"connect_args": {"check_same_thread": False}}
+    if url in ("sqlite://", "sqlite:///:memory:"):
+        options["poolclass"] = StaticPool
+    else:
+        options["poolclass"] = QueuePool
+        options["pool_size"] = DATABASE_POOL_SIZE
+        options["max_overflow"] = DATABASE_MAX_OVERFLOW
+    return options
+
+
+def configure_sqlite(engine) -> None:
+    """Put every new SQLite connection in WAL mode.
+
+    WAL lets readers carry on while the write-behind worker commits, and
+    with WAL synchronous=NORMAL drops the fsync per commit without risking
+    corruption.
+    """
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+        cursor.close()
+
+
 # Create engine
-engine = create_engine(
-    DATABASE_URL,
-    echo=True,
-    connect_args={
-        "check_same_thread": False
-    },  # Set to False in production  # SQLite specific
-)
+engine = create_engine(DATABASE_URL, echo=DATABASE_ECHO, **engine_options(DATABASE_URL))
+if engine.dialect.name == "sqlite":
+    configure_sqlite(engine)
 
 # Session factory
 SessionLocal = sessionmaker(
@@ -0,0 +1,78 @@
+"""
+Groups of imports resolved the first time one of their names is used.
+
+Importing core.game_state used to import every optional phase module, the
+command handler tables and the LLM parser up front, although a CLI run or
+a fresh API worker needs few of them straight away. A ``DeferredImports``
+registry names where each object lives and imports the whole group on
+first access, so ``import core.game_state`` stays cheap.
+"""
+
+import importlib
+import logging
+import threading
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class DeferredImports:
+    """Names imported together from their modules on first use.
+
+    ``names`` maps each exported name to the module defining it; relative
+    module paths are resolved against ``package``. An ``optional`` group
+    that fails to import reports ``is_available() == False`` and raises
+    AttributeError for its names; a required group re-raises the
+    ImportError.
+    """
+
+    def __init__(
+        self,
+        label: str,
+        names: Dict[str, str],
+        package: Optional[str] = None,
+        optional: bool = False,
+    ):
+        self._label = label
+        self._names = dict(names)
+        self._package = package
+        self._optional = optional
+        self._values: Optional[Dict[str, Any]] = None
+        self._error: Optional[ImportError] = None
+        self._lock = threading.Lock()
+
+    def _resolve(self) -> Dict[str, Any]:
+        if self._values is not None:
+            return self._values
+        with self._lock:
+            if self._values is None and self._error is None:
+                try:
+                    self._values = {
+                        name: getattr(
+                            importlib.import_module(module, self._package), name
+                        )
+                        for name, module in self._names.items()
+                    }
+                except ImportError as e:
+                    if not self._optional:
+                        raise
+                    logger.warning(f"{self._label} import error: {e}")
+                    self._error = e
+        return self._values or {}
+
+    def is_available(self) -> bool:
+        """Whether the group imports cleanly (importing it if needed)."""
+        self._resolve()
+        return self._error is None
+
+    def is_loaded(self) -> bool:
+        """Whether the group has been imported yet, without importing it."""
+        return self._values is not None
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_") or name not in self._names:
+            raise AttributeError(name)
+        values = self._resolve()
+        if name not in values:
+            raise AttributeError(f"{name} is not available ({self._label})")
+        return values[name]
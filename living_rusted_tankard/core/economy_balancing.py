@@ -16,6 +16,8 @@ from dataclasses import dataclass
 from enum import Enum
 from datetime import datetime, timedelta
 
+from . import time_source
+
 logger = logging.getLogger(__name__)
 
 
@@ -57,7 +59,7 @@ class PlayerEconomicProfile:
 
     def __post_init__(self):
         if self.last_updated is None:
-            self.last_updated = datetime.now()
+            self.last_updated = time_source.now()
 
 
 class EconomyBalancer:
@@ -256,7 +258,7 @@ class EconomyBalancer:
 
         profile.current_gold += gold_change
         profile.transactions_count += 1
-        profile.last_updated = datetime.now()
+        profile.last_updated = time_source.now()
 
         # Update progression tier
         old_tier = profile.progression_tier
@@ -389,7 +391,7 @@ class EconomyBalancer:
                     "name": event.name,
                     "description": event.description,
                     "time_remaining": (
-                        (event.active_until - datetime.now()).total_seconds() / 3600
+                        (event.active_until - time_source.now()).total_seconds() / 3600
                         if event.active_until
                         else 0
                     ),
@@ -532,5 +534,5 @@ def trigger_economic_update(player_id: str) -> Optional[Dict[str, Any]]:
     """Trigger economic event update."""
     profile = economy_balancer.get_player_profile(player_id)
     return economy_balancer.update_economic_events(
-        datetime.now(), profile.progression_tier
+        time_source.now(), profile.progression_tier
     )
@@ -9,20 +9,27 @@ This module extends the original LLM Game Master with:
 - Context caching and intelligent context management
 """
 
+import asyncio
 import json
 import logging
 import os
 import re
-import requests
+import httpx
 import time
-from typing import Dict, List, Any, Optional, Tuple, Union
+from typing import AsyncIterator, Dict, List, Any, Optional, Tuple, Union
 from dataclasses import dataclass
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 import threading
 import functools
 
-from .narrative_actions import NarrativeActionProcessor
+from .command_normalizer import command_from_intent
+from .config import CONFIG
+from .ollama_transport import CircuitOpenError, get_ollama_transport
+from .prompt_assembly import get_prompt_assembler
+from .narrative_actions import (
+    ActionType,
+    NarrativeActionProcessor,
+    NarrativeStreamParser,
+)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -32,10 +39,21 @@ logger = logging.getLogger(__name__)
 MAX_HISTORY_LENGTH = 10
 DEFAULT_TIMEOUT = 30  # seconds
 MAX_RETRIES = 3
-BACKOFF_FACTOR = 1.0
 CONTEXT_CACHE_TTL = 300  # 5 minutes
 MAX_CONTEXT_SIZE = 2000  # characters
 
+# Appended to the system prompt for fused turns, where one call returns both
+# the command intent and the narration
+FUSED_TURN_FORMAT = """
+
+RESPONSE FORMAT:
+Reply with ONLY a JSON object:
+{"command": {"action": "verb", "target": "object_or_person", "extras": {}}, "narration": "your response to the player"}
+- "command" is the game command the input asks for, or null if it asks for none
+- Use game verbs: look, status, inventory, buy, use, move, interact, jobs, work, wait, sleep, help
+- Put conversation topics in extras as {"topic": "..."}
+- "narration" may use the narrative action tags above, except [COMMAND: ...]"""
+
 
 @dataclass
 class LLMChatMessage:
@@ -71,11 +89,17 @@ class LLMResponse:
 
 
 class ConnectionHealthMonitor:
-    """Monitor LLM service health and provide connection status."""
+    """Monitor LLM service health and provide connection status.
+
+    Check results also open or close the shared transport's circuit breaker;
+    a missing model is only marked unavailable, since the breaker covers
+    every model on the server.
+    """
 
     def __init__(self, ollama_url: str, model: str):
         self.ollama_url = ollama_url
         self.model = model
+        self.transport = get_ollama_transport(ollama_url)
         self.is_healthy = True
         self.last_check = 0
         self.consecutive_failures = 0
@@ -92,11 +116,11 @@ class ConnectionHealthMonitor:
             self.last_check = current_time
             try:
                 # Quick health check
-                response = requests.get(f"{self.ollama_url}/api/tags", timeout=5)
-                response.raise_for_status()
+                tags_data = self.transport.get_json(
+                    "/api/tags", timeout=5, retries=0, use_breaker=False
+                )
 
                 # Check if our model is available
-                tags_data = response.json()
                 available_models = [
                     model["name"] for model in tags_data.get("models", [])
                 ]
@@ -107,16 +131,20 @@ class ConnectionHealthMonitor:
                 if model_available:
                     self.is_healthy = True
                     self.consecutive_failures = 0
+                    self.transport.breaker.reset()
+                    self.transport.mark_model_available(self.model)
                     logger.debug(f"LLM health check passed - {self.model} available")
                 else:
                     logger.warning(
                         f"Model {self.model} not found in available models: {available_models}"
                     )
                     self.is_healthy = False
+                    self.transport.mark_model_unavailable(self.model)
 
             except Exception as e:
                 self.consecutive_failures += 1
                 self.is_healthy = False
+                self.transport.breaker.force_open()
                 logger.warning(
                     f"LLM health check failed ({self.consecutive_failures} consecutive): {e}"
                 )
@@ -204,10 +232,17 @@ class EnhancedLLMGameMaster:
         self,
         ollama_url: str = "http://localhost:11434",
         model: str = "long-gemma:latest",
+        fused: Optional[bool] = None,
     ):
-        """Initialize the Enhanced LLM Game Master."""
+        """Initialize the Enhanced LLM Game Master.
+
+        In fused mode (``CONFIG.FUSED_LLM_TURNS`` unless ``fused`` is given)
+        process_input gets the command intent and the narration from one
+        JSON-format call, so the command needs no separate parse.
+        """
         self.ollama_url = ollama_url
         self.model = model
+        self.fused = CONFIG.FUSED_LLM_TURNS if fused is None else fused
         self.conversation_histories: Dict[str, List[LLMChatMessage]] = {}
         self.current_conversations: Dict[str, Dict[str, Any]] = {}
         self.session_memories: Dict[str, List[Dict[str, Any]]] = {}
@@ -217,19 +252,17 @@ class EnhancedLLMGameMaster:
         self.context_optimizer = ContextOptimizer()
         self.action_processor = NarrativeActionProcessor()
 
-        # Configure robust HTTP session
-        self.session = requests.Session()
-        retry_strategy = Retry(
-            total=MAX_RETRIES,
-            backoff_factor=BACKOFF_FACTOR,
-            status_forcelist=[429, 500, 502, 503, 504],
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        # Pooled, retrying HTTP transport shared with the other LLM clients
+        self.transport = get_ollama_transport(ollama_url)
 
-        # System prompt
-        self.system_prompt = self._get_enhanced_system_prompt()
+        # Static system prompts, shared so Ollama can reuse their evaluation
+        self.prompts = get_prompt_assembler()
+        self.system_prompt = self.prompts.prefix(
+            model, "game_master", self._get_enhanced_system_prompt
+        )
+        self.fused_system_prompt = self.prompts.prefix(
+            model, "game_master_fused", lambda: self.system_prompt + FUSED_TURN_FORMAT
+        )
 
         # Fallback responses
         self.fallback_responses = self._initialize_fallback_responses()
@@ -316,9 +349,11 @@ Be concise but atmospheric. Focus on advancing the story and providing clear pla
                     )
                     return LLMResponse(
                         content=response_text,
-                        command=command
-                        if command in ["look", "status", "inventory"]
-                        else None,
+                        command=(
+                            command
+                            if command in ["look", "status", "inventory"]
+                            else None
+                        ),
                         was_fallback=True,
                     )
 
@@ -401,34 +436,15 @@ Be concise but atmospheric. Focus on advancing the story and providing clear pla
 
         return context
 
-    def process_input(
-        self, user_input: str, game_state, session_id: str
-    ) -> Tuple[str, Optional[str], List[Dict[str, Any]]]:
-        """Process user input with enhanced error handling and fallbacks."""
-        start_time = time.time()
-
-        # Check service availability first
-        if not self.is_service_available():
-            logger.warning("LLM service unavailable, using fallback response")
-
-            # Build game context for enhanced fallback
-            game_context = {}
-            try:
-                from .time_display import get_time_context_for_llm
-
-                game_context["current_time"] = get_time_context_for_llm(
-                    game_state.clock.current_time_hours
-                )
-                present_npcs = game_state.get_present_npcs()
-                game_context["present_npcs"] = [npc.name for npc in present_npcs]
-            except Exception:
-                game_context = {"current_time": "evening", "present_npcs": []}
-
-            fallback = self.get_fallback_response(user_input, session_id, game_context)
-            return fallback.content, fallback.command, fallback.actions or []
-
-        user_input_lower = user_input.lower().strip()
+    def _build_messages(
+        self, user_input: str, game_state, session_id: str, fused: bool = False
+    ) -> List[Dict[str, str]]:
+        """Assemble the chat messages (prompt, history, context, memory, input).
 
+        The static system prompt and the conversation history come first so
+        consecutive turns share them as a prefix; game state and memory
+        change every turn and go last, just before the input.
+        """
         # Build optimized context
         context_str = self._build_optimized_context(game_state, session_id)
 
@@ -436,24 +452,14 @@ Be concise but atmospheric. Focus on advancing the story and providing clear pla
         history = self.get_conversation_history(session_id)
         optimized_history = self._optimize_conversation_history(history)
 
-        # Prepare messages
-        messages = [{"role": "system", "content": self.system_prompt}]
-
-        # Add context
-        messages.append({"role": "system", "content": context_str})
-
-        # Add optimized conversation history
-        messages.extend([msg.to_dict() for msg in optimized_history])
-
         # Add enhanced memory context
+        memory_str = ""
         try:
             from .memory import get_memory_context_for_llm
 
             memory_context = get_memory_context_for_llm(session_id, user_input)
             if memory_context:
-                messages.append(
-                    {"role": "system", "content": f"MEMORY: {memory_context}"}
-                )
+                memory_str = f"MEMORY: {memory_context}"
         except ImportError:
             # Fallback to basic session memories
             if session_id in self.session_memories:
@@ -464,15 +470,35 @@ Be concise but atmospheric. Focus on advancing the story and providing clear pla
                     memory_text = " | ".join(
                         [mem.get("content", "") for mem in recent_memories]
                     )
-                    messages.append(
-                        {"role": "system", "content": f"MEMORY: {memory_text}"}
-                    )
+                    memory_str = f"MEMORY: {memory_text}"
+
+        system_prompt = self.fused_system_prompt if fused else self.system_prompt
+        return self.prompts.chat_messages(
+            system_prompt,
+            [msg.to_dict() for msg in optimized_history],
+            [context_str, memory_str],
+            user_input,
+        )
+
+    def process_input(
+        self, user_input: str, game_state, session_id: str
+    ) -> Tuple[str, Optional[str], List[Dict[str, Any]]]:
+        """Process user input with enhanced error handling and fallbacks."""
+        start_time = time.time()
 
-        # Add current user input
-        messages.append({"role": "user", "content": user_input})
+        # Check service availability first
+        if not self.is_service_available():
+            logger.warning("LLM service unavailable, using fallback response")
+
+            fallback = self._fallback_for_state(user_input, game_state, session_id)
+            return fallback.content, fallback.command, fallback.actions or []
+
+        messages = self._build_messages(
+            user_input, game_state, session_id, fused=self.fused
+        )
 
         try:
-            response = self._make_llm_request(messages, session_id)
+            response = self._make_llm_request(messages, session_id, fused=self.fused)
 
             # Process successful response
             response.response_time = time.time() - start_time
@@ -491,27 +517,129 @@ Be concise but atmospheric. Focus on advancing the story and providing clear pla
             logger.error(f"LLM request failed: {e}", exc_info=True)
 
             # Intelligent fallback based on input with game context
-            game_context = {}
-            try:
-                from .time_display import get_time_context_for_llm
-
-                game_context["current_time"] = get_time_context_for_llm(
-                    game_state.clock.current_time_hours
-                )
-                present_npcs = game_state.get_present_npcs()
-                game_context["present_npcs"] = [npc.name for npc in present_npcs]
-            except Exception:
-                game_context = {"current_time": "evening", "present_npcs": []}
-
-            fallback = self.get_fallback_response(user_input, session_id, game_context)
+            fallback = self._fallback_for_state(user_input, game_state, session_id)
             fallback.response_time = time.time() - start_time
 
             return fallback.content, fallback.command, fallback.actions or []
 
-    def _make_llm_request(self, messages: List[Dict], session_id: str) -> LLMResponse:
-        """Make request to LLM with robust error handling."""
-        api_url = f"{self.ollama_url}/api/chat"
+    def _fallback_for_state(
+        self, user_input: str, game_state, session_id: str
+    ) -> LLMResponse:
+        """Fallback response using whatever game context can be read."""
+        game_context = {}
+        try:
+            from .time_display import get_time_context_for_llm
+
+            game_context["current_time"] = get_time_context_for_llm(
+                game_state.clock.current_time_hours
+            )
+            present_npcs = game_state.get_present_npcs()
+            game_context["present_npcs"] = [npc.name for npc in present_npcs]
+        except Exception:
+            game_context = {"current_time": "evening", "present_npcs": []}
+
+        return self.get_fallback_response(user_input, session_id, game_context)
+
+    async def process_input_stream(
+        self, user_input: str, game_state, session_id: str
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream a response as events while Ollama generates it.
+
+        Yields ``{"type": "token", "text": ...}`` for narration with action
+        tags removed, ``{"type": "command", "command": ...}`` as soon as a
+        ``[COMMAND: ...]`` tag is complete, and finally ``{"type": "done",
+        "content", "command", "actions", "was_fallback"}``. Failures before
+        the first token end with the fallback response instead.
+        """
+        loop = asyncio.get_running_loop()
+        start_time = time.time()
+
+        available = await loop.run_in_executor(None, self.is_service_available)
+        if not available:
+            logger.warning("LLM service unavailable, using fallback response")
+            fallback = self._fallback_for_state(user_input, game_state, session_id)
+            yield self._done_event(fallback)
+            return
 
+        messages = await loop.run_in_executor(
+            None, self._build_messages, user_input, game_state, session_id
+        )
+        data = {
+            "model": self.model,
+            "messages": messages,
+            "stream": True,
+            "options": {"temperature": 0.7, "top_p": 0.9, "num_predict": 400},
+        }
+        self.prompts.with_keep_alive(data, session_id)
+
+        parser = NarrativeStreamParser(self.action_processor)
+        raw: List[str] = []
+        shown: List[str] = []
+        command = None
+
+        try:
+            async for chunk in self.transport.astream_json(
+                "/api/chat", data, model=self.model, timeout=DEFAULT_TIMEOUT
+            ):
+                if chunk.get("done"):
+                    self.prompts.record("game_master_stream", chunk)
+                token = chunk.get("message", {}).get("content", "")
+                if not token:
+                    continue
+                raw.append(token)
+                text, actions = parser.feed(token)
+                if text:
+                    shown.append(text)
+                    yield {"type": "token", "text": text}
+                for action in actions:
+                    if action.action_type == ActionType.COMMAND and command is None:
+                        command = action.raw_text.strip()
+                        yield {"type": "command", "command": command}
+        except Exception as e:
+            logger.error(f"LLM stream failed: {e}", exc_info=True)
+            if not raw:
+                fallback = self._fallback_for_state(user_input, game_state, session_id)
+                fallback.response_time = time.time() - start_time
+                yield self._done_event(fallback)
+                return
+
+        rest = parser.flush()
+        if rest:
+            shown.append(rest)
+            yield {"type": "token", "text": rest}
+
+        # Store memories from the raw text; the narration shown has no tags
+        self._extract_memories_from_response("".join(raw), session_id)
+        content = self.action_processor.clean_text("".join(shown))
+
+        self.add_to_history(session_id, LLMChatMessage(role="user", content=user_input))
+        self.add_to_history(
+            session_id, LLMChatMessage(role="assistant", content=content)
+        )
+
+        yield self._done_event(
+            LLMResponse(
+                content=content,
+                command=command,
+                actions=[],
+                response_time=time.time() - start_time,
+            )
+        )
+
+    @staticmethod
+    def _done_event(response: LLMResponse) -> Dict[str, Any]:
+        return {
+            "type": "done",
+            "content": response.content,
+            "command": response.command,
+            "actions": response.actions or [],
+            "was_fallback": response.was_fallback,
+        }
+
+    def _make_llm_request(
+        self, messages: List[Dict], session_id: str, fused: bool = False
+    ) -> LLMResponse:
+        """Make request to LLM with robust error handling."""
         data = {
             "model": self.model,
             "messages": messages,
@@ -522,14 +650,20 @@ Be concise but atmospheric. Focus on advancing the story and providing clear pla
                 "num_predict": 400,  # Limit response length
             },
         }
+        if fused:
+            data["format"] = "json"
+        self.prompts.with_keep_alive(data, session_id)
 
-        logger.debug(f"Making LLM request to {api_url}")
+        logger.debug(f"Making LLM request to {self.ollama_url}/api/chat")
 
         try:
-            response = self.session.post(api_url, json=data, timeout=DEFAULT_TIMEOUT)
-            response.raise_for_status()
-
-            response_data = response.json()
+            response_data = self.transport.post_json(
+                "/api/chat",
+                data,
+                model=self.model,
+                timeout=DEFAULT_TIMEOUT,
+                retries=MAX_RETRIES,
+            )
 
             if (
                 "message" not in response_data
@@ -537,7 +671,13 @@ Be concise but atmospheric. Focus on advancing the story and providing clear pla
             ):
                 raise ValueError("Invalid response format from LLM")
 
+            self.prompts.record(
+                "game_master_fused" if fused else "game_master", response_data
+            )
             llm_response = response_data["message"]["content"]
+            intent = None
+            if fused:
+                llm_response, intent = self._split_fused_reply(llm_response)
 
             # Process response
             llm_response = self._extract_memories_from_response(
@@ -552,35 +692,60 @@ Be concise but atmospheric. Focus on advancing the story and providing clear pla
                 # action_results = self.action_processor.process_actions(actions, game_state, session_id)
                 llm_response = self.action_processor.clean_text(llm_response)
 
-            # Extract command if present
-            command_to_execute = None
-            if "[COMMAND:" in llm_response:
-                command_start = llm_response.find("[COMMAND:") + 9
-                command_end = llm_response.find("]", command_start)
-                if command_end > command_start:
-                    command_to_execute = llm_response[command_start:command_end].strip()
-                    llm_response = llm_response[command_end + 1 :].strip()
+            # Prefer the structured intent, then any [COMMAND: ...] tag
+            command_to_execute = command_from_intent(intent) if intent else None
+            for action in actions:
+                if action.action_type == ActionType.COMMAND:
+                    command_to_execute = command_to_execute or action.raw_text.strip()
+                    break
+
+            token_counts = [
+                response_data[key]
+                for key in ("prompt_eval_count", "eval_count")
+                if key in response_data
+            ]
 
             return LLMResponse(
                 content=llm_response,
                 command=command_to_execute,
                 actions=action_results,
                 was_fallback=False,
+                token_usage=sum(token_counts) if token_counts else None,
             )
 
-        except requests.Timeout:
+        except httpx.TimeoutException:
             logger.error("LLM request timed out")
             raise Exception("Request timed out")
-        except requests.ConnectionError:
+        except (httpx.TransportError, CircuitOpenError):
             logger.error("Failed to connect to LLM service")
             raise Exception("Connection failed")
-        except requests.HTTPError as e:
+        except httpx.HTTPStatusError as e:
             logger.error(f"HTTP error from LLM service: {e}")
             raise Exception(f"HTTP error: {e}")
         except Exception as e:
             logger.error(f"Unexpected error in LLM request: {e}")
             raise
 
+    @staticmethod
+    def _split_fused_reply(text: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """Split a fused JSON reply into narration and command intent.
+
+        A reply that is not the expected JSON object is kept as narration.
+        """
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError:
+            return text, None
+        if not isinstance(data, dict) or "narration" not in data:
+            return text, None
+
+        intent = data.get("command")
+        if isinstance(intent, str):
+            action, _, target = intent.partition(" ")
+            intent = {"action": action, "target": target}
+        narration = str(data.get("narration") or "")
+        return narration, intent if isinstance(intent, dict) else None
+
     def _optimize_conversation_history(
         self, history: List[LLMChatMessage]
     ) -> List[LLMChatMessage]:
@@ -688,6 +853,9 @@ Be concise but atmospheric. Focus on advancing the story and providing clear pla
             "last_check": self.health_monitor.last_check,
             "model": self.model,
             "ollama_url": self.ollama_url,
+            "fused_turns": self.fused,
+            "transport": self.transport.get_stats(),
+            "prompts": self.prompts.get_stats(),
         }
 
 
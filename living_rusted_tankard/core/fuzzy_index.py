@@ -0,0 +1,155 @@
+"""
+BK-tree index for "did you mean" suggestions.
+
+A BK-tree files every word under its edit distance from a parent word. By
+the triangle inequality, a lookup for words within ``k`` edits of a query
+only needs the children whose distance label lies within ``k`` of the
+query's own distance to the node, so most of the tree is never compared.
+``GameState`` keeps one for command names, items, NPCs and rooms instead of
+running Levenshtein against every candidate on each typo.
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+def _pattern(word: str) -> Tuple[Dict[str, int], int]:
+    """Per-letter bitmasks of where each letter occurs in ``word``."""
+    masks: Dict[str, int] = {}
+    for i, char in enumerate(word):
+        masks[char] = masks.get(char, 0) | (1 << i)
+    return masks, len(word)
+
+
+def _distance(pattern: Tuple[Dict[str, int], int], text: str) -> int:
+    """Levenshtein distance from a ``_pattern`` to ``text``.
+
+    Myers' bit-parallel algorithm: one DP column is held in two integers
+    and advanced a letter of ``text`` at a time with a few bitwise ops,
+    instead of a Python-level loop over every cell.
+    """
+    masks, length = pattern
+    if not length:
+        return len(text)
+    full = (1 << length) - 1
+    last = 1 << (length - 1)
+    plus, minus, score = full, 0, length
+    for char in text:
+        eq = masks.get(char, 0)
+        xv = eq | minus
+        xh = (((eq & plus) + plus) ^ plus) | eq
+        h_plus = minus | (~(xh | plus) & full)
+        h_minus = plus & xh
+        if h_plus & last:
+            score += 1
+        elif h_minus & last:
+            score -= 1
+        h_plus = ((h_plus << 1) | 1) & full
+        h_minus = (h_minus << 1) & full
+        plus = h_minus | (~(xv | h_plus) & full)
+        minus = h_plus & xv
+    return score
+
+
+def edit_distance(a: str, b: str) -> int:
+    """Levenshtein distance between two strings."""
+    return _distance(_pattern(a), b)
+
+
+def typo_distance(a: str, b: str) -> int:
+    """Edit distance that counts swapping two adjacent letters as one edit.
+
+    Used to rank suggestions only: it is not a metric, so the tree itself is
+    built on ``edit_distance``.
+    """
+    rows = [list(range(len(b) + 1))]
+    for i in range(1, len(a) + 1):
+        row = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            row[j] = min(
+                rows[i - 1][j] + 1,
+                row[j - 1] + 1,
+                rows[i - 1][j - 1] + (a[i - 1] != b[j - 1]),
+            )
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                row[j] = min(row[j], rows[i - 2][j - 2] + 1)
+        rows.append(row)
+    return rows[-1][-1]
+
+
+class _Node:
+    __slots__ = ("word", "order", "children")
+
+    def __init__(self, word: str, order: int):
+        self.word = word
+        self.order = order
+        self.children: Dict[int, "_Node"] = {}
+
+
+class BKTree:
+    """Words indexed by edit distance for near-match lookups."""
+
+    def __init__(self, words: Iterable[str] = ()):
+        self._root: Optional[_Node] = None
+        self._size = 0
+        for word in words:
+            self.add(word)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, word: str) -> bool:
+        """Add a word; returns False if it was already present."""
+        if self._root is None:
+            self._root = _Node(word, 0)
+            self._size = 1
+            return True
+
+        node = self._root
+        while True:
+            distance = edit_distance(word, node.word)
+            if distance == 0:
+                return False
+            child = node.children.get(distance)
+            if child is None:
+                node.children[distance] = _Node(word, self._size)
+                self._size += 1
+                return True
+            node = child
+
+    def search(self, word: str, max_distance: int = 2) -> List[Tuple[int, str]]:
+        """All words within ``max_distance`` edits, nearest first.
+
+        Ties keep the order the words were added in.
+        """
+        pattern = _pattern(word)
+        found = []
+        pending = [self._root] if self._root else []
+        while pending:
+            node = pending.pop()
+            distance = _distance(pattern, node.word)
+            if distance <= max_distance:
+                found.append((distance, node.order, node.word))
+            low, high = distance - max_distance, distance + max_distance
+            pending.extend(
+                child for label, child in node.children.items() if low <= label <= high
+            )
+        found.sort()
+        return [(distance, match) for distance, _, match in found]
+
+    def closest(self, word: str, max_distance: Optional[int] = None) -> Optional[str]:
+        """Best suggestion for ``word``, or None if nothing is close enough.
+
+        ``max_distance`` defaults to half the word's length, capped at two, so
+        short words are not "corrected" into unrelated ones. A word that one
+        of them starts with (or that starts with the query) wins; otherwise
+        the fewest typos wins, counting a swapped pair of letters as one.
+        """
+        if max_distance is None:
+            max_distance = min(2, len(word) // 2)
+        matches = self.search(word, max_distance)
+        for _, match in matches:
+            if match.startswith(word) or word.startswith(match):
+                return match
+        if not matches:
+            return None
+        return min(matches, key=lambda match: typo_distance(word, match[1]))[1]
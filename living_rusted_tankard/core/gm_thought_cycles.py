@@ -10,10 +10,40 @@ import json
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass, field
 from enum import Enum
-import requests
+
+from .ollama_transport import get_ollama_transport
+from .prompt_assembly import get_prompt_assembler
 
 logger = logging.getLogger(__name__)
 
+# Static part of the thought prompt, sent unchanged on every cycle so Ollama
+# can reuse its evaluation; the current situation follows it.
+GM_THOUGHT_INSTRUCTIONS = """You are the Game Master for "The Living Rusted Tankard" tavern game.
+This is a HIDDEN thinking cycle - the player cannot see this.
+
+🧠 GM THINKING GOALS:
+1. Plan interesting events for the future
+2. Consider how NPCs should react to player behavior
+3. Think about story progression opportunities
+4. Plan atmosphere changes or world events
+5. Consider what the player might need or want
+
+💭 THOUGHT TYPES:
+- IMMEDIATE: React to recent player actions (spawn NPC, trigger event)
+- IMPORTANT: Plan major story beats or character moments
+- BACKGROUND: Develop world atmosphere, NPC personalities
+
+Generate ONE specific, actionable thought as JSON:
+{
+  "priority": "immediate|important|background",
+  "content": "What you're thinking about doing",
+  "action_type": "spawn_npc|trigger_event|modify_atmosphere|plan_story|update_npc",
+  "details": {"specific": "implementation details"},
+  "reasoning": "Why this is important now"
+}
+
+Focus on making the world feel alive and responsive to the player."""
+
 
 class GMThoughtPriority(Enum):
     IMMEDIATE = "immediate"  # Respond to player actions
@@ -126,10 +156,7 @@ class GMThoughtEngine:
     async def _generate_gm_thought(self, context: GameContext) -> Optional[GMThought]:
         """Generate a GM thought based on current game context."""
 
-        prompt = """You are the Game Master for "The Living Rusted Tankard" tavern game.
-This is a HIDDEN thinking cycle - the player cannot see this.
-
-CURRENT GAME SITUATION:
+        situation = f"""CURRENT GAME SITUATION:
 Recent Player Actions: {', '.join(context.player_actions[-5:])}
 Player Behavior Pattern: {context.recent_player_behavior}
 Game Time: {context.time_in_game} minutes
@@ -140,44 +167,29 @@ NPC STATES:
 {json.dumps(context.npc_states, indent=2)}
 
 WORLD STATE:
-{json.dumps(context.world_state, indent=2)}
-
-🧠 GM THINKING GOALS:
-1. Plan interesting events for the future
-2. Consider how NPCs should react to player behavior
-3. Think about story progression opportunities
-4. Plan atmosphere changes or world events
-5. Consider what the player might need or want
-
-💭 THOUGHT TYPES:
-- IMMEDIATE: React to recent player actions (spawn NPC, trigger event)
-- IMPORTANT: Plan major story beats or character moments
-- BACKGROUND: Develop world atmosphere, NPC personalities
-
-Generate ONE specific, actionable thought as JSON:
-{{
-  "priority": "immediate|important|background",
-  "content": "What you're thinking about doing",
-  "action_type": "spawn_npc|trigger_event|modify_atmosphere|plan_story|update_npc",
-  "details": {{"specific": "implementation details"}},
-  "reasoning": "Why this is important now"
-}}
-
-Focus on making the world feel alive and responsive to the player."""
+{json.dumps(context.world_state, indent=2)}"""
+        prompts = get_prompt_assembler()
+        prompt = prompts.join(
+            prompts.prefix(self.model, "gm_thought", lambda: GM_THOUGHT_INSTRUCTIONS),
+            situation,
+        )
 
         try:
-            response = requests.post(
-                f"{self.llm_endpoint}/api/generate",
-                json={
-                    "model": self.model,
-                    "prompt": prompt,
-                    "format": "json",
-                    "stream": False,
-                },
+            # Background work: keep_alive only while players are active
+            result = await get_ollama_transport(self.llm_endpoint).apost_json(
+                "/api/generate",
+                prompts.with_keep_alive(
+                    {
+                        "model": self.model,
+                        "prompt": prompt,
+                        "format": "json",
+                        "stream": False,
+                    }
+                ),
+                model=self.model,
                 timeout=20,
             )
-            response.raise_for_status()
-            result = response.json()
+            prompts.record("gm_thought", result)
 
             thought_data = json.loads(result.get("response", "{}"))
 
@@ -1,10 +1,12 @@
 """Item system for The Living Rusted Tankard."""
 
-import json
 from pathlib import Path
 from enum import Enum
-from typing import Dict, List, Optional
-from pydantic import BaseModel, Field
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel, Field, PrivateAttr
+
+from .static_data import get_static_data
 
 
 class ItemType(str, Enum):
@@ -25,6 +27,10 @@ class Item(BaseModel):
     base_price: int = 0
     effects: Dict[str, float] = Field(default_factory=dict)
 
+    class Config:
+        # Definitions are shared by every inventory in the process
+        allow_mutation = False
+
     def model_copy(self, *args, **kwargs):
         """For compatibility with Pydantic v2 - needed by NPC code."""
         return self.copy(*args, **kwargs)
@@ -42,6 +48,13 @@ class Inventory(BaseModel):
 
     items: Dict[str, InventoryItem] = Field(default_factory=dict)
 
+    # Goes up with every add/remove, so snapshots can tell when to rebuild
+    _revision: int = PrivateAttr(default=0)
+
+    @property
+    def revision(self) -> int:
+        return self._revision
+
     def add_item(self, item_id: str, quantity: int = 1) -> bool:
         """Add items to the inventory.
 
@@ -56,6 +69,7 @@ class Inventory(BaseModel):
         # If this exact item object is already in the inventory, just increase quantity
         if item_id in self.items:
             self.items[item_id].quantity += quantity
+            self._revision += 1
             return True
 
         # Otherwise, find the item in the definitions
@@ -63,6 +77,7 @@ class Inventory(BaseModel):
             self.items[item_id] = InventoryItem(
                 item=ITEM_DEFINITIONS[item_id], quantity=quantity
             )
+            self._revision += 1
             return True
 
         print(f"Warning: Item ID '{item_id}' not found in ITEM_DEFINITIONS.")
@@ -84,6 +99,7 @@ class Inventory(BaseModel):
 
             if self.items[item_id].quantity > quantity:
                 self.items[item_id].quantity -= quantity
+                self._revision += 1
                 return (
                     True,
                     f"Removed {quantity} {self.items[item_id].item.name}(s) from inventory.",
@@ -93,6 +109,7 @@ class Inventory(BaseModel):
                 # Remove the item entirely
                 item_name = self.items[item_id].item.name
                 del self.items[item_id]
+                self._revision += 1
                 return True, f"Removed all {item_name} from inventory"
             else:  # quantity to remove is greater than available
                 return (
@@ -229,6 +246,22 @@ TAVERN_ITEMS = {
 ITEM_DEFINITIONS = {}
 
 
+def parse_items(data: Dict[str, Any]) -> MappingProxyType:
+    """Build Items from items.json (shared, read-only)."""
+    items = {}
+    for item_data in data.get("items", []):
+        item = Item(
+            id=item_data["id"],
+            name=item_data["name"],
+            description=item_data.get("description", ""),
+            item_type=ItemType(item_data.get("item_type", "misc")),
+            base_price=item_data.get("base_price", 0),
+            effects=item_data.get("effects", {}),
+        )
+        items[item.id] = item
+    return MappingProxyType(items)
+
+
 def load_item_definitions(data_dir: Path = Path("data")) -> Dict[str, Item]:
     """Load item definitions from items.json and populate ITEM_DEFINITIONS."""
     global ITEM_DEFINITIONS
@@ -243,20 +276,8 @@ def load_item_definitions(data_dir: Path = Path("data")) -> Dict[str, Item]:
             print(f"Warning: Item definitions file not found at {items_file}")
             return ITEM_DEFINITIONS
 
-        with open(items_file, "r") as f:
-            data = json.load(f)
-
         # Add additional items from file
-        for item_data in data.get("items", []):
-            item = Item(
-                id=item_data["id"],
-                name=item_data["name"],
-                description=item_data.get("description", ""),
-                item_type=ItemType(item_data.get("item_type", "misc")),
-                base_price=item_data.get("base_price", 0),
-                effects=item_data.get("effects", {}),
-            )
-            ITEM_DEFINITIONS[item.id] = item
+        ITEM_DEFINITIONS.update(get_static_data().load(items_file, parse_items))
 
         return ITEM_DEFINITIONS
     except Exception as e:
@@ -0,0 +1,73 @@
+"""
+Subsystems that are built the first time they are used.
+
+GameState carries many optional subsystems (atmosphere, NPC psychology,
+narrative threads, character memory, ...) and most sessions only touch a
+few of them. Declaring one as a ``LazyComponent`` defers its construction
+to the first attribute access, and lets periodic update code skip anything
+that is not live yet.
+"""
+
+from typing import Any, Callable, Dict, Optional, Union
+
+
+class LazyComponent:
+    """Descriptor for a subsystem built on first access.
+
+    ``factory(instance)`` builds the value, which is then stored in the
+    instance ``__dict__`` so later reads are plain attribute lookups. After
+    the value is stored, ``setup(instance, value)`` runs, which lets it
+    reach other components or the new one itself without recursion. When
+    ``available`` is False (or a callable returning False) the attribute
+    raises AttributeError, so ``hasattr`` checks keep meaning "this
+    subsystem exists".
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[Any], Any],
+        available: Union[bool, Callable[[], bool]] = True,
+        setup: Optional[Callable[[Any, Any], None]] = None,
+    ):
+        self.factory = factory
+        self.available = available
+        self.setup = setup
+        self.name = ""
+
+    def is_available(self) -> bool:
+        return self.available() if callable(self.available) else self.available
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+        components = dict(getattr(owner, "_lazy_components", {}))
+        components[name] = self
+        owner._lazy_components = components
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        if not self.is_available():
+            raise AttributeError(f"{self.name} is not available")
+        value = self.factory(instance)
+        instance.__dict__[self.name] = value
+        if self.setup is not None:
+            self.setup(instance, value)
+        return value
+
+
+def is_live(instance: Any, name: str) -> bool:
+    """Whether the lazy component ``name`` has been built on ``instance``."""
+    return name in instance.__dict__
+
+
+def component_report(instance: Any) -> Dict[str, str]:
+    """Map each lazy component to "live", "dormant" or "unavailable"."""
+    report = {}
+    for name, component in getattr(type(instance), "_lazy_components", {}).items():
+        if is_live(instance, name):
+            report[name] = "live"
+        elif component.is_available():
+            report[name] = "dormant"
+        else:
+            report[name] = "unavailable"
+    return report
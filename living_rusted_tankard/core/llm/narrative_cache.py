@@ -3,17 +3,29 @@ Narrative Caching Layer
 
 This module provides a caching mechanism for narrative generation to improve performance
 by reusing previously generated narratives when the game state hasn't changed.
+
+Narratives live in two tiers: a bounded in-memory LRU cache for hot entries and
+a SQLite database on disk, so each insert writes a single row instead of
+rewriting the whole cache file.
 """
 
 import hashlib
 import json
+import sqlite3
+import threading
 from typing import Any, Dict, Optional
 import logging
 from pathlib import Path
-import os
+
+from ..lru_cache import LRUCache
 
 logger = logging.getLogger(__name__)
 
+# Anchored to the package, not the working directory the game was started from
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parents[2] / "data" / "cache" / "narrative"
+# Where older versions kept the JSON cache: relative to the working directory
+LEGACY_CACHE_DIR = Path(".narrative_cache")
+
 
 class NarrativeCache:
     """
@@ -21,40 +33,78 @@ class NarrativeCache:
     a hash of the game state.
     """
 
-    def __init__(self, cache_dir: str = ".narrative_cache"):
+    DB_FILENAME = "narrative_cache.sqlite3"
+    LEGACY_JSON_FILENAME = "narrative_cache.json"
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_memory_entries: int = 1000,
+        max_memory_bytes: Optional[int] = 8 * 1024 * 1024,
+    ):
         """
         Initialize the narrative cache.
 
         Args:
-            cache_dir: Directory to store cache files
+            cache_dir: Directory to store cache files (default: data/cache/narrative)
+            max_memory_entries: Maximum narratives kept in memory
+            max_memory_bytes: Memory budget for in-memory narratives
         """
-        self.cache_dir = Path(cache_dir)
-        self.cache_dir.mkdir(exist_ok=True)
-        self.cache: Dict[str, str] = {}
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # The default cache also picks up what older versions left behind
+        self._legacy_dirs = [self.cache_dir]
+        if not cache_dir:
+            self._legacy_dirs.append(LEGACY_CACHE_DIR)
+        self.cache = LRUCache(
+            max_entries=max_memory_entries,
+            ttl_seconds=None,
+            max_bytes=max_memory_bytes,
+        )
+        self._db_lock = threading.Lock()
+        self._db = self._open_db()
         self._load_cache()
 
+    def _open_db(self) -> Optional[sqlite3.Connection]:
+        """Open (and create if needed) the on-disk cache database."""
+        try:
+            conn = sqlite3.connect(
+                str(self.cache_dir / self.DB_FILENAME), check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS narratives ("
+                "state_hash TEXT PRIMARY KEY, narrative TEXT NOT NULL)"
+            )
+            conn.commit()
+            return conn
+        except sqlite3.Error as e:
+            logger.error(f"Error opening narrative cache database: {e}")
+            return None
+
     def _load_cache(self) -> None:
-        """Load the cache from disk if it exists."""
-        cache_file = self.cache_dir / "narrative_cache.json"
-        if cache_file.exists():
-            try:
-                with open(cache_file, "r", encoding="utf-8") as f:
-                    self.cache = json.load(f)
-                logger.info(
-                    f"Loaded {len(self.cache)} cached narratives from {cache_file}"
-                )
-            except Exception as e:
-                logger.error(f"Error loading narrative cache: {e}")
-                self.cache = {}
+        """Import legacy JSON cache files into the database, if any exist."""
+        for legacy_dir in self._legacy_dirs:
+            self._migrate_json(legacy_dir / self.LEGACY_JSON_FILENAME)
+
+    def _migrate_json(self, cache_file: Path) -> None:
+        """Import one legacy JSON cache file and rename it out of the way."""
+        if not cache_file.exists() or self._db is None:
+            return
 
-    def _save_cache(self) -> None:
-        """Save the cache to disk."""
-        cache_file = self.cache_dir / "narrative_cache.json"
         try:
-            with open(cache_file, "w", encoding="utf-8") as f:
-                json.dump(self.cache, f, indent=2)
+            with open(cache_file, "r", encoding="utf-8") as f:
+                legacy = json.load(f)
+            with self._db_lock:
+                self._db.executemany(
+                    "INSERT OR IGNORE INTO narratives VALUES (?, ?)", legacy.items()
+                )
+                self._db.commit()
+            cache_file.rename(cache_file.with_suffix(".json.migrated"))
+            logger.info(f"Migrated {len(legacy)} cached narratives from {cache_file}")
         except Exception as e:
-            logger.error(f"Error saving narrative cache: {e}")
+            logger.error(f"Error loading narrative cache: {e}")
 
     def _generate_state_hash(self, state: Dict[str, Any]) -> str:
         """
@@ -81,7 +131,26 @@ class NarrativeCache:
             The cached narrative, or None if not found
         """
         state_hash = self._generate_state_hash(state)
-        return self.cache.get(state_hash)
+        narrative = self.cache.get(state_hash)
+        if narrative is not None or self._db is None:
+            return narrative
+
+        try:
+            with self._db_lock:
+                row = self._db.execute(
+                    "SELECT narrative FROM narratives WHERE state_hash = ?",
+                    (state_hash,),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.error(f"Error reading narrative cache: {e}")
+            return None
+
+        if row is None:
+            return None
+
+        # Promote to the in-memory tier
+        self.cache.set(state_hash, row[0])
+        return row[0]
 
     def cache_narrative(self, state: Dict[str, Any], narrative: str) -> None:
         """
@@ -92,12 +161,46 @@ class NarrativeCache:
             narrative: The generated narrative to cache
         """
         state_hash = self._generate_state_hash(state)
-        self.cache[state_hash] = narrative
-        self._save_cache()
+        self.cache.set(state_hash, narrative)
+
+        if self._db is not None:
+            try:
+                with self._db_lock:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO narratives VALUES (?, ?)",
+                        (state_hash, narrative),
+                    )
+                    self._db.commit()
+            except sqlite3.Error as e:
+                logger.error(f"Error saving narrative cache: {e}")
+
         logger.debug(f"Cached narrative for state {state_hash[:8]}...")
 
     def clear_cache(self) -> None:
         """Clear the entire cache."""
-        self.cache = {}
-        self._save_cache()
+        self.cache.clear()
+        if self._db is not None:
+            try:
+                with self._db_lock:
+                    self._db.execute("DELETE FROM narratives")
+                    self._db.commit()
+            except sqlite3.Error as e:
+                logger.error(f"Error clearing narrative cache: {e}")
         logger.info("Narrative cache cleared")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Memory-tier counters plus the number of persisted narratives."""
+        stats = self.cache.get_stats()
+        if self._db is not None:
+            with self._db_lock:
+                stats["persisted"] = self._db.execute(
+                    "SELECT COUNT(*) FROM narratives"
+                ).fetchone()[0]
+        return stats
+
+    def close(self) -> None:
+        """Close the on-disk database."""
+        if self._db is not None:
+            with self._db_lock:
+                self._db.close()
+            self._db = None
@@ -18,7 +18,7 @@ logger = logging.getLogger(__name__)
 F = TypeVar("F", bound=Callable[..., str])
 
 
-def cached_narrative(cache_dir: str = ".narrative_cache") -> Callable[[F], F]:
+def cached_narrative(cache_dir: Optional[str] = None) -> Callable[[F], F]:
     """
     Decorator that adds caching to a narrative generation function.
 
@@ -26,7 +26,7 @@ def cached_narrative(cache_dir: str = ".narrative_cache") -> Callable[[F], F]:
     and return a string (the narrative).
 
     Args:
-        cache_dir: Directory to store cache files
+        cache_dir: Directory to store cache files (default: data/cache/narrative)
 
     Returns:
         A decorated function with caching
@@ -7,7 +7,7 @@ game state using a local LLM via Ollama.
 import json
 import logging
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Any, AsyncIterator, Dict, Optional
 
 from core.llm.ollama_client import ollama_client
 
@@ -24,6 +24,8 @@ except Exception as e:
     Provide a vivid, atmospheric description based on the game context in 2-4 paragraphs.
     Write in second-person present tense. Current context: {{context}}"""
 
+NARRATOR_SYSTEM = "You are a creative narrator for a text-based RPG."
+
 
 class Narrator:
     """Handles narrative generation for the game."""
@@ -56,18 +58,13 @@ class Narrator:
                 logger.debug("Returning cached narration")
                 return self.cache[cache_key]
 
-            # Format the prompt with the current context
-            prompt = NARRATOR_PROMPT.replace(
-                "{{context}}", json.dumps(context, indent=2)
-            )
-
             logger.debug(f"Generating narration for context: {context}")
 
             # Call the LLM to generate the narration
             response = await ollama_client.generate(
                 model=self.model,
-                prompt=prompt,
-                system="You are a creative narrator for a text-based RPG.",
+                prompt=self._prompt(context),
+                system=NARRATOR_SYSTEM,
                 temperature=0.7,  # Slightly more creative than the parser
                 format="text",
             )
@@ -85,6 +82,47 @@ class Narrator:
             # Fallback narration if LLM fails
             return self._fallback_narration(context)
 
+    async def narrate_stream(
+        self, context: Dict[str, Any], use_cache: bool = True
+    ) -> AsyncIterator[str]:
+        """Generate narrative prose, yielding it piece by piece as it is written.
+
+        Args:
+            context: A dictionary containing the current game state and context.
+            use_cache: Whether to use cached responses for the same context.
+
+        Yields:
+            Fragments of the narration; a cached narration arrives whole.
+        """
+        cache_key = json.dumps(context, sort_keys=True)
+        if use_cache and cache_key in self.cache:
+            logger.debug("Returning cached narration")
+            yield self.cache[cache_key]
+            return
+
+        parts = []
+        try:
+            async for token in ollama_client.generate_stream(
+                model=self.model,
+                prompt=self._prompt(context),
+                system=NARRATOR_SYSTEM,
+                options={"temperature": 0.7},
+            ):
+                parts.append(token)
+                yield token
+        except Exception as e:
+            logger.error(f"Error streaming narration: {e}")
+            if not parts:
+                yield self._fallback_narration(context)
+            return
+
+        if use_cache:
+            self.cache[cache_key] = "".join(parts).strip()
+
+    def _prompt(self, context: Dict[str, Any]) -> str:
+        """Format the narrator prompt with the current context."""
+        return NARRATOR_PROMPT.replace("{{context}}", json.dumps(context, indent=2))
+
     def _fallback_narration(self, context: Dict[str, Any]) -> str:
         """Generate a fallback narration when the LLM fails.
 
@@ -2,23 +2,25 @@
 
 import json
 import logging
-from typing import Dict, Any, Optional
+from typing import Any, AsyncIterator, Dict, Optional
 import httpx
 
+from ..ollama_transport import DEFAULT_OLLAMA_URL, get_ollama_transport
+
 logger = logging.getLogger(__name__)
 
 
 class OllamaClient:
     """Client for interacting with the Ollama API."""
 
-    def __init__(self, base_url: str = "http://localhost:11434"):
+    def __init__(self, base_url: str = DEFAULT_OLLAMA_URL):
         """Initialize the Ollama client.
 
         Args:
             base_url: Base URL of the Ollama API (default: http://localhost:11434)
         """
         self.base_url = base_url.rstrip("/")
-        self.client = httpx.AsyncClient()
+        self.transport = get_ollama_transport(self.base_url)
 
     async def generate(
         self,
@@ -40,7 +42,6 @@ class OllamaClient:
         Returns:
             The parsed JSON response from the API
         """
-        url = f"{self.base_url}/api/generate"
         payload = {"model": model, "prompt": prompt, "format": format, **kwargs}
 
         if system:
@@ -48,8 +49,9 @@ class OllamaClient:
 
         try:
             logger.debug(f"Sending request to Ollama: {payload}")
-            response = await self.client.post(url, json=payload)
-            response.raise_for_status()
+            response = await self.transport.arequest(
+                "POST", "/api/generate", json=payload, model=model
+            )
 
             # The response comes as a series of JSON objects, one per token
             full_response = ""
@@ -87,9 +89,37 @@ class OllamaClient:
             logger.error(f"Unexpected error calling Ollama API: {e}")
             raise
 
+    async def generate_stream(
+        self,
+        model: str,
+        prompt: str,
+        system: Optional[str] = None,
+        **kwargs,
+    ) -> AsyncIterator[str]:
+        """Generate a plain text completion, yielding tokens as they arrive.
+
+        Args:
+            model: The model to use (e.g., "long-gemma")
+            prompt: The prompt to send to the model
+            system: Optional system message to set the context
+            **kwargs: Additional parameters to pass to the API
+        """
+        payload = {"model": model, "prompt": prompt, "stream": True, **kwargs}
+
+        if system:
+            payload["system"] = system
+
+        logger.debug(f"Streaming request to Ollama: {payload}")
+        async for chunk in self.transport.astream_json(
+            "/api/generate", payload, model=model
+        ):
+            token = chunk.get("response", "")
+            if token:
+                yield token
+
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """Release the client's connections for the current event loop."""
+        await self.transport.aclose()
 
 
 # Singleton instance
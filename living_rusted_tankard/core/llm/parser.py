@@ -5,7 +5,9 @@ import json
 import logging
 from typing import Dict, Any, Optional, TypedDict, Literal
 from dataclasses import dataclass
-import requests
+
+from core.command_normalizer import COMMAND_PATTERNS
+from core.prompt_assembly import get_prompt_assembler
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -30,46 +32,87 @@ class GameSnapshot:
     player_state: Dict[str, Any]
 
 
+# Static part of the parser prompt. It is sent unchanged on every call so
+# Ollama can reuse its evaluation; the game context and input follow it.
+PARSER_INSTRUCTIONS = """You are the command parser for "The Living Rusted Tankard" medieval fantasy tavern game.
+
+COMMAND UNDERSTANDING RULES:
+Your job is to translate natural language into precise game commands that the engine understands.
+
+CORE COMMAND MAPPINGS:
+🗣️ Social/Communication:
+- "talk to [person]" / "speak with [person]" / "hey [person]" → "interact [person] talk"
+- "ask [person] about [topic]" → "interact [person] talk" (with topic in extras)
+
+🚶 Movement/Exploration:
+- "go to [place]" / "move to [place]" / "head to [place]" / "walk to [place]" → "move [place]"
+- "go [direction]" / "head [direction]" → "move [direction]"
+
+👁️ Observation/Information:
+- "look around" / "look" / "examine room" / "tell me about this place" → "look"
+- "look at [object]" / "examine [object]" → "look [object]"
+- "what time is it" / "check time" / "current time" → "status"
+- "where am I" / "what's my location" → "look"
+
+🎒 Inventory/Status:
+- "check my inventory" / "what do I have" / "show inventory" → "inventory"
+- "check my status" / "how am I doing" / "my condition" → "status"
+
+💰 Commerce/Economics:
+- "buy [item]" / "purchase [item]" / "I want to buy [item]" / "get me [item]" → "buy [item]"
+- "what can I buy" / "show items" / "what's for sale" → "look" (contextual)
+
+💼 Work/Jobs:
+- "jobs" / "what work is available" / "show me jobs" / "I'm looking for work" → "jobs"
+- "work [job_name]" / "do [job_name]" → "work [job_name]"
+
+📋 Information Systems:
+- "read notice board" / "check board" / "what's on the board" → "read notice board"
+- "bounties" / "quests" / "missions" → "read notice board"
+
+⏰ Time Management:
+- "wait" / "pass time" / "rest a bit" → "wait"
+- "wait [number]" / "wait [number] hours" → "wait [number]"
+- "sleep" / "rest" / "take a nap" → "sleep"
+
+❓ Help/Assistance:
+- "help" / "commands" / "what can I do" / "how do I play" → "help"
+
+RESPONSE FORMAT:
+Return ONLY valid JSON in this exact format:
+{
+    "action": "command_verb",
+    "target": "target_object_or_person",
+    "extras": {"additional_parameters": "if_needed"}
+}
+
+CRITICAL EXAMPLES:
+Input: "talk to the bartender" → {"action": "interact", "target": "bartender", "extras": {"interaction": "talk"}}
+Input: "I want to buy some ale" → {"action": "buy", "target": "ale", "extras": {}}
+Input: "what time is it?" → {"action": "status", "target": "", "extras": {}}
+Input: "go upstairs" → {"action": "move", "target": "upstairs", "extras": {}}
+Input: "check my inventory" → {"action": "inventory", "target": "", "extras": {}}
+Input: "hey there, what's going on?" → {"action": "look", "target": "", "extras": {}}
+
+Parse the player input below with full understanding of context and intent."""
+
+
 class Parser:
     def __init__(
         self,
         use_llm: bool = True,
         llm_endpoint: str = "http://localhost:11434",
         model: str = "long-gemma",
+        session_id: Optional[str] = None,
     ):
         self.use_llm = use_llm
         self.llm_endpoint = llm_endpoint
         self.llm_model = model  # Engine uses long-gemma by default
+        self.session_id = session_id  # Keeps the model loaded while played
+        self.prompts = get_prompt_assembler()
 
         # Define basic command patterns for fallback
-        self.command_patterns = {
-            "look": [
-                (r"^look(?: at| around)?$", "look", "room"),
-                (r"^look at (\w+)$", "look", None),
-                (r"^examine (\w+)$", "examine", None),
-            ],
-            "go": [
-                (r"^go to (\w+)$", "go", None),
-                (r"^walk to (\w+)$", "go", None),
-                (r"^enter (\w+)$", "enter", None),
-            ],
-            "talk": [
-                (r"^talk to (\w+)$", "talk", None),
-                (r"^speak with (\w+)$", "talk", None),
-                (r"^ask (\w+) about (\w+)$", "ask", None),
-            ],
-            "interact": [
-                (r"^take (\w+)$", "take", None),
-                (r"^get (\w+)$", "take", None),
-                (r"^use (\w+)(?: on (\w+))?$", "use", None),
-            ],
-            "meta": [
-                (r"^inventory$", "inventory", None),
-                (r"^help$", "help", None),
-                (r"^quit$", "quit", None),
-                (r"^exit$", "quit", None),
-            ],
-        }
+        self.command_patterns = COMMAND_PATTERNS
 
     def parse(self, text: str, snapshot: GameSnapshot) -> Command:
         """
@@ -89,36 +132,42 @@ class Parser:
 
     def _parse_with_llm(self, text: str, snapshot: GameSnapshot) -> Command:
         """Parse input using the Ollama LLM API."""
+        # Imported here so loading the parser does not pay for httpx
+        import httpx
+
+        from core.ollama_transport import CircuitOpenError, get_ollama_transport
+
         prompt = self._build_llm_prompt(text, snapshot)
 
         try:
             logger.debug(f"Sending LLM request for: '{text}'")
-            response = requests.post(
-                f"{self.llm_endpoint}/api/generate",
-                json={
-                    "model": self.llm_model,
-                    "prompt": prompt,
-                    "format": "json",
-                    "stream": False,
-                },
+            payload = {
+                "model": self.llm_model,
+                "prompt": prompt,
+                "format": "json",
+                "stream": False,
+            }
+            result = get_ollama_transport(self.llm_endpoint).post_json(
+                "/api/generate",
+                self.prompts.with_keep_alive(payload, self.session_id),
+                model=self.llm_model,
                 timeout=45,  # Enhanced prompt needs more processing time
             )
-            response.raise_for_status()
-            result = response.json()
             logger.debug(f"LLM raw response: {result}")
 
             # Parse the LLM response
             command_data = json.loads(result.get("response", "{}"))
             logger.debug(f"Parsed command data: {command_data}")
+            self.prompts.record("parser", result)
             return self._validate_command(command_data)
 
-        except (requests.RequestException, json.JSONDecodeError) as e:
+        except (httpx.HTTPError, CircuitOpenError, json.JSONDecodeError) as e:
             logger.error(f"LLM API error for '{text}': {e}")
             logger.error(f"Full error details: {type(e).__name__}: {str(e)}")
             raise Exception("Failed to parse with LLM") from e
 
     def _build_llm_prompt(self, text: str, snapshot: GameSnapshot) -> str:
-        """Construct the enhanced prompt for the long-Gemma LLM with comprehensive context."""
+        """Construct the parser prompt: static instructions, then game context and input."""
 
         # Build NPC context
         npc_context = ""
@@ -137,85 +186,18 @@ class Parser:
         else:
             inventory_context = "\nPlayer Inventory: Empty"
 
-        # Build player state context
-        player_context = """
-Player Status:
-  Gold: {snapshot.player_state.get('gold', 0)}
-  Energy: {snapshot.player_state.get('energy', 100)}%
-  Tiredness: {snapshot.player_state.get('tiredness', 0)}%"""
-
-        return """You are the command parser for "The Living Rusted Tankard" medieval fantasy tavern game.
-
-CURRENT GAME CONTEXT:
+        context = f"""CURRENT GAME CONTEXT:
 📍 Location: {snapshot.location}
 🕰️ Time: {snapshot.time_of_day}
 💰 Player Gold: {snapshot.player_state.get('gold', 0)}
-⚡ Player Energy: {snapshot.player_state.get('energy', 100)}%{npc_context}{inventory_context}
-
-PLAYER INPUT TO PARSE: "{text}"
-
-COMMAND UNDERSTANDING RULES:
-Your job is to translate natural language into precise game commands that the engine understands.
-
-CORE COMMAND MAPPINGS:
-🗣️ Social/Communication:
-- "talk to [person]" / "speak with [person]" / "hey [person]" → "interact [person] talk"
-- "ask [person] about [topic]" → "interact [person] talk" (with topic in extras)
-
-🚶 Movement/Exploration:
-- "go to [place]" / "move to [place]" / "head to [place]" / "walk to [place]" → "move [place]"
-- "go [direction]" / "head [direction]" → "move [direction]"
-
-👁️ Observation/Information:
-- "look around" / "look" / "examine room" / "tell me about this place" → "look"
-- "look at [object]" / "examine [object]" → "look [object]"
-- "what time is it" / "check time" / "current time" → "status"
-- "where am I" / "what's my location" → "look"
-
-🎒 Inventory/Status:
-- "check my inventory" / "what do I have" / "show inventory" → "inventory"
-- "check my status" / "how am I doing" / "my condition" → "status"
-
-💰 Commerce/Economics:
-- "buy [item]" / "purchase [item]" / "I want to buy [item]" / "get me [item]" → "buy [item]"
-- "what can I buy" / "show items" / "what's for sale" → "look" (contextual)
-
-💼 Work/Jobs:
-- "jobs" / "what work is available" / "show me jobs" / "I'm looking for work" → "jobs"
-- "work [job_name]" / "do [job_name]" → "work [job_name]"
-
-📋 Information Systems:
-- "read notice board" / "check board" / "what's on the board" → "read notice board"
-- "bounties" / "quests" / "missions" → "read notice board"
+⚡ Player Energy: {snapshot.player_state.get('energy', 100)}%{npc_context}{inventory_context}"""
 
-⏰ Time Management:
-- "wait" / "pass time" / "rest a bit" → "wait"
-- "wait [number]" / "wait [number] hours" → "wait [number]"
-- "sleep" / "rest" / "take a nap" → "sleep"
-
-❓ Help/Assistance:
-- "help" / "commands" / "what can I do" / "how do I play" → "help"
-
-CONTEXT-AWARE PARSING:
-{"🚫 No NPCs present - suggest 'wait' or 'move' for social commands" if not snapshot.visible_npcs else f"👥 NPCs available: {', '.join(snapshot.visible_npcs)}"}
-
-RESPONSE FORMAT:
-Return ONLY valid JSON in this exact format:
-{{
-    "action": "command_verb",
-    "target": "target_object_or_person",
-    "extras": {{"additional_parameters": "if_needed"}}
-}}
-
-CRITICAL EXAMPLES:
-Input: "talk to the bartender" → {{"action": "interact", "target": "bartender", "extras": {{"interaction": "talk"}}}}
-Input: "I want to buy some ale" → {{"action": "buy", "target": "ale", "extras": {{}}}}
-Input: "what time is it?" → {{"action": "status", "target": "", "extras": {{}}}}
-Input: "go upstairs" → {{"action": "move", "target": "upstairs", "extras": {{}}}}
-Input: "check my inventory" → {{"action": "inventory", "target": "", "extras": {{}}}}
-Input: "hey there, what's going on?" → {{"action": "look", "target": "", "extras": {{}}}}
-
-Parse the player input with full understanding of context and intent."""
+        instructions = self.prompts.prefix(
+            self.llm_model, "parser", lambda: PARSER_INSTRUCTIONS
+        )
+        return self.prompts.join(
+            instructions, context, f'PLAYER INPUT TO PARSE: "{text}"'
+        )
 
     def _parse_with_regex(self, text: str) -> Command:
         """Fallback to regex-based command parsing."""
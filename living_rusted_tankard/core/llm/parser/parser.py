@@ -8,13 +8,11 @@ import sys
 from dataclasses import dataclass
 from typing import Dict, List, Any, Optional, Pattern, Callable, Union, Tuple
 
-try:
-    import requests
-except ImportError:
-    requests = None
-
+import httpx
 from pydantic import BaseModel, Field
 
+from core.ollama_transport import get_ollama_transport
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
@@ -130,10 +128,6 @@ class Parser:
             logger.warning("No LLM endpoint configured, falling back to regex")
             return self._parse_with_regex(text)
 
-        if requests is None:
-            logger.warning("Requests module not available, falling back to regex")
-            return self._parse_with_regex(text)
-
         try:
             # Prepare the prompt with game context
             prompt = """
@@ -148,14 +142,12 @@ class Parser:
             Parse the above into a JSON object with 'action' and optional 'target' and 'extras' fields.
             """.strip()
 
-            # Call the LLM
-            response = requests.post(
-                self.llm_endpoint, json={"prompt": prompt}, timeout=5
-            )  # 5 second timeout
-            response.raise_for_status()
-
-            # Parse the response
-            result = response.json()
+            # Call the LLM through the shared transport for its server
+            url = httpx.URL(self.llm_endpoint)
+            transport = get_ollama_transport(f"{url.scheme}://{url.netloc.decode()}")
+            result = transport.post_json(
+                url.raw_path.decode() or "/", {"prompt": prompt}, timeout=5
+            )
             if "response" in result:
                 try:
                     # If the response is a string, parse it as JSON
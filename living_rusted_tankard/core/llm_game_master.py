@@ -10,11 +10,12 @@ import json
 import logging
 import os
 import re
-import requests
 import time
 from typing import Dict, List, Any, Optional, Tuple, Union
 from dataclasses import dataclass
 
+from .ollama_transport import get_ollama_transport
+from .prompt_assembly import get_prompt_assembler
 from .narrative_actions import NarrativeActionProcessor
 
 # Configure logging
@@ -59,18 +60,21 @@ class LLMGameMaster:
         self.ollama_url = ollama_url
         self.model = model
         self.conversation_histories: Dict[str, List[LLMChatMessage]] = {}
-        self.current_conversations: Dict[
-            str, Dict[str, Any]
-        ] = {}  # Track active conversations by session
-        self.session_memories: Dict[
-            str, List[Dict[str, Any]]
-        ] = {}  # Track important information by session
+        self.current_conversations: Dict[str, Dict[str, Any]] = (
+            {}
+        )  # Track active conversations by session
+        self.session_memories: Dict[str, List[Dict[str, Any]]] = (
+            {}
+        )  # Track important information by session
 
         # Narrative action processor
         self.action_processor = NarrativeActionProcessor()
 
-        # Default system prompt
-        self.system_prompt = self._get_default_system_prompt()
+        # Default system prompt, shared so Ollama can reuse its evaluation
+        self.prompts = get_prompt_assembler()
+        self.system_prompt = self.prompts.prefix(
+            model, "llm_game_master", self._get_default_system_prompt
+        )
 
     def _get_default_system_prompt(self) -> str:
         """Create the default system prompt for the LLM."""
@@ -648,41 +652,33 @@ These memories will be included in future conversations to maintain consistency.
             elif any(keyword in user_lower for keyword in reject_keywords):
                 input_context += f"\n\nNOTE: Player input '{user_input}' suggests they are declining an offer.\n"
 
-        # Create the full prompt with system instructions, context, and history
-        messages = []
-
-        # Add system prompt as the first message with context, examining info, memories, and input context
-        messages.append(
-            {
-                "role": "system",
-                "content": f"{self.system_prompt}\n\nCURRENT GAME STATE:\n{context_str}{examining_info}{memories_info}{input_context}",
-            }
+        # Static system prompt and history first, so turns share a prefix;
+        # game state, examining info, memories and input notes go last
+        messages = self.prompts.chat_messages(
+            self.system_prompt,
+            [msg.to_dict() for msg in history[-MAX_HISTORY_LENGTH:]],
+            [
+                f"CURRENT GAME STATE:\n{context_str}{examining_info}{memories_info}{input_context}"
+            ],
+            user_input,
         )
 
-        # Add conversation history
-        for msg in history[-MAX_HISTORY_LENGTH:]:
-            messages.append({"role": msg.role, "content": msg.content})
-
-        # Add the current user message
-        messages.append({"role": "user", "content": user_input})
-
         try:
             # Generate a response from Ollama
-            api_url = f"{self.ollama_url}/api/chat"
-
             data = {
                 "model": self.model,
                 "messages": messages,
                 "stream": False,
                 "options": {"temperature": 0.7, "top_p": 0.9},
             }
-
-            logger.info(f"Sending request to Ollama at {api_url}")
-            response = requests.post(api_url, json=data)
-            response.raise_for_status()
-
-            logger.debug(f"Ollama response: {response.text}")
-            response_data = response.json()
+            self.prompts.with_keep_alive(data, session_id)
+
+            # Looked up per call: the API can repoint ollama_url at runtime
+            transport = get_ollama_transport(self.ollama_url)
+            logger.info(f"Sending request to Ollama at {self.ollama_url}/api/chat")
+            response_data = transport.post_json("/api/chat", data, model=self.model)
+            logger.debug(f"Ollama response: {response_data}")
+            self.prompts.record("llm_game_master", response_data)
 
             if "message" in response_data and "content" in response_data["message"]:
                 llm_response = response_data["message"]["content"]
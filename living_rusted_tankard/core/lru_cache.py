@@ -0,0 +1,187 @@
+"""
+Thread-safe LRU cache with TTL and size bounds.
+
+Shared by the LLM response cache, the async context cache and the narrative
+cache. All operations are O(1) amortized:
+
+- Recency is tracked with an OrderedDict; hits move the key to the end and
+  evictions pop from the front.
+- Every entry has the same TTL, so expiry order equals write order. A
+  second OrderedDict keyed by write time lets expired entries be dropped
+  from the front without scanning the whole cache.
+"""
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+_MISSING = object()
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate the memory footprint of a cached value in bytes."""
+    if isinstance(value, str):
+        return len(value.encode("utf-8", errors="ignore"))
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    return sys.getsizeof(value)
+
+
+class LRUCache:
+    """Bounded least-recently-used cache with optional TTL.
+
+    Args:
+        max_entries: Maximum number of entries kept.
+        ttl_seconds: Seconds an entry stays valid after it was written, or
+            None to keep entries until they are evicted.
+        max_bytes: Optional budget for the summed size of cached values.
+        size_of: Function estimating the size of a value in bytes.
+        on_evict: Called with (key, value) when an entry is evicted to
+            respect the size bounds (not on expiry or explicit removal).
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 500,
+        ttl_seconds: Optional[float] = 300,
+        max_bytes: Optional[int] = None,
+        size_of: Callable[[Any], int] = estimate_size,
+        on_evict: Optional[Callable[[Hashable, Any], None]] = None,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.size_of = size_of
+        self.on_evict = on_evict
+
+        # key -> (value, size, expires_at)
+        self._data: "OrderedDict[Hashable, Tuple[Any, int, float]]" = OrderedDict()
+        # key -> expires_at, ordered by write time
+        self._expiry: "OrderedDict[Hashable, float]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.RLock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def _expire(self, now: float) -> None:
+        """Drop entries whose TTL has passed, oldest first."""
+        while self._expiry:
+            key, expires_at = next(iter(self._expiry.items()))
+            if expires_at > now:
+                break
+            self._remove(key)
+            self.expirations += 1
+
+    def _remove(self, key: Hashable) -> Any:
+        value, size, _ = self._data.pop(key)
+        self._expiry.pop(key, None)
+        self._bytes -= size
+        return value
+
+    def _evict_to_fit(self) -> None:
+        while self._data and (
+            len(self._data) > self.max_entries
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            key = next(iter(self._data))
+            value = self._remove(key)
+            self.evictions += 1
+            if self.on_evict:
+                self.on_evict(key, value)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value and mark it recently used."""
+        with self._lock:
+            now = time.time()
+            self._expire(now)
+
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value without touching recency or counters."""
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING or (
+                self.ttl_seconds is not None and entry[2] <= time.time()
+            ):
+                return default
+            return entry[0]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Insert or replace an entry, evicting least recently used ones."""
+        with self._lock:
+            now = time.time()
+            self._expire(now)
+
+            if key in self._data:
+                self._remove(key)
+
+            size = self.size_of(value)
+            expires_at = (
+                now + self.ttl_seconds if self.ttl_seconds is not None else float("inf")
+            )
+            self._data[key] = (value, size, expires_at)
+            if self.ttl_seconds is not None:
+                self._expiry[key] = expires_at
+            self._bytes += size
+
+            self._evict_to_fit()
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove an entry and return its value."""
+        with self._lock:
+            if key not in self._data:
+                return default
+            return self._remove(key)
+
+    def clear(self) -> None:
+        """Remove all entries (counters are kept)."""
+        with self._lock:
+            self._data.clear()
+            self._expiry.clear()
+            self._bytes = 0
+
+    def items(self) -> List[Tuple[Hashable, Any]]:
+        """Snapshot of live entries, least recently used first."""
+        with self._lock:
+            self._expire(time.time())
+            return [(key, entry[0]) for key, entry in self._data.items()]
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.peek(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss/eviction counters and current size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "max_size": self.max_entries,
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
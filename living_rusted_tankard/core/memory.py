@@ -22,6 +22,8 @@ from enum import Enum
 import json
 import hashlib
 
+from . import time_source
+
 logger = logging.getLogger(__name__)
 
 
@@ -55,7 +57,7 @@ class Memory:
 
     def get_age_hours(self) -> float:
         """Get memory age in hours."""
-        return (time.time() - self.timestamp) / 3600.0
+        return (time_source.time() - self.timestamp) / 3600.0
 
     def get_relevance_score(self, current_context: str = "") -> float:
         """Calculate relevance score based on importance, age, and context match."""
@@ -231,7 +233,7 @@ class MemoryManager:
         memory = Memory(
             id=memory_id,
             content=content,
-            timestamp=time.time(),
+            timestamp=time_source.time(),
             importance=importance,
             session_id=session_id,
             context=context or {},
@@ -273,7 +275,7 @@ class MemoryManager:
         relevant_memories = []
         for score, memory in scored_memories[:max_memories]:
             memory.access_count += 1
-            memory.last_accessed = time.time()
+            memory.last_accessed = time_source.time()
             relevant_memories.append(memory)
 
         self.stats["context_retrievals"] += 1
@@ -290,7 +292,7 @@ class MemoryManager:
         if session_id not in self.memories:
             return 0
 
-        current_time = time.time()
+        current_time = time_source.time()
         old_memories = []
         keep_memories = []
 
@@ -4,12 +4,13 @@ Each character remembers their interactions with the player and builds relations
 """
 
 import json
-import time
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 import logging
 
+from .. import time_source
+
 logger = logging.getLogger(__name__)
 
 
@@ -69,7 +70,7 @@ class Memory:
 
     def _get_time_description(self) -> str:
         """Generate natural time description."""
-        age_hours = self.age_in_hours(time.time())
+        age_hours = self.age_in_hours(time_source.time())
         if age_hours < 1:
             return "just now"
         elif age_hours < 24:
@@ -124,7 +125,7 @@ class CharacterMemory:
     ) -> None:
         """Add a new memory of interaction with the player."""
         memory = Memory(
-            timestamp=time.time(),
+            timestamp=time_source.time(),
             interaction_type=interaction_type,
             player_action=player_action,
             npc_response=npc_response,
@@ -238,7 +239,7 @@ class CharacterMemory:
     def _time_since_last_interaction(self) -> Optional[float]:
         """Hours since last interaction."""
         if self.last_interaction:
-            return (time.time() - self.last_interaction) / 3600.0
+            return (time_source.time() - self.last_interaction) / 3600.0
         return None
 
     def _get_most_relevant_memory(
@@ -304,7 +305,7 @@ class CharacterMemory:
 
         # Recency bonus (memories fade)
         age_penalty = min(
-            memory.age_in_hours(time.time()) / 168.0, 1.0
+            memory.age_in_hours(time_source.time()) / 168.0, 1.0
         )  # Max penalty after a week
         relevance *= 1.0 - age_penalty * 0.5
 
@@ -450,7 +451,7 @@ class CharacterMemoryManager:
 
     def cleanup_old_memories(self, max_age_days: int = 30) -> None:
         """Remove very old memories to prevent unbounded growth."""
-        current_time = time.time()
+        current_time = time_source.time()
         max_age_hours = max_age_days * 24
 
         for memory in self.character_memories.values():
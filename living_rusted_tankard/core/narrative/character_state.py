@@ -9,6 +9,8 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 import random
 
+from .. import time_source
+
 
 class Mood(Enum):
     """NPC emotional states that affect dialogue and behavior."""
@@ -43,13 +45,13 @@ class Concern:
     description: str
     intensity: float  # 0.0 to 1.0
     source: str  # What caused this concern
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=time_source.now)
     expires_at: Optional[datetime] = None
 
     def is_expired(self) -> bool:
         """Check if this concern has expired."""
         if self.expires_at:
-            return datetime.now() > self.expires_at
+            return time_source.now() > self.expires_at
         return False
 
     def decay(self, amount: float = 0.1) -> None:
@@ -66,7 +68,7 @@ class Goal:
     progress: float  # 0.0 to 1.0
     required_actions: List[str]  # What needs to happen
     blockers: List[str] = field(default_factory=list)
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=time_source.now)
 
     def is_blocked(self) -> bool:
         """Check if goal is currently blocked."""
@@ -136,7 +138,7 @@ class CharacterState:
                 mood_scores[Mood.EXCITED] += concern.intensity * 0.4
 
         # Apply mood modifiers
-        current_time = datetime.now()
+        current_time = time_source.now()
         expired_modifiers = []
 
         for source, (value, expires) in self.mood_modifiers.items():
@@ -190,7 +192,7 @@ class CharacterState:
         if goal.priority > 0.7:
             self.mood_modifiers[f"goal_{goal.description}"] = (
                 0.3,  # Positive modifier for having purpose
-                datetime.now().replace(hour=23, minute=59),  # Until end of day
+                time_source.now().replace(hour=23, minute=59),  # Until end of day
             )
             self.update_mood()
 
@@ -202,7 +204,7 @@ class CharacterState:
                 # Completing goals improves mood
                 self.mood_modifiers[f"completed_{description}"] = (
                     0.5,
-                    datetime.now().replace(hour=23, minute=59),
+                    time_source.now().replace(hour=23, minute=59),
                 )
                 self.goals.remove(goal)
                 self.update_mood()
@@ -212,12 +214,12 @@ class CharacterState:
         """Mark NPC as busy for a period."""
         self.is_busy = True
         self.busy_reason = reason
-        self.busy_until = datetime.now() + timedelta(minutes=duration_minutes)
+        self.busy_until = time_source.now() + timedelta(minutes=duration_minutes)
 
     def check_availability(self) -> Tuple[bool, Optional[str]]:
         """Check if NPC is available for interaction."""
         if self.is_busy and self.busy_until:
-            if datetime.now() > self.busy_until:
+            if time_source.now() > self.busy_until:
                 # Busy period expired
                 self.is_busy = False
                 self.busy_reason = None
@@ -6,11 +6,13 @@ Tracks player actions and creates meaningful, interconnected consequences across
 from enum import Enum
 from typing import Dict, List, Optional, Set, Tuple, Any, Callable
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import timedelta
 import time
 import random
 import logging
 
+from .. import time_source
+
 logger = logging.getLogger(__name__)
 
 
@@ -125,7 +127,7 @@ class TrackedAction:
 
     def age_in_hours(self) -> float:
         """Get the age of this action in hours."""
-        return (time.time() - self.timestamp) / 3600.0
+        return (time_source.time() - self.timestamp) / 3600.0
 
 
 @dataclass
@@ -152,7 +154,7 @@ class PendingConsequence:
         return (
             not self.executed
             and not self.cancelled
-            and time.time() >= self.scheduled_time
+            and time_source.time() >= self.scheduled_time
         )
 
 
@@ -163,7 +165,7 @@ class ConsequenceChain:
         self.chain_id = chain_id
         self.initial_action_id = initial_action_id
         self.consequences: List[str] = []  # Consequence IDs in order
-        self.created_at = time.time()
+        self.created_at = time_source.time()
         self.impact_score = 0.0
 
     def add_consequence(self, consequence_id: str, impact: float):
@@ -178,7 +180,7 @@ class ConsequenceChain:
             "initial_action": self.initial_action_id,
             "consequence_count": len(self.consequences),
             "total_impact": self.impact_score,
-            "age_hours": (time.time() - self.created_at) / 3600.0,
+            "age_hours": (time_source.time() - self.created_at) / 3600.0,
         }
 
 
@@ -378,7 +380,7 @@ class ConsequenceEngine:
 
     def _cleanup_old_actions(self, max_age_hours: float = 168.0) -> None:
         """Remove actions older than max_age_hours."""
-        current_time = time.time()
+        current_time = time_source.time()
         cutoff_time = current_time - (max_age_hours * 3600)
 
         old_action_ids = [
@@ -434,7 +436,7 @@ class ConsequenceEngine:
         """Determine if a rule should trigger based on occurrence patterns."""
         # Check cooldown
         if rule.last_triggered and rule.cooldown_hours > 0:
-            hours_since_trigger = (time.time() - rule.last_triggered) / 3600.0
+            hours_since_trigger = (time_source.time() - rule.last_triggered) / 3600.0
             if hours_since_trigger < rule.cooldown_hours:
                 return False
 
@@ -443,7 +445,7 @@ class ConsequenceEngine:
             return False
 
         # Count matching actions in time window
-        current_time = time.time()
+        current_time = time_source.time()
         window_start = current_time - (rule.time_window_hours * 3600)
 
         matching_actions = [
@@ -464,7 +466,7 @@ class ConsequenceEngine:
         consequence_id = f"consequence_{rule.rule_id}_{int(time.time())}"
 
         # Calculate when consequence should manifest
-        manifest_time = time.time() + (rule.delay_hours * 3600)
+        manifest_time = time_source.time() + (rule.delay_hours * 3600)
 
         # Determine affected NPCs
         affected_npcs = trigger_action.involved_npcs.copy()
@@ -498,7 +500,7 @@ class ConsequenceEngine:
 
         # Update rule state
         rule.triggered_count += 1
-        rule.last_triggered = time.time()
+        rule.last_triggered = time_source.time()
 
         # Create or extend consequence chain
         chain_id = f"chain_{trigger_action.action_id}"
@@ -609,7 +611,7 @@ class ConsequenceEngine:
                                 f"consequence_{consequence.consequence_id}"
                             ] = (
                                 mood_modifier,
-                                datetime.now() + timedelta(hours=24),
+                                time_source.now() + timedelta(hours=24),
                             )
 
             # Apply world state changes
@@ -724,7 +726,7 @@ class ConsequenceEngine:
         # Create the tracked action
         return TrackedAction(
             action_id=action_id,
-            timestamp=time.time(),
+            timestamp=time_source.time(),
             category=category,
             description=description,
             location=location,
@@ -6,10 +6,11 @@ Makes conversations feel natural and continuous rather than repetitive interacti
 from enum import Enum
 from typing import Dict, List, Optional, Set, Tuple, Any
 from dataclasses import dataclass, field
-import time
 import random
 import logging
 
+from .. import time_source
+
 logger = logging.getLogger(__name__)
 
 
@@ -99,7 +100,7 @@ class OngoingConversation:
             speaker=speaker,
             message=message,
             topic=topic,
-            timestamp=time.time(),
+            timestamp=time_source.time(),
             emotional_tone=emotional_tone,
             reveals_information=reveals_info,
             asks_question=asks_question,
@@ -109,7 +110,7 @@ class OngoingConversation:
         self.turns.append(turn)
         self.topics_discussed.add(topic)
         self.current_topic = topic
-        self.last_interaction = time.time()
+        self.last_interaction = time_source.time()
 
         if asks_question and speaker != "player":
             self.last_question_asked = message
@@ -121,7 +122,7 @@ class OngoingConversation:
 
     def get_time_since_last_turn(self) -> float:
         """Get hours since last conversation turn."""
-        return (time.time() - self.last_interaction) / 3600.0
+        return (time_source.time() - self.last_interaction) / 3600.0
 
     def should_continue_previous_topic(self) -> bool:
         """Check if conversation should continue previous topic."""
@@ -198,8 +199,8 @@ class ConversationMemory:
         self.current_conversation = OngoingConversation(
             npc_id=self.npc_id,
             npc_name=self.npc_name,
-            start_time=time.time(),
-            last_interaction=time.time(),
+            start_time=time_source.time(),
+            last_interaction=time_source.time(),
             current_state=ConversationState.GREETING,
             current_topic=None,  # Will be set when first topic is discussed
         )
@@ -212,7 +213,7 @@ class ConversationMemory:
             return None
 
         if self.current_conversation.should_continue_previous_topic():
-            self.current_conversation.last_interaction = time.time()
+            self.current_conversation.last_interaction = time_source.time()
             return self.current_conversation
         else:
             # Too much time has passed, start fresh
@@ -6,9 +6,11 @@ Creates meaningful quests and objectives that emerge naturally from player actio
 from enum import Enum
 from typing import Dict, List, Optional, Set, Tuple, Any, Union
 from dataclasses import dataclass, field
+import itertools
 import random
 import time
 import logging
+from .. import time_source
 from .story_threads import (
     StoryThread,
     ThreadStage,
@@ -20,6 +22,8 @@ from .story_threads import (
 
 logger = logging.getLogger(__name__)
 
+_quest_numbers = itertools.count(1)
+
 
 class QuestType(Enum):
     """Types of dynamically generated quests."""
@@ -139,7 +143,7 @@ class DynamicQuest:
         self.rewards = QuestReward()
 
         # Timing
-        self.created_at = time.time()
+        self.created_at = time_source.time()
         self.accepted_at: Optional[float] = None
         self.completed_at: Optional[float] = None
         self.expires_at: Optional[float] = None
@@ -186,7 +190,7 @@ class DynamicQuest:
             # Check if quest is complete
             if self.current_objective_index >= len(self.objectives):
                 self.status = "completed"
-                self.completed_at = time.time()
+                self.completed_at = time_source.time()
                 return True
 
         return False
@@ -234,7 +238,7 @@ class DynamicQuest:
 
     def check_expiration(self) -> bool:
         """Check if quest has expired."""
-        if self.expires_at and time.time() > self.expires_at:
+        if self.expires_at and time_source.time() > self.expires_at:
             if self.status in ["available", "active"]:
                 self.status = "expired"
                 return True
@@ -265,7 +269,7 @@ class DynamicQuest:
             "estimated_time": f"{self.estimated_duration_hours:.1f} hours",
             "involved_npcs": list(self.involved_npcs),
             "required_locations": list(self.required_locations),
-            "age_hours": (time.time() - self.created_at) / 3600.0,
+            "age_hours": (time_source.time() - self.created_at) / 3600.0,
         }
 
 
@@ -311,7 +315,8 @@ class QuestTemplate:
             return None
 
         # Generate quest details
-        quest_id = f"quest_{self.template_id}_{int(time.time())}"
+        # The counter keeps two quests from one template in the same second apart
+        quest_id = f"quest_{self.template_id}_{int(time.time())}_{next(_quest_numbers)}"
         title = self._generate_title(context)
         description = self._generate_description(context)
 
@@ -335,7 +340,7 @@ class QuestTemplate:
         # Set expiration if urgent
         if quest.urgency in [QuestUrgency.URGENT, QuestUrgency.CRITICAL]:
             urgency_hours = {QuestUrgency.URGENT: 48.0, QuestUrgency.CRITICAL: 24.0}
-            quest.expires_at = time.time() + (urgency_hours[quest.urgency] * 3600)
+            quest.expires_at = time_source.time() + (urgency_hours[quest.urgency] * 3600)
 
         return quest
 
@@ -704,14 +709,14 @@ class DynamicQuestGenerator:
                     f"New quest available: '{new_quest.title}' from {new_quest.giver_npc_id}"
                 )
                 self.total_quests_generated += 1
-                self.last_generation_time = time.time()
+                self.last_generation_time = time_source.time()
 
         return notifications
 
     def _should_generate_new_quest(self, game_state: Any) -> bool:
         """Determine if a new quest should be generated."""
         # Check cooldown
-        if time.time() - self.last_generation_time < self.quest_generation_cooldown:
+        if time_source.time() - self.last_generation_time < self.quest_generation_cooldown:
             return False
 
         # Check if we have room for more quests
@@ -724,7 +729,7 @@ class DynamicQuestGenerator:
                 q
                 for q in self.completed_quests.values()
                 if q.completed_at
-                and (time.time() - q.completed_at) < 86400  # Last 24 hours
+                and (time_source.time() - q.completed_at) < 86400  # Last 24 hours
             ]
         )
 
@@ -884,7 +889,7 @@ class DynamicQuestGenerator:
             quest = self.active_quests[quest_id]
             if quest.status == "available":
                 quest.status = "active"
-                quest.accepted_at = time.time()
+                quest.accepted_at = time_source.time()
                 return True
         return False
 
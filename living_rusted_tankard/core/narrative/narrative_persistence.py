@@ -1,14 +1,26 @@
 """
 Narrative Persistence System.
 Saves and loads all narrative state to ensure continuity across game sessions.
+
+Auto-saves are incremental. Each registered component is serialized and
+fingerprinted, and only components whose fingerprint changed since the last
+save are appended to the session's journal (``narrative_journal_<id>.jsonl``).
+Every ``compact_after_entries`` appends, the journal is folded into a base
+snapshot (``narrative_base_<id>.json.gz``) and truncated. File writes and
+compaction run on a shared background writer thread, so a save only costs
+the request thread the serialization itself.
 """
 
+import hashlib
 import json
+import os
 import pickle
+import threading
 import time
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Tuple, Union
 from dataclasses import asdict, is_dataclass
 from enum import Enum
 import gzip
@@ -24,6 +36,24 @@ class SerializationFormat(Enum):
     COMPRESSED = "compressed"  # Gzipped JSON for space efficiency
 
 
+# A single writer thread serves every session, so each session's journal
+# appends and compactions happen in the order they were queued. Pending
+# writes still run at interpreter exit, when the executor is joined.
+_narrative_writer: Optional[ThreadPoolExecutor] = None
+_narrative_writer_lock = threading.Lock()
+
+
+def get_narrative_writer() -> ThreadPoolExecutor:
+    """Get the shared background writer for narrative saves."""
+    global _narrative_writer
+    with _narrative_writer_lock:
+        if _narrative_writer is None:
+            _narrative_writer = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="narrative-writer"
+            )
+    return _narrative_writer
+
+
 class NarrativePersistenceManager:
     """Manages saving and loading of all narrative system state."""
 
@@ -44,6 +74,21 @@ class NarrativePersistenceManager:
         self.components_to_save: Dict[str, Any] = {}
         self.save_enabled = True
 
+        # Incremental saves: fingerprints of the last saved state of each
+        # component, and journal bookkeeping, per session
+        self.compact_after_entries = 20
+        self._fingerprints: Dict[str, Dict[str, str]] = {}
+        self._journal_entries: Dict[str, int] = {}
+        self._journal_seq: Dict[str, int] = {}  # Only touched by the writer
+        self._pending_writes: List[Future] = []
+        self.save_stats = {
+            "components_written": 0,
+            "components_skipped": 0,
+            "journal_entries": 0,
+            "compactions": 0,
+            "write_errors": 0,
+        }
+
     def register_component(self, component_name: str, component_instance: Any):
         """Register a narrative component for automatic saving."""
         self.components_to_save[component_name] = component_instance
@@ -52,10 +97,50 @@ class NarrativePersistenceManager:
     def save_all_narrative_state(
         self, session_id: str, save_format: SerializationFormat = None
     ) -> bool:
-        """Save all registered narrative components."""
+        """Save the registered narrative components that changed.
+
+        Changed components are queued for the session's journal; unchanged
+        ones are skipped. Passing ``save_format`` writes a full timestamped
+        snapshot in that format instead.
+        """
         if not self.save_enabled:
             return False
+        if save_format is not None:
+            return self.save_full_snapshot(session_id, save_format)
+
+        timestamp = time.time()
+        fingerprints = self._fingerprints.setdefault(session_id, {})
+        changed: Dict[str, str] = {}
+        for component_name, component in self.components_to_save.items():
+            try:
+                component_state = self._serialize_component(component, component_name)
+            except Exception as e:
+                logger.error(f"Failed to serialize component {component_name}: {e}")
+                continue
+            component_state.pop("timestamp", None)
+            encoded = json.dumps(component_state, sort_keys=True, default=str)
+            digest = self._fingerprint(encoded)
+            if fingerprints.get(component_name) == digest:
+                self.save_stats["components_skipped"] += 1
+                continue
+            fingerprints[component_name] = digest
+            changed[component_name] = encoded
+
+        if not changed:
+            return True
 
+        self._submit_write(self._append_journal_entry, session_id, timestamp, changed)
+        entries = self._journal_entries.get(session_id, 0) + 1
+        if entries >= self.compact_after_entries:
+            self._submit_write(self._compact_journal, session_id)
+            entries = 0
+        self._journal_entries[session_id] = entries
+        return True
+
+    def save_full_snapshot(
+        self, session_id: str, save_format: SerializationFormat = None
+    ) -> bool:
+        """Write every registered component to a new timestamped save file."""
         save_format = save_format or self.default_format
         timestamp = int(time.time())
         filename = f"narrative_state_{session_id}_{timestamp}.{save_format.value}"
@@ -107,7 +192,27 @@ class NarrativePersistenceManager:
     def load_narrative_state(
         self, session_id: str, specific_timestamp: Optional[int] = None
     ) -> bool:
-        """Load narrative state from the most recent save or specific timestamp."""
+        """Load narrative state from the most recent save or specific timestamp.
+
+        Without a timestamp the session's journal is replayed over its base
+        snapshot; older timestamped saves are used when there is no journal.
+        """
+        self.flush()
+        if specific_timestamp is None and self._has_journal(session_id):
+            try:
+                components, _ = self._read_journaled_state(session_id)
+            except Exception as e:
+                logger.error(f"Error reading narrative journal: {e}")
+                return False
+            loaded_components = self._restore_components(components)
+            fingerprints = self._fingerprints.setdefault(session_id, {})
+            for component_name, component_state in components.items():
+                fingerprints[component_name] = self._fingerprint(
+                    json.dumps(component_state, sort_keys=True, default=str)
+                )
+            logger.info(f"Loaded {loaded_components} narrative components")
+            return loaded_components > 0
+
         try:
             # Find the save file to load
             if specific_timestamp:
@@ -143,29 +248,9 @@ class NarrativePersistenceManager:
                 logger.error(f"Failed to read narrative state from {load_file}")
                 return False
 
-            # Restore each component
-            loaded_components = 0
-            for component_name, component_state in narrative_state.get(
-                "components", {}
-            ).items():
-                if component_name in self.components_to_save:
-                    try:
-                        self._deserialize_component(
-                            self.components_to_save[component_name],
-                            component_state,
-                            component_name,
-                        )
-                        loaded_components += 1
-                        logger.debug(f"Restored component: {component_name}")
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to restore component {component_name}: {e}"
-                        )
-                else:
-                    logger.warning(
-                        f"Component {component_name} not registered for loading"
-                    )
-
+            loaded_components = self._restore_components(
+                narrative_state.get("components", {})
+            )
             logger.info(f"Loaded {loaded_components} narrative components")
             return loaded_components > 0
 
@@ -173,6 +258,154 @@ class NarrativePersistenceManager:
             logger.error(f"Error loading narrative state: {e}")
             return False
 
+    def _restore_components(self, components: Dict[str, Any]) -> int:
+        """Deserialize saved component states into the registered components."""
+        loaded_components = 0
+        for component_name, component_state in components.items():
+            if component_name in self.components_to_save:
+                try:
+                    self._deserialize_component(
+                        self.components_to_save[component_name],
+                        component_state,
+                        component_name,
+                    )
+                    loaded_components += 1
+                    logger.debug(f"Restored component: {component_name}")
+                except Exception as e:
+                    logger.error(f"Failed to restore component {component_name}: {e}")
+            else:
+                logger.warning(f"Component {component_name} not registered for loading")
+        return loaded_components
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait for this manager's queued writes to reach disk."""
+        pending, self._pending_writes = self._pending_writes, []
+        _, not_done = wait(pending, timeout)
+        self._pending_writes.extend(not_done)
+        return not not_done
+
+    # Journal of component deltas
+
+    def _fingerprint(self, encoded_state: str) -> str:
+        digest = hashlib.blake2b(encoded_state.encode("utf-8"), digest_size=16)
+        return digest.hexdigest()
+
+    def _journal_path(self, session_id: str) -> Path:
+        return self.save_directory / f"narrative_journal_{session_id}.jsonl"
+
+    def _base_path(self, session_id: str) -> Path:
+        return self.save_directory / f"narrative_base_{session_id}.json.gz"
+
+    def _has_journal(self, session_id: str) -> bool:
+        return (
+            self._journal_path(session_id).exists()
+            or self._base_path(session_id).exists()
+        )
+
+    def _submit_write(self, write, *args):
+        self._pending_writes = [f for f in self._pending_writes if not f.done()]
+        self._pending_writes.append(get_narrative_writer().submit(write, *args))
+
+    def _read_journaled_state(self, session_id: str) -> Tuple[Dict[str, Any], int]:
+        """Replay the journal over the base snapshot.
+
+        Returns the latest state of each component and the last journal
+        sequence number. Entries already folded into the base are skipped,
+        in case a compaction stopped before truncating the journal.
+        """
+        components: Dict[str, Any] = {}
+        base_seq = 0
+        base_path = self._base_path(session_id)
+        if base_path.exists():
+            base = self._read_narrative_file(base_path, SerializationFormat.COMPRESSED)
+            if base:
+                components.update(base.get("components", {}))
+                base_seq = base.get("metadata", {}).get("journal_seq", 0)
+
+        last_seq = base_seq
+        journal_path = self._journal_path(session_id)
+        if journal_path.exists():
+            with open(journal_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        logger.warning(f"Skipping unreadable entry in {journal_path}")
+                        continue
+                    seq = entry.get("seq", 0)
+                    if seq <= base_seq:
+                        continue
+                    components.update(entry.get("components", {}))
+                    last_seq = max(last_seq, seq)
+        return components, last_seq
+
+    def _append_journal_entry(
+        self, session_id: str, timestamp: float, changed: Dict[str, str]
+    ):
+        """Append one save's changed components to the journal (writer thread)."""
+        try:
+            if session_id not in self._journal_seq:
+                _, last_seq = self._read_journaled_state(session_id)
+                self._journal_seq[session_id] = last_seq
+            seq = self._journal_seq[session_id] + 1
+
+            # Components arrive already encoded, so they are not dumped twice
+            components = ", ".join(
+                f"{json.dumps(name)}: {encoded}" for name, encoded in changed.items()
+            )
+            with open(self._journal_path(session_id), "a", encoding="utf-8") as f:
+                f.write(
+                    f'{{"seq": {seq}, "timestamp": {timestamp}, '
+                    f'"components": {{{components}}}}}\n'
+                )
+        except Exception as e:
+            logger.error(f"Error writing narrative journal for {session_id}: {e}")
+            self.save_stats["write_errors"] += 1
+            # Forget the fingerprints so the next save writes these again
+            fingerprints = self._fingerprints.get(session_id, {})
+            for component_name in changed:
+                fingerprints.pop(component_name, None)
+            return
+
+        self._journal_seq[session_id] = seq
+        self.save_stats["journal_entries"] += 1
+        self.save_stats["components_written"] += len(changed)
+
+    def _compact_journal(self, session_id: str):
+        """Fold the journal into a new base snapshot (writer thread)."""
+        journal_path = self._journal_path(session_id)
+        if not journal_path.exists():
+            return
+        try:
+            components, last_seq = self._read_journaled_state(session_id)
+            snapshot = {
+                "metadata": {
+                    "session_id": session_id,
+                    "timestamp": int(time.time()),
+                    "save_format": SerializationFormat.COMPRESSED.value,
+                    "version": "2.0",
+                    "journal_seq": last_seq,
+                    "components": list(components.keys()),
+                },
+                "components": components,
+            }
+            base_path = self._base_path(session_id)
+            temp_path = base_path.with_suffix(".tmp")
+            if not self._write_narrative_file(
+                snapshot, temp_path, SerializationFormat.COMPRESSED
+            ):
+                self.save_stats["write_errors"] += 1
+                return
+            os.replace(temp_path, base_path)
+            journal_path.unlink()
+        except Exception as e:
+            logger.error(f"Error compacting narrative journal for {session_id}: {e}")
+            self.save_stats["write_errors"] += 1
+            return
+
+        self._journal_seq[session_id] = last_seq
+        self.save_stats["compactions"] += 1
+
     def _serialize_component(
         self, component: Any, component_name: str
     ) -> Dict[str, Any]:
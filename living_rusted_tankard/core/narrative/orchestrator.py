@@ -13,6 +13,8 @@ import random
 from collections import defaultdict
 import logging
 
+from .. import time_source
+
 from .story_thread import StoryThread, ThreadStage, ThreadType, StoryBeat
 from .thread_manager import ThreadManager, ThreadConvergence
 from .rules import NarrativeRulesEngine, NarrativeHealth, InterventionAction
@@ -112,7 +114,7 @@ class ClimaticSequencer:
     ) -> List[ClimaticMoment]:
         """Find opportunities for converging multiple threads into a single climax"""
         opportunities = []
-        current_time = time.time()
+        current_time = time_source.time()
 
         # Group threads by potential convergence windows
         climax_ready_threads = [
@@ -158,7 +160,7 @@ class ClimaticSequencer:
 
     def _calculate_optimal_timing(self, thread: StoryThread) -> float:
         """Calculate optimal timing for a thread's climax"""
-        current_time = time.time()
+        current_time = time_source.time()
 
         # Base timing on thread tension and stage
         if thread.stage == ThreadStage.RISING_ACTION:
@@ -194,7 +196,7 @@ class ClimaticSequencer:
 
     def _find_alternative_timing(self, preferred_time: float) -> Optional[float]:
         """Find alternative timing that avoids conflicts"""
-        current_time = time.time()
+        current_time = time_source.time()
 
         # Try slots before and after preferred time
         for offset in [
@@ -316,7 +318,7 @@ class NarrativeOrchestrator:
         # Update orchestration history
         self.orchestration_history.append(
             {
-                "timestamp": time.time(),
+                "timestamp": time_source.time(),
                 "narrative_health": narrative_health.value,
                 "active_arcs": len(self.active_arcs),
                 "actions_taken": len(orchestration_actions),
@@ -419,7 +421,7 @@ class NarrativeOrchestrator:
         self, climax: ClimaticMoment, threads: List[StoryThread]
     ) -> bool:
         """Determine if a climactic moment should be executed"""
-        current_time = time.time()
+        current_time = time_source.time()
 
         # Check timing
         if climax.timestamp > current_time + 1800:  # More than 30 minutes away
@@ -7,9 +7,10 @@ from enum import Enum
 from typing import Dict, List, Optional, Set, Tuple, Any
 from dataclasses import dataclass, field
 import random
-import time
 import logging
 
+from .. import time_source
+
 logger = logging.getLogger(__name__)
 
 
@@ -169,7 +170,7 @@ class PersonalityProfile:
             modified = trait_expr.get_dialogue_flavor(modified, situation)
 
             # Mark trait as recently expressed
-            trait_expr.last_expressed = time.time()
+            trait_expr.last_expressed = time_source.time()
 
         return modified
 
@@ -7,10 +7,11 @@ from enum import Enum
 from typing import Dict, List, Optional, Set, Tuple, Any
 from dataclasses import dataclass, field
 import random
-import time
 import logging
 import math
 
+from .. import time_source
+
 logger = logging.getLogger(__name__)
 
 
@@ -63,7 +64,7 @@ class ReputationOpinion:
         if len(self.experiences) > 5:  # Keep only recent experiences
             self.experiences = self.experiences[-5:]
 
-        self.last_updated = time.time()
+        self.last_updated = time_source.time()
         self.source = "personal_experience"
 
     def update_from_gossip(
@@ -86,7 +87,7 @@ class ReputationOpinion:
                 self.confidence = max(0.1, self.confidence - 0.1)
 
             self.experiences.append(f"heard from others: {gossip_description}")
-            self.last_updated = time.time()
+            self.last_updated = time_source.time()
             self.source = "gossip"
 
 
@@ -99,7 +100,7 @@ class SocialConnection:
         self.connection_strength = connection_strength  # 0.0 to 1.0
         self.trust_level = 0.5  # How much they trust each other's opinions
         self.gossip_frequency = 0.3  # How often they share gossip
-        self.last_interaction = time.time()
+        self.last_interaction = time_source.time()
         self.shared_experiences: List[str] = []
 
     def get_other_npc(self, npc_id: str) -> Optional[str]:
@@ -112,7 +113,7 @@ class SocialConnection:
 
     def should_share_gossip(self) -> bool:
         """Determine if these NPCs should share gossip now."""
-        time_since_last = time.time() - self.last_interaction
+        time_since_last = time_source.time() - self.last_interaction
         hours_since = time_since_last / 3600.0
 
         # More likely to gossip if they haven't talked in a while
@@ -137,7 +138,7 @@ class NPCReputation:
         self.npc_name = npc_name
         self.opinions: Dict[ReputationAspect, ReputationOpinion] = {}
         self.overall_opinion: float = 0.0  # Cached overall opinion
-        self.opinion_update_time = time.time()
+        self.opinion_update_time = time_source.time()
 
         # How this NPC weighs different aspects (personality-dependent)
         self.aspect_importance: Dict[ReputationAspect, float] = {
@@ -152,7 +153,7 @@ class NPCReputation:
                 score=0.0,
                 confidence=0.1,
                 source="unknown",
-                last_updated=time.time(),
+                last_updated=time_source.time(),
             )
         return self.opinions[aspect]
 
@@ -240,7 +241,7 @@ class NPCReputation:
         else:
             self.overall_opinion = 0.0
 
-        self.opinion_update_time = time.time()
+        self.opinion_update_time = time_source.time()
 
     def get_opinion_summary(self) -> Dict[str, Any]:
         """Get a summary of this NPC's opinions about the player."""
@@ -332,7 +333,7 @@ class ReputationNetwork:
         context: Dict[str, Any],
     ):
         """Record a player action and update relevant NPC opinions."""
-        timestamp = time.time()
+        timestamp = time_source.time()
 
         # Add to global events
         self.global_events.append((action_type, outcome, context.copy(), timestamp))
@@ -374,7 +375,7 @@ class ReputationNetwork:
                         self.npc_reputations[connected_id].update_opinion_from_action(
                             action_type, outcome, gossip_context
                         )
-                        connection.last_interaction = time.time()
+                        connection.last_interaction = time_source.time()
 
     def _get_connected_npcs(self, npc_id: str) -> List[Tuple[str, SocialConnection]]:
         """Get all NPCs connected to the given NPC."""
@@ -414,7 +415,7 @@ class ReputationNetwork:
                             score, connection.get_trust_multiplier(), description
                         )
 
-                    connection.last_interaction = time.time()
+                    connection.last_interaction = time_source.time()
 
     def get_overall_reputation_summary(self) -> Dict[str, Any]:
         """Get a summary of the player's reputation across all NPCs."""
@@ -463,7 +464,7 @@ class ReputationNetwork:
             "npc_opinions": npc_summaries,
             "social_connections": len(self.social_connections),
             "recent_events": len(
-                [e for e in self.global_events if time.time() - e[3] < 86400]
+                [e for e in self.global_events if time_source.time() - e[3] < 86400]
             ),  # Last 24 hours
         }
 
@@ -8,10 +8,11 @@ monitoring systems for the Living Rusted Tankard narrative engine.
 from typing import Dict, List, Any, Optional, Set, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
-import time
 from collections import defaultdict, deque
 import logging
 
+from .. import time_source
+
 from .story_thread import StoryThread, ThreadStage, ThreadType
 
 logger = logging.getLogger(__name__)
@@ -126,7 +127,7 @@ class TensionManager:
         else:
             self.global_tension = 0.0
 
-        self.tension_history.append((time.time(), self.global_tension))
+        self.tension_history.append((time_source.time(), self.global_tension))
         return self.global_tension
 
     def _get_thread_weight(self, thread: StoryThread) -> float:
@@ -145,7 +146,7 @@ class TensionManager:
 
     def get_tension_trend(self, window_minutes: int = 30) -> float:
         """Get tension change trend over time window"""
-        cutoff_time = time.time() - (window_minutes * 60)
+        cutoff_time = time_source.time() - (window_minutes * 60)
         recent_points = [
             (t, tension) for t, tension in self.tension_history if t >= cutoff_time
         ]
@@ -216,7 +217,7 @@ class NarrativeRulesEngine:
     def __init__(self):
         self.tension_manager = TensionManager()
         self.pacing_metrics = PacingMetrics()
-        self.last_health_check = time.time()
+        self.last_health_check = time_source.time()
         self.intervention_queue: List[InterventionAction] = []
         self.rule_violations: defaultdict = defaultdict(int)
 
@@ -298,7 +299,7 @@ class NarrativeRulesEngine:
             self.rule_violations[PacingRule.ESCALATION_RATE] += 1
 
         # Check for stagnant threads
-        current_time = time.time()
+        current_time = time_source.time()
         for thread in threads:
             if hasattr(thread, "last_activity"):
                 if current_time - thread.last_activity > 3600:  # 1 hour
@@ -310,7 +311,7 @@ class NarrativeRulesEngine:
         self, threads: List[StoryThread], world_state: Dict[str, Any]
     ):
         """Update pacing metrics based on current state"""
-        current_time = time.time()
+        current_time = time_source.time()
         time_diff = current_time - self.last_health_check
 
         if time_diff > 0:
@@ -476,7 +477,7 @@ class NarrativeRulesEngine:
         interventions = []
 
         # Advance stagnant threads
-        current_time = time.time()
+        current_time = time_source.time()
         for thread in threads:
             if hasattr(thread, "last_activity"):
                 if current_time - thread.last_activity > 2700:  # 45 minutes
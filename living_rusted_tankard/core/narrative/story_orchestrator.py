@@ -10,6 +10,7 @@ import time
 import random
 import logging
 import math
+from .. import time_source
 from .story_threads import StoryThread, ThreadType, ThreadStatus, ThreadPriority
 from .consequence_engine import ConsequenceEngine, TrackedAction
 from .dynamic_quest_generator import DynamicQuestGenerator, QuestType
@@ -63,7 +64,7 @@ class StoryMoment:
     tags: Set[str] = field(default_factory=set)
 
     def age_in_hours(self) -> float:
-        return (time.time() - self.timestamp) / 3600.0
+        return (time_source.time() - self.timestamp) / 3600.0
 
 
 @dataclass
@@ -86,8 +87,8 @@ class NarrativeArc:
     completed_threads: Set[str] = field(default_factory=set)
 
     # Timing
-    started_at: float = field(default_factory=time.time)
-    last_major_event: float = field(default_factory=time.time)
+    started_at: float = field(default_factory=time_source.time)
+    last_major_event: float = field(default_factory=time_source.time)
 
     # Player engagement
     player_investment_score: float = 0.0
@@ -95,7 +96,7 @@ class NarrativeArc:
 
     def get_progress_ratio(self) -> float:
         """Get how far through this arc we are (0.0 to 1.0)."""
-        elapsed_hours = (time.time() - self.started_at) / 3600.0
+        elapsed_hours = (time_source.time() - self.started_at) / 3600.0
         return min(1.0, elapsed_hours / self.target_duration_hours)
 
     def calculate_target_tension(self) -> float:
@@ -130,11 +131,11 @@ class StoryOrchestrator:
         # Tension management
         self.tension_decay_rate = 0.02  # How fast tension naturally decreases
         self.tension_smoothing = 0.1  # How much to smooth tension changes
-        self.last_tension_update = time.time()
+        self.last_tension_update = time_source.time()
 
         # Pacing control
         self.event_cooldown = 1800.0  # 30 minutes between major events
-        self.last_major_event = time.time()
+        self.last_major_event = time_source.time()
         self.events_this_hour = 0
         self.max_events_per_hour = 3
 
@@ -142,7 +143,7 @@ class StoryOrchestrator:
         self.player_engagement_score = 0.5
         self.player_preferred_pacing = PacingMode.STEADY
         self.player_action_frequency = 0.0
-        self.last_player_action = time.time()
+        self.last_player_action = time_source.time()
 
         # Story preferences
         self.active_themes: Set[str] = {"introduction", "exploration", "community"}
@@ -219,7 +220,7 @@ class StoryOrchestrator:
 
     def _update_tension(self):
         """Update overall tension level."""
-        current_time = time.time()
+        current_time = time_source.time()
         time_delta = (current_time - self.last_tension_update) / 3600.0  # Hours
 
         # Natural tension decay
@@ -336,7 +337,7 @@ class StoryOrchestrator:
     def _check_narrative_interventions(self, game_state: Any) -> List[str]:
         """Check if we need to intervene to improve narrative flow."""
         notifications = []
-        current_time = time.time()
+        current_time = time_source.time()
 
         # Check if tension has been too low for too long (lowered thresholds for Phase 1)
         if self.overall_tension < 0.5 and len(self.story_threads) < 3:
@@ -436,7 +437,7 @@ class StoryOrchestrator:
 
     def _update_player_engagement(self, command: str, result: Dict[str, Any]):
         """Update player engagement score based on their actions."""
-        current_time = time.time()
+        current_time = time_source.time()
 
         # Update action frequency
         time_since_last = current_time - self.last_player_action
@@ -575,7 +576,7 @@ class StoryOrchestrator:
         # Create the moment
         moment = StoryMoment(
             moment_id=moment_id,
-            timestamp=time.time(),
+            timestamp=time_source.time(),
             description=f"Player action: {command} - {result.get('message', 'Unknown result')[:100]}",
             emotional_impact=emotional_impact,
             tension_change=tension_change,
@@ -6,6 +6,8 @@ from enum import Enum
 from datetime import datetime, timedelta
 import random
 
+from .. import time_source
+
 
 class ThreadStage(Enum):
     """Stages of story thread progression."""
@@ -119,7 +121,7 @@ class StoryBeat:
     def execute(self, actual_participants: List[str]) -> Dict[str, Any]:
         """Execute the beat and return results."""
         self.executed = True
-        self.actual_time = datetime.now()
+        self.actual_time = time_source.now()
         self.actual_participants = actual_participants
 
         # Calculate success based on participant alignment
@@ -163,7 +165,7 @@ class StoryThread:
     current_beat_index: int = 0
 
     # Timeline
-    started: datetime = field(default_factory=datetime.now)
+    started: datetime = field(default_factory=time_source.now)
     estimated_duration: timedelta = field(default_factory=lambda: timedelta(hours=4))
     deadline: Optional[datetime] = None
 
@@ -265,7 +267,7 @@ class StoryThread:
 
         # Check if beat has been waiting too long
         if current_beat.scheduled_time:
-            wait_time = datetime.now() - current_beat.scheduled_time
+            wait_time = time_source.now() - current_beat.scheduled_time
             if wait_time > timedelta(hours=2):  # Arbitrary threshold
                 return True
 
@@ -289,7 +291,7 @@ class StoryThread:
     def complete(self, quality: float = 0.5) -> None:
         """Mark thread as completed."""
         self.completed = True
-        self.completion_time = datetime.now()
+        self.completion_time = time_source.now()
         self.resolution_quality = quality
         self.stage = ThreadStage.RESOLUTION
 
@@ -6,12 +6,14 @@ Creates and manages interconnected narrative threads that emerge from player act
 from enum import Enum
 from typing import Dict, List, Optional, Set, Tuple, Any, Union
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import timedelta
 import random
 import time
 import logging
 import uuid
 
+from .. import time_source
+
 logger = logging.getLogger(__name__)
 
 
@@ -72,7 +74,7 @@ class ThreadEvent:
 
     def age_in_hours(self) -> float:
         """Get the age of this event in hours."""
-        return (time.time() - self.timestamp) / 3600.0
+        return (time_source.time() - self.timestamp) / 3600.0
 
 
 @dataclass
@@ -174,7 +176,7 @@ class ThreadStage:
     world_changes: Dict[str, Any] = field(default_factory=dict)  # Changes to apply
     completion_rewards: Dict[str, Any] = field(default_factory=dict)
     time_pressure: Optional[float] = None  # Hours before stage expires
-    created_at: float = field(default_factory=time.time)
+    created_at: float = field(default_factory=time_source.time)
 
     def is_ready_to_progress(self, game_state: Any) -> bool:
         """Check if all conditions are met to progress past this stage."""
@@ -188,7 +190,7 @@ class ThreadStage:
         if self.time_pressure is None:
             return False
 
-        age_hours = (time.time() - self.created_at) / 3600.0
+        age_hours = (time_source.time() - self.created_at) / 3600.0
         return age_hours > self.time_pressure
 
 
@@ -216,8 +218,8 @@ class StoryThread:
         self.events: List[ThreadEvent] = []
 
         # Thread metadata
-        self.created_at = time.time()
-        self.last_updated = time.time()
+        self.created_at = time_source.time()
+        self.last_updated = time_source.time()
         self.involved_npcs: Set[str] = set()
         self.tags: Set[str] = set()
 
@@ -255,7 +257,7 @@ class StoryThread:
 
             # Move to next stage
             self.current_stage_index += 1
-            self.last_updated = time.time()
+            self.last_updated = time_source.time()
 
             # Update thread status based on progression
             if self.current_stage_index >= len(self.stages):
@@ -310,7 +312,7 @@ class StoryThread:
                             # Add mood modifier
                             state.mood_modifiers[f"story_{stage.stage_id}"] = (
                                 mood_effect,
-                                datetime.now() + timedelta(hours=24),
+                                time_source.now() + timedelta(hours=24),
                             )
 
             elif change_type == "world_event":
@@ -341,7 +343,7 @@ class StoryThread:
     def add_event(self, event: ThreadEvent) -> None:
         """Add an event to this thread."""
         self.events.append(event)
-        self.last_updated = time.time()
+        self.last_updated = time_source.time()
 
         # Update player engagement if this was a player action
         if event.player_action:
@@ -384,7 +386,7 @@ class StoryThread:
         base_score += min(0.5, self.player_engagement_score * 0.1)
 
         # Recency factor
-        hours_since_update = (time.time() - self.last_updated) / 3600.0
+        hours_since_update = (time_source.time() - self.last_updated) / 3600.0
         recency_factor = max(
             0.1, 1.0 - (hours_since_update / 168.0)
         )  # Decay over a week
@@ -438,7 +440,7 @@ class StoryThread:
             "player_engagement": self.player_engagement_score,
             "tension_level": self.tension_level,
             "events_count": len(self.events),
-            "age_hours": (time.time() - self.created_at) / 3600.0,
+            "age_hours": (time_source.time() - self.created_at) / 3600.0,
             "next_action": self.get_next_suggested_action(),
         }
 
@@ -5,6 +5,8 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 import random
 
+from .. import time_source
+
 from .story_thread import StoryThread, ThreadStage, ThreadType, BeatType, ThreadLibrary
 
 
@@ -63,7 +65,7 @@ class ThreadManager:
 
         # Tracking
         self.thread_history: List[Dict[str, Any]] = []
-        self.last_update: datetime = datetime.now()
+        self.last_update: datetime = time_source.now()
 
     def add_thread(self, thread: StoryThread) -> bool:
         """Add a new active thread."""
@@ -205,7 +207,7 @@ class ThreadManager:
         for thread in self.active_threads.values():
             thread.calculate_tension()
 
-        self.last_update = datetime.now()
+        self.last_update = time_source.now()
         return events
 
     def detect_convergences(self) -> List[ThreadConvergence]:
@@ -470,7 +472,7 @@ class ThreadManager:
     ) -> None:
         """Log a thread event for analysis."""
         event = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": time_source.now().isoformat(),
             "thread_id": thread_id,
             "event_type": event_type,
             "details": details or {},
@@ -483,7 +485,7 @@ class ThreadManager:
 
     def cleanup_old_data(self, days_old: int = 7) -> None:
         """Clean up old completed threads and convergences."""
-        cutoff = datetime.now() - timedelta(days=days_old)
+        cutoff = time_source.now() - timedelta(days=days_old)
 
         # Remove old completed threads
         old_completed = []
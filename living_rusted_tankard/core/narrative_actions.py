@@ -283,3 +283,87 @@ class NarrativeActionProcessor:
             "action_type": "event_trigger",
             "event_name": event_name,
         }
+
+
+class NarrativeStreamParser:
+    """Separate action tags from narration while it is being streamed.
+
+    Text outside tags is released as soon as it cannot be part of a tag, and
+    each action tag is returned the moment its closing bracket arrives, so a
+    ``[COMMAND: ...]`` can be acted on before generation finishes. Brackets
+    that are not action tags (e.g. ``[Options: ...]``) pass through as text.
+    """
+
+    # Longest bracketed run held back before it is treated as plain text
+    MAX_TAG_LENGTH = 200
+
+    _TAG = re.compile(r"\[(\w+):\s*([^\]]+)\]")
+    _TAG_PREFIX = re.compile(r"\[\w*(?::[^\]]*)?")
+
+    def __init__(self, processor: Optional[NarrativeActionProcessor] = None):
+        self.processor = processor or NarrativeActionProcessor()
+        self._buffer = ""
+        self._tag_names = {action_type.value for action_type in ActionType}
+
+    def feed(self, chunk: str) -> Tuple[str, List[NarrativeAction]]:
+        """Add streamed text; return (displayable text, completed actions)."""
+        self._buffer += chunk
+        text: List[str] = []
+        actions: List[NarrativeAction] = []
+
+        while self._buffer:
+            start = self._buffer.find("[")
+            if start == -1:
+                text.append(self._buffer)
+                self._buffer = ""
+                break
+
+            text.append(self._buffer[:start])
+            self._buffer = self._buffer[start:]
+
+            end = self._buffer.find("]")
+            nested = self._buffer.find("[", 1)
+            if nested != -1 and (end == -1 or nested < end):
+                # A stray bracket; only the innermost one can open a tag
+                text.append(self._buffer[:nested])
+                self._buffer = self._buffer[nested:]
+                continue
+
+            if end == -1:
+                if len(
+                    self._buffer
+                ) <= self.MAX_TAG_LENGTH and self._TAG_PREFIX.fullmatch(self._buffer):
+                    break  # Could still become a tag; wait for more text
+                text.append("[")
+                self._buffer = self._buffer[1:]
+                continue
+
+            segment = self._buffer[: end + 1]
+            self._buffer = self._buffer[end + 1 :]
+            action = self._parse_tag(segment)
+            if action is None:
+                text.append(segment)
+            else:
+                actions.append(action)
+
+        return "".join(text), actions
+
+    def flush(self) -> str:
+        """Return any held-back text once the stream has ended."""
+        rest, self._buffer = self._buffer, ""
+        return rest
+
+    def _parse_tag(self, segment: str) -> Optional[NarrativeAction]:
+        match = self._TAG.fullmatch(segment)
+        if not match or match.group(1).upper() not in self._tag_names:
+            return None
+        try:
+            parameters = self.processor._parse_parameters(match.group(2))
+        except Exception as e:
+            logger.error(f"Error parsing streamed action '{segment}': {e}")
+            parameters = {}
+        return NarrativeAction(
+            action_type=ActionType(match.group(1).upper()),
+            parameters=parameters,
+            raw_text=match.group(2),
+        )
@@ -1,9 +1,11 @@
-from typing import Dict, List, Optional, Union, Any
+from typing import Dict, List, Optional, Union, Any, Tuple
 from pydantic import BaseModel, Field
 from pathlib import Path
 import json
 import random
 
+from .static_data import get_static_data
+
 # Assuming NPCType is defined elsewhere, e.g., in core.npc
 # from .npc import NPCType
 # For now, we'll assume NPCType will be passed as a string from npc.py
@@ -14,13 +16,36 @@ class NewsItemCondition(BaseModel):
     requires_event: Optional[str] = None
     # Could add other conditions like player reputation, quest status, etc.
 
+    class Config:
+        allow_mutation = False
+
 
 class NewsItem(BaseModel):
     id: str
     text: str
-    source_types: List[str]  # List of NPCType strings
+    source_types: Tuple[str, ...]  # NPCType strings
     conditions: Optional[NewsItemCondition] = None
 
+    class Config:
+        # Parsed once per process and shared by every session
+        allow_mutation = False
+
+
+def parse_news_items(data: Dict[str, Any]) -> Tuple[NewsItem, ...]:
+    """Build NewsItems from news.json (shared, read-only)."""
+    loaded_items = []
+    for item_data in data.get("news_items", []):
+        # Parse conditions if present
+        conditions_data = item_data.get("conditions")
+        if conditions_data:
+            item_data["conditions"] = NewsItemCondition(**conditions_data)
+        else:
+            item_data["conditions"] = None  # Ensure it's None if not present
+
+        news_item = NewsItem(**item_data)
+        loaded_items.append(news_item)
+    return tuple(loaded_items)
+
 
 class NewsManager(BaseModel):
     news_items: List[NewsItem] = Field(default_factory=list)
@@ -49,21 +74,8 @@ class NewsManager(BaseModel):
             return
 
         try:
-            with open(news_file, "r") as f:
-                data = json.load(f)
-
-            loaded_items = []
-            for item_data in data.get("news_items", []):
-                # Parse conditions if present
-                conditions_data = item_data.get("conditions")
-                if conditions_data:
-                    item_data["conditions"] = NewsItemCondition(**conditions_data)
-                else:
-                    item_data["conditions"] = None  # Ensure it's None if not present
-
-                news_item = NewsItem(**item_data)
-                loaded_items.append(news_item)
-            self.news_items = loaded_items
+            # The parsed items are shared across sessions; the list is ours
+            self.news_items = list(get_static_data().load(news_file, parse_news_items))
             self._loaded = True
             # print(f"DEBUG: Loaded {len(self.news_items)} news items from {news_file}")
         except json.JSONDecodeError as e:
@@ -4,9 +4,11 @@ from dataclasses import dataclass, field
 from enum import Enum, auto
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any, Callable, Set, TYPE_CHECKING, Union
+import heapq
 import random
-import json
-from pydantic import BaseModel, Field as PydanticField
+import weakref
+from types import MappingProxyType
+from pydantic import BaseModel, Field as PydanticField, PrivateAttr
 
 if TYPE_CHECKING:
     from .player import PlayerState
@@ -16,6 +18,7 @@ if TYPE_CHECKING:
     from .game_state import GameState  # To pass to _handle_conversation for context
 
 from .callable_registry import get_interaction
+from .static_data import freeze, get_static_data
 
 
 class NPCType(Enum):
@@ -96,9 +99,41 @@ class NPC(BaseModel):
     current_room: Optional[str] = PydanticField(default=None)
     current_event_modifier: Optional[str] = None
 
+    # Manager whose presence index follows this NPC (a weakref)
+    _presence_index: Optional[Any] = PrivateAttr(default=None)
+
     class Config:
         arbitrary_types_allowed = True
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in _WATCHED_FIELDS and self._presence_index is not None:
+            manager = self._presence_index()
+            if manager is not None:
+                manager._on_npc_changed(self, name)
+
+    def is_scheduled_at(self, hour: float) -> bool:
+        """Whether ``hour`` (0-24) falls in one of the schedule windows."""
+        return any(
+            (start <= hour < end) if start < end else (hour >= start or hour < end)
+            for start, end in self.schedule
+        )
+
+    def next_schedule_change(self, current_time: float) -> float:
+        """Game time of the next schedule boundary or midnight after ``current_time``.
+
+        Presence only changes at these times, so there is no need to look at
+        the NPC again before then.
+        """
+        day_start = (current_time // 24) * 24
+        hour = current_time - day_start
+        for boundary in sorted(
+            {float(b) % 24 for window in self.schedule for b in window}
+        ):
+            if boundary > hour:
+                return day_start + boundary
+        return day_start + 24
+
     def update_presence(
         self,
         current_time: float,
@@ -108,12 +143,7 @@ class NPC(BaseModel):
         was_present = self.is_present
         current_hour = current_time % 24
         current_day = int(current_time // 24)
-        scheduled_now = any(
-            (start <= current_hour < end)
-            if start < end
-            else (current_hour >= start or current_hour < end)
-            for start, end in self.schedule
-        )
+        scheduled_now = self.is_scheduled_at(current_hour)
 
         if not scheduled_now:
             if self.is_present:
@@ -300,13 +330,98 @@ class NPC(BaseModel):
         }
 
 
+def parse_npc_definitions(data: Dict[str, Any]) -> MappingProxyType:
+    """Index raw npcs.json definitions by id (shared, read-only)."""
+    return MappingProxyType(
+        {
+            npc_def_data["id"]: freeze(npc_def_data)
+            for npc_def_data in data.get("npc_definitions", [])
+            if npc_def_data.get("id")
+        }
+    )
+
+
+# NPC fields that move an NPC within the presence index
+_INDEXED_FIELDS = frozenset({"is_present", "current_room", "schedule"})
+# NPC fields shown to players while the NPC is present
+_DISPLAYED_FIELDS = frozenset({"name", "description"})
+_WATCHED_FIELDS = _INDEXED_FIELDS | _DISPLAYED_FIELDS
+
+
+class _NPCRegistry(dict):
+    """NPC id -> NPC mapping that keeps its manager's presence index in step."""
+
+    def __init__(self, manager: "NPCManager", *args, **kwargs):
+        super().__init__()
+        self._manager = weakref.ref(manager)
+        self.update(*args, **kwargs)
+
+    def __setitem__(self, npc_id: str, npc: NPC) -> None:
+        manager = self._manager()
+        previous = self.get(npc_id)
+        if previous is not None and previous is not npc and manager:
+            manager._untrack(previous)
+        super().__setitem__(npc_id, npc)
+        if manager:
+            manager._track(npc)
+
+    def __delitem__(self, npc_id: str) -> None:
+        npc = self[npc_id]
+        super().__delitem__(npc_id)
+        manager = self._manager()
+        if manager:
+            manager._untrack(npc)
+
+    def pop(self, npc_id: str, *default):
+        if npc_id not in self:
+            return super().pop(npc_id, *default)
+        npc = self[npc_id]
+        del self[npc_id]
+        return npc
+
+    def popitem(self):
+        npc_id = next(reversed(self))
+        return npc_id, self.pop(npc_id)
+
+    def setdefault(self, npc_id: str, npc: Optional[NPC] = None):
+        if npc_id not in self:
+            self[npc_id] = npc
+        return self[npc_id]
+
+    def update(self, *args, **kwargs) -> None:
+        for npc_id, npc in dict(*args, **kwargs).items():
+            self[npc_id] = npc
+
+    def clear(self) -> None:
+        for npc_id in list(self):
+            del self[npc_id]
+
+
 class NPCManager:
-    """Manages NPCs in the game world. Not a Pydantic model for compatibility."""
+    """Manages NPCs in the game world. Not a Pydantic model for compatibility.
+
+    Presence is indexed: present NPCs are kept by id and by room, and each
+    NPC is queued on a heap under the game time of its next schedule
+    boundary, so ``update_all_npcs`` only touches NPCs whose boundary has
+    passed and presence queries never scan the roster.
+    """
 
     def __init__(self, data_dir: Union[str, Path], event_bus: Optional[Any] = None):
         self._data_dir = Path(data_dir)
         self._event_bus = event_bus
         self._npc_definitions = {}  # Initialize as empty dict
+
+        # Presence index
+        self._present: Dict[str, NPC] = {}
+        self._present_by_room: Dict[Optional[str], Dict[str, NPC]] = {}
+        self._indexed_room: Dict[str, Optional[str]] = {}
+        self._presence_changes: Set[str] = set()
+        self._presence_revision = 0
+        self._transitions: List[Tuple[float, int, str]] = []
+        self._transition_seq: Dict[str, int] = {}
+        self._next_seq = 0
+        self._last_update_time: Optional[float] = None
+
         self.npcs = {}  # Dictionary of active NPCs
 
         # Load NPC definitions from JSON
@@ -322,12 +437,10 @@ class NPCManager:
             print(f"Warning: NPC file {npc_file} not found.")
             return
         try:
-            with open(npc_file, "r") as f:
-                data = json.load(f)
-            for npc_def_data in data.get("npc_definitions", []):
-                def_id = npc_def_data.get("id")
-                if def_id:
-                    self._npc_definitions[def_id] = npc_def_data
+            # Parsed once per process and shared by every session's manager
+            self._npc_definitions = get_static_data().load(
+                npc_file, parse_npc_definitions
+            )
         except Exception as e:
             print(f"Error loading NPC definitions: {e}")
 
@@ -355,8 +468,9 @@ class NPCManager:
                         # Create inventory item in the proper format
                         from .items import InventoryItem
 
+                        # Definitions are shared, as in the player's Inventory
                         inv_item = InventoryItem(
-                            item=item_def.model_copy(deep=True),
+                            item=item_def,
                             quantity=item_data.get("quantity", 1),
                         )
                         inventory_objects.append(inv_item)
@@ -366,6 +480,7 @@ class NPCManager:
                 for key, interact_data in processed_data.get(
                     "interactions", {}
                 ).items():
+                    interact_data = dict(interact_data)  # Leave the definition intact
                     if (
                         "reputation_requirement" in interact_data
                         and interact_data["reputation_requirement"]
@@ -381,15 +496,121 @@ class NPCManager:
             except Exception as e:
                 print(f"Error creating NPC '{def_id}': {e}")
 
+    @property
+    def npcs(self) -> Dict[str, NPC]:
+        return self._npcs
+
+    @npcs.setter
+    def npcs(self, npcs: Dict[str, NPC]) -> None:
+        for npc in getattr(self, "_npcs", {}).values():
+            self._untrack(npc)
+        self._npcs = _NPCRegistry(self, npcs)
+
     def get_npc(self, npc_id: str) -> Optional[NPC]:
         return self.npcs.get(npc_id)
 
     def update_all_npcs(self, game_time: float) -> None:
-        for npc in self.npcs.values():
+        """Re-evaluate presence for NPCs whose schedule boundary has passed."""
+        if self._last_update_time is not None and game_time < self._last_update_time:
+            # Time went backwards (e.g. a load); every NPC is due again
+            for npc in self.npcs.values():
+                self._schedule(npc, float("-inf"))
+        self._last_update_time = game_time
+
+        while self._transitions and self._transitions[0][0] <= game_time:
+            _, seq, npc_id = heapq.heappop(self._transitions)
+            if self._transition_seq.get(npc_id) != seq:
+                continue  # Superseded entry
+            npc = self.npcs[npc_id]
             npc.update_presence(game_time, self._event_bus, self._npc_definitions)
+            self._schedule(npc, npc.next_schedule_change(game_time))
 
     def get_present_npcs(self) -> List[NPC]:
-        return [npc for npc in self.npcs.values() if npc.is_present]
+        return list(self._present.values())
+
+    def get_present_npcs_in_room(self, room_id: Optional[str]) -> List[NPC]:
+        """Present NPCs whose ``current_room`` is ``room_id``."""
+        return list(self._present_by_room.get(room_id, {}).values())
+
+    def is_npc_present(self, npc_id: str) -> bool:
+        return npc_id in self._present
+
+    @property
+    def presence_revision(self) -> int:
+        """Goes up whenever the present NPCs, or how they are shown, change."""
+        return self._presence_revision
+
+    def pop_presence_changes(self) -> Set[str]:
+        """Ids of NPCs whose presence or room changed since the last call."""
+        changes, self._presence_changes = self._presence_changes, set()
+        return changes
+
+    def _track(self, npc: NPC) -> None:
+        """Start indexing an NPC that joined the roster."""
+        npc._presence_index = weakref.ref(self)
+        self._index_presence(npc)
+        self._schedule(npc, float("-inf"))
+
+    def _untrack(self, npc: NPC) -> None:
+        """Stop indexing an NPC that left the roster."""
+        if npc._presence_index is not None and npc._presence_index() is self:
+            npc._presence_index = None
+        self._unindex(npc.id)
+        self._transition_seq.pop(npc.id, None)
+
+    def _on_npc_changed(self, npc: NPC, field_name: str) -> None:
+        if self.npcs.get(npc.id) is not npc:
+            return  # A copy, or an NPC that has left the roster
+        if field_name == "schedule":
+            self._schedule(npc, float("-inf"))
+        elif field_name in _DISPLAYED_FIELDS:
+            if npc.id in self._present:
+                self._presence_revision += 1
+        else:
+            self._index_presence(npc)
+
+    def _index_presence(self, npc: NPC) -> None:
+        was_present = npc.id in self._present
+        old_room = self._indexed_room.get(npc.id)
+        if npc.is_present == was_present and (
+            not was_present or old_room == npc.current_room
+        ):
+            return
+
+        self._unindex(npc.id)
+        if npc.is_present:
+            self._present[npc.id] = npc
+            self._present_by_room.setdefault(npc.current_room, {})[npc.id] = npc
+            self._indexed_room[npc.id] = npc.current_room
+        self._presence_changes.add(npc.id)
+        self._presence_revision += 1
+
+    def _unindex(self, npc_id: str) -> None:
+        if self._present.pop(npc_id, None) is None:
+            return
+        room_id = self._indexed_room.pop(npc_id, None)
+        room = self._present_by_room.get(room_id)
+        if room is not None:
+            room.pop(npc_id, None)
+            if not room:
+                del self._present_by_room[room_id]
+        self._presence_changes.add(npc_id)
+        self._presence_revision += 1
+
+    def _schedule(self, npc: NPC, due: float) -> None:
+        """Queue the NPC's next presence check at game time ``due``."""
+        self._next_seq += 1
+        self._transition_seq[npc.id] = self._next_seq
+        heapq.heappush(self._transitions, (due, self._next_seq, npc.id))
+
+        # Drop superseded entries once they outnumber the live ones
+        if len(self._transitions) > 2 * len(self._transition_seq) + 16:
+            self._transitions = [
+                entry
+                for entry in self._transitions
+                if self._transition_seq.get(entry[2]) == entry[1]
+            ]
+            heapq.heapify(self._transitions)
 
     def get_interactive_npcs(self, player_state: "PlayerState") -> List[Dict[str, Any]]:
         from .reputation import get_reputation, get_reputation_tier, REPUTATION_TIERS
@@ -517,7 +738,7 @@ class NPCManager:
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize NPCManager state to a dictionary."""
-        return {"npcs": {npc_id: npc.model_dump() for npc_id, npc in self.npcs.items()}}
+        return {"npcs": {npc_id: npc.dict() for npc_id, npc in self.npcs.items()}}
 
     @classmethod
     def from_dict(
@@ -532,6 +753,6 @@ class NPCManager:
         # Load NPCs from serialized data
         if "npcs" in data and isinstance(data["npcs"], dict):
             for npc_id, npc_data in data["npcs"].items():
-                manager.npcs[npc_id] = NPC.model_validate(npc_data)
+                manager.npcs[npc_id] = NPC.parse_obj(npc_data)
 
         return manager
@@ -6,6 +6,8 @@ from enum import Enum
 import random
 from datetime import datetime, time
 
+from .. import time_source
+
 from .psychology import NPCPsychology, Personality, Mood, MotivationType
 
 
@@ -157,7 +159,7 @@ class BehaviorRule:
         """Check if rule can be triggered."""
         # Check cooldown
         if self.last_triggered and self.cooldown > 0:
-            time_passed = (datetime.now() - self.last_triggered).total_seconds() / 60
+            time_passed = (time_source.now() - self.last_triggered).total_seconds() / 60
             if time_passed < self.cooldown:
                 return False
 
@@ -177,7 +179,7 @@ class BehaviorRule:
 
     def trigger(self) -> List[Action]:
         """Trigger the rule and return actions."""
-        self.last_triggered = datetime.now()
+        self.last_triggered = time_source.now()
         return self.actions.copy()
 
 
@@ -416,7 +418,7 @@ class BehaviorEngine:
                 return rule
 
         # Check daily schedule as fallback
-        current_time = context.get("current_time", datetime.now())
+        current_time = context.get("current_time", time_source.now())
         routine = self.daily_schedule.get_current_routine(current_time)
         if routine and routine.can_trigger(context, current_mood):
             return routine
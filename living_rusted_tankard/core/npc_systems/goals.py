@@ -6,6 +6,8 @@ from enum import Enum
 from datetime import datetime, timedelta
 import random
 
+from .. import time_source
+
 from .psychology import NPCPsychology, MotivationType, Personality
 from .behavioral_rules import (
     BehaviorRule,
@@ -86,7 +88,7 @@ class GoalStep:
         # Check cooldown
         if self.last_attempt:
             cooldown = timedelta(hours=self.difficulty * 2)
-            if datetime.now() - self.last_attempt < cooldown:
+            if time_source.now() - self.last_attempt < cooldown:
                 return False
 
         return True
@@ -94,7 +96,7 @@ class GoalStep:
     def attempt(self, skill_level: float = 0.5) -> bool:
         """Attempt to complete the step."""
         self.attempts += 1
-        self.last_attempt = datetime.now()
+        self.last_attempt = time_source.now()
 
         # Success chance based on skill vs difficulty
         success_chance = skill_level * (1.0 - self.difficulty) + 0.2
@@ -142,7 +144,7 @@ class Goal:
     motivation_strength: float = 0.5
 
     # Lifecycle
-    created: datetime = field(default_factory=datetime.now)
+    created: datetime = field(default_factory=time_source.now)
     deadline: Optional[datetime] = None
     completed: Optional[datetime] = None
 
@@ -201,7 +203,7 @@ class Goal:
         # Update status
         if self.progress >= 1.0:
             self.status = GoalStatus.COMPLETED
-            self.completed = datetime.now()
+            self.completed = time_source.now()
         elif self.blockers:
             self.status = GoalStatus.BLOCKED
         elif self.status == GoalStatus.PLANNING and self.steps:
@@ -217,7 +219,7 @@ class Goal:
             return False
 
         # Check deadline
-        if self.deadline and datetime.now() > self.deadline:
+        if self.deadline and time_source.now() > self.deadline:
             self.status = GoalStatus.FAILED
             return False
 
@@ -233,7 +235,7 @@ class Goal:
 
         # Increase priority as deadline approaches
         if self.deadline:
-            time_left = (self.deadline - datetime.now()).total_seconds()
+            time_left = (self.deadline - time_source.now()).total_seconds()
             if time_left < 86400:  # Less than a day
                 base_priority *= 1.5
             elif time_left < 604800:  # Less than a week
@@ -405,7 +407,7 @@ class GoalGenerator:
             owner_id=npc_id,
             importance=0.8,
             urgency=0.6,
-            deadline=datetime.now() + timedelta(days=1),
+            deadline=time_source.now() + timedelta(days=1),
         )
 
         profit_goal.add_step(
@@ -1,12 +1,17 @@
 """Rumor and gossip propagation system."""
 
-from typing import Dict, List, Optional, Set, Tuple, Any
+from typing import Deque, Dict, Iterable, List, Optional, Set, Tuple, Any
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime, timedelta
+import heapq
+import itertools
 import random
 import math
 
+from .. import time_source
+
 from .psychology import NPCPsychology, Personality
 from .relationships import RelationshipWeb, RelationshipType
 from .secrets import EnhancedSecret, SecretType
@@ -82,7 +87,7 @@ class Rumor:
     danger_level: float = 0.0  # Dangerous to spread
 
     # Lifecycle
-    created: datetime = field(default_factory=datetime.now)
+    created: datetime = field(default_factory=time_source.now)
     last_spread: Optional[datetime] = None
     expiry: Optional[datetime] = None  # When it becomes old news
 
@@ -94,7 +99,7 @@ class Rumor:
         self.sources[npc_id] = source
         self.perceived_truth[npc_id] = perceived_truth
         self.spread_count += 1
-        self.last_spread = datetime.now()
+        self.last_spread = time_source.now()
 
     def get_spread_probability(self) -> float:
         """Calculate probability of spreading further."""
@@ -106,7 +111,7 @@ class Rumor:
 
         # Reduce over time (old news)
         if self.created:
-            age_days = (datetime.now() - self.created).days
+            age_days = (time_source.now() - self.created).days
             age_factor = math.exp(-age_days * 0.1)  # Exponential decay
             base_prob *= age_factor
 
@@ -127,11 +132,11 @@ class Rumor:
 
     def is_fresh(self) -> bool:
         """Check if rumor is still fresh/interesting."""
-        if self.expiry and datetime.now() > self.expiry:
+        if self.expiry and time_source.now() > self.expiry:
             return False
 
         # Check age
-        age_days = (datetime.now() - self.created).days
+        age_days = (time_source.now() - self.created).days
         if age_days > 7:  # Week old
             return False
 
@@ -158,13 +163,144 @@ class GossipExchange:
     reactions: Dict[str, str] = field(default_factory=dict)  # Rumor ID -> reaction
 
 
+# Rumor.is_fresh() treats a rumor as stale once it is more than 7 whole days old
+RUMOR_FRESH_PERIOD = timedelta(days=8)
+
+
+class RumorStore:
+    """Rumors indexed by who knows them and by when they go stale.
+
+    ``known_ids(npc)`` and ``fresh_ids(npc)`` answer "what does this NPC
+    know" without scanning every rumor, and a heap ordered by each rumor's
+    stale time lets ``prune`` retire old rumors without scanning either.
+    Knowers must be added through ``learn`` (or be present when the rumor
+    is ``add``ed) so the indexes stay in step with ``Rumor.known_by``.
+    Call ``reschedule`` after changing a rumor's ``created`` or ``expiry``.
+    """
+
+    def __init__(self):
+        self.rumors: Dict[str, Rumor] = {}
+        # NPC -> rumor IDs, as ordered sets in the order they were learned
+        self._known: Dict[str, Dict[str, None]] = {}
+        self._fresh_known: Dict[str, Dict[str, None]] = {}
+        self._fresh: Dict[str, None] = {}
+        # (stale time, tie-breaker, rumor ID)
+        self._stale_heap: List[Tuple[datetime, int, str]] = []
+        self._sequence = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self.rumors)
+
+    def __contains__(self, rumor_id: str) -> bool:
+        return rumor_id in self.rumors
+
+    def get(self, rumor_id: str) -> Optional[Rumor]:
+        return self.rumors.get(rumor_id)
+
+    def add(self, rumor: Rumor) -> None:
+        """Store a rumor and index everyone who already knows it."""
+        self.rumors[rumor.id] = rumor
+        fresh = not self._is_stale(rumor, time_source.now())
+        if fresh:
+            self._fresh[rumor.id] = None
+            self._schedule(rumor)
+        for npc_id in rumor.known_by:
+            self._index_knower(rumor.id, npc_id, fresh)
+
+    def learn(
+        self, rumor: Rumor, npc_id: str, source: RumorSource, perceived_truth: float
+    ) -> None:
+        """Record that an NPC has heard a rumor."""
+        rumor.add_knower(npc_id, source, perceived_truth)
+        self._index_knower(rumor.id, npc_id, rumor.id in self._fresh)
+
+    def reschedule(self, rumor: Rumor) -> None:
+        """Re-index a rumor whose age or expiry changed."""
+        if self._is_stale(rumor, time_source.now()):
+            self._retire(rumor.id)
+        elif rumor.id not in self._fresh:
+            self._fresh[rumor.id] = None
+            for npc_id in rumor.known_by:
+                self._fresh_known.setdefault(npc_id, {})[rumor.id] = None
+            self._schedule(rumor)
+        else:
+            self._schedule(rumor)
+
+    def prune(self, now: Optional[datetime] = None) -> List[str]:
+        """Retire rumors whose stale time has passed. Returns their IDs."""
+        now = now or time_source.now()
+        retired = []
+        while self._stale_heap and self._stale_heap[0][0] <= now:
+            _, _, rumor_id = heapq.heappop(self._stale_heap)
+            rumor = self.rumors.get(rumor_id)
+            if rumor is None or rumor_id not in self._fresh:
+                continue
+            if self._is_stale(rumor, now):
+                self._retire(rumor_id)
+                retired.append(rumor_id)
+            else:
+                # Expiry moved later; due again at its new stale time
+                self._schedule(rumor, not_before=now)
+        return retired
+
+    def knows(self, npc_id: str, rumor_id: str) -> bool:
+        return rumor_id in self._known.get(npc_id, ())
+
+    def known_ids(self, npc_id: str) -> List[str]:
+        """IDs of every rumor an NPC knows, in the order they learned them."""
+        return list(self._known.get(npc_id, ()))
+
+    def fresh_ids(self, npc_id: str) -> List[str]:
+        """IDs of the fresh rumors an NPC knows, as of the last prune."""
+        return list(self._fresh_known.get(npc_id, ()))
+
+    def fresh_rumor_ids(self) -> List[str]:
+        return list(self._fresh)
+
+    def gossipers(self) -> List[str]:
+        """NPCs who know at least one fresh rumor."""
+        return [npc_id for npc_id, known in self._fresh_known.items() if known]
+
+    def _index_knower(self, rumor_id: str, npc_id: str, fresh: bool) -> None:
+        self._known.setdefault(npc_id, {})[rumor_id] = None
+        if fresh:
+            self._fresh_known.setdefault(npc_id, {})[rumor_id] = None
+
+    def _retire(self, rumor_id: str) -> None:
+        if rumor_id not in self._fresh:
+            return
+        del self._fresh[rumor_id]
+        for npc_id in self.rumors[rumor_id].known_by:
+            self._fresh_known.get(npc_id, {}).pop(rumor_id, None)
+
+    def _schedule(self, rumor: Rumor, not_before: Optional[datetime] = None) -> None:
+        stale_at = rumor.created + RUMOR_FRESH_PERIOD
+        if rumor.expiry:
+            # is_fresh() still holds at the expiry instant itself
+            stale_at = min(stale_at, rumor.expiry + timedelta(microseconds=1))
+        if not_before and stale_at <= not_before:
+            stale_at = not_before + timedelta(microseconds=1)
+        heapq.heappush(self._stale_heap, (stale_at, next(self._sequence), rumor.id))
+
+    @staticmethod
+    def _is_stale(rumor: Rumor, now: datetime) -> bool:
+        if rumor.expiry and now > rumor.expiry:
+            return True
+        return (now - rumor.created).days > 7
+
+
 class GossipNetwork:
     """Manages the spread of rumors and gossip."""
 
+    # Exchanges kept in the rolling log; older ones are dropped
+    EXCHANGE_LOG_SIZE = 1000
+
     def __init__(self, relationship_web: RelationshipWeb):
         self.relationship_web = relationship_web
-        self.rumors: Dict[str, Rumor] = {}
-        self.exchanges: List[GossipExchange] = []
+        self.store = RumorStore()
+        self.rumors: Dict[str, Rumor] = self.store.rumors
+        self.exchanges: Deque[GossipExchange] = deque(maxlen=self.EXCHANGE_LOG_SIZE)
+        self.total_exchanges = 0
 
         # Gossiper traits
         self.gossip_tendencies: Dict[str, float] = {}  # NPC -> tendency to gossip
@@ -237,7 +373,7 @@ class GossipNetwork:
         rumor.add_knower(discovered_by, source, accuracy)
 
         # Add to network
-        self.rumors[rumor.id] = rumor
+        self.store.add(rumor)
 
         return rumor
 
@@ -289,7 +425,7 @@ class GossipNetwork:
         rumor.add_knower(witness, source, 0.9)
 
         # Add to network
-        self.rumors[rumor.id] = rumor
+        self.store.add(rumor)
 
         return rumor
 
@@ -358,11 +494,11 @@ class GossipNetwork:
             confidence=gossiper_belief,
         )
 
-        rumor.add_knower(listener, source, belief)
+        self.store.learn(rumor, listener, source, belief)
 
         # Record exchange
         exchange = GossipExchange(
-            timestamp=datetime.now(),
+            timestamp=time_source.now(),
             gossiper=gossiper,
             listener=listener,
             rumors_shared=[rumor_id],
@@ -373,6 +509,7 @@ class GossipNetwork:
         exchange.belief_levels[rumor_id] = belief
 
         self.exchanges.append(exchange)
+        self.total_exchanges += 1
 
         return True
 
@@ -417,10 +554,11 @@ class GossipNetwork:
         opportunities = []
 
         # Get NPC's known rumors
+        self.store.prune()
         known_rumors = [
             rumor_id
-            for rumor_id, rumor in self.rumors.items()
-            if npc_id in rumor.known_by and rumor.is_fresh()
+            for rumor_id in self.store.fresh_ids(npc_id)
+            if self.rumors[rumor_id].is_fresh()
         ]
 
         if not known_rumors:
@@ -440,7 +578,7 @@ class GossipNetwork:
             shareable_rumors = [
                 rumor_id
                 for rumor_id in known_rumors
-                if other_npc not in self.rumors[rumor_id].known_by
+                if not self.store.knows(other_npc, rumor_id)
             ]
 
             if shareable_rumors:
@@ -460,74 +598,95 @@ class GossipNetwork:
         return opportunities
 
     def simulate_gossip_spread(self, hours: float = 1.0) -> Dict[str, Any]:
-        """Simulate gossip spreading over time."""
+        """Simulate gossip spreading over time.
+
+        Every NPC gets one chance per fresh rumor they know, with a
+        probability of their gossip tendency scaled by the hours passed.
+        Rather than rolling each chance separately, the chances that come
+        up are found by skipping ahead geometrically, so a quiet tick costs
+        about as much as the gossip it produces. A rumor moves at most one
+        step along the network per call.
+        """
         spread_events = []
+        self.store.prune()
+        learned_now: Set[Tuple[str, str]] = set()
 
-        # For each active rumor
-        for rumor_id, rumor in self.rumors.items():
-            if not rumor.is_fresh():
+        for gossiper in self.store.gossipers():
+            gossip_chance = self.gossip_tendencies.get(gossiper, 0.5) * (hours / 24.0)
+            if gossip_chance <= 0:
                 continue
 
-            # For each knower
-            for gossiper in list(rumor.known_by):  # Copy to avoid modification issues
-                # Check gossip probability based on time
-                gossip_chance = self.gossip_tendencies.get(gossiper, 0.5) * (
-                    hours / 24.0
-                )
-
-                if random.random() < gossip_chance:
-                    # Find someone to tell
-                    connections = self.relationship_web.gossip_network.get(
-                        gossiper, set()
-                    )
-
-                    for potential_listener in connections:
-                        if potential_listener not in rumor.known_by:
-                            # Try to spread
-                            context = {"location": "tavern", "time": "gossip_hour"}
-                            if self.spread_rumor(
-                                rumor_id, gossiper, potential_listener, context
-                            ):
-                                spread_events.append(
-                                    {
-                                        "rumor": rumor_id,
-                                        "from": gossiper,
-                                        "to": potential_listener,
-                                        "content": rumor.evolve_content(),
-                                    }
-                                )
-                                break  # One spread per gossiper per cycle
+            known = self.store.fresh_ids(gossiper)
+            for rumor_id in self._sample_chances(known, gossip_chance):
+                if (gossiper, rumor_id) in learned_now:
+                    continue  # Heard it this cycle; passes it on next time
+                rumor = self.rumors[rumor_id]
+                if not rumor.is_fresh():
+                    continue
+
+                # Find someone to tell
+                connections = self.relationship_web.gossip_network.get(gossiper, set())
+                for potential_listener in connections:
+                    if potential_listener not in rumor.known_by:
+                        # Try to spread
+                        context = {"location": "tavern", "time": "gossip_hour"}
+                        if self.spread_rumor(
+                            rumor_id, gossiper, potential_listener, context
+                        ):
+                            learned_now.add((potential_listener, rumor_id))
+                            spread_events.append(
+                                {
+                                    "rumor": rumor_id,
+                                    "from": gossiper,
+                                    "to": potential_listener,
+                                    "content": rumor.evolve_content(),
+                                }
+                            )
+                            break  # One spread per gossiper per rumor
 
         return {
             "spread_count": len(spread_events),
             "events": spread_events,
-            "active_rumors": len([r for r in self.rumors.values() if r.is_fresh()]),
+            "active_rumors": len(self.store.fresh_rumor_ids()),
         }
 
+    @staticmethod
+    def _sample_chances(items: List[str], probability: float) -> Iterable[str]:
+        """Yield each item independently with the given probability."""
+        if probability >= 1.0:
+            yield from items
+            return
+        log_miss = math.log1p(-probability)
+        index = -1
+        while True:
+            # Number of misses before the next hit is geometric
+            index += 1 + int(math.log(1.0 - random.random()) / log_miss)
+            if index >= len(items):
+                return
+            yield items[index]
+
     def get_npc_known_rumors(
         self, npc_id: str, include_beliefs: bool = True
     ) -> List[Dict[str, Any]]:
         """Get all rumors known by an NPC."""
         known = []
 
-        for rumor_id, rumor in self.rumors.items():
-            if npc_id in rumor.known_by:
-                rumor_info = {
-                    "id": rumor_id,
-                    "type": rumor.type.value,
-                    "content": rumor.evolve_content(),
-                    "subject": rumor.subject,
-                    "source": rumor.sources[npc_id].current_source,
-                    "freshness": rumor.is_fresh(),
-                }
-
-                if include_beliefs:
-                    rumor_info["belie"] = rumor.perceived_truth.get(npc_id, 0.5)
-                    rumor_info["trust_in_source"] = rumor.sources[
-                        npc_id
-                    ].get_trust_factor()
-
-                known.append(rumor_info)
+        for rumor_id in self.store.known_ids(npc_id):
+            rumor = self.rumors[rumor_id]
+            rumor_info = {
+                "id": rumor_id,
+                "type": rumor.type.value,
+                "content": rumor.evolve_content(),
+                "subject": rumor.subject,
+                "source": rumor.sources[npc_id].current_source,
+                "freshness": rumor.is_fresh(),
+            }
+
+            if include_beliefs:
+                rumor_info["belie"] = rumor.perceived_truth.get(npc_id, 0.5)
+                rumor_info["trust_in_source"] = rumor.sources[npc_id].get_trust_factor()
+
+            known.append(rumor_info)
 
         # Sort by freshness and importance
         known.sort(
@@ -577,7 +736,7 @@ class GossipNetwork:
         )
         rumor.add_knower(creator, source, 0.8)
 
-        self.rumors[rumor.id] = rumor
+        self.store.add(rumor)
 
         return rumor
 
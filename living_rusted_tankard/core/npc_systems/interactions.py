@@ -6,6 +6,8 @@ from enum import Enum
 from datetime import datetime, timedelta
 import random
 
+from .. import time_source
+
 from .psychology import NPCPsychology, Personality, Mood
 from .relationships import RelationshipWeb, RelationshipType, Conflict, ConflictType
 from .dialogue import DialogueGenerator, DialogueContext, DialogueType
@@ -102,7 +104,7 @@ class NPCInteraction:
             "speaker": speaker,
             "action": action,
             "dialogue": dialogue,
-            "timestamp": datetime.now(),
+            "timestamp": time_source.now(),
         }
         self.turns.append(turn)
 
@@ -147,7 +149,7 @@ class InteractionManager:
 
         # Check last interaction time
         if context.last_interaction:
-            time_since = datetime.now() - context.last_interaction
+            time_since = time_source.now() - context.last_interaction
             if time_since < timedelta(minutes=30):
                 return None  # Too soon
 
@@ -203,7 +205,7 @@ class InteractionManager:
         """Start an interaction between NPCs."""
         interaction = NPCInteraction(
             id=f"interaction_{datetime.now().timestamp()}_{initiator}_{responder}",
-            timestamp=datetime.now(),
+            timestamp=time_source.now(),
             initiator=initiator,
             responder=responder,
             type=interaction_type,
@@ -469,13 +471,16 @@ class InteractionManager:
             positive=interaction.outcome
             in [InteractionOutcome.POSITIVE, InteractionOutcome.RESOLVED]
         )
+        self.relationship_web.invalidate_influence(
+            interaction.initiator, interaction.responder
+        )
 
         # Create rumors if witnessed
         if interaction.context.witnesses and not interaction.context.private:
             self._create_rumors_from_interaction(interaction)
 
         # Update last interaction time
-        interaction.context.last_interaction = datetime.now()
+        interaction.context.last_interaction = time_source.now()
 
     def _create_conflict_from_interaction(
         self, interaction: NPCInteraction
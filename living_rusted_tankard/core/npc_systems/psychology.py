@@ -6,6 +6,8 @@ from enum import Enum
 import random
 from datetime import datetime
 
+from .. import time_source
+
 
 class Personality(Enum):
     """Basic personality types."""
@@ -198,7 +200,7 @@ class Relationship:
             self.positive_interactions += 1
         else:
             self.negative_interactions += 1
-        self.last_interaction = datetime.now()
+        self.last_interaction = time_source.now()
 
 
 class NPCPsychology:
@@ -285,7 +287,7 @@ class NPCPsychology:
     ) -> None:
         """Create a memory of an event."""
         memory = Memory(
-            timestamp=datetime.now(),
+            timestamp=time_source.now(),
             event_type=event_type,
             participants=participants,
             location=location,
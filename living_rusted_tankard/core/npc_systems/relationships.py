@@ -6,6 +6,8 @@ from enum import Enum
 import random
 from datetime import datetime
 
+from .. import time_source
+
 from .psychology import Relationship, Secret, Personality, Mood
 
 
@@ -73,7 +75,7 @@ class Conflict:
     participants: Set[str]  # NPC IDs
     description: str
     intensity: float = 0.5  # 0-1, how serious
-    started: datetime = field(default_factory=datetime.now)
+    started: datetime = field(default_factory=time_source.now)
 
     # Conflict details
     root_cause: str = ""
@@ -117,7 +119,7 @@ class Alliance:
     members: Set[str]  # NPC IDs
     description: str
     strength: float = 0.5  # 0-1
-    formed: datetime = field(default_factory=datetime.now)
+    formed: datetime = field(default_factory=time_source.now)
 
     # Alliance details
     purpose: str = ""
@@ -205,6 +207,13 @@ class RelationshipWeb:
         self.gossip_network: Dict[str, Set[str]] = {}  # Who shares gossip with whom
         self.influence_map: Dict[str, float] = {}  # Social influence scores
 
+        # Per-NPC adjacency, kept in step with the collections above so
+        # per-NPC queries scale with the NPC's ties rather than the world
+        self._neighbors: Dict[str, Dict[str, Tuple[str, str]]] = {}
+        self._npc_alliances: Dict[str, Dict[str, Alliance]] = {}
+        self._npc_conflicts: Dict[str, Dict[str, Conflict]] = {}
+        self._npc_groups: Dict[str, Set[str]] = {}
+
         # History
         self.social_events: List[SocialEvent] = []
 
@@ -217,8 +226,23 @@ class RelationshipWeb:
 
     def get_relationship(self, npc1: str, npc2: str) -> Optional[Relationship]:
         """Get relationship between two NPCs."""
-        key = self._get_relationship_key(npc1, npc2)
-        return self.relationships.get(key)
+        key = self._neighbors.get(npc1, {}).get(npc2)
+        return self.relationships.get(key) if key else None
+
+    def get_related_npcs(self, npc_id: str) -> List[str]:
+        """Get all NPCs the given NPC has a relationship with."""
+        return list(self._neighbors.get(npc_id, ()))
+
+    def invalidate_influence(self, *npc_ids: str) -> None:
+        """Drop cached influence scores, for all NPCs if none are given.
+
+        Call this after changing a relationship, alliance or conflict
+        directly rather than through this web.
+        """
+        if not npc_ids:
+            self.influence_map.clear()
+        for npc_id in npc_ids:
+            self.influence_map.pop(npc_id, None)
 
     def set_relationship(
         self,
@@ -231,6 +255,9 @@ class RelationshipWeb:
         key = self._get_relationship_key(npc1, npc2)
         self.relationships[key] = relationship
         self.relationship_types[key] = rel_type
+        self._neighbors.setdefault(npc1, {})[npc2] = key
+        self._neighbors.setdefault(npc2, {})[npc1] = key
+        self.invalidate_influence(npc1, npc2)
 
     def create_relationship(
         self,
@@ -261,14 +288,15 @@ class RelationshipWeb:
         """Add NPC to a social group."""
         if group in self.social_groups:
             self.social_groups[group].add(npc_id)
+            self._npc_groups.setdefault(npc_id, set()).add(group)
+            self.invalidate_influence(npc_id)
 
     def get_social_groups(self, npc_id: str) -> List[str]:
         """Get all social groups an NPC belongs to."""
-        groups = []
-        for group_name, members in self.social_groups.items():
-            if npc_id in members:
-                groups.append(group_name)
-        return groups
+        groups = self._npc_groups.get(npc_id)
+        if not groups:
+            return []
+        return [group for group in self.social_groups if group in groups]
 
     def create_conflict(
         self,
@@ -291,6 +319,9 @@ class RelationshipWeb:
         )
 
         self.conflicts[conflict_id] = conflict
+        for npc_id in conflict.participants:
+            self._npc_conflicts.setdefault(npc_id, {})[conflict_id] = conflict
+        self.invalidate_influence(*conflict.participants)
 
         # Affect relationships
         for i, npc1 in enumerate(participants):
@@ -329,6 +360,9 @@ class RelationshipWeb:
         )
 
         self.alliances[alliance_id] = alliance
+        for npc_id in alliance.members:
+            self._npc_alliances.setdefault(npc_id, {})[alliance_id] = alliance
+        self.invalidate_influence(*alliance.members)
 
         # Strengthen relationships between members
         for i, npc1 in enumerate(members):
@@ -346,6 +380,24 @@ class RelationshipWeb:
 
         return alliance
 
+    def add_alliance_member(self, alliance_id: str, npc_id: str) -> bool:
+        """Add an NPC to an existing alliance."""
+        alliance = self.alliances.get(alliance_id)
+        if not alliance or not alliance.add_member(npc_id):
+            return False
+        self._npc_alliances.setdefault(npc_id, {})[alliance_id] = alliance
+        self.invalidate_influence(*alliance.members)
+        return True
+
+    def remove_alliance_member(self, alliance_id: str, npc_id: str) -> bool:
+        """Remove an NPC from an existing alliance."""
+        alliance = self.alliances.get(alliance_id)
+        if not alliance or not alliance.remove_member(npc_id):
+            return False
+        self._npc_alliances.get(npc_id, {}).pop(alliance_id, None)
+        self.invalidate_influence(npc_id, *alliance.members)
+        return True
+
     def add_to_gossip_network(self, npc1: str, npc2: str) -> None:
         """Add gossip connection between NPCs."""
         if npc1 not in self.gossip_network:
@@ -390,7 +442,13 @@ class RelationshipWeb:
         return informed
 
     def calculate_social_influence(self, npc_id: str) -> float:
-        """Calculate an NPC's social influence score."""
+        """Calculate an NPC's social influence score.
+
+        Scores are cached until something involving the NPC changes.
+        """
+        if npc_id in self.influence_map:
+            return self.influence_map[npc_id]
+
         influence = 0.0
 
         # Base influence from social groups
@@ -411,24 +469,21 @@ class RelationshipWeb:
         relationship_count = 0
         total_disposition = 0.0
 
-        for (npc1, npc2), rel in self.relationships.items():
-            if npc1 == npc_id or npc2 == npc_id:
-                relationship_count += 1
-                total_disposition += rel.get_overall_disposition()
+        for key in self._neighbors.get(npc_id, {}).values():
+            relationship_count += 1
+            total_disposition += self.relationships[key].get_overall_disposition()
 
         if relationship_count > 0:
             avg_disposition = total_disposition / relationship_count
             influence += avg_disposition * 0.3
 
         # Influence from alliances
-        for alliance in self.alliances.values():
-            if npc_id in alliance.members:
-                influence += alliance.strength * 0.2
+        for alliance in self._npc_alliances.get(npc_id, {}).values():
+            influence += alliance.strength * 0.2
 
         # Negative influence from conflicts
-        for conflict in self.conflicts.values():
-            if npc_id in conflict.participants:
-                influence -= conflict.intensity * 0.1
+        for conflict in self._npc_conflicts.get(npc_id, {}).values():
+            influence -= conflict.intensity * 0.1
 
         # Store calculated influence
         self.influence_map[npc_id] = max(0.0, min(1.0, influence))
@@ -440,14 +495,12 @@ class RelationshipWeb:
         faction_members = set()
 
         # Check alliances
-        for alliance in self.alliances.values():
-            if npc_id in alliance.members:
-                faction_members.update(alliance.members)
+        for alliance in self._npc_alliances.get(npc_id, {}).values():
+            faction_members.update(alliance.members)
 
         # Check social groups
-        for group_name, members in self.social_groups.items():
-            if npc_id in members:
-                faction_members.update(members)
+        for group_name in self._npc_groups.get(npc_id, ()):
+            faction_members.update(self.social_groups[group_name])
 
         faction_members.discard(npc_id)  # Remove self
         return faction_members
@@ -456,17 +509,17 @@ class RelationshipWeb:
         """Get all NPCs in conflict with the given NPC."""
         enemies = set()
 
-        for conflict in self.conflicts.values():
-            if npc_id in conflict.participants and not conflict.resolved:
+        for conflict in self._npc_conflicts.get(npc_id, {}).values():
+            if not conflict.resolved:
                 enemies.update(conflict.participants)
 
         # Check for enemy relationships
-        for (npc1, npc2), rel_type in self.relationship_types.items():
-            if rel_type in [RelationshipType.ENEMY, RelationshipType.RIVAL]:
-                if npc1 == npc_id:
-                    enemies.add(npc2)
-                elif npc2 == npc_id:
-                    enemies.add(npc1)
+        for other_npc, key in self._neighbors.get(npc_id, {}).items():
+            if self.relationship_types[key] in [
+                RelationshipType.ENEMY,
+                RelationshipType.RIVAL,
+            ]:
+                enemies.add(other_npc)
 
         enemies.discard(npc_id)  # Remove self
         return enemies
@@ -481,7 +534,7 @@ class RelationshipWeb:
     ) -> SocialEvent:
         """Record a social event that affects relationships."""
         event = SocialEvent(
-            timestamp=datetime.now(),
+            timestamp=time_source.now(),
             event_type=event_type,
             participants=participants,
             location=location,
@@ -498,6 +551,8 @@ class RelationshipWeb:
 
     def _process_social_event(self, event: SocialEvent) -> None:
         """Process the effects of a social event."""
+        self.invalidate_influence(*event.participants)
+
         if event.event_type == "public_argument":
             # Arguments damage relationships
             for i, npc1 in enumerate(event.participants):
@@ -569,39 +624,37 @@ class RelationshipWeb:
         }
 
         # Categorize relationships
-        for (npc1, npc2), rel_type in self.relationship_types.items():
-            other_npc = npc2 if npc1 == npc_id else npc1 if npc2 == npc_id else None
-
-            if other_npc:
-                rel = self.get_relationship(npc_id, other_npc)
-                if not rel:
-                    continue
-
-                rel_info = {
-                    "npc": other_npc,
-                    "type": rel_type.value,
-                    "disposition": rel.get_overall_disposition(),
-                }
-
-                if rel_type == RelationshipType.ENEMY:
-                    summary["enemies"].append(rel_info)
-                elif rel_type == RelationshipType.RIVAL:
-                    summary["rivals"].append(rel_info)
-                elif rel_type in [RelationshipType.LOVER, RelationshipType.SPOUSE]:
-                    summary["romantic"].append(rel_info)
-                elif rel_type in [
-                    RelationshipType.FRIEND,
-                    RelationshipType.BEST_FRIEND,
-                ]:
-                    summary["friends"].append(rel_info)
-                elif rel_type == RelationshipType.ALLY:
-                    summary["allies"].append(rel_info)
-                else:
-                    summary["neutral"].append(rel_info)
+        for other_npc, key in self._neighbors.get(npc_id, {}).items():
+            rel = self.relationships.get(key)
+            if not rel:
+                continue
+
+            rel_type = self.relationship_types[key]
+            rel_info = {
+                "npc": other_npc,
+                "type": rel_type.value,
+                "disposition": rel.get_overall_disposition(),
+            }
+
+            if rel_type == RelationshipType.ENEMY:
+                summary["enemies"].append(rel_info)
+            elif rel_type == RelationshipType.RIVAL:
+                summary["rivals"].append(rel_info)
+            elif rel_type in [RelationshipType.LOVER, RelationshipType.SPOUSE]:
+                summary["romantic"].append(rel_info)
+            elif rel_type in [
+                RelationshipType.FRIEND,
+                RelationshipType.BEST_FRIEND,
+            ]:
+                summary["friends"].append(rel_info)
+            elif rel_type == RelationshipType.ALLY:
+                summary["allies"].append(rel_info)
+            else:
+                summary["neutral"].append(rel_info)
 
         # Add conflicts
-        for conflict in self.conflicts.values():
-            if npc_id in conflict.participants and not conflict.resolved:
+        for conflict in self._npc_conflicts.get(npc_id, {}).values():
+            if not conflict.resolved:
                 summary["conflicts"].append(
                     {
                         "id": conflict.id,
@@ -612,15 +665,14 @@ class RelationshipWeb:
                 )
 
         # Add alliances
-        for alliance in self.alliances.values():
-            if npc_id in alliance.members:
-                summary["alliances"].append(
-                    {
-                        "id": alliance.id,
-                        "type": alliance.type.value,
-                        "strength": alliance.strength,
-                        "members": list(alliance.members),
-                    }
-                )
+        for alliance in self._npc_alliances.get(npc_id, {}).values():
+            summary["alliances"].append(
+                {
+                    "id": alliance.id,
+                    "type": alliance.type.value,
+                    "strength": alliance.strength,
+                    "members": list(alliance.members),
+                }
+            )
 
         return summary
@@ -6,6 +6,8 @@ from enum import Enum
 from datetime import datetime
 import random
 
+from .. import time_source
+
 
 class SecretType(Enum):
     """Types of secrets NPCs can hold."""
@@ -54,7 +56,7 @@ class Evidence:
     holder: Optional[str] = None  # Who has this evidence
     reliability: float = 0.7  # 0-1, how trustworthy
     discovered_by: Set[str] = field(default_factory=set)
-    created: datetime = field(default_factory=datetime.now)
+    created: datetime = field(default_factory=time_source.now)
 
     # Discovery conditions
     discovery_difficulty: float = 0.5  # 0-1, how hard to find
@@ -149,7 +151,7 @@ class EnhancedSecret:
     cover_stories: List[str] = field(default_factory=list)
 
     # History
-    created: datetime = field(default_factory=datetime.now)
+    created: datetime = field(default_factory=time_source.now)
     last_investigated: Optional[datetime] = None
     exposure_events: List[Tuple[datetime, str, str]] = field(
         default_factory=list
@@ -185,7 +187,7 @@ class EnhancedSecret:
         if investigator_id not in self.investigating:
             self.investigating.add(investigator_id)
 
-        self.last_investigated = datetime.now()
+        self.last_investigated = time_source.now()
         found_evidence = []
 
         # Check each piece of evidence
@@ -232,7 +234,7 @@ class EnhancedSecret:
                 self.investigating.remove(character_id)
 
             self.exposure_events.append(
-                (datetime.now(), character_id, "full_revelation")
+                (time_source.now(), character_id, "full_revelation")
             )
 
         self._update_state()
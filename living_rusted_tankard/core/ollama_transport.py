@@ -0,0 +1,575 @@
+"""
+Shared HTTP transport for the Ollama API.
+
+All Ollama HTTP traffic goes through one ``OllamaTransport`` per base URL
+(see ``get_ollama_transport``). The transport provides:
+
+- pooled keep-alive connections for sync (``httpx.Client``) and async
+  (``httpx.AsyncClient``, one per event loop) callers;
+- bounded concurrency per model;
+- retries with jittered exponential backoff for connection errors and
+  429/5xx responses;
+- a circuit breaker that fails fast while the server is down and that the
+  health monitors can open or close directly;
+- per-model availability, so a model missing from the server fails fast
+  without blocking the other models it serves;
+- per-call latency histograms, exposed through ``get_stats()``.
+"""
+
+import asyncio
+import json
+import logging
+import random
+import threading
+import time
+import weakref
+from bisect import bisect_left
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Sequence
+import httpx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_OLLAMA_URL = "http://localhost:11434"
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class CircuitOpenError(Exception):
+    """Raised without making a request while the circuit breaker is open."""
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (seconds)."""
+
+    DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float) -> None:
+        with self._lock:
+            self.counts[bisect_left(self.buckets, seconds)] += 1
+            self.count += 1
+            self.total += seconds
+            self.max = max(self.max, seconds)
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket containing the q-th quantile."""
+        with self._lock:
+            if not self.count:
+                return 0.0
+            rank = q * self.count
+            seen = 0
+            for i, bucket_count in enumerate(self.counts):
+                seen += bucket_count
+                if seen >= rank and bucket_count:
+                    return self.buckets[i] if i < len(self.buckets) else self.max
+            return self.max
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            labels = [f"<={bucket}" for bucket in self.buckets] + ["+inf"]
+            snapshot = {
+                "count": self.count,
+                "sum": self.total,
+                "mean": self.total / self.count if self.count else 0.0,
+                "max": self.max,
+                "buckets": dict(zip(labels, self.counts)),
+            }
+        for q in (0.5, 0.95, 0.99):
+            snapshot[f"p{int(q * 100)}"] = self.quantile(q)
+        return snapshot
+
+
+class CircuitBreaker:
+    """Closed/open/half-open circuit breaker.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    calls fail fast. Once ``reset_timeout`` has passed a single probe call is
+    let through; its outcome closes or re-opens the circuit.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_started_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if (
+            self._state == self.OPEN
+            and time.monotonic() - self._opened_at >= self.reset_timeout
+        ):
+            self._state = self.HALF_OPEN
+            self._probe_started_at = None
+        return self._state
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            state = self._current_state()
+            if state == self.CLOSED:
+                return True
+            # One probe at a time; a probe that never reported back is
+            # replaced after another reset_timeout
+            now = time.monotonic()
+            if state == self.HALF_OPEN and (
+                self._probe_started_at is None
+                or now - self._probe_started_at >= self.reset_timeout
+            ):
+                self._probe_started_at = now
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probe_started_at = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if (
+                self._current_state() == self.HALF_OPEN
+                or self._failures >= self.failure_threshold
+            ):
+                self._open()
+
+    def force_open(self) -> None:
+        """Open the circuit now (e.g. a health check found the server down)."""
+        with self._lock:
+            self._open()
+
+    def reset(self) -> None:
+        """Close the circuit now (e.g. a health check succeeded)."""
+        self.record_success()
+
+    def _open(self) -> None:
+        if self._state != self.OPEN:
+            logger.warning("Ollama circuit breaker opened")
+        self._state = self.OPEN
+        self._opened_at = time.monotonic()
+        self._probe_started_at = None
+
+    def get_status(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "state": self._current_state(),
+                "consecutive_failures": self._failures,
+                "failure_threshold": self.failure_threshold,
+                "reset_timeout": self.reset_timeout,
+            }
+
+
+class OllamaTransport:
+    """Process-wide pooled HTTP access to one Ollama server.
+
+    Use ``get_ollama_transport(base_url)`` rather than constructing this
+    directly so every call site shares the same connection pool, model
+    slots and circuit breaker.
+
+    Args:
+        base_url: Base URL of the Ollama API.
+        max_connections: Connection pool size per client.
+        max_keepalive_connections: Idle connections kept open for reuse.
+        keepalive_expiry: Seconds an idle connection is kept.
+        max_concurrency_per_model: Concurrent calls per model, applied
+            separately to sync callers and to each event loop.
+        max_retries: Retries after the first attempt for retryable errors.
+        backoff_base: First retry delay ceiling in seconds; doubles per try.
+        backoff_cap: Maximum retry delay ceiling in seconds.
+        timeout: Default request timeout in seconds.
+        failure_threshold: Consecutive failures that open the circuit.
+        reset_timeout: Seconds before an open circuit lets a probe through.
+    """
+
+    def __init__(
+        self,
+        base_url: str = DEFAULT_OLLAMA_URL,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        max_concurrency_per_model: int = 4,
+        max_retries: int = 2,
+        backoff_base: float = 0.25,
+        backoff_cap: float = 4.0,
+        timeout: float = 30.0,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.max_concurrency_per_model = max_concurrency_per_model
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.timeout = timeout
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout)
+
+        self._lock = threading.Lock()
+        self._client: Optional[httpx.Client] = None
+        # httpx.AsyncClient is bound to the loop that first uses it
+        self._async_clients: (
+            "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]"
+        ) = weakref.WeakKeyDictionary()
+        self._model_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._async_model_slots: (
+            "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]"
+        ) = weakref.WeakKeyDictionary()
+        # model -> monotonic time until which calls for it fail fast
+        self._unavailable_models: Dict[str, float] = {}
+        self._latency: Dict[str, LatencyHistogram] = {}
+        self._counters = {
+            "requests": 0,
+            "retries": 0,
+            "failures": 0,
+            "short_circuited": 0,
+        }
+
+    # -- clients and slots -------------------------------------------------
+
+    def _sync_client(self) -> httpx.Client:
+        with self._lock:
+            if self._client is None:
+                self._client = httpx.Client(
+                    base_url=self.base_url, limits=self.limits, timeout=self.timeout
+                )
+            return self._client
+
+    def _async_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._async_clients.get(loop)
+            if client is None:
+                client = httpx.AsyncClient(
+                    base_url=self.base_url, limits=self.limits, timeout=self.timeout
+                )
+                self._async_clients[loop] = client
+            return client
+
+    @contextmanager
+    def _model_slot(self, model: Optional[str]) -> Iterator[None]:
+        if model is None:
+            yield
+            return
+        with self._lock:
+            slot = self._model_slots.get(model)
+            if slot is None:
+                slot = threading.BoundedSemaphore(self.max_concurrency_per_model)
+                self._model_slots[model] = slot
+        with slot:
+            yield
+
+    @asynccontextmanager
+    async def _async_model_slot(self, model: Optional[str]) -> AsyncIterator[None]:
+        if model is None:
+            yield
+            return
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            slots = self._async_model_slots.setdefault(loop, {})
+            slot = slots.get(model)
+            if slot is None:
+                slot = asyncio.Semaphore(self.max_concurrency_per_model)
+                slots[model] = slot
+        async with slot:
+            yield
+
+    # -- bookkeeping ---------------------------------------------------------
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._counters[key] += 1
+
+    def _observe(self, label: str, seconds: float) -> None:
+        with self._lock:
+            histogram = self._latency.get(label)
+            if histogram is None:
+                histogram = self._latency[label] = LatencyHistogram()
+        histogram.observe(seconds)
+
+    def _check_circuit(self, use_breaker: bool, model: Optional[str] = None) -> None:
+        if not use_breaker:
+            return
+        if model is not None and not self.is_model_available(model):
+            self._count("short_circuited")
+            raise CircuitOpenError(f"Model {model} is not available at {self.base_url}")
+        if not self.breaker.allow_request():
+            self._count("short_circuited")
+            raise CircuitOpenError(f"Ollama at {self.base_url} is unavailable")
+
+    # -- per-model availability ----------------------------------------------
+
+    def mark_model_unavailable(self, model: str) -> None:
+        """Fail calls for ``model`` fast for ``reset_timeout`` seconds.
+
+        Other models on the same server are unaffected, unlike opening the
+        circuit breaker.
+        """
+        with self._lock:
+            self._unavailable_models[model] = (
+                time.monotonic() + self.breaker.reset_timeout
+            )
+
+    def mark_model_available(self, model: str) -> None:
+        with self._lock:
+            self._unavailable_models.pop(model, None)
+
+    def is_model_available(self, model: str) -> bool:
+        with self._lock:
+            until = self._unavailable_models.get(model)
+            if until is None:
+                return True
+            if time.monotonic() >= until:
+                # Let calls probe the model again
+                del self._unavailable_models[model]
+                return True
+            return False
+
+    def _backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff delay for a retry."""
+        return random.uniform(
+            0, min(self.backoff_cap, self.backoff_base * (2**attempt))
+        )
+
+    def _request_kwargs(self, json_body: Any, timeout: Optional[float]) -> dict:
+        kwargs = {}
+        if json_body is not None:
+            kwargs["json"] = json_body
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+        return kwargs
+
+    def _finish(
+        self, response: httpx.Response, use_breaker: bool, attempt: int, retries: int
+    ) -> bool:
+        """Return True if ``response`` is final, False if it should be retried."""
+        if response.status_code in RETRY_STATUSES and attempt < retries:
+            return False
+        if response.status_code in RETRY_STATUSES or response.status_code >= 500:
+            self._count("failures")
+            if use_breaker:
+                self.breaker.record_failure()
+        elif use_breaker:
+            self.breaker.record_success()
+        response.raise_for_status()
+        return True
+
+    def _record_transport_failure(self, use_breaker: bool) -> None:
+        self._count("failures")
+        if use_breaker:
+            self.breaker.record_failure()
+
+    # -- sync facade -------------------------------------------------------
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        json: Any = None,
+        model: Optional[str] = None,
+        timeout: Optional[float] = None,
+        retries: Optional[int] = None,
+        use_breaker: bool = True,
+    ) -> httpx.Response:
+        """Send a request, retrying transient failures.
+
+        Raises:
+            CircuitOpenError: The circuit is open; no request was sent.
+            httpx.HTTPError: The request failed after all retries.
+        """
+        retries = self.max_retries if retries is None else retries
+        label = f"{model or '-'} {path}"
+        self._check_circuit(use_breaker, model)
+        self._count("requests")
+
+        with self._model_slot(model):
+            client = self._sync_client()
+            for attempt in range(retries + 1):
+                if attempt:
+                    self._count("retries")
+                    time.sleep(self._backoff(attempt - 1))
+                start = time.perf_counter()
+                try:
+                    response = client.request(
+                        method, path, **self._request_kwargs(json, timeout)
+                    )
+                except httpx.TransportError:
+                    self._observe(label, time.perf_counter() - start)
+                    if attempt < retries:
+                        continue
+                    self._record_transport_failure(use_breaker)
+                    raise
+                self._observe(label, time.perf_counter() - start)
+                if self._finish(response, use_breaker, attempt, retries):
+                    return response
+
+    def post_json(self, path: str, payload: Dict[str, Any], **kwargs) -> Any:
+        """POST ``payload`` and return the decoded JSON response."""
+        return self.request("POST", path, json=payload, **kwargs).json()
+
+    def get_json(self, path: str, **kwargs) -> Any:
+        """GET ``path`` and return the decoded JSON response."""
+        return self.request("GET", path, **kwargs).json()
+
+    # -- async facade ------------------------------------------------------
+
+    async def arequest(
+        self,
+        method: str,
+        path: str,
+        *,
+        json: Any = None,
+        model: Optional[str] = None,
+        timeout: Optional[float] = None,
+        retries: Optional[int] = None,
+        use_breaker: bool = True,
+    ) -> httpx.Response:
+        """Async version of ``request``."""
+        retries = self.max_retries if retries is None else retries
+        label = f"{model or '-'} {path}"
+        self._check_circuit(use_breaker, model)
+        self._count("requests")
+
+        async with self._async_model_slot(model):
+            client = self._async_client()
+            for attempt in range(retries + 1):
+                if attempt:
+                    self._count("retries")
+                    await asyncio.sleep(self._backoff(attempt - 1))
+                start = time.perf_counter()
+                try:
+                    response = await client.request(
+                        method, path, **self._request_kwargs(json, timeout)
+                    )
+                except httpx.TransportError:
+                    self._observe(label, time.perf_counter() - start)
+                    if attempt < retries:
+                        continue
+                    self._record_transport_failure(use_breaker)
+                    raise
+                self._observe(label, time.perf_counter() - start)
+                if self._finish(response, use_breaker, attempt, retries):
+                    return response
+
+    async def apost_json(self, path: str, payload: Dict[str, Any], **kwargs) -> Any:
+        """Async ``post_json``."""
+        return (await self.arequest("POST", path, json=payload, **kwargs)).json()
+
+    async def aget_json(self, path: str, **kwargs) -> Any:
+        """Async ``get_json``."""
+        return (await self.arequest("GET", path, **kwargs)).json()
+
+    async def astream_json(
+        self,
+        path: str,
+        payload: Dict[str, Any],
+        *,
+        model: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """POST ``payload`` and yield each JSON line of a streamed response.
+
+        Streams are not retried; lines that are not valid JSON are skipped.
+        """
+        label = f"{model or '-'} {path} (stream)"
+        self._check_circuit(True, model)
+        self._count("requests")
+
+        async with self._async_model_slot(model):
+            client = self._async_client()
+            start = time.perf_counter()
+            try:
+                async with client.stream(
+                    "POST", path, **self._request_kwargs(payload, timeout)
+                ) as response:
+                    if response.status_code >= 400:
+                        await response.aread()
+                    self._finish(response, True, 0, 0)
+                    async for line in response.aiter_lines():
+                        if not line.strip():
+                            continue
+                        try:
+                            yield json.loads(line)
+                        except json.JSONDecodeError:
+                            continue
+            except httpx.TransportError:
+                self._record_transport_failure(True)
+                raise
+            finally:
+                self._observe(label, time.perf_counter() - start)
+
+    # -- lifecycle and stats -----------------------------------------------
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._counters)
+            histograms = dict(self._latency)
+            stats["async_clients"] = len(self._async_clients)
+            stats["unavailable_models"] = sorted(self._unavailable_models)
+        stats["base_url"] = self.base_url
+        stats["circuit"] = self.breaker.get_status()
+        stats["latency"] = {
+            label: histogram.snapshot() for label, histogram in histograms.items()
+        }
+        return stats
+
+    def close(self) -> None:
+        """Close the sync client; async clients are dropped with their loops."""
+        with self._lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
+    async def aclose(self) -> None:
+        """Close the sync client and the current event loop's async client."""
+        self.close()
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._async_clients.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+
+
+_transports: Dict[str, OllamaTransport] = {}
+_transports_lock = threading.Lock()
+
+
+def get_ollama_transport(base_url: str = DEFAULT_OLLAMA_URL) -> OllamaTransport:
+    """Get the shared transport for an Ollama server."""
+    key = base_url.rstrip("/")
+    with _transports_lock:
+        transport = _transports.get(key)
+        if transport is None:
+            transport = _transports[key] = OllamaTransport(key)
+        return transport
+
+
+async def shutdown_ollama_transports() -> None:
+    """Close pooled connections for every Ollama server."""
+    with _transports_lock:
+        transports = list(_transports.values())
+    for transport in transports:
+        await transport.aclose()
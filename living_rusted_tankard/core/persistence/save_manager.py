@@ -6,20 +6,34 @@ This module provides:
 - Migration system for save file upgrades
 - Backup and restore functionality
 - Save validation and corruption detection
+- Streaming, checksummed writes with an atomic rename, optionally run on
+  a background thread
 """
 
 import json
 import gzip
 import hashlib
+import os
 import shutil
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Callable
+from typing import Dict, Any, Iterable, Optional, List, Callable, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from enum import Enum
 
 from .migrations import SaveMigrator
+from .save_format import (
+    HashingWriter,
+    decode_binary_save,
+    is_binary_save,
+    read_binary_header,
+    read_binary_sections,
+    write_binary_save,
+    write_json_save,
+)
 from .validation import SaveValidator
 
 
@@ -31,6 +45,14 @@ class SaveFormat(Enum):
     BINARY = "binary"
 
 
+# File extension for each save format
+SAVE_EXTENSIONS = {
+    SaveFormat.COMPRESSED_JSON: ".save.json.gz",
+    SaveFormat.JSON: ".save.json",
+    SaveFormat.BINARY: ".save.bin",
+}
+
+
 @dataclass
 class SaveMetadata:
     """Metadata for save files."""
@@ -68,11 +90,16 @@ class SaveManager:
     - Backup creation before migrations
     - Save validation and corruption detection
     - Multiple save formats (JSON, compressed, binary)
+    - Background saves via save_game_async
     """
 
     CURRENT_SAVE_VERSION = "1.0.0"
     CURRENT_GAME_VERSION = "0.1.0"  # Should match game version
 
+    # gzip's default level 9 costs several times the CPU of level 5 for a
+    # few percent smaller files
+    COMPRESSION_LEVEL = 5
+
     def __init__(self, save_directory: str = "saves"):
         self.save_dir = Path(save_directory)
         self.save_dir.mkdir(exist_ok=True)
@@ -83,6 +110,10 @@ class SaveManager:
         self.migrator = SaveMigrator()
         self.validator = SaveValidator()
 
+        # Background saves run one at a time, in submission order
+        self._save_executor: Optional[ThreadPoolExecutor] = None
+        self._save_executor_lock = threading.Lock()
+
         # Register built-in migrations
         self._register_default_migrations()
 
@@ -143,7 +174,7 @@ class SaveManager:
                     "format": format.value,
                     "session_id": session_id,
                     "player_name": player_name,
-                    "compressed": format == SaveFormat.COMPRESSED_JSON,
+                    "compressed": format != SaveFormat.JSON,
                 },
                 "game_state": game_state,
             }
@@ -153,31 +184,27 @@ class SaveManager:
             if not validation_result.is_valid:
                 raise ValueError(f"Save validation failed: {validation_result.errors}")
 
-            # Determine save file path
-            file_extension = (
-                ".save.json.gz"
-                if format == SaveFormat.COMPRESSED_JSON
-                else ".save.json"
-            )
-            save_path = self.save_dir / f"{save_name}{file_extension}"
+            if format not in SAVE_EXTENSIONS:
+                raise ValueError(f"Unsupported save format: {format}")
+            save_path = self.save_dir / f"{save_name}{SAVE_EXTENSIONS[format]}"
 
-            # Create backup if file exists
-            if save_path.exists():
-                self._create_backup(save_path)
+            # Write to a temporary file, checksumming as the bytes go out
+            temp_path = save_path.with_name(save_path.name + ".tmp")
+            try:
+                size_bytes, checksum = self._write_save_file(
+                    save_data, temp_path, format
+                )
 
-            # Write save file
-            if format == SaveFormat.COMPRESSED_JSON:
-                self._write_compressed_save(save_data, save_path)
-            elif format == SaveFormat.JSON:
-                self._write_json_save(save_data, save_path)
-            else:
-                raise ValueError(f"Unsupported save format: {format}")
+                # Create backup if file exists
+                if save_path.exists():
+                    self._create_backup(save_path)
 
-            # Update metadata with file information
-            file_size = save_path.stat().st_size
-            checksum = self._calculate_checksum(save_path)
+                os.replace(temp_path, save_path)
+            finally:
+                if temp_path.exists():
+                    temp_path.unlink()
 
-            save_data["metadata"]["size_bytes"] = file_size
+            save_data["metadata"]["size_bytes"] = size_bytes
             save_data["metadata"]["checksum"] = checksum
 
             # Write metadata file
@@ -190,6 +217,40 @@ class SaveManager:
             print(f"Failed to save game: {e}")
             return False
 
+    def save_game_async(
+        self,
+        game_state: Dict[str, Any],
+        save_name: str,
+        session_id: str,
+        player_name: str,
+        format: SaveFormat = SaveFormat.COMPRESSED_JSON,
+    ) -> Future:
+        """
+        Save game state on the manager's background thread.
+
+        The game_state dictionary is read while the save runs, so pass one
+        that will not be modified meanwhile, such as a fresh
+        ``GameState.to_dict()``.
+
+        Returns:
+            Future resolving to the result of save_game
+        """
+        with self._save_executor_lock:
+            if self._save_executor is None:
+                self._save_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="save-manager"
+                )
+        return self._save_executor.submit(
+            self.save_game, game_state, save_name, session_id, player_name, format
+        )
+
+    def shutdown(self, wait: bool = True):
+        """Stop the background save thread, finishing queued saves first."""
+        with self._save_executor_lock:
+            executor, self._save_executor = self._save_executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
     def load_game(self, save_name: str) -> Optional[Dict[str, Any]]:
         """
         Load game state with automatic migration if needed.
@@ -206,22 +267,21 @@ class SaveManager:
             if not save_path:
                 return None
 
-            # Load metadata
+            # Read the file once, checksumming the bytes as they are loaded
+            with open(save_path, "rb") as f:
+                raw_data = f.read()
+
             metadata_path = save_path.with_suffix(save_path.suffix + ".meta")
             metadata = self._load_metadata(metadata_path)
 
             if metadata:
                 # Verify file integrity
-                current_checksum = self._calculate_checksum(save_path)
+                current_checksum = hashlib.sha256(raw_data).hexdigest()
                 if metadata.checksum != current_checksum:
                     print(f"Warning: Save file checksum mismatch for {save_name}")
                     # Could implement corruption recovery here
 
-            # Load save data
-            if save_path.suffix.endswith(".gz"):
-                save_data = self._load_compressed_save(save_path)
-            else:
-                save_data = self._load_json_save(save_path)
+            save_data = self._decode_save(raw_data, save_path)
 
             if not save_data:
                 return None
@@ -250,6 +310,7 @@ class SaveManager:
                     save_name,
                     migrated_data["metadata"]["session_id"],
                     migrated_data["metadata"]["player_name"],
+                    self._format_for_path(save_path),
                 )
 
                 save_data = migrated_data
@@ -266,6 +327,42 @@ class SaveManager:
             print(f"Failed to load game {save_name}: {e}")
             return None
 
+    def load_sections(
+        self, save_name: str, sections: Iterable[str]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Load selected top-level sections of a save's game state.
+
+        Binary saves decode only the requested sections. Other formats,
+        and saves that still need migrating, go through load_game.
+
+        Args:
+            save_name: Name of the save file to load
+            sections: game_state keys to load
+
+        Returns:
+            Dictionary of the sections found, None if the save can't be read
+        """
+        sections = list(sections)
+        save_path = self._find_save_file(save_name)
+        if not save_path:
+            return None
+
+        if save_path.name.endswith(SAVE_EXTENSIONS[SaveFormat.BINARY]):
+            try:
+                with open(save_path, "rb") as f:
+                    header = read_binary_header(f)
+                    if header["metadata"].get("version") == self.CURRENT_SAVE_VERSION:
+                        return read_binary_sections(f, sections)
+            except Exception as e:
+                print(f"Failed to load sections of {save_name}: {e}")
+                return None
+
+        game_state = self.load_game(save_name)
+        if game_state is None:
+            return None
+        return {name: game_state[name] for name in sections if name in game_state}
+
     def list_saves(self) -> List[Dict[str, Any]]:
         """
         List all available save files with metadata.
@@ -275,16 +372,15 @@ class SaveManager:
         """
         saves = []
 
-        for save_path in self.save_dir.glob("*.save.json*"):
-            if save_path.suffix == ".meta":
-                continue
-
-            # Load metadata
+        for save_path in self._iter_save_files():
+            # Load metadata, without parsing the save itself
             metadata_path = save_path.with_suffix(save_path.suffix + ".meta")
             metadata = self._load_metadata(metadata_path)
+            if metadata is None:
+                metadata = self._load_header_metadata(save_path)
 
             save_info = {
-                "name": save_path.stem.replace(".save", ""),
+                "name": save_path.name.split(".save")[0],
                 "path": str(save_path),
                 "size_bytes": save_path.stat().st_size,
                 "modified_at": datetime.fromtimestamp(
@@ -373,9 +469,7 @@ class SaveManager:
             # Find backup file
             backup_path = None
             for backup_file in self.backup_dir.glob(f"*{backup_name}*"):
-                if backup_file.suffix.endswith(".json") or backup_file.suffix.endswith(
-                    ".gz"
-                ):
+                if backup_file.suffix in (".json", ".gz", ".bin"):
                     backup_path = backup_file
                     break
 
@@ -388,10 +482,8 @@ class SaveManager:
                 restore_as = backup_path.stem.split("_")[0]
 
             # Copy backup to save directory
-            if backup_path.suffix.endswith(".gz"):
-                restore_path = self.save_dir / f"{restore_as}.save.json.gz"
-            else:
-                restore_path = self.save_dir / f"{restore_as}.save.json"
+            extension = SAVE_EXTENSIONS[self._format_for_path(backup_path)]
+            restore_path = self.save_dir / f"{restore_as}{extension}"
 
             shutil.copy2(backup_path, restore_path)
 
@@ -408,52 +500,89 @@ class SaveManager:
             return False
 
     def _find_save_file(self, save_name: str) -> Optional[Path]:
-        """Find save file by name, checking different extensions."""
+        """Find save file by name, preferring the newest of its formats."""
         candidates = [
-            self.save_dir / f"{save_name}.save.json.gz",
-            self.save_dir / f"{save_name}.save.json",
+            self.save_dir / f"{save_name}{extension}"
+            for extension in SAVE_EXTENSIONS.values()
+        ]
+        existing = [candidate for candidate in candidates if candidate.exists()]
+        if not existing:
+            return None
+        return max(existing, key=lambda candidate: candidate.stat().st_mtime)
+
+    def _iter_save_files(self) -> List[Path]:
+        """All save files in the save directory, without sidecars or temp files."""
+        return [
+            save_path
+            for extension in SAVE_EXTENSIONS.values()
+            for save_path in self.save_dir.glob(f"*{extension}")
         ]
 
-        for candidate in candidates:
-            if candidate.exists():
-                return candidate
-
-        return None
-
-    def _write_json_save(self, save_data: Dict[str, Any], save_path: Path):
-        """Write save data as JSON."""
-        with open(save_path, "w", encoding="utf-8") as f:
-            json.dump(save_data, f, indent=2, ensure_ascii=False)
-
-    def _write_compressed_save(self, save_data: Dict[str, Any], save_path: Path):
-        """Write save data as compressed JSON."""
-        json_data = json.dumps(save_data, ensure_ascii=False).encode("utf-8")
-        with gzip.open(save_path, "wb") as f:
-            f.write(json_data)
-
-    def _load_json_save(self, save_path: Path) -> Optional[Dict[str, Any]]:
-        """Load save data from JSON file."""
+    def _format_for_path(self, save_path: Path) -> SaveFormat:
+        """Save format implied by a save or backup file name."""
+        if save_path.name.endswith(".gz"):
+            return SaveFormat.COMPRESSED_JSON
+        if save_path.name.endswith(".bin"):
+            return SaveFormat.BINARY
+        return SaveFormat.JSON
+
+    def _write_save_file(
+        self, save_data: Dict[str, Any], save_path: Path, format: SaveFormat
+    ) -> Tuple[int, str]:
+        """Stream save data to disk in one pass.
+
+        Returns the file size and SHA-256 checksum, both taken from the
+        bytes as they were written.
+        """
+        with open(save_path, "wb") as f:
+            writer = HashingWriter(f)
+            if format == SaveFormat.COMPRESSED_JSON:
+                with gzip.GzipFile(
+                    fileobj=writer, mode="wb", compresslevel=self.COMPRESSION_LEVEL
+                ) as compressed:
+                    write_json_save(compressed, save_data)
+            elif format == SaveFormat.BINARY:
+                write_binary_save(writer, save_data)
+            else:
+                write_json_save(writer, save_data)
+            f.flush()
+            os.fsync(f.fileno())
+        return writer.size, writer.hexdigest()
+
+    def _decode_save(
+        self, raw_data: bytes, save_path: Path
+    ) -> Optional[Dict[str, Any]]:
+        """Parse the bytes of a save file in any supported format."""
         try:
-            with open(save_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            if is_binary_save(raw_data):
+                return decode_binary_save(raw_data)
+            if save_path.name.endswith(".gz"):
+                raw_data = gzip.decompress(raw_data)
+            return json.loads(raw_data.decode("utf-8"))
         except Exception as e:
-            print(f"Failed to load JSON save {save_path}: {e}")
+            print(f"Failed to read save {save_path}: {e}")
             return None
 
-    def _load_compressed_save(self, save_path: Path) -> Optional[Dict[str, Any]]:
-        """Load save data from compressed JSON file."""
+    def _load_header_metadata(self, save_path: Path) -> Optional[SaveMetadata]:
+        """Metadata from a binary save's header, for saves without a sidecar."""
+        if not save_path.name.endswith(SAVE_EXTENSIONS[SaveFormat.BINARY]):
+            return None
         try:
-            with gzip.open(save_path, "rb") as f:
-                json_data = f.read().decode("utf-8")
-                return json.loads(json_data)
+            with open(save_path, "rb") as f:
+                metadata = dict(read_binary_header(f)["metadata"])
+            metadata.setdefault("checksum", "")
+            metadata.setdefault("size_bytes", save_path.stat().st_size)
+            return SaveMetadata.from_dict(metadata)
         except Exception as e:
-            print(f"Failed to load compressed save {save_path}: {e}")
+            print(f"Failed to read save header {save_path}: {e}")
             return None
 
     def _write_metadata(self, metadata: Dict[str, Any], metadata_path: Path):
         """Write metadata to file."""
-        with open(metadata_path, "w", encoding="utf-8") as f:
+        temp_path = metadata_path.with_name(metadata_path.name + ".tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
             json.dump(metadata, f, indent=2, ensure_ascii=False)
+        os.replace(temp_path, metadata_path)
 
     def _load_metadata(self, metadata_path: Path) -> Optional[SaveMetadata]:
         """Load metadata from file."""
@@ -468,14 +597,6 @@ class SaveManager:
             print(f"Failed to load metadata {metadata_path}: {e}")
             return None
 
-    def _calculate_checksum(self, file_path: Path) -> str:
-        """Calculate SHA-256 checksum of file."""
-        hash_sha256 = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_sha256.update(chunk)
-        return hash_sha256.hexdigest()
-
     def _create_backup(self, save_path: Path, suffix: str = None) -> bool:
         """Create backup of save file."""
         try:
@@ -0,0 +1,198 @@
+"""
+Prompt assembly laid out for Ollama's prompt cache.
+
+A loaded Ollama model keeps the key/value cache of the prompt it last
+evaluated and only evaluates the tokens after the longest prefix a new
+prompt shares with it. Prompts rebuilt with the game state in the middle
+share almost nothing between calls, so every call paid to evaluate the
+full instructions again.
+
+``PromptAssembler`` keeps every call site's prompt in two parts:
+
+- a static prefix (instructions, formats, examples) built once per model
+  and role, then returned byte-for-byte identical on every call;
+- the volatile context and the player's input, always appended last.
+
+It also picks each request's ``keep_alive`` from player-session activity,
+so the model (and its cache) stays loaded while anyone is playing, and it
+records prompt-eval against generated tokens per call site from Ollama's
+response counters.
+"""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .config import CONFIG
+
+_DURATION = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*(ms|s|m|h)?\s*$")
+_UNIT_SECONDS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def duration_seconds(value: str) -> float:
+    """Seconds in an Ollama ``keep_alive`` duration such as ``"30m"``."""
+    match = _DURATION.match(str(value))
+    if not match:
+        raise ValueError(f"Not a keep_alive duration: {value!r}")
+    amount, unit = match.groups()
+    return float(amount) * _UNIT_SECONDS[unit or "s"]
+
+
+class PromptAssembler:
+    """Cached static prompt prefixes, keep_alive choice and token metrics.
+
+    Use ``get_prompt_assembler()`` so every call site shares the prefixes,
+    session activity and metrics.
+
+    Args:
+        keep_alive: How long Ollama keeps the model loaded after a player
+            request. Defaults to ``CONFIG.OLLAMA_KEEP_ALIVE``.
+    """
+
+    def __init__(self, keep_alive: Optional[str] = None):
+        self.keep_alive_duration = keep_alive or CONFIG.OLLAMA_KEEP_ALIVE
+        self.session_window = duration_seconds(self.keep_alive_duration)
+        self._prefixes: Dict[Tuple[str, str], str] = {}
+        self._sessions: "OrderedDict[str, float]" = OrderedDict()
+        self._metrics: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    # -- prompt layout -----------------------------------------------------
+
+    def prefix(self, model: str, role: str, build: Callable[[], str]) -> str:
+        """Return the static prefix for a model and role, building it once."""
+        key = (model, role)
+        with self._lock:
+            cached = self._prefixes.get(key)
+        if cached is None:
+            built = build()
+            with self._lock:
+                cached = self._prefixes.setdefault(key, built)
+        return cached
+
+    def invalidate(self, model: Optional[str] = None) -> None:
+        """Forget cached prefixes for one model, or for all models."""
+        with self._lock:
+            for key in [key for key in self._prefixes if model in (None, key[0])]:
+                del self._prefixes[key]
+
+    @staticmethod
+    def join(prefix: str, *sections: str) -> str:
+        """A single prompt: the static prefix, then non-empty sections in order."""
+        return "\n\n".join([prefix, *(section for section in sections if section)])
+
+    @staticmethod
+    def chat_messages(
+        prefix: str,
+        history: Iterable[Dict[str, str]],
+        context: Iterable[str],
+        user_input: str,
+    ) -> List[Dict[str, str]]:
+        """Chat messages ordered static prefix, history, context, input.
+
+        History only grows at its end, so the system prompt and earlier turns
+        stay a shared prefix from one turn to the next.
+        """
+        messages = [{"role": "system", "content": prefix}]
+        messages.extend(history)
+        messages.extend(
+            {"role": "system", "content": section} for section in context if section
+        )
+        messages.append({"role": "user", "content": user_input})
+        return messages
+
+    # -- keep_alive --------------------------------------------------------
+
+    def keep_alive(self, session_id: Optional[str] = None) -> Optional[str]:
+        """``keep_alive`` for a request, recording the session as active.
+
+        Player requests keep the model loaded for the configured duration.
+        Background requests (no session) do the same while any session was
+        active within that window, and otherwise leave Ollama's default so
+        they do not pin the model for an idle server.
+        """
+        now = time.monotonic()
+        with self._lock:
+            if session_id is not None:
+                self._sessions[session_id] = now
+                self._sessions.move_to_end(session_id)
+            cutoff = now - self.session_window
+            while self._sessions and next(iter(self._sessions.values())) < cutoff:
+                self._sessions.popitem(last=False)
+            active = bool(self._sessions)
+        return self.keep_alive_duration if active else None
+
+    def with_keep_alive(
+        self, payload: Dict[str, Any], session_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Add ``keep_alive`` to a request payload when one applies."""
+        keep_alive = self.keep_alive(session_id)
+        if keep_alive is not None:
+            payload["keep_alive"] = keep_alive
+        return payload
+
+    def active_sessions(self) -> int:
+        with self._lock:
+            return len(self._sessions)
+
+    # -- metrics -----------------------------------------------------------
+
+    def record(self, site: str, response: Dict[str, Any]) -> None:
+        """Add a response's prompt-eval and generation counters to a call site."""
+        with self._lock:
+            metrics = self._metrics.get(site)
+            if metrics is None:
+                metrics = self._metrics[site] = {
+                    "calls": 0,
+                    "prompt_eval_tokens": 0,
+                    "eval_tokens": 0,
+                    "prompt_eval_seconds": 0.0,
+                    "eval_seconds": 0.0,
+                }
+            metrics["calls"] += 1
+            metrics["prompt_eval_tokens"] += response.get("prompt_eval_count") or 0
+            metrics["eval_tokens"] += response.get("eval_count") or 0
+            # Ollama reports durations in nanoseconds
+            metrics["prompt_eval_seconds"] += (
+                response.get("prompt_eval_duration") or 0
+            ) / 1e9
+            metrics["eval_seconds"] += (response.get("eval_duration") or 0) / 1e9
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            sites = {site: dict(metrics) for site, metrics in self._metrics.items()}
+            stats = {
+                "cached_prefixes": len(self._prefixes),
+                "active_sessions": len(self._sessions),
+                "keep_alive": self.keep_alive_duration,
+            }
+        for metrics in sites.values():
+            calls = metrics["calls"]
+            tokens = metrics["prompt_eval_tokens"] + metrics["eval_tokens"]
+            seconds = metrics["prompt_eval_seconds"] + metrics["eval_seconds"]
+            metrics["prompt_eval_tokens_per_call"] = (
+                metrics["prompt_eval_tokens"] / calls if calls else 0.0
+            )
+            metrics["prompt_token_share"] = (
+                metrics["prompt_eval_tokens"] / tokens if tokens else 0.0
+            )
+            metrics["prompt_time_share"] = (
+                metrics["prompt_eval_seconds"] / seconds if seconds else 0.0
+            )
+        stats["sites"] = sites
+        return stats
+
+
+_assembler: Optional[PromptAssembler] = None
+_assembler_lock = threading.Lock()
+
+
+def get_prompt_assembler() -> PromptAssembler:
+    """Get the shared prompt assembler."""
+    global _assembler
+    with _assembler_lock:
+        if _assembler is None:
+            _assembler = PromptAssembler()
+        return _assembler
@@ -78,6 +78,51 @@ class SessionService:
         else:
             return self.create_game_state(player_name, session_id, game_data)
 
+    def save_game_states(self, records: List[Dict[str, Any]]) -> Dict[str, str]:
+        """Upsert many game states by session_id in a single transaction.
+
+        Each record has the shape of ``GameState.to_persistence_model()``.
+        Returns the row id of each saved state keyed by session_id. Nothing
+        is written if any record fails.
+        """
+        if not records:
+            return {}
+
+        session_ids = [record["session_id"] for record in records]
+        existing = {
+            state.session_id: state
+            for state in self.session.exec(
+                select(GameStatePersistence).where(
+                    GameStatePersistence.session_id.in_(session_ids)
+                )
+            )
+        }
+
+        saved = {}
+        now = datetime.utcnow()
+        try:
+            for record in records:
+                state = existing.get(record["session_id"])
+                if state is None:
+                    state = GameStatePersistence(
+                        player_name=record.get("player_name") or "Unknown",
+                        session_id=record["session_id"],
+                        inventory=[],
+                        flags={},
+                    )
+                    if record.get("id"):
+                        state.id = record["id"]
+                    existing[state.session_id] = state
+                state.game_data = record.get("game_data") or {}
+                state.updated_at = now
+                self.session.add(state)
+                saved[state.session_id] = state.id
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+        return saved
+
     # Session Management
 
     def create_session(
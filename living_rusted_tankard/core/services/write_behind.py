@@ -0,0 +1,263 @@
+"""
+Write-behind persistence of live game states.
+
+Saving through ``SessionService.save_game_state_data`` commits, and
+refreshes, one full ``game_data`` blob per call, so a database write sat on
+the path of every command. The ``WriteBehindPersister`` takes that write off
+the request path:
+- ``enqueue(game_state)`` snapshots a dirty state and marks it clean.
+- Snapshots are keyed by session_id. A newer snapshot of the same session
+  replaces one that has not been written yet.
+- A background thread writes pending snapshots in one transaction, either
+  every ``flush_interval`` seconds or as soon as ``batch_size`` sessions
+  are waiting.
+
+``shutdown()`` stops the thread and flushes whatever is left. It is also
+registered with ``atexit``, so pending saves survive an interpreter exit
+that skips the application's shutdown hook.
+
+A batch is one transaction, so when it fails its records are written one
+at a time and only the ones that fail again stay pending, to be retried on
+the next flush unless a newer snapshot of the same session has replaced
+them. A record that fails ``max_attempts`` flushes is dropped and its
+state marked dirty again, so the session's next save takes a fresh
+snapshot instead of one bad record holding up the queue.
+"""
+
+import atexit
+import logging
+import threading
+import time
+import weakref
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..config import CONFIG
+
+logger = logging.getLogger(__name__)
+
+
+# A pending save: (record, weak reference to the game state, failed flushes)
+_Entry = Tuple[Dict[str, Any], Any, int]
+
+
+class WriteBehindPersister:
+    """Coalescing, batching writer for ``GameState.to_persistence_model``.
+
+    ``session_factory`` returns a new database session; the default is
+    ``core.db.session.SessionLocal``, resolved on first flush so importing
+    this module does not create an engine.
+    """
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Any]] = None,
+        flush_interval: float = 2.0,
+        batch_size: int = 50,
+        max_attempts: int = 3,
+    ):
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self._session_factory = session_factory
+        self._pending: Dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+        # Held for a whole flush, so shutdown never races a worker batch
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+        self._exit_hook_registered = False
+
+        self._stats = {
+            "enqueued": 0,
+            "coalesced": 0,
+            "batches": 0,
+            "rows_written": 0,
+            "failed_batches": 0,
+            "failed_records": 0,
+            "dropped_records": 0,
+            "last_flush_ms": 0.0,
+        }
+
+    def start(self) -> None:
+        """Start the background flush thread if it is not running."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopping = False
+            self._thread = threading.Thread(
+                target=self._run, name="write-behind", daemon=True
+            )
+            self._thread.start()
+            if not self._exit_hook_registered:
+                atexit.register(self.shutdown)
+                self._exit_hook_registered = True
+
+    def enqueue(self, game_state) -> bool:
+        """Queue a snapshot of ``game_state`` if it needs saving.
+
+        Call this from the thread that owns the state; the snapshot is
+        taken here so the flush thread never reads a state mid-command.
+        Returns whether a snapshot was queued.
+        """
+        if not game_state.needs_save():
+            return False
+        record = game_state.to_persistence_model()
+        session_id = record.get("session_id")
+        if not session_id:
+            return False
+        game_state.mark_clean()
+
+        with self._lock:
+            if session_id in self._pending:
+                self._stats["coalesced"] += 1
+            self._pending[session_id] = (record, weakref.ref(game_state), 0)
+            self._stats["enqueued"] += 1
+            batch_ready = len(self._pending) >= self.batch_size
+
+        if self._thread is None and not self._stopping:
+            self.start()
+        if batch_ready:
+            self._wakeup.set()
+        return True
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def flush(self) -> int:
+        """Write every pending snapshot now. Returns the rows written."""
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+            if not batch:
+                return 0
+
+            started = time.perf_counter()
+            try:
+                saved = self._write([entry[0] for entry in batch.values()])
+            except Exception as e:
+                logger.warning(
+                    f"Write-behind flush of {len(batch)} sessions failed ({e}); "
+                    "writing them one at a time"
+                )
+                with self._lock:
+                    self._stats["failed_batches"] += 1
+                saved, failed = self._write_each(batch)
+                self._requeue(failed)
+
+            for session_id, db_id in saved.items():
+                game_state = batch[session_id][1]()
+                if game_state is not None and db_id:
+                    game_state.set_db_id(db_id)
+
+            with self._lock:
+                self._stats["batches"] += 1
+                self._stats["rows_written"] += len(saved)
+                self._stats["last_flush_ms"] = round(
+                    (time.perf_counter() - started) * 1000, 2
+                )
+            return len(saved)
+
+    def shutdown(self, timeout: Optional[float] = None) -> int:
+        """Stop the flush thread and write everything still pending."""
+        self._stopping = True
+        self._wakeup.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        self._thread = None
+        return self.flush()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["pending"] = len(self._pending)
+        stats["running"] = self._thread is not None and self._thread.is_alive()
+        return stats
+
+    def _run(self) -> None:
+        while not self._stopping:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            if self._stopping:
+                break
+            self.flush()
+
+    def _write(self, records: List[Dict[str, Any]]) -> Dict[str, str]:
+        from .session_service import SessionService
+
+        if self._session_factory is None:
+            from ..db.session import SessionLocal
+
+            self._session_factory = SessionLocal
+
+        session = self._session_factory()
+        try:
+            return SessionService(session).save_game_states(records)
+        finally:
+            session.close()
+
+    def _write_each(
+        self, batch: Dict[str, _Entry]
+    ) -> Tuple[Dict[str, str], Dict[str, _Entry]]:
+        """Write records in separate transactions; return (saved, failed)."""
+        saved: Dict[str, str] = {}
+        failed: Dict[str, _Entry] = {}
+        for session_id, entry in batch.items():
+            try:
+                saved.update(self._write([entry[0]]))
+            except Exception as e:
+                logger.error(f"Write-behind save of session {session_id} failed: {e}")
+                failed[session_id] = entry
+        with self._lock:
+            self._stats["failed_records"] += len(failed)
+        return saved, failed
+
+    def _requeue(self, failed: Dict[str, _Entry]) -> None:
+        dropped = []
+        with self._lock:
+            for session_id, (record, state_ref, attempts) in failed.items():
+                if session_id in self._pending:
+                    continue  # A newer snapshot queued during the flush wins
+                if attempts + 1 >= self.max_attempts:
+                    dropped.append((session_id, state_ref))
+                    continue
+                self._pending[session_id] = (record, state_ref, attempts + 1)
+            self._stats["dropped_records"] += len(dropped)
+
+        for session_id, state_ref in dropped:
+            logger.error(
+                f"Dropping the write-behind save of session {session_id} "
+                f"after {self.max_attempts} failed flushes"
+            )
+            game_state = state_ref()
+            if game_state is not None:
+                game_state.mark_dirty()
+
+
+def queue_save(game_state) -> None:
+    """Hand a changed session to the write-behind persister.
+
+    The database write happens later on the persister's thread; a failed
+    snapshot is logged rather than failing the command.
+    """
+    try:
+        get_write_behind().enqueue(game_state)
+    except Exception as e:
+        logger.error(f"Could not queue save for session {game_state.session_id}: {e}")
+
+
+# Global write-behind persister
+_write_behind: Optional[WriteBehindPersister] = None
+
+
+def get_write_behind() -> WriteBehindPersister:
+    """Get the global write-behind persister."""
+    global _write_behind
+    if _write_behind is None:
+        _write_behind = WriteBehindPersister(
+            flush_interval=CONFIG.WRITE_BEHIND_FLUSH_SECONDS,
+            batch_size=CONFIG.WRITE_BEHIND_BATCH_SIZE,
+        )
+    return _write_behind
@@ -0,0 +1,98 @@
+"""
+Per-session serialized execution of blocking game work.
+
+GameState is not thread-safe, but blocking work such as command processing
+and snapshot building should not run on the event loop either. The
+SessionExecutor runs such work on a shared thread pool while guaranteeing
+that calls for the same session execute one at a time and in arrival order.
+Calls for different sessions run in parallel.
+
+A request that touches the session more than once, such as narration
+followed by mechanics, holds the session for its whole ``turn`` so the next
+request's prompt is never built from a half-applied command.
+"""
+
+import asyncio
+import contextlib
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SessionExecutor:
+    """Run blocking callables off the event loop, serialized per session."""
+
+    def __init__(self, max_workers: int = 8):
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="session"
+        )
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._waiters: Dict[str, int] = {}
+
+    def _acquire_lock(self, session_id: str) -> asyncio.Lock:
+        lock = self._locks.get(session_id)
+        if lock is None:
+            lock = self._locks[session_id] = asyncio.Lock()
+        self._waiters[session_id] = self._waiters.get(session_id, 0) + 1
+        return lock
+
+    def _release_lock(self, session_id: str) -> None:
+        remaining = self._waiters.get(session_id, 1) - 1
+        if remaining <= 0:
+            # Nobody else is queued for this session; drop the lock so idle
+            # sessions do not accumulate
+            self._waiters.pop(session_id, None)
+            self._locks.pop(session_id, None)
+        else:
+            self._waiters[session_id] = remaining
+
+    @contextlib.asynccontextmanager
+    async def turn(self, session_id: str) -> AsyncIterator[None]:
+        """Hold the session until the block exits; other work for it queues.
+
+        Inside the block, run blocking work with ``call`` rather than ``run``,
+        which would wait for the turn itself to finish.
+        """
+        lock = self._acquire_lock(session_id)
+        try:
+            async with lock:
+                yield
+        finally:
+            self._release_lock(session_id)
+
+    async def call(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run ``func(*args, **kwargs)`` in the pool without per-session ordering."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, functools.partial(func, *args, **kwargs)
+        )
+
+    async def run(
+        self, session_id: str, func: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        """Run ``func(*args, **kwargs)`` in the pool, one call per session at a time."""
+        async with self.turn(session_id):
+            return await self.call(func, *args, **kwargs)
+
+    def is_busy(self, session_id: str) -> bool:
+        """Whether work for the session is running or queued."""
+        return session_id in self._waiters
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the underlying thread pool."""
+        self.executor.shutdown(wait=wait)
+
+
+# Global executor instance shared by the API layers
+_session_executor: Optional[SessionExecutor] = None
+
+
+def get_session_executor() -> SessionExecutor:
+    """Get the global session executor."""
+    global _session_executor
+    if _session_executor is None:
+        _session_executor = SessionExecutor()
+    return _session_executor
@@ -0,0 +1,142 @@
+"""
+Pre-warmed pool of fresh GameStates.
+
+Building a GameState loads the NPC, bounty and news data, copies item
+definitions into NPC inventories, wires up the core managers and runs the
+opening scene. GameStatePool does that work ahead of time on a
+background thread, so creating a session only has to hand out a world that
+is already built. When the pool runs dry, acquire() builds one inline.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional
+
+from . import time_source
+from .game_state import GameState
+from .ollama_transport import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+# Session creation is measured in milliseconds, not LLM seconds
+CREATION_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+
+class GameStatePool:
+    """Hand out ready-built GameStates and refill the pool in the background."""
+
+    def __init__(
+        self,
+        size: int = 4,
+        factory: Optional[Callable[[], GameState]] = None,
+        data_dir: str = "data",
+    ):
+        self.size = size
+        self.factory = factory or (lambda: GameState(data_dir=data_dir))
+        self._ready: Deque[GameState] = deque()
+        self._lock = threading.Lock()
+        self._refill_needed = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+        self.build_latency = LatencyHistogram(CREATION_BUCKETS)
+        self.acquire_latency = LatencyHistogram(CREATION_BUCKETS)
+        self._stats = {"hits": 0, "misses": 0, "built": 0, "build_errors": 0}
+
+    def acquire(self, session_id: Optional[str] = None) -> GameState:
+        """Take a fresh GameState for a new session."""
+        start = time.perf_counter()
+        with self._lock:
+            game_state = self._ready.popleft() if self._ready else None
+            self._stats["hits" if game_state else "misses"] += 1
+
+        if game_state is None:
+            game_state = self._build()
+        if session_id:
+            game_state.set_session_id(session_id)
+        # Game time must not include the time spent waiting in the pool
+        game_state.clock.last_tick = time_source.monotonic()
+
+        self.acquire_latency.observe(time.perf_counter() - start)
+        self.start()
+        return game_state
+
+    def start(self) -> None:
+        """Start (or wake) the background refill thread."""
+        with self._lock:
+            if self._stopped:
+                return
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._refill_loop, name="session-pool", daemon=True
+                )
+                self._thread.start()
+        self._refill_needed.set()
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Stop refilling and drop the ready GameStates."""
+        with self._lock:
+            self._stopped = True
+            self._ready.clear()
+            thread = self._thread
+        self._refill_needed.set()
+        if thread is not None:
+            thread.join(timeout)
+
+    def _build(self) -> GameState:
+        start = time.perf_counter()
+        try:
+            game_state = self.factory()
+        except Exception:
+            with self._lock:
+                self._stats["build_errors"] += 1
+            raise
+        self.build_latency.observe(time.perf_counter() - start)
+        with self._lock:
+            self._stats["built"] += 1
+        return game_state
+
+    def _refill_loop(self) -> None:
+        while True:
+            self._refill_needed.wait()
+            self._refill_needed.clear()
+            while True:
+                with self._lock:
+                    if self._stopped:
+                        return
+                    if len(self._ready) >= self.size:
+                        break
+                try:
+                    game_state = self._build()
+                except Exception as e:
+                    logger.error(f"Failed to pre-build a game state: {e}")
+                    break
+                with self._lock:
+                    if self._stopped:
+                        return
+                    self._ready.append(game_state)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Pool occupancy, hit rate and creation latency."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["ready"] = len(self._ready)
+        stats["size"] = self.size
+        acquired = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / acquired if acquired else 0.0
+        stats["build_latency"] = self.build_latency.snapshot()
+        stats["acquire_latency"] = self.acquire_latency.snapshot()
+        return stats
+
+
+# Global pool shared by the API layers
+_session_pool: Optional[GameStatePool] = None
+
+
+def get_session_pool() -> GameStatePool:
+    """Get the global GameState pool."""
+    global _session_pool
+    if _session_pool is None:
+        _session_pool = GameStatePool()
+    return _session_pool
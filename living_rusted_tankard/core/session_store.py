@@ -0,0 +1,491 @@
+"""
+Bounded store for live game sessions.
+
+The API used to keep every GameState in a plain dict until it expired, and
+found expired sessions by scanning the whole dict on every request. The
+SessionStore keeps at most ``max_live`` sessions in memory in LRU order.
+Colder sessions are serialized with ``GameState.to_persistence_model`` into
+a SQLite spill file and rebuilt transparently on their next lookup.
+Expiry uses a timer wheel. Deadlines are bucketed into fixed-width slots,
+and each request only visits the slots that have come due since the last
+one.
+
+A request may still hold a GameState while its session is spilled, for
+example while it awaits the LLM. Two safeguards keep that request's changes:
+- Spilled sessions keep a weak reference to their last object, so a
+  lookup during that time returns the same instance rather than an older
+  copy.
+- Handlers finish with ``touch(session_id, game_state)``, which puts the
+  object back in memory if the session was spilled meanwhile.
+
+Spilling a session only moves it out of the LRU. Serializing it and
+writing the row happen on a background writer thread, so neither runs
+inside ``get()``/``put()`` or under the store lock. Until its row is
+written the store keeps a strong reference to the spilled object, and a
+lookup in that window returns the object itself. ``flush()`` waits for the
+writer to catch up.
+
+A session that fails to serialize goes back into memory, and is not
+serialized again until it sees new activity.
+"""
+
+import json
+import logging
+import queue
+import sqlite3
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from .config import CONFIG
+
+logger = logging.getLogger(__name__)
+
+
+class TimerWheel:
+    """Deadline buckets of ``slot_seconds`` width, visited once each.
+
+    A key comes back from ``pop_due`` once its whole slot has passed, so
+    expiry can run up to one slot late. Keys are never moved when their
+    deadline changes; the caller re-checks each due key and schedules it
+    again if it is still alive.
+    """
+
+    def __init__(self, slot_seconds: float, now: float):
+        self.slot_seconds = slot_seconds
+        self._slots: Dict[int, Set[str]] = {}
+        self._cursor = int(now // slot_seconds)
+
+    def schedule(self, key: str, deadline: float) -> None:
+        slot = max(int(deadline // self.slot_seconds), self._cursor)
+        self._slots.setdefault(slot, set()).add(key)
+
+    def pop_due(self, now: float) -> List[str]:
+        current = int(now // self.slot_seconds)
+        if current <= self._cursor:
+            return []
+        if current - self._cursor <= len(self._slots):
+            due_slots = range(self._cursor, current)
+        else:
+            # Long idle gap: visit the occupied slots, not every empty one
+            due_slots = sorted(slot for slot in self._slots if slot < current)
+        due: List[str] = []
+        for slot in due_slots:
+            due.extend(self._slots.pop(slot, ()))
+        self._cursor = current
+        return due
+
+    def clear(self) -> None:
+        self._slots.clear()
+
+
+class SessionStore:
+    """LRU-bounded sessions that spill to SQLite and expire on a timer wheel.
+
+    Args:
+        max_live: Sessions kept in memory before the least recently used
+            ones are spilled.
+        ttl_seconds: Idle time after which a session (live or spilled) is
+            dropped.
+        spill_path: SQLite database for spilled sessions (":memory:" keeps
+            them in process, still far smaller than live GameStates).
+        serialize: Turns a GameState into JSON-compatible data.
+        deserialize: Rebuilds a GameState from ``serialize`` output.
+        is_busy: Tells whether a session has work in flight; busy sessions
+            are never spilled.
+        slot_seconds: Width of a timer wheel slot.
+    """
+
+    def __init__(
+        self,
+        max_live: int = 100,
+        ttl_seconds: float = 30 * 60,
+        spill_path: str = ":memory:",
+        serialize: Optional[Callable[[Any], Dict[str, Any]]] = None,
+        deserialize: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        is_busy: Optional[Callable[[str], bool]] = None,
+        slot_seconds: float = 60.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.max_live = max_live
+        self.ttl_seconds = ttl_seconds
+        self.serialize = serialize or (
+            lambda game_state: game_state.to_persistence_model()
+        )
+        self.deserialize = deserialize or _game_state_from_persistence_data
+        self.is_busy = is_busy or (lambda session_id: False)
+        self.clock = clock
+
+        # session_id -> {"game_state", "created_at", "last_activity"}
+        self._live: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # session_id -> (created_at, last_activity) for spilled sessions
+        self._spilled: Dict[str, Tuple[float, float]] = {}
+        # Spilled GameStates that requests may still be holding
+        self._spilled_objects: Dict[str, "weakref.ref[Any]"] = {}
+        # session_id -> (spill number, GameState) for spills the writer has
+        # not stored yet
+        self._unwritten: Dict[str, Tuple[int, Any]] = {}
+        self._spill_count = 0
+        # session_id -> last_activity of a live session that failed to spill;
+        # it is not retried until it sees activity again
+        self._spill_failed: Dict[str, float] = {}
+        self._wheel = TimerWheel(slot_seconds, clock())
+        self._lock = threading.RLock()
+
+        self.spill_path = spill_path
+        self._connection: Optional[sqlite3.Connection] = None
+        # Guards the connection, which the writer and rehydration share
+        self._db_lock = threading.Lock()
+        self._writes: "queue.Queue[Optional[Tuple[str, str, int]]]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+
+        self._stats = {
+            "spills": 0,
+            "rehydrations": 0,
+            "expirations": 0,
+            "spill_errors": 0,
+            "rehydrate_errors": 0,
+        }
+
+    def get(self, session_id: str) -> Optional[Any]:
+        """Return the session's GameState, rehydrating it if it was spilled.
+
+        Counts as activity: the session becomes most recently used and its
+        expiry deadline moves forward.
+        """
+        with self._lock:
+            record = self._live.get(session_id)
+            if record is None:
+                record = self._rehydrate(session_id)
+                if record is None:
+                    return None
+            self._live.move_to_end(session_id)
+            record["last_activity"] = self.clock()
+            self._enforce_budget()
+            return record["game_state"]
+
+    def touch(self, session_id: str, game_state: Optional[Any] = None) -> None:
+        """Record activity without fetching the GameState.
+
+        Passing the ``game_state`` a request worked on brings it back into
+        memory if the session was spilled while the request ran, so the
+        request's changes win over the spilled copy.
+        """
+        with self._lock:
+            if game_state is not None and session_id in self._spilled:
+                created_at, _ = self._spilled[session_id]
+                self._drop_spilled(session_id)
+                self._live[session_id] = {
+                    "game_state": game_state,
+                    "created_at": created_at,
+                    "last_activity": self.clock(),
+                }
+                self._enforce_budget()
+            elif session_id in self._live:
+                self._live.move_to_end(session_id)
+                self._live[session_id]["last_activity"] = self.clock()
+            elif session_id in self._spilled:
+                created_at, _ = self._spilled[session_id]
+                self._spilled[session_id] = (created_at, self.clock())
+
+    def __contains__(self, session_id: Optional[str]) -> bool:
+        with self._lock:
+            return session_id in self._live or session_id in self._spilled
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._live) + len(self._spilled)
+
+    def list_sessions(self) -> List[Dict[str, Any]]:
+        """Metadata for every session; ``game_state`` is None when spilled."""
+        with self._lock:
+            sessions = [
+                {
+                    "session_id": session_id,
+                    "created_at": record["created_at"],
+                    "last_activity": record["last_activity"],
+                    "game_state": record["game_state"],
+                }
+                for session_id, record in self._live.items()
+            ]
+            sessions.extend(
+                {
+                    "session_id": session_id,
+                    "created_at": created_at,
+                    "last_activity": last_activity,
+                    "game_state": None,
+                }
+                for session_id, (created_at, last_activity) in self._spilled.items()
+            )
+            return sessions
+
+    def put(self, session_id: str, game_state: Any) -> None:
+        """Add a session, or replace the GameState of an existing one."""
+        with self._lock:
+            now = self.clock()
+            if session_id not in self:
+                self._wheel.schedule(session_id, now + self.ttl_seconds)
+            self._drop_spilled(session_id)
+            self._spill_failed.pop(session_id, None)
+            self._live.pop(session_id, None)
+            self._live[session_id] = {
+                "game_state": game_state,
+                "created_at": now,
+                "last_activity": now,
+            }
+            self._enforce_budget()
+
+    def remove(self, session_id: str) -> bool:
+        """Forget a session; returns whether it existed."""
+        with self._lock:
+            self._spill_failed.pop(session_id, None)
+            existed = self._live.pop(session_id, None) is not None
+            return self._drop_spilled(session_id) or existed
+
+    def expire(self) -> int:
+        """Drop sessions idle for longer than the TTL.
+
+        Only the timer wheel slots that came due since the last call are
+        visited, so calling this on every request is cheap.
+        """
+        with self._lock:
+            now = self.clock()
+            expired = 0
+            for session_id in self._wheel.pop_due(now):
+                last_activity = self._last_activity(session_id)
+                if last_activity is None:
+                    continue  # removed since it was scheduled
+                deadline = last_activity + self.ttl_seconds
+                if deadline > now:
+                    self._wheel.schedule(session_id, deadline)
+                    continue
+                logger.info(f"Removing expired session: {session_id}")
+                self.remove(session_id)
+                expired += 1
+            self._stats["expirations"] += expired
+            return expired
+
+    def flush(self) -> None:
+        """Wait until the writer has stored every queued spill."""
+        self._writes.join()
+
+    def close(self) -> None:
+        """Drop every session, stop the writer and close the spill database."""
+        with self._lock:
+            self._live.clear()
+            self._spilled.clear()
+            self._spilled_objects.clear()
+            self._unwritten.clear()
+            self._spill_failed.clear()
+            self._wheel.clear()
+            writer, self._writer = self._writer, None
+        if writer is not None:
+            self._writes.put(None)
+            writer.join()
+        with self._db_lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Live/spilled counts and spill, rehydration and expiry counters."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["live"] = len(self._live)
+            stats["spilled"] = len(self._spilled)
+            stats["unwritten"] = len(self._unwritten)
+            stats["max_live"] = self.max_live
+            return stats
+
+    @property
+    def _db(self) -> sqlite3.Connection:
+        """The spill database, opened on first use; hold ``_db_lock``."""
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.spill_path, check_same_thread=False)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS spilled_sessions ("
+                "session_id TEXT PRIMARY KEY, data TEXT NOT NULL)"
+            )
+            # Spilled sessions only live as long as the process that spilled them
+            self._connection.execute("DELETE FROM spilled_sessions")
+            self._connection.commit()
+        return self._connection
+
+    def _last_activity(self, session_id: str) -> Optional[float]:
+        if session_id in self._live:
+            return self._live[session_id]["last_activity"]
+        if session_id in self._spilled:
+            return self._spilled[session_id][1]
+        return None
+
+    def _enforce_budget(self) -> None:
+        """Spill least recently used sessions until the live set fits."""
+        excess = len(self._live) - self.max_live
+        if excess <= 0:
+            return
+        # The most recently used session is the one being served
+        for session_id in list(self._live)[:-1]:
+            if excess <= 0:
+                break
+            if self.is_busy(session_id):
+                continue
+            last_activity = self._live[session_id]["last_activity"]
+            if self._spill_failed.get(session_id) == last_activity:
+                continue  # Failed as it is now; serializing again won't help
+            self._spill(session_id)
+            excess -= 1
+
+    def _spill(self, session_id: str) -> None:
+        """Move a session out of memory and queue its row for the writer."""
+        record = self._live.pop(session_id)
+        self._spill_failed.pop(session_id, None)
+        self._spilled[session_id] = (record["created_at"], record["last_activity"])
+        self._spilled_objects[session_id] = weakref.ref(record["game_state"])
+        self._spill_count += 1
+        self._unwritten[session_id] = (self._spill_count, record["game_state"])
+        self._submit(("spill", session_id, self._spill_count))
+
+    def _submit(self, write: Tuple[str, str, int]) -> None:
+        if self._writer is None:
+            self._writer = threading.Thread(
+                target=self._run_writer, name="session-spill", daemon=True
+            )
+            self._writer.start()
+        self._writes.put(write)
+
+    def _run_writer(self) -> None:
+        while True:
+            write = self._writes.get()
+            try:
+                if write is None:
+                    return
+                kind, session_id, spill = write
+                if kind == "spill":
+                    self._write_spill(session_id, spill)
+                else:
+                    self._delete_row(session_id)
+            except Exception as e:
+                logger.error(f"Session spill writer failed on {write}: {e}")
+            finally:
+                self._writes.task_done()
+
+    def _is_unwritten(self, session_id: str, spill: int) -> bool:
+        """Whether ``spill`` is still the session's latest, unstored spill."""
+        return self._unwritten.get(session_id, (None,))[0] == spill
+
+    def _write_spill(self, session_id: str, spill: int) -> None:
+        with self._lock:
+            if not self._is_unwritten(session_id, spill):
+                return  # Back in memory, or spilled again since
+            game_state = self._unwritten[session_id][1]
+        try:
+            data = json.dumps(self.serialize(game_state), default=str)
+        except Exception as e:
+            logger.error(f"Could not spill session {session_id}: {e}")
+            with self._lock:
+                self._stats["spill_errors"] += 1
+                if self._is_unwritten(session_id, spill):
+                    self._restore_failed(session_id)
+            return
+        with self._db_lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO spilled_sessions (session_id, data) "
+                "VALUES (?, ?)",
+                (session_id, data),
+            )
+            self._db.commit()
+        with self._lock:
+            self._stats["spills"] += 1
+            if self._is_unwritten(session_id, spill):
+                del self._unwritten[session_id]
+
+    def _restore_failed(self, session_id: str) -> None:
+        """Put a session that failed to serialize back in memory, LRU first.
+
+        Keeping it in memory beats losing the player's game.
+        """
+        created_at, last_activity = self._spilled.pop(session_id)
+        self._spilled_objects.pop(session_id, None)
+        _, game_state = self._unwritten.pop(session_id)
+        self._live[session_id] = {
+            "game_state": game_state,
+            "created_at": created_at,
+            "last_activity": last_activity,
+        }
+        self._live.move_to_end(session_id, last=False)
+        self._spill_failed[session_id] = last_activity
+
+    def _delete_row(self, session_id: str) -> None:
+        with self._db_lock:
+            self._db.execute(
+                "DELETE FROM spilled_sessions WHERE session_id = ?", (session_id,)
+            )
+            self._db.commit()
+
+    def _rehydrate(self, session_id: str) -> Optional[Dict[str, Any]]:
+        if session_id not in self._spilled:
+            return None
+        created_at, last_activity = self._spilled[session_id]
+        # Not written yet, or a request still holding the old object: keep
+        # using that instance
+        if session_id in self._unwritten:
+            game_state = self._unwritten[session_id][1]
+        else:
+            game_state = self._spilled_objects[session_id]()
+        try:
+            if game_state is None:
+                with self._db_lock:
+                    row = self._db.execute(
+                        "SELECT data FROM spilled_sessions WHERE session_id = ?",
+                        (session_id,),
+                    ).fetchone()
+                game_state = self.deserialize(json.loads(row[0]))
+        except Exception as e:
+            self._stats["rehydrate_errors"] += 1
+            logger.error(f"Could not restore spilled session {session_id}: {e}")
+            self._drop_spilled(session_id)
+            return None
+        self._drop_spilled(session_id)
+        self._live[session_id] = record = {
+            "game_state": game_state,
+            "created_at": created_at,
+            "last_activity": last_activity,
+        }
+        self._stats["rehydrations"] += 1
+        return record
+
+    def _drop_spilled(self, session_id: str) -> bool:
+        if self._spilled.pop(session_id, None) is None:
+            return False
+        self._spilled_objects.pop(session_id, None)
+        self._unwritten.pop(session_id, None)
+        # Queued behind any spill of the same session, so its row goes too
+        self._submit(("drop", session_id, 0))
+        return True
+
+
+def _game_state_from_persistence_data(data: Dict[str, Any]) -> Any:
+    from .game_state import GameState
+
+    return GameState.from_persistence_data(data)
+
+
+# Global store shared by the API layers
+_session_store: Optional[SessionStore] = None
+
+
+def get_session_store() -> SessionStore:
+    """Get the global session store."""
+    global _session_store
+    if _session_store is None:
+        from .session_executor import get_session_executor
+
+        _session_store = SessionStore(
+            max_live=CONFIG.MAX_LIVE_SESSIONS,
+            ttl_seconds=CONFIG.SESSION_IDLE_TIMEOUT_MINUTES * 60,
+            spill_path=CONFIG.SESSION_SPILL_PATH,
+            is_busy=get_session_executor().is_busy,
+        )
+    return _session_store
@@ -1,7 +1,9 @@
-from typing import Dict, List, Optional, Any, TYPE_CHECKING
-from dataclasses import dataclass, asdict
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Any, Tuple, TYPE_CHECKING
+from dataclasses import dataclass
 from datetime import datetime
 import logging
+import uuid
 
 logger = logging.getLogger(__name__)
 
@@ -23,37 +25,221 @@ class GameSnapshot:
     location: str  # Current location (always "tavern" for now)
 
 
+# Snapshot keys produced by each tracked subsystem, in GameSnapshot order
+SNAPSHOT_SECTIONS: Dict[str, Tuple[str, ...]] = {
+    "clock": ("time", "formatted_time"),
+    "npc_manager": ("present_npcs",),
+    "bounties": ("board_notes",),
+    "player": ("player",),
+    "room_manager": ("location",),
+}
+
+
+class SectionVersions:
+    """Per-subsystem version counters for a game state.
+
+    A section's version goes up when it is bumped explicitly or when
+    ``observe`` sees a different signature than last time. ``version`` is a
+    global counter that goes up with every section change; ``checkpoint``
+    remembers which section versions a global version stood for, so later
+    snapshots can be diffed against it.
+
+    Versions restart with every instance, so clients get them as a ``token``
+    that also carries the instance's ``epoch``; a token from another
+    instance (a reset, pooled or restored game state) is never diffed.
+    """
+
+    SECTIONS = ("clock", "player", "npc_manager", "room_manager", "economy", "bounties")
+
+    def __init__(self, history_size: int = 64):
+        self.epoch = uuid.uuid4().hex[:12]
+        self.version = 0
+        self._sections: Dict[str, int] = {name: 0 for name in self.SECTIONS}
+        self._signatures: Dict[str, Any] = {}
+        self._history: "OrderedDict[int, Dict[str, int]]" = OrderedDict()
+        self._history_size = history_size
+
+    @property
+    def token(self) -> str:
+        """The current version as handed to clients."""
+        return f"{self.epoch}-{self.version}"
+
+    def resolve(self, token: Any) -> Optional[int]:
+        """The version a client token stands for, or None if not ours."""
+        if not isinstance(token, str):
+            return None
+        epoch, _, version = token.rpartition("-")
+        if epoch != self.epoch or not version.isdigit():
+            return None
+        return int(version)
+
+    def get(self, section: str) -> int:
+        return self._sections.get(section, 0)
+
+    def as_dict(self) -> Dict[str, int]:
+        return dict(self._sections)
+
+    def bump(self, *sections: str) -> None:
+        """Record that the given sections changed."""
+        for section in sections:
+            self._sections[section] = self._sections.get(section, 0) + 1
+            self.version += 1
+
+    def observe(self, section: str, signature: Any) -> bool:
+        """Bump ``section`` if its signature changed; return whether it did."""
+        if section in self._signatures and self._signatures[section] == signature:
+            return False
+        self._signatures[section] = signature
+        self.bump(section)
+        return True
+
+    def checkpoint(self) -> int:
+        """Remember the current section versions under the global version."""
+        if self.version not in self._history:
+            self._history[self.version] = dict(self._sections)
+            while len(self._history) > self._history_size:
+                self._history.popitem(last=False)
+        return self.version
+
+    def changed_since(self, version: int) -> Optional[List[str]]:
+        """Sections changed after ``version``, or None if it is unknown."""
+        previous = self._history.get(version)
+        if previous is None:
+            return None
+        return [
+            name
+            for name, current in self._sections.items()
+            if previous.get(name, 0) != current
+        ]
+
+
 class SnapshotManager:
-    """Manages creation of game state snapshots for the parser."""
+    """Manages creation of game state snapshots for the parser.
+
+    Each snapshot section is cached with the section version it was built
+    at and only rebuilt once that version moves on. Sections are observed
+    through cheap signatures (scalars and change counters such as the
+    inventory and NPC presence revisions), so an idle session re-serializes
+    nothing.
+    """
 
     def __init__(self, game_state):
         self.game_state = game_state
+        self.versions = SectionVersions()
+        self._sections: Dict[str, Dict[str, Any]] = {}
+        self._built_at: Dict[str, int] = {}
 
     def create_snapshot(self) -> Dict[str, Any]:
         """Create a snapshot of the current game state for the parser.
 
         Returns:
             Dict containing the minimal structured data needed by the parser.
+            Section values are shared with the cache and must not be mutated.
         """
-        # Get present NPCs with their basic info
-        present_npcs = []
-        for npc in self._get_present_npcs():
-            present_npcs.append(
-                {
-                    "id": npc.id,
-                    "name": npc.name,
-                    "description": npc.description,
-                    "mood": npc.mood if hasattr(npc, "mood") else "neutral",
-                    "last_interaction_time": npc.last_interaction_time
+        time_value = self._get_time_value()
+
+        self._refresh(
+            "clock",
+            time_value,
+            lambda: {
+                "time": time_value,
+                "formatted_time": self._format_time(time_value),
+            },
+        )
+        self._refresh(
+            "npc_manager",
+            self._npc_signature(),
+            lambda: {
+                "present_npcs": self._build_present_npcs(self._get_present_npcs())
+            },
+        )
+        board = getattr(self.game_state, "bulletin_board", None)
+        self._refresh(
+            "bounties",
+            (id(board), getattr(board, "revision", None)),
+            lambda: {"board_notes": self._get_visible_board_notes()},
+        )
+        self._refresh(
+            "player",
+            self._player_signature(),
+            lambda: {"player": self._get_player_state()},
+        )
+        # Hardcoded for now
+        self._refresh("room_manager", "tavern", lambda: {"location": "tavern"})
+
+        snapshot: Dict[str, Any] = {}
+        for section in SNAPSHOT_SECTIONS:
+            snapshot.update(self._sections[section])
+        self.versions.checkpoint()
+        return snapshot
+
+    def snapshot_since(self, version: Optional[str] = None) -> Dict[str, Any]:
+        """Snapshot, or a JSON patch against an earlier snapshot version.
+
+        ``version`` is a token previously returned here. Returns
+        ``{"version", "snapshot"}`` when it is None, from another epoch or
+        no longer known, otherwise ``{"version", "patch"}`` with one
+        ``replace`` operation per top-level key whose section changed since.
+        """
+        snapshot = self.create_snapshot()
+        known = self.versions.resolve(version)
+        changed = None if known is None else self.versions.changed_since(known)
+        if changed is None:
+            return {"version": self.versions.token, "snapshot": snapshot}
+
+        patch = [
+            {"op": "replace", "path": f"/{key}", "value": snapshot[key]}
+            for section in changed
+            for key in SNAPSHOT_SECTIONS.get(section, ())
+        ]
+        return {"version": self.versions.token, "patch": patch}
+
+    def _refresh(
+        self, section: str, signature: Any, build: Callable[[], Dict[str, Any]]
+    ) -> None:
+        """Rebuild a section if its signature or version changed."""
+        self.versions.observe(section, signature)
+        version = self.versions.get(section)
+        if self._built_at.get(section) != version:
+            self._sections[section] = build()
+            self._built_at[section] = version
+
+    def _build_present_npcs(self, npcs: List["NPC"]) -> List[Dict[str, Any]]:
+        return [
+            {
+                "id": npc.id,
+                "name": npc.name,
+                "description": npc.description,
+                "mood": npc.mood if hasattr(npc, "mood") else "neutral",
+                "last_interaction_time": (
+                    npc.last_interaction_time
                     if hasattr(npc, "last_interaction_time")
-                    else 0,
-                }
-            )
+                    else 0
+                ),
+            }
+            for npc in npcs
+        ]
+
+    def _npc_signature(self) -> Any:
+        from .npc import NPCManager  # Import here to avoid circular import
 
-        # Get visible board notes (simplified for now)
-        board_notes = self._get_visible_board_notes()
+        npc_manager = getattr(self.game_state, "npc_manager", None)
+        if isinstance(npc_manager, NPCManager):
+            return (id(npc_manager), npc_manager.presence_revision)
+        return tuple(id(npc) for npc in self._get_present_npcs())
 
-        # Create player state snapshot
+    def _player_signature(self) -> Tuple[Any, ...]:
+        player = self.game_state.player
+        inventory = getattr(player, "inventory", None)
+        return (
+            player.gold,
+            player.has_room,
+            getattr(player, "tiredness", 0),
+            id(inventory),
+            getattr(inventory, "revision", None),
+        )
+
+    def _get_player_state(self) -> Dict[str, Any]:
         player_inventory = []
         if hasattr(self.game_state.player, "inventory"):
             inventory = self.game_state.player.inventory
@@ -64,58 +250,48 @@ class SnapshotManager:
                             {"name": inv_item.item.name, "quantity": inv_item.quantity}
                         )
 
-        player_state = {
+        return {
             "gold": self.game_state.player.gold,
             "has_room": self.game_state.player.has_room,
             "tiredness": getattr(self.game_state.player, "tiredness", 0),
             "inventory": player_inventory,
         }
 
-        # Create and return the snapshot
+    def _get_time_value(self) -> float:
         try:
             if hasattr(self.game_state.clock, "get_time"):
-                time_value = self.game_state.clock.get_time()
+                return self.game_state.clock.get_time()
             elif hasattr(self.game_state.clock, "get_current_time"):
-                time_value = self.game_state.clock.get_current_time().hours
+                return self.game_state.clock.get_current_time().hours
             elif hasattr(self.game_state.clock, "current_time"):
-                time_value = self.game_state.clock.current_time.hours
-            else:
-                time_value = 0.0
+                return self.game_state.clock.current_time.hours
         except (ValueError, TypeError, AttributeError) as e:
             logger.warning(f"Failed to parse time value: {e}")
-            time_value = 0.0
+        return 0.0
 
-        # Get formatted natural time
-        formatted_time = "Unknown time"
+    def _format_time(self, time_value: float) -> str:
+        """Get formatted natural time."""
         try:
             from .time_display import format_time_for_display
 
-            formatted_time = format_time_for_display(time_value, "ui_main")
+            return format_time_for_display(time_value, "ui_main")
         except Exception:
             # Fallback to clock's formatted time if available
             try:
                 if hasattr(self.game_state.clock, "get_formatted_time"):
-                    formatted_time = self.game_state.clock.get_formatted_time()
+                    return self.game_state.clock.get_formatted_time()
                 elif hasattr(self.game_state.clock, "current_time"):
-                    formatted_time = self.game_state.clock.current_time.format_time()
+                    return self.game_state.clock.current_time.format_time()
             except Exception:
-                formatted_time = f"Day {int(time_value // 24) + 1}"
-
-        snapshot = GameSnapshot(
-            time=time_value,
-            formatted_time=formatted_time,
-            present_npcs=present_npcs,
-            board_notes=board_notes,
-            player=player_state,
-            location="tavern",  # Hardcoded for now
-        )
-
-        return asdict(snapshot)
+                return f"Day {int(time_value // 24) + 1}"
+            return "Unknown time"
 
     def _get_present_npcs(self) -> List["NPC"]:
         """Get a list of currently present NPCs."""
-        from .npc import NPC  # Import here to avoid circular import
+        from .npc import NPCManager  # Import here to avoid circular import
 
+        if isinstance(getattr(self.game_state, "npc_manager", None), NPCManager):
+            return self.game_state.npc_manager.get_present_npcs()
         if hasattr(self.game_state, "npc_manager") and hasattr(
             self.game_state.npc_manager, "npcs"
         ):
@@ -0,0 +1,107 @@
+"""
+Process-wide registry of parsed static game data.
+
+The JSON files under data/ (items, NPC definitions, bounties, news) do not
+change during play, yet every GameState used to load and validate its own
+copy. StaticDataRegistry parses each file once per process and hands every
+session the same result by reference, so nothing handed out may change:
+plain data is deep-frozen with ``freeze`` (mappings and tuples), model
+definitions are immutable (Item, NewsItem), and the bounty definitions,
+which become per-session state once accepted, are copied by their manager
+before anyone can change them.
+
+With watching enabled (TAVERNA_WATCH_STATIC_DATA=1), a file whose mtime has
+changed is parsed again on its next access.
+"""
+
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+from .config import CONFIG
+
+logger = logging.getLogger(__name__)
+
+
+def freeze(value: Any) -> Any:
+    """Read-only deep copy of plain JSON data (dicts become mappings, lists tuples)."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+class StaticDataRegistry:
+    """Parse each static data file once and share the result."""
+
+    def __init__(self, watch: bool = False):
+        self.watch = watch
+        self._entries: Dict[Tuple[Path, Callable[[Any], Any]], Tuple[int, Any]] = {}
+        self._timings: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def load(self, path: Union[str, Path], parse: Callable[[Any], Any]) -> Any:
+        """Return ``parse(json.load(path))``, parsing once per version of the file.
+
+        Raises the usual OSError / JSONDecodeError / validation errors; a
+        failed parse is not cached.
+        """
+        key = (Path(path).resolve(), parse)
+        entry = self._entries.get(key)
+        if entry is not None and not self.watch:
+            return entry[1]
+
+        mtime = key[0].stat().st_mtime_ns
+        if entry is not None and entry[0] == mtime:
+            return entry[1]
+
+        with self._lock:
+            current = self._entries.get(key)
+            if current is not None and current[0] == mtime:
+                return current[1]
+
+            start = time.perf_counter()
+            with open(key[0], "r") as f:
+                value = parse(json.load(f))
+            elapsed_ms = (time.perf_counter() - start) * 1000
+
+            self._entries[key] = (mtime, value)
+            timing = self._timings.setdefault(
+                key[0].name, {"loads": 0, "total_ms": 0.0}
+            )
+            timing["loads"] += 1
+            timing["total_ms"] += elapsed_ms
+            timing["last_ms"] = elapsed_ms
+            timing["path"] = str(key[0])
+
+        if current is not None:
+            logger.info(f"Reloaded {key[0].name} after it changed on disk")
+        return value
+
+    def get_timings(self) -> Dict[str, Dict[str, Any]]:
+        """Per-file load counts and parse times in milliseconds."""
+        with self._lock:
+            return {name: dict(timing) for name, timing in self._timings.items()}
+
+    def clear(self) -> None:
+        """Forget everything parsed so far."""
+        with self._lock:
+            self._entries.clear()
+            self._timings.clear()
+
+
+# Global registry shared by every GameState in the process
+_static_data: Optional[StaticDataRegistry] = None
+
+
+def get_static_data() -> StaticDataRegistry:
+    """Get the global static data registry."""
+    global _static_data
+    if _static_data is None:
+        _static_data = StaticDataRegistry(watch=CONFIG.WATCH_STATIC_DATA)
+    return _static_data
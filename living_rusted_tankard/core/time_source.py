@@ -0,0 +1,105 @@
+"""
+The wall clock the simulation reads.
+
+World subsystems (the game clock's real-time coupling, consequence rules,
+memories, rumors, reputation, NPC goals and agents) used to call
+``time.time()`` and ``datetime.now()`` directly, which tied every run to
+real time. They now read this module instead, so a headless run can swap
+in a ``SimulatedTime`` that only moves when it is told to.
+
+Timestamps used purely to build unique ids, throttle disk writes or expire
+infrastructure caches stay on the real clock.
+"""
+
+import threading
+import time as _time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Iterator, Optional
+
+
+class WallTime:
+    """The real clock."""
+
+    def time(self) -> float:
+        return _time.time()
+
+    def monotonic(self) -> float:
+        return _time.monotonic()
+
+    def now(self) -> datetime:
+        return datetime.now()
+
+
+class SimulatedTime(WallTime):
+    """A clock that stands still until ``advance`` is called.
+
+    Args:
+        start: Epoch seconds to start at. Defaults to the current real time,
+            so timestamps taken before the switch stay in the past.
+    """
+
+    def __init__(self, start: Optional[float] = None):
+        self._time = _time.time() if start is None else start
+        self._monotonic = 0.0
+
+    def time(self) -> float:
+        return self._time
+
+    def monotonic(self) -> float:
+        return self._monotonic
+
+    def now(self) -> datetime:
+        return datetime.fromtimestamp(self._time)
+
+    def advance(self, seconds: float) -> None:
+        if seconds < 0:
+            raise ValueError("Simulated time cannot go backwards")
+        self._time += seconds
+        self._monotonic += seconds
+
+
+_source: WallTime = WallTime()
+_source_lock = threading.Lock()
+
+
+def get_time_source() -> WallTime:
+    """Get the clock subsystems currently read."""
+    return _source
+
+
+def set_time_source(source: WallTime) -> WallTime:
+    """Make every subsystem read ``source``; returns the previous one.
+
+    The source is process-wide, so a simulated clock must not be installed
+    in a server that is also running live sessions.
+    """
+    global _source
+    with _source_lock:
+        previous, _source = _source, source
+    return previous
+
+
+@contextmanager
+def use_time_source(source: WallTime) -> Iterator[WallTime]:
+    """Install ``source`` for the duration of a ``with`` block."""
+    previous = set_time_source(source)
+    try:
+        yield source
+    finally:
+        set_time_source(previous)
+
+
+def time() -> float:
+    """Seconds since the epoch, from the current source."""
+    return _source.time()
+
+
+def monotonic() -> float:
+    """Monotonic seconds, from the current source."""
+    return _source.monotonic()
+
+
+def now() -> datetime:
+    """Local naive datetime, from the current source."""
+    return _source.now()
@@ -11,6 +11,17 @@ class GamblingManager:
         self.games = GamblingGames()
         self.current_games: Dict[str, Dict[str, Any]] = {}
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the per-player game statistics."""
+        return {"current_games": self.current_games}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "GamblingManager":
+        """Create a GamblingManager from serialized data."""
+        manager = cls()
+        manager.current_games = dict(data.get("current_games", {}))
+        return manager
+
     def get_available_games(self) -> List[Dict[str, Any]]:
         """Get a list of available gambling games."""
         return self.games.get_available_games()
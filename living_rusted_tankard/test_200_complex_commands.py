@@ -13,6 +13,7 @@ from datetime import datetime
 
 logging.basicConfig(level=logging.ERROR, format="%(levelname)s: %(message)s")
 
+from complex_commands import COMPLEX_COMMANDS
 from core.game_state import GameState
 
 
@@ -61,742 +62,7 @@ class Comprehensive200CommandTest:
 
         Returns: List of (command, category, complexity, expected_behavior)
         """
-        commands = []
-
-        # BASIC VARIATIONS (20 commands)
-        basic_commands = [
-            ("look", "observation", "simple", "show room description"),
-            ("glance around", "observation", "simple", "show room description"),
-            ("take a look", "observation", "simple", "show room description"),
-            ("examine surroundings", "observation", "simple", "show room description"),
-            ("survey the area", "observation", "simple", "show room description"),
-            ("check status", "info", "simple", "show player status"),
-            ("how am I doing", "info", "simple", "show player status"),
-            ("what's my condition", "info", "simple", "show player status"),
-            ("am I okay", "info", "simple", "show player status"),
-            ("show me my stats", "info", "simple", "show player status"),
-            ("inventory", "info", "simple", "show inventory"),
-            ("what do I have", "info", "simple", "show inventory"),
-            ("check my stuf", "info", "simple", "show inventory"),
-            ("what am I carrying", "info", "simple", "show inventory"),
-            ("show my items", "info", "simple", "show inventory"),
-            ("help", "system", "simple", "show help"),
-            ("what can I do", "system", "simple", "show help or commands"),
-            ("how do I play", "system", "simple", "show help"),
-            ("show commands", "system", "simple", "show commands"),
-            ("what are my options", "system", "simple", "show help or commands"),
-        ]
-        commands.extend(basic_commands)
-
-        # COMPLEX NATURAL LANGUAGE (40 commands)
-        complex_natural = [
-            (
-                "I'd like to purchase some refreshments",
-                "commerce",
-                "complex",
-                "buy items",
-            ),
-            (
-                "Could you help me find something to eat",
-                "commerce",
-                "complex",
-                "buy food or show items",
-            ),
-            (
-                "I'm feeling quite parched and need a beverage",
-                "commerce",
-                "complex",
-                "buy drink",
-            ),
-            (
-                "What sort of victuals do you have available",
-                "commerce",
-                "complex",
-                "show available items",
-            ),
-            (
-                "I require sustenance after my long journey",
-                "commerce",
-                "complex",
-                "buy food",
-            ),
-            (
-                "Might I inquire about your finest ales",
-                "commerce",
-                "complex",
-                "show drinks or buy ale",
-            ),
-            (
-                "I seek conversation with the proprietor",
-                "social",
-                "complex",
-                "interact with bartender",
-            ),
-            (
-                "Would it be possible to speak with someone",
-                "social",
-                "complex",
-                "interact with NPC",
-            ),
-            ("I wish to engage in discourse", "social", "complex", "talk to someone"),
-            (
-                "Pray tell, who runs this establishment",
-                "social",
-                "complex",
-                "talk to bartender or look",
-            ),
-            (
-                "I'm curious about local happenings",
-                "info",
-                "complex",
-                "talk to NPCs or read board",
-            ),
-            ("What news from the surrounding lands", "info", "complex", "talk to NPCs"),
-            (
-                "Are there any matters requiring attention",
-                "work",
-                "complex",
-                "check jobs or bounties",
-            ),
-            ("I seek employment or tasks to complete", "work", "complex", "show jobs"),
-            (
-                "What opportunities for coin exist here",
-                "work",
-                "complex",
-                "show jobs or bounties",
-            ),
-            (
-                "I require shelter for the evening",
-                "lodging",
-                "complex",
-                "rent room or ask about rooms",
-            ),
-            ("Where might a weary traveler rest", "lodging", "complex", "rent room"),
-            (
-                "I need somewhere to store my belongings",
-                "storage",
-                "complex",
-                "ask about storage",
-            ),
-            (
-                "My pack grows heavy with treasures",
-                "storage",
-                "complex",
-                "store items or rent room",
-            ),
-            ("I must secure my valuables", "storage", "complex", "store items"),
-            (
-                "The hour grows late, what time is it",
-                "time",
-                "complex",
-                "check time or status",
-            ),
-            ("How long until dawn breaks", "time", "complex", "check time"),
-            ("Has much time passed since my arrival", "time", "complex", "check time"),
-            (
-                "What tales do the walls of this place hold",
-                "exploration",
-                "complex",
-                "look around",
-            ),
-            (
-                "Tell me of this tavern's history",
-                "exploration",
-                "complex",
-                "look or talk to NPCs",
-            ),
-            (
-                "What secrets might this place harbor",
-                "exploration",
-                "complex",
-                "explore or look",
-            ),
-            (
-                "I sense there's more here than meets the eye",
-                "exploration",
-                "complex",
-                "look or explore",
-            ),
-            (
-                "Something about this place intrigues me",
-                "exploration",
-                "complex",
-                "look around",
-            ),
-            (
-                "I feel the weight of destiny upon me",
-                "narrative",
-                "complex",
-                "look or check status",
-            ),
-            (
-                "Perhaps fate has brought me to this place",
-                "narrative",
-                "complex",
-                "philosophical response",
-            ),
-            (
-                "The threads of my story seem to converge here",
-                "narrative",
-                "complex",
-                "philosophical response",
-            ),
-            (
-                "What role am I meant to play in this tale",
-                "narrative",
-                "complex",
-                "check status or talk",
-            ),
-            (
-                "I sense great adventures await",
-                "narrative",
-                "complex",
-                "check bounties or jobs",
-            ),
-            (
-                "My heart yearns for purpose and meaning",
-                "work",
-                "complex",
-                "check jobs or bounties",
-            ),
-            (
-                "I must prove my worth through noble deeds",
-                "work",
-                "complex",
-                "accept bounty or work",
-            ),
-            ("Honor and glory call to me", "work", "complex", "check bounties"),
-            (
-                "I seek to forge my legend in this realm",
-                "work",
-                "complex",
-                "accept challenging work",
-            ),
-            (
-                "What challenges might test my mettle",
-                "work",
-                "complex",
-                "check bounties",
-            ),
-            (
-                "I hunger for trials that will shape me",
-                "work",
-                "complex",
-                "check difficult jobs",
-            ),
-            (
-                "Show me tasks worthy of a true hero",
-                "work",
-                "complex",
-                "check bounties",
-            ),
-        ]
-        commands.extend(complex_natural)
-
-        # AMBIGUOUS/UNCLEAR COMMANDS (30 commands)
-        ambiguous = [
-            (
-                "do something",
-                "ambiguous",
-                "edge",
-                "unclear intent - ask for clarification",
-            ),
-            ("make it happen", "ambiguous", "edge", "unclear intent"),
-            ("you know what I mean", "ambiguous", "edge", "unclear intent"),
-            ("the usual", "ambiguous", "edge", "unclear - no established pattern"),
-            ("same as before", "ambiguous", "edge", "unclear - no previous command"),
-            ("handle it", "ambiguous", "edge", "unclear intent"),
-            ("fix this", "ambiguous", "edge", "unclear what to fix"),
-            ("sort me out", "ambiguous", "edge", "unclear intent"),
-            ("hook me up", "ambiguous", "edge", "unclear with what"),
-            ("I need stuf", "ambiguous", "edge", "unclear what stuf"),
-            ("get me things", "ambiguous", "edge", "unclear what things"),
-            ("do the thing", "ambiguous", "edge", "unclear what thing"),
-            ("make magic happen", "ambiguous", "edge", "unclear intent"),
-            ("work your magic", "ambiguous", "edge", "unclear intent"),
-            ("surprise me", "ambiguous", "edge", "unclear what kind of surprise"),
-            ("whatever works", "ambiguous", "edge", "unclear intent"),
-            ("just... anything", "ambiguous", "edge", "unclear intent"),
-            ("I don't know, something", "ambiguous", "edge", "unclear intent"),
-            ("figure it out", "ambiguous", "edge", "unclear what to figure out"),
-            ("deal with this situation", "ambiguous", "edge", "unclear what situation"),
-            ("resolve my predicament", "ambiguous", "edge", "unclear predicament"),
-            ("address my concerns", "ambiguous", "edge", "unclear concerns"),
-            ("attend to my needs", "ambiguous", "edge", "unclear needs"),
-            ("see to my requirements", "ambiguous", "edge", "unclear requirements"),
-            ("handle my business", "ambiguous", "edge", "unclear business"),
-            ("take care of everything", "ambiguous", "edge", "unclear what everything"),
-            ("make everything better", "ambiguous", "edge", "unclear what's wrong"),
-            ("fix whatever's broken", "ambiguous", "edge", "unclear what's broken"),
-            ("improve my situation", "ambiguous", "edge", "unclear situation"),
-            ("optimize my experience", "ambiguous", "edge", "unclear experience"),
-        ]
-        commands.extend(ambiguous)
-
-        # MULTI-PART COMPLEX COMMANDS (25 commands)
-        multipart = [
-            (
-                "I want to buy some ale and then talk to the bartender about rumors",
-                "multipart",
-                "complex",
-                "buy ale then interact",
-            ),
-            (
-                "Show me the jobs available and also check what time it is",
-                "multipart",
-                "complex",
-                "show jobs and time",
-            ),
-            (
-                "Let me examine my inventory and then purchase some food",
-                "multipart",
-                "complex",
-                "inventory then buy food",
-            ),
-            (
-                "I'd like to rent a room but first tell me how much gold I have",
-                "multipart",
-                "complex",
-                "check gold then rent room",
-            ),
-            (
-                "Check the notice board and if there's anything interesting, accept it",
-                "multipart",
-                "complex",
-                "read board then maybe accept",
-            ),
-            (
-                "Look around the room and then examine anything that seems valuable",
-                "multipart",
-                "complex",
-                "look then examine objects",
-            ),
-            (
-                "Talk to whoever's here and ask them about work opportunities",
-                "multipart",
-                "complex",
-                "interact with NPCs about jobs",
-            ),
-            (
-                "I need to rest but first make sure I have enough money for a room",
-                "multipart",
-                "complex",
-                "check gold then rent room",
-            ),
-            (
-                "Buy the cheapest food available and then eat it immediately",
-                "multipart",
-                "complex",
-                "buy food then use it",
-            ),
-            (
-                "Find out what time it is and then decide if I should sleep",
-                "multipart",
-                "complex",
-                "check time then maybe sleep",
-            ),
-            (
-                "Check if anyone's here to talk to, and if not, wait a while",
-                "multipart",
-                "complex",
-                "check NPCs then wait",
-            ),
-            (
-                "Examine my current status and buy healing items if I need them",
-                "multipart",
-                "complex",
-                "check status then buy items",
-            ),
-            (
-                "Look for work that pays well and doesn't require special skills",
-                "multipart",
-                "complex",
-                "check jobs with criteria",
-            ),
-            (
-                "I want to socialize but first need to buy a drink to be polite",
-                "multipart",
-                "complex",
-                "buy drink then socialize",
-            ),
-            (
-                "Check what's available to buy and purchase anything useful",
-                "multipart",
-                "complex",
-                "check items then buy useful ones",
-            ),
-            (
-                "Talk to people about current events and local news",
-                "multipart",
-                "complex",
-                "interact about topics",
-            ),
-            (
-                "I need to manage my finances, show me my gold and expenses",
-                "multipart",
-                "complex",
-                "financial management",
-            ),
-            (
-                "Help me plan my next adventure based on available bounties",
-                "multipart",
-                "complex",
-                "check bounties and plan",
-            ),
-            (
-                "I want to become stronger, what training is available",
-                "multipart",
-                "complex",
-                "check improvement options",
-            ),
-            (
-                "Show me everything I can do to earn money here",
-                "multipart",
-                "complex",
-                "comprehensive money-making info",
-            ),
-            (
-                "I'm new here, give me a complete overview of this place",
-                "multipart",
-                "complex",
-                "comprehensive introduction",
-            ),
-            (
-                "Help me understand the rules and customs of this establishment",
-                "multipart",
-                "complex",
-                "explain game mechanics",
-            ),
-            (
-                "What's the most efficient way to spend my time here",
-                "multipart",
-                "complex",
-                "optimization advice",
-            ),
-            (
-                "I want to maximize my profits while minimizing risks",
-                "multipart",
-                "complex",
-                "strategic advice",
-            ),
-            (
-                "Guide me through the best sequence of actions for a newcomer",
-                "multipart",
-                "complex",
-                "step-by-step guidance",
-            ),
-        ]
-        commands.extend(multipart)
-
-        # EMOTIONAL/ROLEPLAY COMMANDS (25 commands)
-        emotional = [
-            (
-                "I'm feeling overwhelmed by all these choices",
-                "emotional",
-                "complex",
-                "provide guidance or help",
-            ),
-            (
-                "This place makes me nervous, I don't know what to do",
-                "emotional",
-                "complex",
-                "provide comfort or help",
-            ),
-            (
-                "I'm excited to be here, what should I try first",
-                "emotional",
-                "complex",
-                "suggest activities",
-            ),
-            (
-                "I feel lost and confused, can someone help me",
-                "emotional",
-                "complex",
-                "provide help or guidance",
-            ),
-            (
-                "I'm angry about something that happened earlier",
-                "emotional",
-                "complex",
-                "provide sympathy or diversion",
-            ),
-            (
-                "I'm sad and need cheering up",
-                "emotional",
-                "complex",
-                "provide cheer or diversion",
-            ),
-            (
-                "I'm bored out of my mind, entertain me",
-                "emotional",
-                "complex",
-                "suggest entertainment",
-            ),
-            (
-                "I feel lonely, is anyone here to talk to",
-                "emotional",
-                "complex",
-                "check for NPCs or provide interaction",
-            ),
-            (
-                "I'm homesick and miss my family",
-                "emotional",
-                "complex",
-                "provide sympathy",
-            ),
-            (
-                "I'm terrified of what might happen next",
-                "emotional",
-                "complex",
-                "provide reassurance",
-            ),
-            (
-                "I feel like I don't belong here",
-                "emotional",
-                "complex",
-                "provide welcome or inclusion",
-            ),
-            (
-                "I'm suspicious of everyone in this place",
-                "emotional",
-                "complex",
-                "provide reassurance or info",
-            ),
-            (
-                "I trust you completely, what do you recommend",
-                "emotional",
-                "complex",
-                "provide recommendations",
-            ),
-            (
-                "I'm proud of my accomplishments so far",
-                "emotional",
-                "complex",
-                "acknowledge achievements",
-            ),
-            (
-                "I feel guilty about something I did",
-                "emotional",
-                "complex",
-                "provide absolution or advice",
-            ),
-            (
-                "I'm curious about everyone's stories here",
-                "emotional",
-                "complex",
-                "facilitate social interaction",
-            ),
-            (
-                "I want to make friends with the locals",
-                "emotional",
-                "complex",
-                "facilitate social connections",
-            ),
-            (
-                "I'm homesick for adventure and excitement",
-                "emotional",
-                "complex",
-                "suggest exciting activities",
-            ),
-            (
-                "I feel protective of this place and its people",
-                "emotional",
-                "complex",
-                "acknowledge sentiment",
-            ),
-            (
-                "I'm grateful for the hospitality shown here",
-                "emotional",
-                "complex",
-                "acknowledge gratitude",
-            ),
-            (
-                "I feel inspired to do great things",
-                "emotional",
-                "complex",
-                "suggest heroic activities",
-            ),
-            (
-                "I'm determined to prove myself worthy",
-                "emotional",
-                "complex",
-                "suggest challenging tasks",
-            ),
-            (
-                "I feel a deep connection to this place",
-                "emotional",
-                "complex",
-                "acknowledge connection",
-            ),
-            (
-                "I'm nostalgic for simpler times",
-                "emotional",
-                "complex",
-                "provide comfort",
-            ),
-            (
-                "I feel like destiny brought me here",
-                "emotional",
-                "complex",
-                "acknowledge fate/destiny",
-            ),
-        ]
-        commands.extend(emotional)
-
-        # TECHNICAL/EDGE CASES (25 commands)
-        technical = [
-            ("", "technical", "edge", "handle empty input"),
-            ("   ", "technical", "edge", "handle whitespace only"),
-            ("!@#$%^&*()", "technical", "edge", "handle special characters"),
-            ("buy buy buy buy buy", "technical", "edge", "handle repetitive commands"),
-            (
-                "look look look look look look look",
-                "technical",
-                "edge",
-                "handle command repetition",
-            ),
-            ("a", "technical", "edge", "handle single character"),
-            ("aa", "technical", "edge", "handle two characters"),
-            (
-                "aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa",
-                "technical",
-                "edge",
-                "handle very short repetitive",
-            ),
-            (
-                "This is a very long command that goes on and on and on and contains many words that might confuse the parser because it's so verbose and complex",
-                "technical",
-                "edge",
-                "handle very long input",
-            ),
-            (
-                "BUY ALE NOW IMMEDIATELY RIGHT NOW",
-                "technical",
-                "edge",
-                "handle all caps",
-            ),
-            (
-                "buy ale buy ale buy ale",
-                "technical",
-                "edge",
-                "handle command repetition",
-            ),
-            (
-                "look; buy ale; talk to bartender",
-                "technical",
-                "edge",
-                "handle semicolon separation",
-            ),
-            (
-                "look && buy ale && inventory",
-                "technical",
-                "edge",
-                "handle && operators",
-            ),
-            ("look | buy ale | status", "technical", "edge", "handle pipe operators"),
-            ("look > inventory", "technical", "edge", "handle redirection operators"),
-            ("buy ale --help", "technical", "edge", "handle command line flags"),
-            ("buy ale -v", "technical", "edge", "handle command line options"),
-            (
-                "SELECT * FROM inventory",
-                "technical",
-                "edge",
-                "handle SQL injection attempt",
-            ),
-            ("DROP TABLE players", "technical", "edge", "handle SQL injection attempt"),
-            (
-                "<script>alert('xss')</script>",
-                "technical",
-                "edge",
-                "handle XSS attempt",
-            ),
-            (
-                "../../../etc/passwd",
-                "technical",
-                "edge",
-                "handle path traversal attempt",
-            ),
-            ("rm -rf /", "technical", "edge", "handle dangerous system command"),
-            ("sudo buy ale", "technical", "edge", "handle sudo command"),
-            ("buy ale 2>&1", "technical", "edge", "handle shell redirection"),
-            ("$(buy ale)", "technical", "edge", "handle shell command substitution"),
-        ]
-        commands.extend(technical)
-
-        # MISSPELLINGS/TYPOS (20 commands)
-        typos = [
-            ("lok around", "typos", "edge", "handle misspelling of look"),
-            ("inventori", "typos", "edge", "handle misspelling of inventory"),
-            ("hlep me", "typos", "edge", "handle misspelling of help"),
-            ("buy alr", "typos", "edge", "handle misspelling of ale"),
-            ("satus check", "typos", "edge", "handle misspelling of status"),
-            ("bauy some food", "typos", "edge", "handle misspelling of buy"),
-            ("tlak to bartender", "typos", "edge", "handle misspelling of talk"),
-            ("chekc my gold", "typos", "edge", "handle misspelling of check"),
-            ("whta time is it", "typos", "edge", "handle misspelling of what"),
-            ("raed notice board", "typos", "edge", "handle misspelling of read"),
-            (
-                "intercat with bartender",
-                "typos",
-                "edge",
-                "handle misspelling of interact",
-            ),
-            ("moe to cellar", "typos", "edge", "handle misspelling of move"),
-            ("waht jobs are available", "typos", "edge", "handle misspelling of what"),
-            ("purcase bread", "typos", "edge", "handle misspelling of purchase"),
-            ("examnie the room", "typos", "edge", "handle misspelling of examine"),
-            ("hwere am I", "typos", "edge", "handle misspelling of where"),
-            ("giev me help", "typos", "edge", "handle misspelling of give"),
-            ("shwo inventory", "typos", "edge", "handle misspelling of show"),
-            ("tiem check please", "typos", "edge", "handle misspelling of time"),
-            ("fidn work for me", "typos", "edge", "handle misspelling of find"),
-        ]
-        commands.extend(typos)
-
-        # CONTEXTUAL REFERENCES (15 commands)
-        contextual = [
-            ("do that again", "contextual", "complex", "repeat last action"),
-            (
-                "same thing as last time",
-                "contextual",
-                "complex",
-                "repeat previous command",
-            ),
-            (
-                "go back to what I was doing",
-                "contextual",
-                "complex",
-                "return to previous activity",
-            ),
-            (
-                "continue what I started",
-                "contextual",
-                "complex",
-                "continue previous action",
-            ),
-            ("finish what I began", "contextual", "complex", "complete previous task"),
-            ("undo that", "contextual", "complex", "reverse last action"),
-            ("cancel what I just did", "contextual", "complex", "cancel last command"),
-            ("never mind", "contextual", "complex", "cancel current action"),
-            ("forget I said that", "contextual", "complex", "ignore previous command"),
-            ("that wasn't what I meant", "contextual", "complex", "clarify intent"),
-            ("I changed my mind", "contextual", "complex", "change decision"),
-            ("actually, do something else", "contextual", "complex", "change action"),
-            ("on second thought", "contextual", "complex", "reconsider action"),
-            (
-                "wait, I meant something different",
-                "contextual",
-                "complex",
-                "clarify intent",
-            ),
-            (
-                "let me rephrase that",
-                "contextual",
-                "complex",
-                "clarify previous command",
-            ),
-        ]
-        commands.extend(contextual)
+        commands = list(COMPLEX_COMMANDS)
 
         assert len(commands) == 200, f"Expected 200 commands, got {len(commands)}"
         return commands
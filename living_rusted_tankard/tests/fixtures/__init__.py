@@ -10,3 +10,4 @@ from .economy_fixtures import *
 from .player_fixtures import *
 from .database_fixtures import *
 from .performance_fixtures import *
+from .fake_fixtures import *
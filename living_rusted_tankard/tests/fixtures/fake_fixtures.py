@@ -0,0 +1,118 @@
+"""Lightweight stand-ins shared by the unit tests."""
+
+import time
+from types import SimpleNamespace
+
+from core.enhanced_llm_game_master import EnhancedLLMGameMaster
+from core.npc_systems.relationships import RelationshipWeb
+
+
+class FakeGameState:
+    """Just the surface of GameState the session and persistence layers use.
+
+    ``serial`` tells apart states built by a pool factory; setting ``broken``
+    puts a value the JSON column cannot store into the persistence record.
+    """
+
+    def __init__(self, session_id=None, gold=0, player_name="Tester", serial=0):
+        self.session_id = session_id
+        self.gold = gold
+        self.player_name = player_name
+        self.serial = serial
+        self.turn = 0
+        self.db_id = None
+        self.broken = False
+        self.clock = SimpleNamespace(last_tick=0.0)
+        self._needs_save = True
+
+    @classmethod
+    def from_persistence_data(cls, data):
+        game_state = cls(data["session_id"], data["game_data"]["gold"])
+        game_state.turn = data["game_data"]["turn"]
+        return game_state
+
+    def play(self):
+        self.turn += 1
+        self._needs_save = True
+
+    def needs_save(self):
+        return self._needs_save
+
+    def mark_dirty(self):
+        self._needs_save = True
+
+    def mark_clean(self):
+        self._needs_save = False
+
+    def set_db_id(self, db_id):
+        self.db_id = db_id
+
+    def set_session_id(self, session_id):
+        self.session_id = session_id
+
+    def to_persistence_model(self):
+        return {
+            "id": self.db_id,
+            "session_id": self.session_id,
+            "player_name": self.player_name,
+            "game_data": {
+                "turn": object() if self.broken else self.turn,
+                "gold": self.gold,
+            },
+        }
+
+
+def make_state(hours=19.0, room="tavern_main", npcs=("barkeep",), gold=20, events=0):
+    """The parts of a GameState that LLM cache keys are built from."""
+    return SimpleNamespace(
+        clock=SimpleNamespace(current_time_hours=hours),
+        room_manager=SimpleNamespace(current_room_id=room),
+        npc_manager=SimpleNamespace(
+            get_present_npcs=lambda: [SimpleNamespace(id=npc_id) for npc_id in npcs]
+        ),
+        player=SimpleNamespace(gold=gold, tiredness=0, has_room=False),
+        events=[object()] * events,
+    )
+
+
+class FakeTransport:
+    """Stands in for the shared Ollama transport.
+
+    ``post_json`` answers with ``reply``; ``astream_json`` replays ``chunks``
+    as /api/chat stream messages. Both record the payloads they were sent,
+    and ``post_json`` sleeps ``delay`` seconds to model a round trip.
+    """
+
+    def __init__(self, reply=None, chunks=(), delay=0.0):
+        self.reply = reply
+        self.chunks = list(chunks)
+        self.delay = delay
+        self.payloads = []
+        self.calls = 0
+
+    def post_json(self, path, payload, **kwargs):
+        time.sleep(self.delay)
+        self.calls += 1
+        self.payloads.append(payload)
+        return self.reply
+
+    async def astream_json(self, path, payload, *, model=None, timeout=None):
+        self.payloads.append(payload)
+        for chunk in self.chunks:
+            yield {"message": {"content": chunk}, "done": False}
+
+
+def make_game_master(transport, **kwargs):
+    """An EnhancedLLMGameMaster that talks to ``transport``."""
+    gm = EnhancedLLMGameMaster(**kwargs)
+    gm.transport = transport
+    gm.is_service_available = lambda: True
+    return gm
+
+
+def make_web(*links):
+    """A RelationshipWeb from ``(npc1, npc2, rel_type[, trust])`` links."""
+    web = RelationshipWeb()
+    for link in links:
+        web.create_relationship(*link)
+    return web
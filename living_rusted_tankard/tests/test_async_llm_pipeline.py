@@ -0,0 +1,442 @@
+"""Tests for the async LLM pipeline request scheduler and coalescing."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from core.async_llm_pipeline import (
+    AsyncLLMPipeline,
+    LLMRequest,
+    RequestPriority,
+    RequestScheduler,
+    SchedulerConfig,
+)
+from tests.fixtures.fake_fixtures import make_state
+
+
+def make_request(request_id, session_id="s1", priority=RequestPriority.NORMAL):
+    return LLMRequest(
+        id=request_id,
+        session_id=session_id,
+        user_input=request_id,
+        game_state=None,
+        priority=priority,
+        created_at=time.time(),
+    )
+
+
+def fallback(request, reason):
+    return {"id": request.id, "fallback": reason}
+
+
+class TestRequestScheduler:
+    """Test scheduling, fairness, shedding and preemption."""
+
+    @pytest.mark.asyncio
+    async def test_runs_requests_concurrently(self):
+        active = []
+        peak = []
+
+        async def handler(request):
+            active.append(request.id)
+            peak.append(len(active))
+            await asyncio.sleep(0.05)
+            active.remove(request.id)
+            return {"id": request.id}
+
+        scheduler = RequestScheduler(handler, fallback, SchedulerConfig(num_workers=4))
+        await scheduler.start()
+        futures = [
+            await scheduler.submit(make_request(f"r{i}", session_id=f"s{i}"))
+            for i in range(4)
+        ]
+        results = await asyncio.gather(*futures)
+        await scheduler.stop()
+
+        assert [r["id"] for r in results] == ["r0", "r1", "r2", "r3"]
+        assert max(peak) == 4
+
+    @pytest.mark.asyncio
+    async def test_priority_and_session_fairness(self):
+        order = []
+        gate = asyncio.Event()
+
+        async def handler(request):
+            if request.id == "blocker":
+                await gate.wait()
+            order.append(request.id)
+            return request.id
+
+        config = SchedulerConfig(num_workers=1, max_in_flight_per_session=1)
+        scheduler = RequestScheduler(handler, fallback, config)
+        await scheduler.start()
+
+        futures = [await scheduler.submit(make_request("blocker", "other"))]
+        await asyncio.sleep(0)
+        for i in range(3):
+            futures.append(await scheduler.submit(make_request(f"chatty{i}", "chatty")))
+        futures.append(await scheduler.submit(make_request("quiet", "quiet")))
+        futures.append(
+            await scheduler.submit(make_request("urgent", "x", RequestPriority.URGENT))
+        )
+        gate.set()
+        await asyncio.gather(*futures)
+        await scheduler.stop()
+
+        assert order[0] == "blocker"
+        assert order[1] == "urgent"
+        # The quiet session is served before the chatty one drains its queue
+        assert order.index("quiet") < order.index("chatty1")
+
+    @pytest.mark.asyncio
+    async def test_expired_requests_are_shed(self):
+        gate = asyncio.Event()
+
+        async def handler(request):
+            await gate.wait()
+            return request.id
+
+        scheduler = RequestScheduler(handler, fallback, SchedulerConfig(num_workers=1))
+        await scheduler.start()
+        first = await scheduler.submit(make_request("first", "a"))
+        late = make_request("late", "b")
+        late.deadline = time.time() + 0.01
+        late_future = await scheduler.submit(late)
+        await asyncio.sleep(0.05)
+        gate.set()
+
+        assert await first == "first"
+        assert await late_future == {"id": "late", "fallback": "deadline exceeded"}
+        assert scheduler.get_stats()["shed"] == 1
+        await scheduler.stop()
+
+    @pytest.mark.asyncio
+    async def test_admission_control_rejects_when_full(self):
+        gate = asyncio.Event()
+
+        async def handler(request):
+            await gate.wait()
+            return request.id
+
+        config = SchedulerConfig(num_workers=1, max_queue_size=1)
+        scheduler = RequestScheduler(handler, fallback, config)
+        await scheduler.start()
+        running = await scheduler.submit(make_request("running", "a"))
+        await asyncio.sleep(0)
+        queued = await scheduler.submit(make_request("queued", "b"))
+        rejected = await scheduler.submit(make_request("rejected", "c"))
+
+        assert rejected.done()
+        assert rejected.result()["fallback"] == "queue full"
+        gate.set()
+        assert await running == "running"
+        assert await queued == "queued"
+        assert scheduler.get_stats()["rejected"] == 1
+        await scheduler.stop()
+
+    @pytest.mark.asyncio
+    async def test_full_queue_evicts_low_and_sheds_expired_on_admission(self):
+        gate = asyncio.Event()
+
+        async def handler(request):
+            await gate.wait()
+            return request.id
+
+        config = SchedulerConfig(num_workers=1, max_queue_size=1)
+        scheduler = RequestScheduler(handler, fallback, config)
+        await scheduler.start()
+        running = await scheduler.submit(make_request("running", "a"))
+        await asyncio.sleep(0)
+        low = await scheduler.submit(make_request("low", "b", RequestPriority.LOW))
+        expiring = make_request("expiring", "c")
+        expiring.deadline = time.time() + 0.01
+        expiring_future = await scheduler.submit(expiring)
+        await asyncio.sleep(0.02)
+        admitted = await scheduler.submit(make_request("admitted", "d"))
+
+        assert low.result()["fallback"] == "preempted by higher priority"
+        assert expiring_future.result()["fallback"] == "deadline exceeded"
+        assert not admitted.done()
+        stats = scheduler.get_stats()
+        assert (stats["evicted"], stats["shed"]) == (1, 1)
+        assert "preempted" not in stats and "rejected" not in stats
+        gate.set()
+        assert await running == "running"
+        assert await admitted == "admitted"
+        await scheduler.stop()
+
+    @pytest.mark.asyncio
+    async def test_high_priority_preempts_running_low(self):
+        low_attempts = []
+
+        async def handler(request):
+            if request.priority == RequestPriority.LOW:
+                low_attempts.append(request.id)
+                await asyncio.sleep(0.2 if len(low_attempts) == 1 else 0)
+            return request.id
+
+        config = SchedulerConfig(num_workers=1, low_priority_max_workers=1)
+        scheduler = RequestScheduler(handler, fallback, config)
+        await scheduler.start()
+        low = await scheduler.submit(make_request("pregen", "a", RequestPriority.LOW))
+        await asyncio.sleep(0.01)
+        high = await scheduler.submit(make_request("chat", "b", RequestPriority.HIGH))
+
+        assert await asyncio.wait_for(high, 0.1) == "chat"
+        assert await low == "pregen"
+        assert low_attempts == ["pregen", "pregen"]
+        assert scheduler.get_stats()["preempted"] == 1
+        await scheduler.stop()
+
+    @pytest.mark.asyncio
+    async def test_cancel_withdraws_queued_and_running_requests(self):
+        started = []
+
+        async def handler(request):
+            started.append(request.id)
+            await asyncio.sleep(1)
+            return request.id
+
+        scheduler = RequestScheduler(handler, fallback, SchedulerConfig(num_workers=1))
+        await scheduler.start()
+        running = await scheduler.submit(make_request("running", "a"))
+        await asyncio.sleep(0.01)
+        queued = await scheduler.submit(make_request("queued", "b"))
+
+        assert scheduler.cancel("queued")
+        assert scheduler.cancel("running")
+        assert (await asyncio.wait_for(running, 0.1))["fallback"] == "cancelled"
+        assert (await queued)["fallback"] == "cancelled"
+        assert started == ["running"]
+        assert scheduler.qsize() == 0
+        assert not scheduler.cancel("running")
+        await scheduler.stop()
+
+
+class CountingLLM:
+    """Stand-in for the game master that counts generations."""
+
+    def __init__(self, delay=0.1):
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def process_input(self, user_input, game_state, session_id):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        return f"narration for {user_input}", None, []
+
+
+class TestSingleFlight:
+    """Test coalescing of identical in-flight requests."""
+
+    @pytest.mark.asyncio
+    async def test_identical_requests_share_one_generation(self):
+        pipeline = AsyncLLMPipeline()
+        pipeline.enhanced_llm = CountingLLM()
+        state = make_state()
+
+        ids = [
+            await pipeline.process_request_async(text, state, "s1")
+            for text in ["talk to the barkeep", "speak with barkeep", "talk to barkeep"]
+        ]
+        responses = [await pipeline.get_response(request_id) for request_id in ids]
+
+        assert pipeline.enhanced_llm.calls == 1
+        assert [r.request_id for r in responses] == ids
+        assert len({r.content for r in responses}) == 1
+        stats = pipeline.get_stats()
+        assert stats["coalesced_responses"] == 2
+        assert stats["in_flight_keys"] == 0
+        await pipeline.stop()
+
+    @pytest.mark.asyncio
+    async def test_other_sessions_are_not_coalesced(self):
+        """Test that a command parsed for one session never reaches another."""
+        pipeline = AsyncLLMPipeline()
+        pipeline.enhanced_llm = CountingLLM()
+        state = make_state()
+
+        first = await pipeline.process_request_async("look", state, "a")
+        second = await pipeline.process_request_async("look", state, "b")
+        await pipeline.get_response(first)
+        await pipeline.get_response(second)
+
+        assert pipeline.enhanced_llm.calls == 2
+        assert pipeline.get_stats()["coalesced_responses"] == 0
+        await pipeline.stop()
+
+    @pytest.mark.asyncio
+    async def test_different_state_is_not_coalesced(self):
+        pipeline = AsyncLLMPipeline()
+        pipeline.enhanced_llm = CountingLLM()
+
+        first = await pipeline.process_request_async("look", make_state(), "a")
+        second = await pipeline.process_request_async(
+            "look", make_state(room="cellar"), "a"
+        )
+        await pipeline.get_response(first)
+        await pipeline.get_response(second)
+
+        assert pipeline.enhanced_llm.calls == 2
+        assert pipeline.get_stats()["coalesced_responses"] == 0
+        await pipeline.stop()
+
+    @pytest.mark.asyncio
+    async def test_urgent_request_does_not_wait_on_low_leader(self):
+        pipeline = AsyncLLMPipeline()
+        pipeline.enhanced_llm = CountingLLM()
+        state = make_state()
+
+        low = await pipeline.process_request_async(
+            "look", state, "a", priority=RequestPriority.LOW
+        )
+        high = await pipeline.process_request_async(
+            "look", state, "a", priority=RequestPriority.HIGH
+        )
+        # A NORMAL request can ride on the HIGH one
+        normal = await pipeline.process_request_async("look", state, "a")
+        for request_id in (low, high, normal):
+            await pipeline.get_response(request_id)
+
+        assert pipeline.enhanced_llm.calls == 2
+        assert pipeline.get_stats()["coalesced_responses"] == 1
+        await pipeline.stop()
+
+
+class TestGetResponse:
+    """Test collecting responses from the pipeline."""
+
+    @pytest.mark.asyncio
+    async def test_timed_out_request_is_withdrawn(self):
+        """Test that a timed-out request no longer runs against the caller's state."""
+        pipeline = AsyncLLMPipeline(scheduler_config=SchedulerConfig(num_workers=1))
+        pipeline.enhanced_llm = CountingLLM(delay=0.1)
+        state = make_state()
+
+        busy = await pipeline.process_request_async("look", state, "a")
+        late = await pipeline.process_request_async("talk to barkeep", state, "b")
+        response = await pipeline.get_response(late, timeout=0.01)
+        await pipeline.get_response(busy)
+
+        assert response.content
+        assert pipeline.enhanced_llm.calls == 1
+        assert pipeline.scheduler.get_stats()["cancelled"] == 1
+        await pipeline.stop()
+
+    @pytest.mark.asyncio
+    async def test_uncollected_responses_are_dropped(self):
+        """Test that callback-only requests do not leave their response behind."""
+        pipeline = AsyncLLMPipeline(result_ttl=0)
+        pipeline.enhanced_llm = CountingLLM(delay=0)
+        replies = []
+
+        await pipeline.process_request_async(
+            "look", make_state(), "a", callback=lambda *reply: replies.append(reply)
+        )
+        for _ in range(50):
+            if replies and not pipeline.get_stats()["uncollected_results"]:
+                break
+            await asyncio.sleep(0.01)
+
+        assert replies
+        assert pipeline.get_stats()["uncollected_results"] == 0
+        await pipeline.stop()
+
+
+class StreamingLLM(CountingLLM):
+    """Stand-in that streams narration with a command tag midway."""
+
+    async def process_input_stream(self, user_input, game_state, session_id):
+        self.calls += 1
+        yield {"type": "token", "text": "The barkeep "}
+        await asyncio.sleep(self.delay)
+        yield {"type": "command", "command": "interact barkeep talk"}
+        yield {"type": "token", "text": "leans in."}
+        yield {
+            "type": "done",
+            "content": "The barkeep leans in.",
+            "command": "interact barkeep talk",
+            "actions": [],
+            "was_fallback": False,
+        }
+
+
+class TestStreamRequest:
+    """Test streaming requests through the scheduler."""
+
+    @pytest.mark.asyncio
+    async def test_tokens_and_command_then_done(self):
+        pipeline = AsyncLLMPipeline()
+        pipeline.enhanced_llm = StreamingLLM(delay=0.01)
+        state = make_state()
+
+        events = [
+            event
+            async for event in pipeline.stream_request("talk to barkeep", state, "s1")
+        ]
+
+        assert [event["type"] for event in events] == [
+            "token",
+            "command",
+            "token",
+            "done",
+        ]
+        response = events[-1]["response"]
+        assert response.content == "The barkeep leans in."
+        assert response.command == "interact barkeep talk"
+
+        # A turn with a command is not cached, so a repeat runs it again
+        await asyncio.sleep(0)  # the finished leader leaves the single-flight table
+        repeat = [
+            event
+            async for event in pipeline.stream_request(
+                "speak with barkeep", state, "s2"
+            )
+        ]
+        assert repeat[-1]["response"].command == "interact barkeep talk"
+        assert not repeat[-1]["response"].was_cached
+        assert pipeline.enhanced_llm.calls == 2
+        await pipeline.stop()
+
+    @pytest.mark.asyncio
+    async def test_narration_only_repeat_is_one_cached_token(self):
+        pipeline = AsyncLLMPipeline()
+        pipeline.enhanced_llm = CountingLLM(delay=0.01)
+        state = make_state()
+
+        first = await pipeline.process_request_async("look around", state, "s1")
+        await pipeline.get_response(first)
+        cached = [
+            event async for event in pipeline.stream_request("look", state, "s2")
+        ]
+
+        assert cached[0] == {"type": "token", "text": "narration for look around"}
+        assert cached[-1]["response"].was_cached
+        assert pipeline.enhanced_llm.calls == 1
+        await pipeline.stop()
+
+    @pytest.mark.asyncio
+    async def test_follower_gets_whole_response(self):
+        pipeline = AsyncLLMPipeline()
+        pipeline.enhanced_llm = StreamingLLM()
+        state = make_state()
+
+        async def collect():
+            return [
+                event
+                async for event in pipeline.stream_request(
+                    "talk to barkeep", state, "a"
+                )
+            ]
+
+        leader, follower = await asyncio.gather(collect(), collect())
+
+        assert pipeline.enhanced_llm.calls == 1
+        assert [event["type"] for event in follower] == ["command", "token", "done"]
+        assert follower[-1]["response"].request_id != leader[-1]["response"].request_id
+        assert leader[-1]["response"].content == follower[1]["text"]
+        await pipeline.stop()
@@ -0,0 +1,94 @@
+"""Tests for canonical LLM cache keys."""
+
+import pytest
+
+from core.async_llm_optimization import AsyncContextCache
+from core.async_llm_pipeline import ResponseCache
+from core.command_normalizer import canonicalize, fix_command
+from tests.fixtures.fake_fixtures import make_state
+
+
+class TestCanonicalize:
+    """Test reduction of input to (intent, target)."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "talk to the barkeep",
+            "talk to barkeep",
+            "Speak with the barkeep!",
+            "interact barkeep talk",
+        ],
+    )
+    def test_talk_paraphrases_share_a_form(self, text):
+        assert canonicalize(text) == ("talk", "barkeep")
+
+    def test_movement_and_room_fixes(self):
+        assert canonicalize("go to the celler") == ("go", "cellar")
+        assert canonicalize("walk to cellar") == ("go", "cellar")
+        assert canonicalize("mve upstair") == ("go", "upstairs")
+
+    def test_quick_fixes_and_items(self):
+        assert canonicalize("inv") == ("inventory", None)
+        assert canonicalize("check my stats") == ("status", None)
+        assert canonicalize("buy a beer") == ("buy", "ale")
+
+    def test_distinct_topics_stay_distinct(self):
+        assert canonicalize("ask barkeep about rumors") != canonicalize(
+            "ask barkeep about weather"
+        )
+
+    def test_fix_command_matches_game_rewrites(self):
+        assert fix_command("go to cellar") == "move cellar"
+        assert fix_command("talk to gene") == "interact gene talk"
+        assert fix_command("buy food") == "buy bread"
+
+
+class TestResponseCache:
+    """Test feature-based keys and per-feature-set metrics."""
+
+    def test_paraphrase_hits(self):
+        cache = ResponseCache()
+        state = make_state()
+        cache.set("talk to the barkeep", state, "The barkeep grunts.")
+
+        assert cache.get("speak with barkeep", state) == "The barkeep grunts."
+
+    def test_state_features_separate_entries(self):
+        cache = ResponseCache()
+        cache.set("look", make_state(room="tavern_main"), "Warm hearth.")
+
+        assert cache.get("look", make_state(room="cellar")) is None
+        assert cache.get("look", make_state(npcs=())) is None
+        # Same time period, same room, same company
+        assert cache.get("look", make_state(hours=19.5, gold=5)) == "Warm hearth."
+
+    def test_hit_rate_per_feature_set(self):
+        cache = ResponseCache(features=("location",))
+        state = make_state()
+        cache.set("look", state, "Warm hearth.")
+        cache.get("look", state)
+        cache.get("look around", make_state(room="cellar"))
+
+        cache.set_features(("location", "present_npcs"))
+        cache.get("look", state)
+
+        by_set = cache.get_stats()["by_feature_set"]
+        assert by_set["location"] == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+        assert by_set["location+present_npcs"]["misses"] == 1
+        assert cache.get_stats()["features"] == "location+present_npcs"
+
+    def test_unknown_feature_rejected(self):
+        with pytest.raises(ValueError):
+            ResponseCache(features=("moon_phase",))
+
+
+class TestAsyncContextCache:
+    """Test that the context key ignores the event log."""
+
+    def test_new_events_do_not_invalidate(self):
+        cache = AsyncContextCache()
+        cache.set("s1", make_state(events=3), "context")
+
+        assert cache.get("s1", make_state(events=9)) == "context"
+        assert cache.get("s1", make_state(gold=1)) is None
@@ -5,9 +5,24 @@ from datetime import datetime
 
 from tests.utils.assertion_helpers import assert_timestamp_recent
 
+from core.callable_registry import CALLBACK_REGISTRY
 from core.clock import GameClock, GameTime, ScheduledEvent
 
 
+@pytest.fixture
+def recorded_callback():
+    """Register a scheduled-event callback that records (clock time, kwargs)."""
+    calls = []
+    clock_ref = {}
+
+    def record(**kwargs):
+        calls.append((clock_ref["clock"].time.hours, kwargs))
+
+    CALLBACK_REGISTRY["test_clock_record"] = record
+    yield calls, clock_ref
+    CALLBACK_REGISTRY.pop("test_clock_record", None)
+
+
 class TestGameTime:
     """Test GameTime data structure."""
 
@@ -494,3 +509,123 @@ class TestClockEdgeCases:
         # Should equal 100 minutes (1 hour 40 minutes)
         assert clock.current_time.hour == 13  # Started at 12
         assert clock.current_time.minute == 40
+
+
+class TestScheduledEventHeap:
+    """Test heap ordering and catch-up over long time skips."""
+
+    def make_clock(self, clock_ref):
+        clock = GameClock()
+        clock_ref["clock"] = clock
+        return clock
+
+    def test_events_fire_in_order_at_their_time(self, recorded_callback):
+        calls, clock_ref = recorded_callback
+        clock = self.make_clock(clock_ref)
+        for delay in (5, 1, 3):
+            clock.schedule_event(delay, "test_clock_record", n=delay)
+        clock.schedule_event(30, "test_clock_record", n=30)
+
+        clock.advance_time(24)
+
+        assert [kwargs["n"] for _, kwargs in calls] == [1, 3, 5]
+        assert [hours for hours, _ in calls] == [1, 3, 5]
+        assert len(clock.events_by_id) == 1
+
+    def test_cancelled_event_does_not_fire(self, recorded_callback):
+        calls, clock_ref = recorded_callback
+        clock = self.make_clock(clock_ref)
+        event_id = clock.schedule_event(1, "test_clock_record")
+
+        assert clock.cancel_event(event_id) is True
+        assert clock.cancel_event(event_id) is False
+        clock.advance_time(2)
+        assert calls == []
+
+    def test_repeating_event_catches_up(self, recorded_callback):
+        calls, clock_ref = recorded_callback
+        clock = self.make_clock(clock_ref)
+        clock.schedule_event(1, "test_clock_record", repeats=True)
+
+        clock.advance_time(24)
+
+        assert [hours for hours, _ in calls] == [float(h) for h in range(1, 25)]
+
+    def test_batched_repeating_event_gets_count(self, recorded_callback):
+        calls, clock_ref = recorded_callback
+        clock = self.make_clock(clock_ref)
+        clock.schedule_event(1, "test_clock_record", repeats=True, batched=True)
+
+        clock.advance_time(10.5)
+        clock.advance_time(0.5)
+
+        assert [kwargs["count"] for _, kwargs in calls] == [10, 1]
+
+    def test_hour_callbacks_see_every_skipped_hour(self):
+        clock = GameClock()
+        seen = []
+        clock.on_hour_change(lambda hour: seen.append((hour, clock.time.hours)))
+
+        clock.advance_time(8)
+
+        assert seen == [(h, float(h)) for h in range(1, 9)]
+
+    def test_npcs_update_once_per_hour_boundary(self, game_state):
+        updates = []
+        game_state.npc_manager.update_all_npcs = updates.append
+        old_time = game_state.clock.current_time_hours
+        delta = 2 - old_time % 1
+
+        game_state.clock.advance_time(delta)
+        new_time = game_state.clock.current_time_hours
+        game_state.clock.on_time_advanced(old_time, new_time, delta)
+
+        assert len(updates) == 2
+        assert updates[-1] == pytest.approx(new_time)
+
+    def test_batched_callbacks_called_once_with_count(self):
+        clock = GameClock()
+        hours, days = [], []
+        clock.on_hour_change(lambda h, count: hours.append((h, count)), batched=True)
+        clock.on_day_change(lambda d, count: days.append((d, count)), batched=True)
+
+        clock.advance_time(50)
+
+        assert hours == [(2, 50)]
+        assert days == [(3, 2)]
+
+    def test_replaced_event_list_is_reindexed(self, recorded_callback):
+        calls, clock_ref = recorded_callback
+        clock = self.make_clock(clock_ref)
+        clock.schedule_event(1, "test_clock_record", n="old")
+        other = GameClock()
+        other.schedule_event(2, "test_clock_record", n="new")
+
+        clock.scheduled_events_data = other.scheduled_events_data
+        clock.advance_time(3)
+
+        assert [kwargs["n"] for _, kwargs in calls] == ["new"]
+
+    def test_benchmark_10k_events_24_hour_skip(self, recorded_callback):
+        """10k scheduled events and hourly subscribers across one 24-hour skip."""
+        import random
+        import time
+
+        calls, clock_ref = recorded_callback
+        clock = self.make_clock(clock_ref)
+        rng = random.Random(7)
+        delays = [rng.uniform(0.01, 48) for _ in range(10000)]
+        for delay in delays:
+            clock.schedule_event(delay, "test_clock_record")
+        hours = []
+        clock.on_hour_change(hours.append)
+
+        start = time.perf_counter()
+        clock.advance_time(24)
+        elapsed = time.perf_counter() - start
+
+        fired_at = [hours_at for hours_at, _ in calls]
+        assert len(fired_at) == sum(1 for delay in delays if delay <= 24)
+        assert fired_at == sorted(fired_at)
+        assert len(hours) == 24
+        assert elapsed < 1.0
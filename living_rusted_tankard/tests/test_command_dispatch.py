@@ -0,0 +1,145 @@
+"""Tests for registry-based command dispatch and BK-tree suggestions."""
+
+import random
+import time
+
+import pytest
+
+from complex_commands import COMPLEX_COMMANDS
+from core.command_dispatch import CommandRegistry
+from core.fuzzy_index import BKTree, edit_distance
+
+
+def reference_distance(a, b):
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(
+                min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (char_a != char_b),
+                )
+            )
+        previous = current
+    return previous[-1]
+
+
+def echo(game_state, args):
+    return {"success": True, "message": " ".join(args)}
+
+
+class TestCommandRegistry:
+    """Test phrase lookup, argument schemas and aliases."""
+
+    def test_longest_phrase_that_fits_wins(self):
+        registry = CommandRegistry()
+        registry.register("bounty", lambda gs, args: {"message": "short"})
+        registry.register("bounty view", echo, min_args=1)
+
+        assert registry.dispatch(None, "bounty view rats")["message"] == "rats"
+        assert registry.dispatch(None, "bounty")["message"] == "short"
+        assert registry.dispatch(None, "bounty view")["message"] == "short"
+
+    def test_rejected_arguments_show_usage(self):
+        registry = CommandRegistry()
+        registry.register("buy", echo, min_args=1, usage="buy <item>")
+        registry.register("look", echo, max_args=0)
+
+        assert registry.dispatch(None, "buy")["message"] == "Usage: buy <item>"
+        assert registry.dispatch(None, "look up")["message"] == "Usage: look"
+        assert registry.dispatch(None, "dance") is None
+
+    def test_tables_and_aliases_share_a_spec(self):
+        registry = CommandRegistry()
+        registry.register_table({"rep": echo, "rep status": echo})
+        registry.alias("reputation", "rep")
+
+        assert registry.get("reputation") is registry.get("rep")
+        assert registry.dispatch(None, "rep status now")["message"] == "now"
+
+    def test_suggestions_follow_new_registrations(self):
+        registry = CommandRegistry()
+        registry.register("look", echo)
+        assert registry.suggest("lok") == "look"
+        assert registry.suggest("hepl") is None
+
+        registry.register("help", echo)
+        assert registry.suggest("hepl") == "help"
+
+
+class TestBKTree:
+    """Test near-match search against a brute-force scan."""
+
+    def test_edit_distance_matches_dynamic_programming(self):
+        rng = random.Random(3)
+        for _ in range(2000):
+            a = "".join(rng.choice("abc") for _ in range(rng.randint(0, 9)))
+            b = "".join(rng.choice("abc") for _ in range(rng.randint(0, 9)))
+            assert edit_distance(a, b) == reference_distance(a, b)
+
+    def test_search_finds_every_word_a_scan_would(self):
+        rng = random.Random(4)
+        words = {
+            "".join(rng.choice("abcdef") for _ in range(rng.randint(2, 7)))
+            for _ in range(300)
+        }
+        tree = BKTree(words)
+
+        for query in ["abc", "fedcb", "aaaa", "b"]:
+            expected = {w for w in words if reference_distance(query, w) <= 2}
+            assert {word for _, word in tree.search(query)} == expected
+
+    @pytest.mark.parametrize(
+        "typo, expected",
+        [("lok", "look"), ("hepl", "help"), ("invetory", "inventory"), ("am", None)],
+    )
+    def test_closest(self, typo, expected):
+        tree = BKTree(["look", "rep", "help", "inventory", "ask"])
+        assert tree.closest(typo) == expected
+
+
+class TestGameStateDispatch:
+    """Test commands that go through the registry and retry suggestions."""
+
+    @pytest.fixture(autouse=True)
+    def without_llm(self, game_state):
+        game_state.llm_parser.use_llm = False
+
+    @pytest.mark.parametrize("command", ["bounty list", "bounty active"])
+    def test_bounty_subcommands_are_reachable(self, game_state, command):
+        assert game_state.process_command(command)["success"]
+
+    def test_misspelled_room_is_corrected(self, game_state):
+        result = game_state.process_command("move cellar")
+        assert result["success"]
+        assert game_state.room_manager.current_room.id == "deep_cellar"
+
+    @pytest.mark.parametrize(
+        "command, message",
+        [
+            ("buy alr", "Did you mean 'ale'?"),
+            ("hepl", "Did you mean 'help'?"),
+            ("buy", "Usage: buy <item>"),
+        ],
+    )
+    def test_failures_suggest_what_was_meant(self, game_state, command, message):
+        result = game_state.process_command(command)
+        assert not result["success"]
+        assert message in result["message"]
+
+    def test_benchmark_process_command_throughput(self, game_state):
+        """The 200 complex commands, parsed without the LLM."""
+        commands = [command for command, *_ in COMPLEX_COMMANDS]
+
+        for command in commands:  # warm up the lazily built systems
+            game_state.process_command(command)
+        start = time.perf_counter()
+        for command in commands:
+            game_state.process_command(command)
+        elapsed = time.perf_counter() - start
+
+        # The if/elif chain with a Levenshtein scan per unknown word took about
+        # 0.044s here; dispatched from the registry, a warm pass takes 0.01-0.02s
+        assert elapsed < 0.044
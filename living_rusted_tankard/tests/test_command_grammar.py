@@ -0,0 +1,113 @@
+"""Tests for the deterministic command grammar ahead of the LLM parser."""
+
+import pytest
+
+from core.command_grammar import COMMAND_VOCABULARY, CommandGrammar
+
+VOCABULARY = {
+    "npc": {"gene", "gene_bartender"},
+    "item": {"ale", "bread"},
+    "room": {"cellar", "tavern_main"},
+    "job": {"wash_dishes"},
+}
+
+
+class TestCommandGrammar:
+    """Test template matching and confidence scoring."""
+
+    @pytest.mark.parametrize(
+        "text, command",
+        [
+            ("look", "look"),
+            ("Inventory!", "inventory"),
+            ("buy the ale", "buy ale"),
+            ("buy beer", "buy ale"),
+            ("go to the cellar", "move cellar"),
+            ("talk to gene", "interact gene talk"),
+            (
+                "interact gene talk about the weather",
+                "interact gene talk about weather",
+            ),
+            ("wait 2 hours", "wait 2 hours"),
+            ("read notice board", "read notice board"),
+            ("rent room with chest", "rent room with chest"),
+            ("store bread 3", "store bread 3"),
+        ],
+    )
+    def test_canonical_commands_resolve(self, text, command):
+        grammar = CommandGrammar()
+
+        found = grammar.resolve(text, VOCABULARY)
+
+        assert found is not None
+        assert found.command == command
+        assert found.confidence == 1.0
+
+    @pytest.mark.parametrize(
+        "text",
+        ["what's going on here?", "wait a while", "look at the fire", "gamble lots"],
+    )
+    def test_free_form_input_is_left_to_the_llm(self, text):
+        assert CommandGrammar().resolve(text, VOCABULARY) is None
+
+    def test_unknown_words_in_vocabulary_slots_score_low(self):
+        grammar = CommandGrammar()
+
+        found = grammar.match("buy a pony", VOCABULARY)
+
+        assert found.template == "buy <item>"
+        assert found.confidence < grammar.min_confidence
+        assert grammar.resolve("buy a pony", VOCABULARY) is None
+
+    def test_every_listed_command_has_a_template(self):
+        grammar = CommandGrammar()
+        samples = {"<hours>": "2", "<amount>": "5", "<qty>": "1", "<item>": "ale"}
+
+        for template in COMMAND_VOCABULARY:
+            text = " ".join(samples.get(word, word) for word in template.split())
+            text = text.replace("<", "").replace(">", "")
+            assert grammar.match(text) is not None, template
+
+    def test_stats_report_hit_rate(self):
+        grammar = CommandGrammar()
+        grammar.resolve("look")
+        grammar.resolve("status")
+        grammar.resolve("sing a song about ale")
+
+        stats = grammar.get_stats()
+
+        assert (stats["grammar"], stats["miss"]) == (2, 1)
+        assert stats["hit_rate"] == pytest.approx(2 / 3)
+
+
+class TestGameStateGrammar:
+    """Test that GameState only consults the LLM parser on grammar misses."""
+
+    @pytest.fixture
+    def llm_calls(self, game_state, monkeypatch):
+        calls = []
+
+        def parse(text, snapshot):
+            calls.append(text)
+            return {"action": "look", "target": None, "extras": {}}
+
+        game_state.llm_parser.use_llm = True
+        monkeypatch.setattr(game_state.llm_parser, "parse", parse)
+        return calls
+
+    def test_canonical_command_skips_the_llm(self, game_state, llm_calls):
+        game_state.process_command("inventory")
+
+        assert llm_calls == []
+        assert game_state.get_parse_stats()["grammar"] == 1
+
+    def test_known_npc_alias_skips_the_llm(self, game_state, llm_calls):
+        game_state.process_command("talk to gene")
+
+        assert llm_calls == []
+
+    def test_free_form_input_goes_to_the_llm(self, game_state, llm_calls):
+        game_state.process_command("what is happening around here")
+
+        assert llm_calls == ["what is happening around here"]
+        assert game_state.get_parse_stats()["llm"] == 1
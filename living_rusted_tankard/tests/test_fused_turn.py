@@ -0,0 +1,181 @@
+"""Tests for fused LLM turns, where one call returns command and narration."""
+
+import json
+import time
+
+from tests.fixtures.fake_fixtures import FakeTransport, make_game_master
+
+NARRATION = (
+    "The barkeep wipes down a tankard and sets it before you with a grunt. "
+    "Firelight catches the scratches in the old oak bar, and somewhere behind "
+    "you a dice game erupts into laughter. 'What'll it be?' he asks. "
+    "[Options: 1. Ask about rumors 2. Order an ale 3. Ask about rooms]"
+)
+INTENT = {"action": "talk", "target": "the barkeep", "extras": {}}
+
+
+def tokens(text):
+    return max(1, len(text) // 4)
+
+
+def count_tokens(prompt, reply):
+    return tokens(prompt), tokens(reply)
+
+
+class FakeChatTransport(FakeTransport):
+    """Answers /api/chat and counts the tokens of each round trip."""
+
+    def __init__(self, content, delay=0.0):
+        super().__init__(delay=delay)
+        self.content = content
+        self.tokens = 0
+
+    def post_json(self, path, data, **kwargs):
+        super().post_json(path, data)
+        prompt = "".join(message["content"] for message in data["messages"])
+        prompt_tokens, output_tokens = count_tokens(prompt, self.content)
+        self.tokens += prompt_tokens + output_tokens
+        return {
+            "message": {"content": self.content},
+            "prompt_eval_count": prompt_tokens,
+            "eval_count": output_tokens,
+        }
+
+
+class FakeGenerateTransport(FakeTransport):
+    """Stands in for the transport the parser posts to /api/generate through."""
+
+    def __init__(self, delay=0.0):
+        super().__init__(delay=delay)
+        self.tokens = 0
+
+    def post_json(self, path, payload, **kwargs):
+        super().post_json(path, payload)
+        reply = json.dumps(INTENT)
+        prompt_tokens, output_tokens = count_tokens(payload["prompt"], reply)
+        self.tokens += prompt_tokens + output_tokens
+        return {"response": reply}
+
+
+def make_chat_game_master(reply, fused, delay=0.0):
+    return make_game_master(FakeChatTransport(reply, delay), fused=fused)
+
+
+class TestFusedTurn:
+    """Test the single-call turn and its fallbacks."""
+
+    def test_one_call_returns_command_and_narration(self, game_state):
+        reply = json.dumps({"command": INTENT, "narration": NARRATION})
+        gm = make_chat_game_master(reply, fused=True)
+
+        narration, command, _ = gm.process_input("hey barkeep", game_state, "s1")
+
+        assert command == "interact barkeep talk"
+        assert narration.startswith("The barkeep wipes down a tankard")
+        (payload,) = gm.transport.payloads
+        assert payload["format"] == "json"
+        assert "RESPONSE FORMAT" in payload["messages"][0]["content"]
+
+    def test_plain_text_reply_falls_back_to_command_tags(self, game_state):
+        gm = make_chat_game_master("[COMMAND: look] The room is quiet.", fused=True)
+
+        narration, command, _ = gm.process_input("look around", game_state, "s1")
+
+        assert command == "look"
+        assert narration == "The room is quiet."
+
+    def test_reply_without_command_is_narration_only(self, game_state):
+        reply = json.dumps({"command": None, "narration": "You hum a tune."})
+        gm = make_chat_game_master(reply, fused=True)
+
+        narration, command, _ = gm.process_input("hum", game_state, "s1")
+
+        assert (narration, command) == ("You hum a tune.", None)
+
+    def test_token_usage_is_recorded(self):
+        reply = json.dumps({"command": INTENT, "narration": NARRATION})
+        gm = make_chat_game_master(reply, fused=True)
+
+        response = gm._make_llm_request(
+            [{"role": "user", "content": "hey barkeep"}], "s1", fused=True
+        )
+
+        assert response.token_usage == gm.transport.tokens
+
+    def test_fused_command_skips_the_parser(self, game_state, monkeypatch):
+        calls = []
+        game_state.llm_parser.use_llm = True
+        monkeypatch.setattr(
+            game_state.llm_parser, "parse", lambda text, snapshot: calls.append(text)
+        )
+
+        game_state.process_command("interact barkeep talk", use_llm_parser=False)
+
+        assert calls == []
+
+    def test_fused_turn_uses_fewer_tokens_than_parse_then_narrate(
+        self, game_state, monkeypatch
+    ):
+        """Per-command LLM tokens for both paths."""
+        generate = FakeGenerateTransport()
+        monkeypatch.setattr(
+            "core.ollama_transport.get_ollama_transport", lambda base_url: generate
+        )
+        game_state.llm_parser.use_llm = True
+        two_call = make_chat_game_master(
+            f"{NARRATION} [COMMAND: talk to the barkeep]", fused=False
+        )
+        fused = make_chat_game_master(
+            json.dumps({"command": INTENT, "narration": NARRATION}), fused=True
+        )
+        commands = ["hey barkeep", "what's the news", "I'd like a word"] * 3
+
+        for text in commands:
+            _, command, _ = two_call.process_input(text, game_state, "two")
+            parsed = game_state.llm_parser.parse(
+                command, game_state._get_game_snapshot()
+            )
+            assert parsed["action"] == "talk"
+        two_call_tokens = two_call.transport.tokens + generate.tokens
+
+        for text in commands:
+            _, command, _ = fused.process_input(text, game_state, "fused")
+            assert command == "interact barkeep talk"
+
+        # The parser prompt and its reply disappear from every turn
+        assert fused.transport.tokens < two_call_tokens * 0.6
+
+    def test_fused_turn_is_faster_than_parse_then_narrate(
+        self, game_state, monkeypatch
+    ):
+        """Per-command latency when every model round trip costs the same."""
+        round_trip = 0.02
+        generate = FakeGenerateTransport(delay=round_trip)
+        monkeypatch.setattr(
+            "core.ollama_transport.get_ollama_transport", lambda base_url: generate
+        )
+        game_state.llm_parser.use_llm = True
+        two_call = make_chat_game_master(
+            f"{NARRATION} [COMMAND: talk to the barkeep]", fused=False, delay=round_trip
+        )
+        fused = make_chat_game_master(
+            json.dumps({"command": INTENT, "narration": NARRATION}),
+            fused=True,
+            delay=round_trip,
+        )
+        commands = ["hey barkeep", "what's the news", "I'd like a word"] * 3
+
+        started = time.perf_counter()
+        for text in commands:
+            _, command, _ = two_call.process_input(text, game_state, "two")
+            game_state.llm_parser.parse(command, game_state._get_game_snapshot())
+        two_call_latency = (time.perf_counter() - started) / len(commands)
+
+        started = time.perf_counter()
+        for text in commands:
+            fused.process_input(text, game_state, "fused")
+        fused_latency = (time.perf_counter() - started) / len(commands)
+
+        assert generate.calls == len(commands)
+        # One round trip per command instead of two
+        assert fused_latency < two_call_latency * 0.75
@@ -0,0 +1,167 @@
+"""Tests for the indexed rumor store behind GossipNetwork."""
+
+import random
+import time
+from datetime import datetime, timedelta
+
+from core.npc_systems.gossip import (
+    GossipNetwork,
+    Rumor,
+    RumorSource,
+    RumorStore,
+    RumorType,
+)
+from core.npc_systems.relationships import RelationshipType
+from tests.fixtures.fake_fixtures import make_web
+
+
+def make_rumor(rumor_id, knowers, **kwargs):
+    rumor = Rumor(id=rumor_id, type=RumorType.EVENT, content=rumor_id, **kwargs)
+    for npc_id in knowers:
+        rumor.add_knower(npc_id, RumorSource(npc_id, npc_id), 0.8)
+    return rumor
+
+
+def make_network(npc_count, friends_per_npc, seed=3):
+    rng = random.Random(seed)
+    npcs = [f"npc_{i}" for i in range(npc_count)]
+    network = GossipNetwork(
+        make_web(
+            *(
+                (npc_id, friend, RelationshipType.FRIEND, 0.8)
+                for npc_id in npcs
+                for friend in rng.sample(npcs, friends_per_npc)
+                if friend != npc_id
+            )
+        )
+    )
+    for npc_id in npcs:
+        network.gossip_tendencies[npc_id] = 0.9
+    return network, npcs
+
+
+class TestRumorStore:
+    """Test the knower and freshness indexes."""
+
+    def test_indexes_knowers_on_add_and_learn(self):
+        store = RumorStore()
+        rumor = make_rumor("r1", ["alice"])
+        store.add(rumor)
+
+        store.learn(rumor, "bob", RumorSource("alice", "alice"), 0.5)
+
+        assert store.known_ids("bob") == ["r1"]
+        assert store.fresh_ids("alice") == ["r1"]
+        assert store.knows("bob", "r1") and not store.knows("carol", "r1")
+        assert rumor.known_by == {"alice", "bob"}
+
+    def test_prune_retires_expired_rumors_only(self):
+        store = RumorStore()
+        now = datetime.now()
+        store.add(make_rumor("old", ["alice"], expiry=now + timedelta(hours=1)))
+        store.add(make_rumor("new", ["alice"]))
+
+        assert store.prune(now) == []
+        assert store.prune(now + timedelta(hours=2)) == ["old"]
+
+        assert store.fresh_ids("alice") == ["new"]
+        assert store.known_ids("alice") == ["old", "new"]
+        assert store.fresh_rumor_ids() == ["new"]
+
+    def test_rumors_go_stale_after_a_week(self):
+        store = RumorStore()
+        rumor = make_rumor("r1", ["alice"])
+        store.add(rumor)
+
+        assert store.prune(rumor.created + timedelta(days=7, hours=23)) == []
+        assert store.prune(rumor.created + timedelta(days=8)) == ["r1"]
+
+    def test_extended_expiry_is_rescheduled(self):
+        store = RumorStore()
+        now = datetime.now()
+        rumor = make_rumor("r1", ["alice"], expiry=now + timedelta(hours=1))
+        store.add(rumor)
+
+        rumor.expiry = now + timedelta(days=2)
+        assert store.prune(now + timedelta(hours=2)) == []
+        assert store.prune(now + timedelta(days=3)) == ["r1"]
+
+
+class TestGossipNetwork:
+    """Test gossip spreading over the indexed store."""
+
+    def test_opportunities_skip_rumors_the_listener_knows(self):
+        network, _ = make_network(0, 0)
+        network.relationship_web.create_relationship(
+            "alice", "bob", RelationshipType.FRIEND, trust=0.8
+        )
+        network.store.add(make_rumor("shared", ["alice", "bob"]))
+        network.store.add(make_rumor("secret", ["alice"]))
+
+        opportunities = network.find_gossip_opportunities(
+            "alice", "tavern", ["alice", "bob"]
+        )
+
+        assert opportunities == [("bob", ["secret"])]
+
+    def test_rumor_moves_one_step_per_cycle(self):
+        network, _ = make_network(0, 0)
+        for a, b in (("a", "b"), ("b", "c")):
+            network.relationship_web.create_relationship(
+                a, b, RelationshipType.FRIEND, trust=0.9
+            )
+            network.gossip_tendencies[a] = network.gossip_tendencies[b] = 1.0
+        rumor = make_rumor("r1", ["a"], scandalousness=1.0, importance=1.0)
+        rumor.spread_speed = 1.0
+        network.store.add(rumor)
+
+        network.simulate_gossip_spread(hours=24)
+
+        assert network.store.knows("b", "r1")
+        assert "c" not in rumor.known_by
+
+        network.simulate_gossip_spread(hours=24)
+
+        assert network.store.knows("c", "r1")
+
+    def test_exchange_log_is_bounded(self):
+        network, _ = make_network(0, 0)
+        network.exchanges = network.exchanges.__class__(maxlen=5)
+        network.relationship_web.create_relationship(
+            "a", "b", RelationshipType.FRIEND, trust=0.9
+        )
+        network.gossip_tendencies["a"] = 1.0
+        for i in range(50):
+            rumor = make_rumor(f"r{i}", ["a"], scandalousness=1.0, importance=1.0)
+            rumor.spread_speed = 1.0
+            network.store.add(rumor)
+            network.spread_rumor(rumor.id, "a", "b", {})
+
+        assert len(network.exchanges) == 5
+        assert network.total_exchanges > 5
+
+    def test_sample_chances_hits_at_the_expected_rate(self):
+        items = [str(i) for i in range(100_000)]
+
+        hits = list(GossipNetwork._sample_chances(items, 0.01))
+
+        assert 800 < len(hits) < 1200
+        assert len(set(hits)) == len(hits)
+
+    def test_benchmark_500_npcs_10k_rumors(self):
+        """A day of quarter-hour gossip ticks and opportunity lookups."""
+        network, npcs = make_network(500, 8)
+        rng = random.Random(11)
+        for i in range(10_000):
+            network.store.add(make_rumor(f"r{i}", rng.sample(npcs, rng.randint(1, 5))))
+
+        start = time.perf_counter()
+        for _ in range(96):
+            network.propagate_rumors(900)
+        for npc_id in npcs[:100]:
+            network.find_gossip_opportunities(npc_id, "tavern", rng.sample(npcs, 10))
+        elapsed = time.perf_counter() - start
+
+        assert network.total_exchanges > 0
+        # Scanning every rumor each tick took over 4s here; indexed, about 1.5s
+        assert elapsed < 3.0
@@ -0,0 +1,113 @@
+"""Tests for lazily built GameState subsystems."""
+
+from core.event_bus import Event, EventBus, EventType
+from core.game_state import GameState
+from core.lazy_components import LazyComponent, component_report, is_live
+
+
+class Host:
+    built = []
+
+    tracker = LazyComponent(lambda host: host.built.append("tracker") or "tracker")
+    greeting = LazyComponent(
+        lambda host: "hello",
+        setup=lambda host, value: host.built.append(f"setup {value}"),
+    )
+    missing = LazyComponent(lambda host: "never", available=False)
+
+    def __init__(self):
+        self.built = []
+
+
+class TestLazyComponent:
+    """Test the descriptor on its own."""
+
+    def test_builds_once_on_first_access(self):
+        host = Host()
+        assert not is_live(host, "tracker")
+
+        assert host.tracker == "tracker"
+        assert host.tracker == "tracker"
+        assert host.built == ["tracker"]
+        assert is_live(host, "tracker")
+
+    def test_setup_runs_after_value_is_stored(self):
+        host = Host()
+
+        assert host.greeting == "hello"
+        assert host.built == ["setup hello"]
+
+    def test_unavailable_component_is_missing(self):
+        host = Host()
+
+        assert not hasattr(host, "missing")
+        assert component_report(host) == {
+            "tracker": "dormant",
+            "greeting": "dormant",
+            "missing": "unavailable",
+        }
+
+
+class TestGameStateSubsystems:
+    """Test which subsystems a session builds and when."""
+
+    def test_new_session_starts_with_npc_and_narrative_systems_dormant(self):
+        game_state = GameState()
+
+        report = game_state.get_subsystem_report()
+        # Phase 4 may already be awake if an NPC arrived during setup
+        for name in ("atmosphere_manager", "npc_psychology", "story_orchestrator"):
+            assert report[name] != "live"
+
+    def test_updates_skip_dormant_subsystems(self):
+        game_state = GameState()
+
+        game_state._update_phase_systems(2.0)
+        game_state._update_narrative_systems()
+
+        assert not is_live(game_state, "npc_psychology")
+        assert not is_live(game_state, "goal_manager")
+
+    def test_look_and_buy_leave_narrative_systems_dormant(self):
+        game_state = GameState()
+
+        for command in ("look", "buy ale", "look"):
+            game_state.process_command(command)
+        game_state.get_narrative_status()
+        game_state.get_active_quests()
+
+        report = game_state.get_subsystem_report()
+        for name in (
+            "atmosphere_manager",
+            "story_orchestrator",
+            "reputation_network",
+            "narrative_persistence",
+        ):
+            assert report[name] != "live", name
+
+    def test_subsystem_is_built_on_first_use(self):
+        game_state = GameState()
+        if game_state.get_subsystem_report()["goal_manager"] == "unavailable":
+            return
+
+        goal_manager = game_state.goal_manager
+        for npc_id in game_state.npc_manager.npcs:
+            assert npc_id in goal_manager.npc_goals
+        assert game_state.get_subsystem_report()["goal_manager"] == "live"
+
+    def test_narrative_handler_wakes_on_first_event(self):
+        game_state = GameState()
+        if game_state.get_subsystem_report()["narrative_handler"] == "unavailable":
+            return
+        for name in ("narrative_handler", "narrative_orchestrator", "thread_manager"):
+            game_state.__dict__.pop(name, None)
+        game_state.event_bus = EventBus()
+        game_state._wake_narrative_handler_on_events()
+
+        game_state.event_bus.dispatch(
+            Event("room_change", {"old_room": "tavern", "new_room": "cellar"})
+        )
+
+        report = game_state.get_subsystem_report()
+        assert report["narrative_handler"] == "live"
+        assert report["thread_manager"] == "live"
@@ -3,23 +3,9 @@
 import pytest
 
 import json
-import sys
 from dataclasses import asdict
 from unittest.mock import MagicMock, Mock, patch
 
-# Create a mock requests module
-mock_requests = Mock()
-requests_mock = MagicMock()
-requests_mock.post.return_value = MagicMock()
-requests_mock.post.return_value.json.return_value = {}
-requests_mock.exceptions = MagicMock()
-requests_mock.exceptions.RequestException = Exception
-
-# Patch sys.modules to include our mock requests
-sys.modules["requests"] = requests_mock
-
-# Now import the parser
-
 from core.llm.parser import Parser, GameSnapshot
 
 # Test data
@@ -42,6 +28,17 @@ def create_mock_llm_response(action: str, target: str = None, **extras):
     }
 
 
+@pytest.fixture
+def transport(monkeypatch):
+    """Stand-in for the shared Ollama transport the parser posts through."""
+    transport = MagicMock()
+    transport.post_json.return_value = {}
+    monkeypatch.setattr(
+        "core.llm.parser.parser.get_ollama_transport", lambda base_url: transport
+    )
+    return transport
+
+
 # Test the regex fallback parser
 
 
@@ -77,15 +74,10 @@ def test_regex_fallback_parser():
 # Test LLM parser with mocks
 
 
-def test_llm_parser():
+def test_llm_parser(transport):
     """Test the LLM parser with mocked responses."""
-    # Setup mock response for look command
-    mock_response = MagicMock()
-    mock_response.json.return_value = create_mock_llm_response("look", "room")
-    mock_response.raise_for_status.return_value = None
-
-    # Configure the mock to return our response
-    requests_mock.post.return_value = mock_response
+    # Configure the transport to return a look command
+    transport.post_json.return_value = create_mock_llm_response("look", "room")
 
     # Test with LLM
     parser = Parser(use_llm=True, llm_endpoint="http://test-endpoint")
@@ -95,10 +87,10 @@ def test_llm_parser():
     assert cmd["target"] == "room"
 
     # Verify LLM was called
-    assert requests_mock.post.called
+    assert transport.post_json.called
 
     # Test with a more complex command
-    mock_response.json.return_value = create_mock_llm_response(
+    transport.post_json.return_value = create_mock_llm_response(
         "ask", "bartender", topic="rumors"
     )
 
@@ -111,10 +103,10 @@ def test_llm_parser():
 # Test LLM fallback to regex
 
 
-def test_llm_fallback():
+def test_llm_fallback(transport):
     """Test that the parser falls back to regex when LLM fails."""
     # Make the LLM call raise an exception
-    requests_mock.post.side_effect = Exception("API error")
+    transport.post_json.side_effect = Exception("API error")
 
     # This should fall back to regex parsing
     parser = Parser(use_llm=True, llm_endpoint="http://test-endpoint")
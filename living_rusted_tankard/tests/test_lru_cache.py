@@ -0,0 +1,86 @@
+"""Tests for the shared LRU/TTL cache."""
+
+import threading
+from unittest.mock import patch
+
+from core.lru_cache import LRUCache
+
+
+class TestLRUCache:
+    """Test eviction, expiry and counters."""
+
+    def test_get_and_set(self):
+        cache = LRUCache(max_entries=10)
+        cache.set("a", "alpha")
+
+        assert cache.get("a") == "alpha"
+        assert cache.get("missing") is None
+        assert "a" in cache
+        assert len(cache) == 1
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(max_entries=3)
+        for key in "abc":
+            cache.set(key, key)
+
+        cache.get("a")  # "b" is now least recently used
+        cache.set("d", "d")
+
+        assert "b" not in cache
+        assert [key for key, _ in cache.items()] == ["c", "a", "d"]
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_byte_budget(self):
+        evicted = []
+        cache = LRUCache(
+            max_entries=100, max_bytes=10, on_evict=lambda k, v: evicted.append(k)
+        )
+        cache.set("a", "12345")
+        cache.set("b", "12345")
+        cache.set("c", "123")
+
+        assert evicted == ["a"]
+        assert cache.size_bytes == 8
+
+    def test_ttl_expiry(self):
+        cache = LRUCache(max_entries=10, ttl_seconds=60)
+        with patch("core.lru_cache.time.time", return_value=1000.0):
+            cache.set("old", 1)
+        with patch("core.lru_cache.time.time", return_value=1030.0):
+            cache.set("new", 2)
+        with patch("core.lru_cache.time.time", return_value=1070.0):
+            assert cache.get("old") is None
+            assert cache.get("new") == 2
+
+        assert cache.get_stats()["expirations"] == 1
+
+    def test_overwrite_refreshes_entry(self):
+        cache = LRUCache(max_entries=2, ttl_seconds=60)
+        with patch("core.lru_cache.time.time", return_value=1000.0):
+            cache.set("a", 1)
+            cache.set("b", 2)
+        with patch("core.lru_cache.time.time", return_value=1050.0):
+            cache.set("a", 3)
+        with patch("core.lru_cache.time.time", return_value=1070.0):
+            assert cache.get("a") == 3
+            assert cache.get("b") is None
+
+    def test_concurrent_access(self):
+        cache = LRUCache(max_entries=50)
+
+        def worker(offset):
+            for i in range(500):
+                cache.set(offset + i, i)
+                cache.get(offset + i - 1)
+
+        threads = [threading.Thread(target=worker, args=(n * 1000,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(cache) == 50
@@ -25,9 +25,9 @@ SAMPLE_STATE_2 = {
 SAMPLE_STATE_INVALID = "not a dictionary"
 
 
-def test_generate_state_hash():
+def test_generate_state_hash(tmp_path):
     """Test that the state hash is consistent for the same input."""
-    cache = NarrativeCache()
+    cache = NarrativeCache(str(tmp_path))
     hash1 = cache._generate_state_hash(SAMPLE_STATE_1)
     hash2 = cache._generate_state_hash(SAMPLE_STATE_1)
 
@@ -116,3 +116,53 @@ def test_validate_state_decorator():
 
     with pytest.raises(ValueError):
         generate_narrative("not a dict")  # Not a dictionary
+
+
+def test_cache_migrates_legacy_json(tmp_path):
+    """Test that an old JSON cache file is imported into the database."""
+    cache_dir = tmp_path / "legacy_cache"
+    cache_dir.mkdir()
+    state_hash = NarrativeCache(str(tmp_path / "scratch"))._generate_state_hash(
+        SAMPLE_STATE_1
+    )
+    (cache_dir / "narrative_cache.json").write_text(
+        json.dumps({state_hash: "Legacy narrative"})
+    )
+
+    cache = NarrativeCache(str(cache_dir))
+
+    assert cache.get_cached_narrative(SAMPLE_STATE_1) == "Legacy narrative"
+    assert not (cache_dir / "narrative_cache.json").exists()
+
+
+def test_default_cache_migrates_the_old_working_directory_cache(tmp_path, monkeypatch):
+    """Test that the JSON cache older versions wrote to ./.narrative_cache is imported."""
+    monkeypatch.setattr(
+        "core.llm.narrative_cache.DEFAULT_CACHE_DIR", tmp_path / "data" / "narrative"
+    )
+    monkeypatch.chdir(tmp_path)
+    state_hash = NarrativeCache(str(tmp_path / "scratch"))._generate_state_hash(
+        SAMPLE_STATE_1
+    )
+    legacy_dir = tmp_path / ".narrative_cache"
+    legacy_dir.mkdir()
+    (legacy_dir / "narrative_cache.json").write_text(
+        json.dumps({state_hash: "Legacy narrative"})
+    )
+
+    cache = NarrativeCache()
+
+    assert cache.cache_dir == tmp_path / "data" / "narrative"
+    assert cache.get_cached_narrative(SAMPLE_STATE_1) == "Legacy narrative"
+    assert (legacy_dir / "narrative_cache.json.migrated").exists()
+
+
+def test_cache_memory_tier_is_bounded(tmp_path):
+    """Test that evicted narratives are still served from disk."""
+    cache = NarrativeCache(str(tmp_path / "bounded"), max_memory_entries=1)
+    cache.cache_narrative(SAMPLE_STATE_1, "Morning")
+    cache.cache_narrative(SAMPLE_STATE_2, "Afternoon")
+
+    assert len(cache.cache) == 1
+    assert cache.get_cached_narrative(SAMPLE_STATE_1) == "Morning"
+    assert cache.get_stats()["persisted"] == 2
@@ -0,0 +1,113 @@
+"""Tests for incremental narrative saves through the component journal."""
+
+import json
+
+from core.narrative.narrative_persistence import (
+    NarrativePersistenceManager,
+    SerializationFormat,
+)
+
+
+class Ledger:
+    """A component saved through the generic attribute serializer."""
+
+    def __init__(self):
+        self.entries = []
+        self.mood = "calm"
+
+
+def make_manager(tmp_path):
+    manager = NarrativePersistenceManager(str(tmp_path))
+    ledger, diary = Ledger(), Ledger()
+    manager.register_component("ledger", ledger)
+    manager.register_component("diary", diary)
+    return manager, ledger, diary
+
+
+def journal_lines(manager, session_id):
+    path = manager._journal_path(session_id)
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class TestNarrativeJournal:
+    """Test that saves only write what changed and still load back."""
+
+    def test_only_changed_components_are_written(self, tmp_path):
+        manager, ledger, _ = make_manager(tmp_path)
+
+        assert manager.save_all_narrative_state("s1")
+        ledger.entries.append("a round of ale")
+        manager.save_all_narrative_state("s1")
+        manager.save_all_narrative_state("s1")
+        manager.flush()
+
+        entries = journal_lines(manager, "s1")
+        assert [sorted(entry["components"]) for entry in entries] == [
+            ["diary", "ledger"],
+            ["ledger"],
+        ]
+        assert manager.save_stats["components_skipped"] == 3
+        assert list(tmp_path.glob("narrative_state_*")) == []
+
+    def test_journal_replays_into_a_new_manager(self, tmp_path):
+        manager, ledger, diary = make_manager(tmp_path)
+        manager.save_all_narrative_state("s1")
+        ledger.entries.append("a round of ale")
+        diary.mood = "wistful"
+        manager.save_all_narrative_state("s1")
+        manager.flush()
+
+        restored, restored_ledger, restored_diary = make_manager(tmp_path)
+        assert restored.load_narrative_state("s1")
+
+        assert restored_ledger.entries == ["a round of ale"]
+        assert restored_diary.mood == "wistful"
+        # Loaded state counts as saved, so nothing is rewritten
+        restored.save_all_narrative_state("s1")
+        restored.flush()
+        assert restored.save_stats["journal_entries"] == 0
+
+    def test_compaction_folds_journal_into_base(self, tmp_path):
+        manager, ledger, _ = make_manager(tmp_path)
+        manager.compact_after_entries = 3
+
+        for i in range(4):
+            ledger.entries.append(f"entry {i}")
+            manager.save_all_narrative_state("s1")
+        manager.flush()
+
+        assert manager._base_path("s1").exists()
+        assert [entry["seq"] for entry in journal_lines(manager, "s1")] == [4]
+        assert manager.save_stats["compactions"] == 1
+
+        restored, restored_ledger, _ = make_manager(tmp_path)
+        restored.load_narrative_state("s1")
+        assert restored_ledger.entries == [f"entry {i}" for i in range(4)]
+
+    def test_entries_already_in_base_are_not_replayed(self, tmp_path):
+        manager, ledger, _ = make_manager(tmp_path)
+        manager.compact_after_entries = 2
+        ledger.entries.append("old")
+        manager.save_all_narrative_state("s1")
+        ledger.entries.append("new")
+        manager.save_all_narrative_state("s1")
+        manager.flush()
+
+        # As if compaction stopped before truncating the journal
+        stale_entry = {"seq": 1, "components": {"ledger": {"attributes": {}}}}
+        with open(manager._journal_path("s1"), "w") as f:
+            f.write(json.dumps(stale_entry) + "\n")
+
+        restored, restored_ledger, _ = make_manager(tmp_path)
+        restored.load_narrative_state("s1")
+        assert restored_ledger.entries == ["old", "new"]
+
+    def test_explicit_format_still_writes_a_full_snapshot(self, tmp_path):
+        manager, _, _ = make_manager(tmp_path)
+
+        assert manager.save_all_narrative_state("s1", SerializationFormat.JSON)
+
+        assert len(list(tmp_path.glob("narrative_state_s1_*.json"))) == 1
+        assert not manager._journal_path("s1").exists()
@@ -0,0 +1,79 @@
+"""Tests for streamed narration and early command extraction."""
+
+import pytest
+
+from core.narrative_actions import ActionType, NarrativeStreamParser
+from tests.fixtures.fake_fixtures import FakeTransport, make_game_master
+
+
+def feed_all(parser, chunks):
+    text, actions = [], []
+    for chunk in chunks:
+        shown, found = parser.feed(chunk)
+        text.append(shown)
+        actions.extend(found)
+    text.append(parser.flush())
+    return "".join(text), actions
+
+
+class TestNarrativeStreamParser:
+    """Test tag extraction from chunked narration."""
+
+    def test_tag_split_across_chunks(self):
+        parser = NarrativeStreamParser()
+        text, actions = feed_all(
+            parser,
+            ["You hand over a coin. [COM", "MAND: buy", " ale] The barkeep nods."],
+        )
+
+        assert text == "You hand over a coin.  The barkeep nods."
+        assert [a.action_type for a in actions] == [ActionType.COMMAND]
+        assert actions[0].raw_text == "buy ale"
+
+    def test_command_is_returned_when_its_tag_closes(self):
+        parser = NarrativeStreamParser()
+        parser.feed("[COMMAND: look")
+        _, actions = parser.feed("]")
+
+        assert actions and actions[0].action_type == ActionType.COMMAND
+
+    def test_non_action_brackets_pass_through(self):
+        parser = NarrativeStreamParser()
+        text, actions = feed_all(
+            parser, ["Choose: [Options: 1. Ask", " | 2. Leave] or [wave"]
+        )
+
+        assert text == "Choose: [Options: 1. Ask | 2. Leave] or [wave"
+        assert actions == []
+
+    def test_stray_bracket_does_not_hide_a_tag(self):
+        parser = NarrativeStreamParser()
+        text, actions = feed_all(parser, ["[sigh [COMMAND: wait 1]"])
+
+        assert text == "[sigh "
+        assert actions[0].raw_text == "wait 1"
+
+
+class TestProcessInputStream:
+    """Test the game master's streaming path."""
+
+    @pytest.mark.asyncio
+    async def test_command_arrives_before_narration_ends(self):
+        gm = make_game_master(
+            FakeTransport(
+                chunks=["The fire ", "crackles. [COMMAND: look]", " Shadows dance."]
+            )
+        )
+        gm._build_messages = lambda user_input, game_state, session_id: []
+
+        events = [event async for event in gm.process_input_stream("look", None, "s1")]
+
+        types = [event["type"] for event in events]
+        assert types.index("command") < max(
+            i for i, t in enumerate(types) if t == "token"
+        )
+        assert events[-1]["type"] == "done"
+        assert events[-1]["command"] == "look"
+        assert events[-1]["content"] == "The fire crackles. Shadows dance."
+        assert gm.transport.payloads[0]["stream"] is True
+        assert gm.get_conversation_history("s1")[-1].content == events[-1]["content"]
@@ -192,3 +192,83 @@ class TestNPCManager:
         present_npcs = [npc.id for npc in npc_manager.get_present_npcs()]
         assert "day_npc" not in present_npcs
         assert "night_npc" in present_npcs
+
+
+def make_npc(npc_id, schedule, **kwargs):
+    from core.npc import NPC, NPCType
+
+    kwargs.setdefault("visit_frequency", 1.0)
+    kwargs.setdefault("departure_chance", 0.0)
+    return NPC(
+        id=npc_id,
+        name=npc_id.title(),
+        description="",
+        npc_type=NPCType.PATRON,
+        schedule=schedule,
+        **kwargs,
+    )
+
+
+class TestPresenceIndex:
+    @pytest.fixture
+    def manager(self, tmp_path):
+        from core.npc import NPCManager
+
+        return NPCManager(data_dir=tmp_path)
+
+    def test_tick_only_touches_npcs_at_a_boundary(self, manager):
+        """Test that NPCs are re-evaluated only when a schedule boundary passes."""
+        from core.npc import NPC
+
+        npcs = [make_npc(f"npc{i}", [(9 + i % 8, 18)]) for i in range(200)]
+        for npc in npcs:
+            manager.add_npc(npc)
+        manager.update_all_npcs(20.0)
+
+        with patch.object(NPC, "update_presence", autospec=True) as update:
+            manager.update_all_npcs(20.5)
+            assert update.call_count == 0
+
+            manager.update_all_npcs(24.0)  # Midnight: everyone's next boundary
+            assert update.call_count == 200
+
+    def test_presence_queries_follow_changes(self, manager):
+        """Test the index across schedule changes, room moves and removal."""
+        night = make_npc("night", [(20, 4)])
+        manager.add_npc(night)
+
+        manager.update_all_npcs(22.0)
+        assert manager.is_npc_present("night")
+        assert manager.pop_presence_changes() == {"night"}
+
+        night.current_room = "cellar"
+        assert manager.get_present_npcs_in_room("cellar") == [night]
+        assert manager.get_present_npcs_in_room(None) == []
+
+        manager.update_all_npcs(27.0)  # 3 AM next day, still scheduled
+        assert manager.get_present_npcs() == [night]
+        manager.update_all_npcs(28.0)
+        assert manager.get_present_npcs() == []
+
+        night.is_present = True
+        del manager.npcs["night"]
+        assert not manager.is_npc_present("night")
+
+    def test_copies_do_not_touch_the_index(self, manager):
+        """Test that edits to a copied NPC leave the roster's index alone."""
+        npc = make_npc("regular", [(0, 24)])
+        manager.add_npc(npc)
+        manager.update_all_npcs(12.0)
+
+        copy = npc.copy(deep=True)
+        copy.is_present = False
+
+        assert manager.is_npc_present("regular")
+
+    def test_next_schedule_change(self):
+        """Test boundary times, including midnight and overnight windows."""
+        npc = make_npc("night", [(20, 4)])
+
+        assert npc.next_schedule_change(22.0) == 24.0
+        assert npc.next_schedule_change(27.0) == 28.0
+        assert npc.next_schedule_change(30.0) == 44.0
@@ -0,0 +1,209 @@
+"""Tests for the shared pooled Ollama transport."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from core.async_llm_optimization import AsyncLLMOptimizer
+from core.ollama_transport import (
+    CircuitBreaker,
+    CircuitOpenError,
+    LatencyHistogram,
+    OllamaTransport,
+    get_ollama_transport,
+)
+
+BASE_URL = "http://ollama.test"
+
+
+def make_transport(handler, **kwargs):
+    kwargs.setdefault("backoff_base", 0)
+    transport = OllamaTransport(BASE_URL, **kwargs)
+    transport._client = httpx.Client(
+        base_url=BASE_URL, transport=httpx.MockTransport(handler)
+    )
+    return transport
+
+
+def use_async_handler(transport, handler):
+    loop = asyncio.get_running_loop()
+    transport._async_clients[loop] = httpx.AsyncClient(
+        base_url=BASE_URL, transport=httpx.MockTransport(handler)
+    )
+
+
+class TestOllamaTransport:
+    """Test retries, circuit breaking, concurrency limits and metrics."""
+
+    def test_retries_transient_errors(self):
+        statuses = [503, 200]
+
+        def handler(request):
+            return httpx.Response(statuses.pop(0), json={"ok": True})
+
+        transport = make_transport(handler)
+        assert transport.post_json("/api/chat", {}, model="m") == {"ok": True}
+
+        stats = transport.get_stats()
+        assert stats["retries"] == 1
+        assert stats["latency"]["m /api/chat"]["count"] == 2
+        assert stats["circuit"]["state"] == CircuitBreaker.CLOSED
+
+    def test_circuit_opens_and_fails_fast(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            raise httpx.ConnectError("refused", request=request)
+
+        transport = make_transport(handler, max_retries=0, failure_threshold=2)
+        for _ in range(2):
+            with pytest.raises(httpx.ConnectError):
+                transport.get_json("/api/tags")
+
+        with pytest.raises(CircuitOpenError):
+            transport.get_json("/api/tags")
+        assert len(calls) == 2
+        assert transport.get_stats()["short_circuited"] == 1
+
+        # A health check that succeeds closes the circuit again
+        transport.breaker.reset()
+        with pytest.raises(httpx.ConnectError):
+            transport.get_json("/api/tags")
+        assert len(calls) == 3
+
+    def test_client_errors_are_not_retried(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(404)
+
+        transport = make_transport(handler)
+        with pytest.raises(httpx.HTTPStatusError):
+            transport.get_json("/api/missing")
+        assert len(calls) == 1
+        assert transport.breaker.state == CircuitBreaker.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_async_calls_are_bounded_per_model(self):
+        active = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.02)
+            active -= 1
+            return httpx.Response(200, json={"model": json.loads(request.content)})
+
+        transport = OllamaTransport(BASE_URL, max_concurrency_per_model=2)
+        use_async_handler(transport, handler)
+
+        results = await asyncio.gather(
+            *[transport.apost_json("/api/chat", {"n": i}, model="m") for i in range(6)]
+        )
+
+        assert [r["model"]["n"] for r in results] == list(range(6))
+        assert peak == 2
+        await transport.aclose()
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_json_lines(self):
+        body = "\n".join(
+            json.dumps({"response": token, "done": token == "!"})
+            for token in ["Hel", "lo", "!"]
+        )
+
+        def handler(request):
+            return httpx.Response(200, content=body.encode())
+
+        transport = OllamaTransport(BASE_URL)
+        use_async_handler(transport, handler)
+
+        tokens = [
+            chunk["response"]
+            async for chunk in transport.astream_json("/api/generate", {}, model="m")
+        ]
+
+        assert tokens == ["Hel", "lo", "!"]
+        await transport.aclose()
+
+    @pytest.mark.asyncio
+    async def test_closing_one_optimizer_leaves_the_shared_client_open(self):
+        def handler(request):
+            return httpx.Response(200, json={"ok": True})
+
+        stopped = AsyncLLMOptimizer(BASE_URL)
+        running = AsyncLLMOptimizer(BASE_URL)
+        use_async_handler(running.transport, handler)
+
+        await stopped.close()
+
+        assert running.transport is get_ollama_transport(BASE_URL)
+        assert await running.transport.apost_json("/api/chat", {}) == {"ok": True}
+        assert running.transport.get_stats()["async_clients"] == 1
+        await running.transport.aclose()
+
+    def test_missing_model_fails_fast_without_blocking_others(self):
+        calls = []
+
+        def handler(request):
+            calls.append(json.loads(request.content)["model"])
+            return httpx.Response(200, json={"ok": True})
+
+        transport = make_transport(handler)
+        transport.mark_model_unavailable("gone")
+
+        with pytest.raises(CircuitOpenError):
+            transport.post_json("/api/chat", {"model": "gone"}, model="gone")
+        assert transport.post_json("/api/chat", {"model": "m"}, model="m") == {
+            "ok": True
+        }
+        assert calls == ["m"]
+        assert transport.get_stats()["unavailable_models"] == ["gone"]
+        assert transport.breaker.state == CircuitBreaker.CLOSED
+
+        transport.mark_model_available("gone")
+        transport.post_json("/api/chat", {"model": "gone"}, model="gone")
+        assert calls == ["m", "gone"]
+
+    def test_transports_are_shared_per_base_url(self):
+        assert get_ollama_transport(BASE_URL) is get_ollama_transport(BASE_URL + "/")
+
+
+class TestCircuitBreaker:
+    """Test breaker state transitions."""
+
+    def test_half_open_allows_one_probe(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+
+        assert breaker.allow_request()  # probe
+        breaker.record_failure()
+        assert breaker.allow_request()  # reset_timeout=0: next probe at once
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_force_open(self):
+        breaker = CircuitBreaker(reset_timeout=60)
+        breaker.force_open()
+
+        assert not breaker.allow_request()
+
+
+class TestLatencyHistogram:
+    """Test bucket counting and quantiles."""
+
+    def test_quantiles(self):
+        histogram = LatencyHistogram(buckets=(0.1, 1.0))
+        for seconds in (0.05, 0.05, 0.5, 2.0):
+            histogram.observe(seconds)
+
+        snapshot = histogram.snapshot()
+        assert snapshot["buckets"] == {"<=0.1": 2, "<=1.0": 1, "+inf": 1}
+        assert snapshot["p50"] == 0.1
+        assert snapshot["p99"] == 2.0
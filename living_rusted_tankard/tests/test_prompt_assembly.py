@@ -0,0 +1,167 @@
+"""Tests for cache-friendly prompt layout, keep_alive and prompt metrics."""
+
+from dataclasses import replace
+
+import pytest
+
+from core import memory
+from core.enhanced_llm_game_master import EnhancedLLMGameMaster, LLMChatMessage
+from core.prompt_assembly import PromptAssembler, duration_seconds
+from tests.fixtures.fake_fixtures import FakeTransport
+
+
+@pytest.fixture
+def parser(game_state):
+    """The command parser GameState loads from core/llm/parser.py."""
+    parser = game_state.llm_parser
+    parser.prompts = PromptAssembler(keep_alive="5m")
+    return parser
+
+
+@pytest.fixture
+def session_memory(monkeypatch):
+    """A fresh global memory manager, so other tests' memories stay out."""
+    manager = memory.MemoryManager()
+    monkeypatch.setattr(memory, "_memory_manager", manager)
+    return manager
+
+
+def make_snapshot(game_state, gold, npcs):
+    snapshot = game_state._get_game_snapshot()
+    return replace(snapshot, visible_npcs=npcs, player_state={"gold": gold})
+
+
+class TestPromptAssembler:
+    """Test prefix caching, message order, keep_alive and metrics."""
+
+    def test_prefix_is_built_once_per_model_and_role(self):
+        prompts = PromptAssembler()
+        calls = []
+
+        def build():
+            calls.append(1)
+            return "static"
+
+        first = prompts.prefix("gemma", "parser", build)
+        assert prompts.prefix("gemma", "parser", build) is first
+        prompts.prefix("llama", "parser", build)
+        assert len(calls) == 2
+
+        prompts.invalidate("gemma")
+        prompts.prefix("gemma", "parser", build)
+        assert len(calls) == 3
+
+    def test_chat_messages_put_volatile_context_after_history(self):
+        messages = PromptAssembler.chat_messages(
+            "rules",
+            [{"role": "user", "content": "hi"}],
+            ["GAME STATE: noon", ""],
+            "look",
+        )
+
+        assert [m["content"] for m in messages] == [
+            "rules",
+            "hi",
+            "GAME STATE: noon",
+            "look",
+        ]
+
+    def test_background_calls_keep_the_model_only_while_players_are_active(
+        self, monkeypatch
+    ):
+        now = [1000.0]
+        monkeypatch.setattr("core.prompt_assembly.time.monotonic", lambda: now[0])
+        prompts = PromptAssembler(keep_alive="10m")
+
+        assert prompts.keep_alive() is None
+        assert prompts.keep_alive("s1") == "10m"
+        assert prompts.with_keep_alive({}) == {"keep_alive": "10m"}
+
+        now[0] += 601
+        assert prompts.with_keep_alive({}) == {}
+        assert prompts.active_sessions() == 0
+
+    @pytest.mark.parametrize(
+        "value, seconds", [("30m", 1800), ("2h", 7200), ("45s", 45), ("300", 300)]
+    )
+    def test_keep_alive_durations(self, value, seconds):
+        assert duration_seconds(value) == seconds
+
+    def test_metrics_split_prompt_eval_from_generation(self):
+        prompts = PromptAssembler()
+        prompts.record(
+            "parser",
+            {
+                "prompt_eval_count": 300,
+                "eval_count": 100,
+                "prompt_eval_duration": 3_000_000_000,
+                "eval_duration": 1_000_000_000,
+            },
+        )
+        prompts.record("parser", {"prompt_eval_count": 100, "eval_count": 100})
+
+        site = prompts.get_stats()["sites"]["parser"]
+
+        assert site["calls"] == 2
+        assert site["prompt_eval_tokens_per_call"] == 200
+        assert site["prompt_token_share"] == pytest.approx(400 / 600)
+        assert site["prompt_time_share"] == pytest.approx(0.75)
+
+
+class TestParserPrompt:
+    """Test that parser prompts share their instructions as a prefix."""
+
+    def test_instructions_lead_and_input_comes_last(self, parser, game_state):
+        first = parser._build_llm_prompt(
+            "buy ale", make_snapshot(game_state, 10, ["gene"])
+        )
+        second = parser._build_llm_prompt(
+            "go upstairs", make_snapshot(game_state, 99, [])
+        )
+
+        instructions = first[: first.index("CURRENT GAME CONTEXT")]
+        assert "RESPONSE FORMAT" in instructions
+        assert second.startswith(instructions)
+        assert first.endswith('PLAYER INPUT TO PARSE: "buy ale"')
+        assert "Player Gold: 99" in second
+        assert "NPCs Present: gene" in first
+
+    def test_request_carries_keep_alive_and_records_tokens(
+        self, parser, game_state, monkeypatch
+    ):
+        transport = FakeTransport(
+            {
+                "response": '{"action": "buy", "target": "ale"}',
+                "prompt_eval_count": 40,
+                "eval_count": 12,
+            }
+        )
+        monkeypatch.setattr(
+            "core.ollama_transport.get_ollama_transport", lambda base_url: transport
+        )
+        parser.use_llm = True
+        game_state.set_session_id("s1")
+
+        command = parser.parse("buy some ale", make_snapshot(game_state, 10, []))
+
+        assert command["action"] == "buy"
+        assert transport.payloads[0]["keep_alive"] == "5m"
+        assert parser.prompts.get_stats()["sites"]["parser"]["eval_tokens"] == 12
+
+
+class TestGameMasterPrompt:
+    """Test that game master turns share the system prompt and history."""
+
+    def test_turns_share_system_prompt_and_history(self, game_state, session_memory):
+        gm = EnhancedLLMGameMaster()
+        gm.add_to_history("s1", LLMChatMessage(role="user", content="hello"))
+
+        first = gm._build_messages("look", game_state, "s1")
+        game_state.player.gold += 25
+        second = gm._build_messages("buy ale", game_state, "s1")
+
+        assert first[:2] == second[:2]
+        assert first[0]["content"] is gm.system_prompt
+        assert first[1] == {"role": "user", "content": "hello"}
+        assert second[-2]["content"].startswith("GAME STATE:")
+        assert second[-1] == {"role": "user", "content": "buy ale"}
@@ -0,0 +1,125 @@
+"""Tests for streamed, background and binary saves in SaveManager."""
+
+import gzip
+import hashlib
+import json
+
+import pytest
+
+from core.persistence import SaveFormat, SaveManager
+from core.persistence.save_format import (
+    get_binary_codec,
+    iter_json_chunks,
+    write_binary_save,
+)
+
+
+@pytest.fixture
+def save_state():
+    return {
+        "player": {
+            "name": "Tester",
+            "gold": 120,
+            "health": 90,
+            "max_health": 100,
+            "level": 3,
+            "inventory": ["ale", "bread"],
+        },
+        "clock": {"hours": 31.5},
+        "npcs": {f"npc_{i}": {"mood": "cheerful", "trust": i} for i in range(50)},
+        "events": [{"message": "A stranger arrives", "type": "ambient"}],
+        "notes": "Ünïcode ☕ survives",
+    }
+
+
+class TestSaveStreaming:
+    """Test the one-pass save pipeline and the formats it writes."""
+
+    def test_json_chunks_match_json_dumps(self, save_state):
+        save_data = {"metadata": {"version": "1.0.0"}, "game_state": save_state}
+
+        encoded = b"".join(iter_json_chunks(save_data))
+
+        assert json.loads(encoded) == save_data
+
+    @pytest.mark.parametrize("format", list(SaveFormat))
+    def test_round_trip_and_checksum_match_file(self, tmp_path, save_state, format):
+        manager = SaveManager(str(tmp_path))
+
+        assert manager.save_game(save_state, "slot", "session", "Tester", format)
+
+        save_path = manager._find_save_file("slot")
+        metadata = manager._load_metadata(
+            save_path.with_suffix(save_path.suffix + ".meta")
+        )
+        assert metadata.checksum == hashlib.sha256(save_path.read_bytes()).hexdigest()
+        assert metadata.size_bytes == save_path.stat().st_size
+        assert manager.load_game("slot") == save_state
+        assert list(tmp_path.glob("*.tmp")) == []
+
+    def test_compressed_save_is_plain_gzipped_json(self, tmp_path, save_state):
+        manager = SaveManager(str(tmp_path))
+        manager.save_game(save_state, "slot", "session", "Tester")
+
+        with gzip.open(tmp_path / "slot.save.json.gz") as f:
+            assert json.load(f)["game_state"] == save_state
+
+    def test_binary_sections_load_without_the_rest(self, tmp_path, save_state):
+        manager = SaveManager(str(tmp_path))
+        manager.save_game(save_state, "slot", "session", "Tester", SaveFormat.BINARY)
+
+        sections = manager.load_sections("slot", ["player", "missing"])
+
+        assert sections == {"player": save_state["player"]}
+
+    def test_list_saves_reads_binary_header_without_sidecar(self, tmp_path, save_state):
+        manager = SaveManager(str(tmp_path))
+        manager.save_game(save_state, "slot", "session", "Tester", SaveFormat.BINARY)
+        (tmp_path / "slot.save.bin.meta").unlink()
+
+        (save_info,) = manager.list_saves()
+
+        assert save_info["name"] == "slot"
+        assert save_info["metadata"]["player_name"] == "Tester"
+
+    def test_newest_format_of_a_save_wins(self, tmp_path, save_state):
+        manager = SaveManager(str(tmp_path))
+        manager.save_game(save_state, "slot", "session", "Tester")
+        newer_state = dict(save_state, notes="saved later")
+        manager.save_game(newer_state, "slot", "session", "Tester", SaveFormat.BINARY)
+
+        assert manager.load_game("slot") == newer_state
+
+    def test_background_save_completes_before_shutdown(self, tmp_path, save_state):
+        manager = SaveManager(str(tmp_path))
+
+        future = manager.save_game_async(save_state, "slot", "session", "Tester")
+        manager.shutdown()
+
+        assert future.result() is True
+        assert manager.load_game("slot") == save_state
+
+    def test_failed_write_keeps_previous_save(self, tmp_path, save_state):
+        manager = SaveManager(str(tmp_path))
+        manager.save_game(save_state, "slot", "session", "Tester")
+
+        unencodable = dict(save_state, broken=object())
+        assert not manager.save_game(unencodable, "slot", "session", "Tester")
+
+        assert manager.load_game("slot") == save_state
+        assert list(tmp_path.glob("*.tmp")) == []
+
+    def test_json_codec_is_always_available(self, save_state):
+        name, encode, decode = get_binary_codec("json")
+
+        assert decode(encode(save_state)) == save_state
+
+    def test_binary_header_records_codec(self, tmp_path, save_state):
+        path = tmp_path / "raw.bin"
+        with open(path, "wb") as f:
+            codec = write_binary_save(
+                f, {"metadata": {"version": "1.0.0"}, "game_state": save_state}
+            )
+
+        assert codec in ("msgpack", "json")
+        assert codec.encode() in path.read_bytes()[:200]
@@ -0,0 +1,82 @@
+"""Tests for per-session serialized execution."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from core.session_executor import SessionExecutor
+
+
+class TestSessionExecutor:
+    """Test ordering and parallelism guarantees."""
+
+    @pytest.mark.asyncio
+    async def test_same_session_runs_serially_in_order(self):
+        executor = SessionExecutor(max_workers=4)
+        order = []
+        active = []
+        overlap = []
+
+        def work(i):
+            active.append(i)
+            overlap.append(len(active))
+            time.sleep(0.02)
+            order.append(i)
+            active.remove(i)
+            return i
+
+        results = await asyncio.gather(*[executor.run("s1", work, i) for i in range(5)])
+        executor.shutdown()
+
+        assert results == [0, 1, 2, 3, 4]
+        assert order == [0, 1, 2, 3, 4]
+        assert max(overlap) == 1
+        assert not executor.is_busy("s1")
+
+    @pytest.mark.asyncio
+    async def test_different_sessions_run_in_parallel(self):
+        executor = SessionExecutor(max_workers=4)
+        barrier = threading.Barrier(2, timeout=1.0)
+
+        def work():
+            # Both calls must be running at the same time to pass the barrier
+            barrier.wait()
+            return threading.current_thread().name
+
+        names = await asyncio.gather(executor.run("a", work), executor.run("b", work))
+        executor.shutdown()
+
+        assert len(set(names)) == 2
+
+    @pytest.mark.asyncio
+    async def test_runs_off_the_event_loop(self):
+        executor = SessionExecutor(max_workers=1)
+        loop_thread = threading.current_thread()
+
+        thread = await executor.run("s1", threading.current_thread)
+        executor.shutdown()
+
+        assert thread is not loop_thread
+
+    @pytest.mark.asyncio
+    async def test_turn_holds_the_session_across_awaits(self):
+        executor = SessionExecutor(max_workers=2)
+        order = []
+
+        async def turn():
+            async with executor.turn("s1"):
+                order.append("narrate")
+                await asyncio.sleep(0.02)
+                await executor.call(order.append, "mechanics")
+
+        async def next_request():
+            await asyncio.sleep(0.005)
+            await executor.run("s1", order.append, "next")
+
+        await asyncio.gather(turn(), next_request())
+        executor.shutdown()
+
+        assert order == ["narrate", "mechanics", "next"]
+        assert not executor.is_busy("s1")
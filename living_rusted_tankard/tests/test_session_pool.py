@@ -0,0 +1,92 @@
+"""Tests for the pre-warmed GameState pool."""
+
+import threading
+import time
+
+import pytest
+
+from core.game_state import GameState
+from core.session_pool import GameStatePool
+from core.time_source import SimulatedTime, use_time_source
+from tests.fixtures.fake_fixtures import FakeGameState
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        time.sleep(0.005)
+
+
+@pytest.fixture
+def pool():
+    built = []
+    lock = threading.Lock()
+
+    def factory():
+        with lock:
+            built.append(FakeGameState(serial=len(built)))
+            return built[-1]
+
+    pool = GameStatePool(size=3, factory=factory)
+    pool.built = built
+    yield pool
+    pool.shutdown()
+
+
+class TestGameStatePool:
+    """Test pre-building, hand-out and refill."""
+
+    def test_cold_pool_builds_inline_then_refills(self, pool):
+        game_state = pool.acquire("s1")
+
+        assert game_state.session_id == "s1"
+        assert game_state.clock.last_tick > 0
+        wait_for(lambda: pool.get_stats()["ready"] == 3)
+        assert pool.get_stats()["misses"] == 1
+
+    def test_warm_pool_hands_out_prebuilt_states(self, pool):
+        pool.start()
+        wait_for(lambda: pool.get_stats()["ready"] == 3)
+
+        first = pool.acquire("a")
+        second = pool.acquire("b")
+
+        assert (first.serial, second.serial) == (0, 1)
+        stats = pool.get_stats()
+        assert stats["hits"] == 2 and stats["hit_rate"] == 1.0
+        assert stats["acquire_latency"]["count"] == 2
+        assert stats["build_latency"]["count"] >= 3
+
+    def test_sessions_never_share_a_state(self, pool):
+        pool.start()
+        states = [pool.acquire(str(i)) for i in range(10)]
+
+        assert len({id(state) for state in states}) == 10
+
+    def test_acquire_reads_the_current_time_source(self, pool):
+        with use_time_source(SimulatedTime(start=1000.0)) as clock:
+            clock.advance(5)
+            game_state = pool.acquire("s1")
+
+        assert game_state.clock.last_tick == clock.monotonic()
+
+    def test_shutdown_stops_refilling(self, pool):
+        pool.shutdown()
+        pool.acquire("late")
+        time.sleep(0.05)
+
+        assert pool.get_stats()["ready"] == 0
+
+    def test_real_game_state(self):
+        pool = GameStatePool(size=1)
+        try:
+            game_state = pool.acquire("real-session")
+        finally:
+            pool.shutdown()
+
+        assert isinstance(game_state, GameState)
+        assert game_state.session_id == "real-session"
+        # Keep-alive and session tracking follow the session, not the pool
+        assert game_state.llm_parser.session_id == "real-session"
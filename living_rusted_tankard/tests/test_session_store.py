@@ -0,0 +1,213 @@
+"""Tests for the bounded, spilling session store."""
+
+import gc
+import threading
+import weakref
+
+import pytest
+
+from core.game_state import GameState
+from core.session_store import SessionStore, TimerWheel
+from tests.fixtures.fake_fixtures import FakeGameState
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def store(clock):
+    store = SessionStore(
+        max_live=2,
+        ttl_seconds=600,
+        deserialize=FakeGameState.from_persistence_data,
+        slot_seconds=60,
+        clock=clock,
+    )
+    yield store
+    store.close()
+
+
+class TestSessionStore:
+    """Test LRU spilling, rehydration and timer-wheel expiry."""
+
+    def test_least_recently_used_session_spills(self, store):
+        for session_id, gold in (("a", 1), ("b", 2)):
+            store.put(session_id, FakeGameState(gold=gold))
+        store.get("a")
+        store.put("c", FakeGameState(gold=3))
+        store.flush()
+
+        stats = store.get_stats()
+        assert (stats["live"], stats["spilled"], stats["spills"]) == (2, 1, 1)
+        assert "b" in store and len(store) == 3
+        listed = {s["session_id"]: s["game_state"] for s in store.list_sessions()}
+        assert listed["b"] is None
+
+    def test_spilled_session_rehydrates_on_lookup(self, store):
+        store.put("a", FakeGameState(gold=7))
+        store.put("b", FakeGameState(gold=0))
+        store.put("c", FakeGameState(gold=0))
+        store.flush()
+
+        # Nothing holds the spilled object, so it comes back from SQLite
+        restored = store.get("a")
+
+        assert restored.gold == 7
+        assert store.get_stats()["rehydrations"] == 1
+        assert store.get_stats()["live"] == 2
+
+    def test_request_holding_a_spilled_state_keeps_its_changes(self, store):
+        held = FakeGameState(gold=5)
+        store.put("a", held)
+        store.put("b", FakeGameState(gold=0))
+        store.put("c", FakeGameState(gold=0))  # spills "a" mid-request
+
+        held.gold = 50
+        assert store.get("a") is held
+        store.put("d", FakeGameState(gold=0))
+        store.touch("a", held)
+
+        assert store.get("a").gold == 50
+
+    def test_busy_sessions_are_not_spilled(self, clock):
+        store = SessionStore(max_live=1, is_busy=lambda sid: sid == "a", clock=clock)
+        store.put("a", FakeGameState())
+        store.put("b", FakeGameState())
+
+        assert store.get_stats()["spilled"] == 0
+        store.close()
+
+    def test_unserializable_session_stays_in_memory(self, clock):
+        def fail(game_state):
+            raise TypeError("not serializable")
+
+        store = SessionStore(max_live=1, serialize=fail, clock=clock)
+        store.put("a", FakeGameState())
+        store.put("b", FakeGameState())
+        store.flush()
+
+        stats = store.get_stats()
+        assert (stats["live"], stats["spill_errors"]) == (2, 1)
+
+        # Not retried on every lookup, only once the session is used again
+        store.get("b")
+        store.get("b")
+        store.flush()
+        assert store.get_stats()["spill_errors"] == 1
+        clock.now += 1
+        store.touch("a")
+        store.get("b")
+        store.flush()
+        assert store.get_stats()["spill_errors"] == 2
+        store.close()
+
+    def test_real_game_state_spills_and_rehydrates(self, clock):
+        store = SessionStore(max_live=1, clock=clock)
+        game_state = GameState(session_id="a")
+        game_state.player.gold = 77
+        game_state.player.inventory.add_item("ale", 2)
+        store.put("a", game_state)
+        store.put("b", GameState(session_id="b"))
+        store.flush()
+
+        stats = store.get_stats()
+        assert (stats["spilled"], stats["spill_errors"]) == (1, 0)
+
+        held = weakref.ref(game_state)
+        del game_state
+        gc.collect()  # GameState holds reference cycles
+        assert held() is None  # So it has to come back from SQLite
+        restored = store.get("a")
+
+        assert store.get_stats()["rehydrations"] == 1
+        assert restored.session_id == "a"
+        assert restored.player.gold == 77
+        assert restored.player.inventory.get_item_quantity("ale") >= 2
+        assert restored.process_command("look")["success"]
+        store.close()
+
+    def test_spills_are_written_off_the_calling_thread(self, clock):
+        release = threading.Event()
+        writers = []
+
+        def serialize(game_state):
+            writers.append(threading.current_thread())
+            release.wait(5)
+            return game_state.to_persistence_model()
+
+        store = SessionStore(
+            max_live=1,
+            serialize=serialize,
+            deserialize=FakeGameState.from_persistence_data,
+            clock=clock,
+        )
+        store.put("a", FakeGameState(gold=4))
+        store.put("b", FakeGameState())  # returns while "a" is still being written
+
+        assert store.get_stats()["unwritten"] == 1
+        release.set()
+        store.flush()
+        assert writers and threading.current_thread() not in writers
+        stats = store.get_stats()
+        assert (stats["spills"], stats["unwritten"]) == (1, 0)
+        assert store.get("a").gold == 4
+        store.close()
+
+    def test_unwritten_spill_rehydrates_the_same_object(self, clock):
+        release = threading.Event()
+
+        def serialize(game_state):
+            release.wait(5)
+            return game_state.to_persistence_model()
+
+        store = SessionStore(max_live=1, serialize=serialize, clock=clock)
+        store.put("a", FakeGameState(gold=9))
+        store.put("b", FakeGameState())
+        held = weakref.ref(store._unwritten["a"][1])
+
+        # Until its row is written the store keeps the object alive
+        restored = store.get("a")
+        release.set()
+        store.flush()
+
+        assert restored is held()
+        assert restored.gold == 9
+        store.close()
+
+    def test_idle_sessions_expire_live_or_spilled(self, store, clock):
+        for session_id in ("a", "b", "c"):
+            store.put(session_id, FakeGameState())
+        clock.now += 500
+        store.touch("c")
+        clock.now += 200
+
+        assert store.expire() == 2
+        assert "c" in store and "a" not in store and "b" not in store
+        clock.now += 700
+        assert store.expire() == 1
+        assert len(store) == 0
+
+
+class TestTimerWheel:
+    """Test slot bookkeeping."""
+
+    def test_keys_come_due_once_their_slot_has_passed(self):
+        wheel = TimerWheel(slot_seconds=10, now=0)
+        wheel.schedule("early", 15)
+        wheel.schedule("late", 1_000_000)
+
+        assert wheel.pop_due(19) == []
+        assert wheel.pop_due(20) == ["early"]
+        assert wheel.pop_due(20) == []
+        # A long idle gap only visits occupied slots
+        assert wheel.pop_due(2_000_000) == ["late"]
@@ -0,0 +1,117 @@
+"""Tests for the injectable time source and the headless simulation driver."""
+
+import random
+import time
+
+import pytest
+
+from core import time_source
+from core.simulation import HeadlessSimulation
+from core.time_source import SimulatedTime, use_time_source
+
+START = 1_700_000_000.0
+
+
+def world_fingerprint(seed):
+    sim = HeadlessSimulation(seed=seed, start=START)
+    sim.run(hours=48)
+    game_state = sim.game_state
+    return (
+        [event.message for event in game_state.events],
+        game_state.player.gold,
+        game_state.travelling_merchant_active,
+    )
+
+
+class TestTimeSource:
+    """Test swapping the clock subsystems read."""
+
+    def test_simulated_time_only_moves_when_advanced(self):
+        clock = SimulatedTime(start=START)
+        clock.advance(3600)
+
+        assert clock.time() == START + 3600
+        assert clock.monotonic() == 3600
+        assert clock.now().timestamp() == START + 3600
+        with pytest.raises(ValueError):
+            clock.advance(-1)
+
+    def test_use_time_source_restores_the_wall_clock(self):
+        with use_time_source(SimulatedTime(start=START)):
+            assert time_source.time() == START
+        assert abs(time_source.time() - time.time()) < 5
+
+
+class TestHeadlessSimulation:
+    """Test fixed-step runs, reproducibility and the per-subsystem report."""
+
+    def test_run_advances_game_time_in_fixed_steps(self):
+        sim = HeadlessSimulation(seed=1, step_hours=0.5, start=START)
+        hours_before = sim.game_state.clock.current_time_hours
+
+        report = sim.run(hours=24)
+
+        assert report.steps == 48
+        assert report.simulated_hours == 24
+        assert sim.game_state.clock.current_time_hours == hours_before + 24
+        assert sim.time.time() == START + 24 * 3600
+
+    def test_clock_is_live_again_after_a_run(self):
+        sim = HeadlessSimulation(seed=1, start=START)
+        sim.run(hours=2)
+        hours_after_run = sim.game_state.clock.current_time_hours
+
+        sim.game_state.clock.update()
+
+        assert not sim.game_state.clock.paused
+        assert sim.game_state.clock.current_time_hours - hours_after_run < 0.01
+
+    def test_same_seed_reproduces_the_world(self):
+        assert world_fingerprint(5) == world_fingerprint(5)
+
+    def test_process_random_generator_is_left_alone(self):
+        random.seed(99)
+        expected = [random.random() for _ in range(3)]
+        random.seed(99)
+
+        sim = HeadlessSimulation(seed=6, start=START)
+        sim.run(hours=12)
+
+        assert [random.random() for _ in range(3)] == expected
+        assert random.random is not sim.random.random
+
+    def test_wall_clock_subsystems_follow_simulated_time(self):
+        sim = HeadlessSimulation(seed=2, start=START)
+        with use_time_source(sim.time):
+            rumor = sim.game_state.gossip_network.create_rumor_from_event(
+                "argument", ["gene", "jenkins"], "serena", "arguing over ale"
+            )
+        assert rumor.created.timestamp() == START
+
+        sim.run(hours=24 * 8)
+
+        with use_time_source(sim.time):
+            assert not rumor.is_fresh()
+
+    def test_report_times_each_subsystem(self):
+        sim = HeadlessSimulation(seed=3, start=START)
+        steps = []
+
+        report = sim.run(hours=6, on_step=steps.append)
+
+        assert len(steps) == report.steps
+        assert {"clock", "npcs", "gossip", "story", "on_step"} <= set(
+            report.subsystem_seconds
+        )
+        assert sum(report.subsystem_seconds.values()) <= report.wall_seconds
+        assert report.to_dict()["hours_per_second"] == report.hours_per_second
+
+    def test_benchmark_simulated_week(self):
+        """A week of game time with every subsystem awake."""
+        sim = HeadlessSimulation(seed=4, start=START)
+
+        report = sim.run(hours=24 * 7)
+
+        # Coupled to real time a week took a week; headless it took about
+        # 0.1s here (about 1,500 game hours per second)
+        assert report.hours_per_second > 50
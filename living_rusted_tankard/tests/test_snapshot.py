@@ -1,8 +1,9 @@
 import unittest
 from unittest.mock import MagicMock, patch, PropertyMock
-from core.snapshot import SnapshotManager, GameSnapshot
+from core.snapshot import SnapshotManager, GameSnapshot, SectionVersions
 from core.game_state import GameState
 from core.npc import NPC
+from core.items import ITEM_DEFINITIONS, TAVERN_ITEMS, Inventory
 from typing import List, Dict, Any
 
 
@@ -104,5 +105,115 @@ class TestSnapshotManager(unittest.TestCase):
             # So we'll just check for the required fields
 
 
+class TestIncrementalSnapshots(unittest.TestCase):
+    def setUp(self):
+        self.game_state = MagicMock()
+        self.game_state.clock.get_time.return_value = 12.5
+        self.game_state.player.gold = 100
+        self.game_state.player.has_room = False
+        self.game_state.player.tiredness = 0
+        self.game_state.player.inventory = []
+        self.game_state.bulletin_board.get_visible_notes.return_value = []
+        self.snapshot_manager = SnapshotManager(self.game_state)
+        self.snapshot_manager._get_present_npcs = lambda: []
+
+    def test_unchanged_sections_are_not_rebuilt(self):
+        """Test that an idle snapshot reuses every cached section."""
+        with patch.object(
+            self.snapshot_manager, "_format_time", return_value="Noon"
+        ) as format_time:
+            first = self.snapshot_manager.create_snapshot()
+            second = self.snapshot_manager.create_snapshot()
+
+        self.assertEqual(first, second)
+        self.assertIs(first["player"], second["player"])
+        self.assertEqual(format_time.call_count, 1)
+
+    def test_patch_contains_only_changed_sections(self):
+        """Test that a patch replaces just the sections that changed."""
+        version = self.snapshot_manager.snapshot_since()["version"]
+        self.game_state.player.gold = 90
+
+        state = self.snapshot_manager.snapshot_since(version)
+
+        self.assertNotIn("snapshot", state)
+        versions = self.snapshot_manager.versions
+        self.assertGreater(
+            versions.resolve(state["version"]), versions.resolve(version)
+        )
+        self.assertEqual([op["path"] for op in state["patch"]], ["/player"])
+        self.assertEqual(state["patch"][0]["value"]["gold"], 90)
+        self.assertEqual(
+            self.snapshot_manager.snapshot_since(state["version"])["patch"], []
+        )
+
+    def test_unknown_version_gets_full_snapshot(self):
+        """Test fallback to a full snapshot for versions no longer held."""
+        self.snapshot_manager.create_snapshot()
+        epoch = self.snapshot_manager.versions.epoch
+        state = self.snapshot_manager.snapshot_since(f"{epoch}-12345")
+
+        self.assertEqual(state["snapshot"]["player"]["gold"], 100)
+
+    def test_version_from_another_game_state_gets_full_snapshot(self):
+        """Test that a token from a fresh or reset state is never diffed."""
+        version = self.snapshot_manager.snapshot_since()["version"]
+        replacement = SnapshotManager(self.game_state)
+        replacement._get_present_npcs = lambda: []
+
+        state = replacement.snapshot_since(version)
+
+        self.assertIn("snapshot", state)
+        self.assertNotEqual(state["version"], version)
+
+    def test_inventory_change_is_seen_through_its_revision(self):
+        """Test that the player section follows the inventory revision."""
+        self.game_state.player.inventory = Inventory()
+        version = self.snapshot_manager.snapshot_since()["version"]
+        self.assertEqual(
+            self.snapshot_manager.snapshot_since(version)["patch"], []
+        )
+
+        with patch.dict(ITEM_DEFINITIONS, TAVERN_ITEMS):
+            self.game_state.player.inventory.add_item("ale")
+        state = self.snapshot_manager.snapshot_since(version)
+
+        self.assertEqual([op["path"] for op in state["patch"]], ["/player"])
+        self.assertEqual(state["patch"][0]["value"]["inventory"][0]["quantity"], 1)
+
+    def test_npc_presence_is_seen_through_its_revision(self):
+        """Test that the NPC section follows the presence index revision."""
+        game_state = GameState()
+        manager = SnapshotManager(game_state)
+        version = manager.snapshot_since()["version"]
+        npc = next(iter(game_state.npc_manager.npcs.values()))
+
+        npc.is_present = not npc.is_present
+        state = manager.snapshot_since(version)
+
+        self.assertEqual([op["path"] for op in state["patch"]], ["/present_npcs"])
+        present = {entry["id"] for entry in state["patch"][0]["value"]}
+        self.assertEqual(npc.id in present, npc.is_present)
+
+    def test_explicit_bump_rebuilds_section(self):
+        """Test that a bumped section is rebuilt even with the same signature."""
+        version = self.snapshot_manager.snapshot_since()["version"]
+        self.snapshot_manager.versions.bump("npc_manager", "economy")
+
+        state = self.snapshot_manager.snapshot_since(version)
+
+        self.assertEqual([op["path"] for op in state["patch"]], ["/present_npcs"])
+
+    def test_history_is_bounded(self):
+        """Test that old versions are forgotten."""
+        versions = SectionVersions(history_size=2)
+        for _ in range(3):
+            versions.bump("player")
+            versions.checkpoint()
+
+        self.assertIsNone(versions.changed_since(1))
+        self.assertEqual(versions.changed_since(2), ["player"])
+
+
 if __name__ == "__main__":
     unittest.main()
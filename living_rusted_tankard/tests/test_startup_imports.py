@@ -0,0 +1,72 @@
+"""Startup import budget for the modules the CLI and API workers load first."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).parent.parent
+
+# Cumulative `python -X importtime` time for core.game_state, best of a few
+# cold interpreters. Measured around 180ms; the budget leaves room for slow CI.
+GAME_STATE_IMPORT_BUDGET_MS = 400
+
+# Modules that only load once a session actually needs them
+DEFERRED_MODULES = (
+    "sqlmodel",
+    "requests",
+    "httpx",
+    "games.gambling_manager",
+    "game.commands.bounty_commands",
+    "core.world.atmosphere",
+    "core.npc_systems.psychology",
+    "core.narrative",
+)
+
+
+def import_profile(module):
+    """Map each module imported by ``import module`` to its cumulative ms."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [str(PROJECT_DIR), env.get("PYTHONPATH")])
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    profile = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        try:
+            profile[name.strip()] = int(cumulative) / 1000
+        except ValueError:
+            continue  # the header line
+    return profile
+
+
+class TestStartupImports:
+    """Test what importing the game costs before any session exists."""
+
+    def test_game_state_import_defers_optional_systems(self):
+        profile = import_profile("core.game_state")
+
+        assert "core.game_state" in profile
+        assert [name for name in DEFERRED_MODULES if name in profile] == []
+
+    def test_game_state_import_within_budget(self):
+        best_ms = min(
+            import_profile("core.game_state")["core.game_state"] for _ in range(3)
+        )
+
+        assert best_ms < GAME_STATE_IMPORT_BUDGET_MS
+
+    def test_core_submodule_does_not_import_game_state(self):
+        profile = import_profile("core.clock")
+
+        assert "core.game_state" not in profile
@@ -0,0 +1,109 @@
+"""Tests for the shared static data registry."""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from core.bounties import BountyManager
+from core.items import Item, ItemType
+from core.news_manager import NewsManager
+from core.npc import NPCManager
+from core.static_data import StaticDataRegistry, get_static_data
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+
+def parse_names(data):
+    return tuple(data["names"])
+
+
+def write_names(path, names, mtime_ns=None):
+    path.write_text(json.dumps({"names": names}))
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+class TestStaticDataRegistry:
+    """Test parse-once sharing, reloads and timings."""
+
+    def test_parses_once_and_shares(self, tmp_path):
+        path = tmp_path / "names.json"
+        write_names(path, ["gene"])
+        registry = StaticDataRegistry()
+
+        first = registry.load(path, parse_names)
+        write_names(path, ["serena"])
+
+        assert registry.load(str(path), parse_names) is first
+        assert registry.get_timings()["names.json"]["loads"] == 1
+
+    def test_watch_reloads_changed_files(self, tmp_path):
+        path = tmp_path / "names.json"
+        write_names(path, ["gene"], mtime_ns=1_000_000_000)
+        registry = StaticDataRegistry(watch=True)
+
+        assert registry.load(path, parse_names) == ("gene",)
+        write_names(path, ["serena"], mtime_ns=2_000_000_000)
+
+        assert registry.load(path, parse_names) == ("serena",)
+        timing = registry.get_timings()["names.json"]
+        assert timing["loads"] == 2 and timing["last_ms"] >= 0
+
+    def test_failed_parse_is_not_cached(self, tmp_path):
+        path = tmp_path / "names.json"
+        path.write_text("{not json")
+        registry = StaticDataRegistry()
+
+        with pytest.raises(json.JSONDecodeError):
+            registry.load(path, parse_names)
+        write_names(path, ["gene"])
+        assert registry.load(path, parse_names) == ("gene",)
+
+
+class TestSharedDefinitions:
+    """Test that sessions share definitions without sharing changes."""
+
+    def test_npc_managers_share_definitions(self):
+        first = NPCManager(data_dir=DATA_DIR)
+        second = NPCManager(data_dir=DATA_DIR)
+
+        assert first._npc_definitions is second._npc_definitions
+        # Interactions with reputation requirements build for every session
+        assert second.get_npc("gene_bartender").interactions
+        assert set(first.npcs) == set(second.npcs)
+
+    def test_posting_a_bounty_stays_in_its_session(self):
+        first = BountyManager(data_dir=DATA_DIR)
+        second = BountyManager(data_dir=DATA_DIR)
+        bounty_id = next(iter(first._bounty_definitions))
+        was_posted = second.get_bounty(bounty_id).is_posted
+
+        assert first.post_bounty(bounty_id)
+
+        assert first.get_bounty(bounty_id).is_posted
+        assert second.get_bounty(bounty_id).is_posted == was_posted
+        assert "bounties.json" in get_static_data().get_timings()
+
+    def test_changing_a_bounty_from_get_bounty_stays_in_its_session(self):
+        first = BountyManager(data_dir=DATA_DIR)
+        second = BountyManager(data_dir=DATA_DIR)
+        bounty_id = next(iter(first._bounty_definitions))
+
+        first.get_bounty(bounty_id).title = "Changed"
+
+        assert second.get_bounty(bounty_id).title != "Changed"
+
+    def test_shared_definitions_are_read_only(self):
+        npc_definition = next(iter(NPCManager(data_dir=DATA_DIR)._npc_definitions.values()))
+        news_item = NewsManager(data_dir=DATA_DIR).news_items[0]
+        item = Item(id="ale", name="Ale", description="", item_type=ItemType.DRINK)
+
+        with pytest.raises(TypeError):
+            npc_definition["name"] = "Changed"
+        assert isinstance(npc_definition.get("schedule", ()), tuple)
+        with pytest.raises(TypeError):
+            news_item.text = "Changed"
+        with pytest.raises(TypeError):
+            item.base_price = 1
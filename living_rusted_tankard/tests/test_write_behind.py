@@ -0,0 +1,180 @@
+"""Tests for write-behind persistence of game states."""
+
+import time
+
+import pytest
+from sqlmodel import Session, create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from core.db.session import configure_sqlite, engine_options
+from core.game_state import GameState
+from core.models.persistence_models import GameStatePersistence
+from core.services.write_behind import WriteBehindPersister
+from tests.fixtures.fake_fixtures import FakeGameState
+
+
+class CountingSessions:
+    """Session factory that counts the transactions it opens."""
+
+    def __init__(self, engine):
+        self._factory = sessionmaker(bind=engine, class_=Session)
+        self.opened = 0
+        self.fail = False
+
+    def __call__(self):
+        self.opened += 1
+        if self.fail:
+            raise RuntimeError("database is unavailable")
+        return self._factory()
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", **engine_options("sqlite://"))
+    GameStatePersistence.__table__.create(engine)
+    return engine
+
+
+def saved_turns(engine):
+    with Session(engine) as session:
+        rows = session.exec(select(GameStatePersistence)).all()
+        return {row.session_id: row.game_data["turn"] for row in rows}
+
+
+class TestWriteBehindPersister:
+    """Test coalescing, batching and the shutdown flush."""
+
+    def test_repeated_saves_coalesce_into_one_row_write(self, engine):
+        sessions = CountingSessions(engine)
+        persister = WriteBehindPersister(sessions, flush_interval=60)
+        game_state = FakeGameState("s1")
+
+        for _ in range(5):
+            game_state.play()
+            persister.enqueue(game_state)
+
+        assert persister.flush() == 1
+        assert sessions.opened == 1
+        assert saved_turns(engine) == {"s1": 5}
+        assert persister.get_stats()["coalesced"] == 4
+        assert game_state.db_id is not None
+        persister.shutdown()
+
+    def test_clean_state_is_not_queued(self, engine):
+        persister = WriteBehindPersister(CountingSessions(engine), flush_interval=60)
+        game_state = FakeGameState("s1")
+        game_state.mark_clean()
+
+        assert not persister.enqueue(game_state)
+        assert persister.pending_count() == 0
+
+    def test_many_sessions_share_one_transaction_and_update_in_place(self, engine):
+        sessions = CountingSessions(engine)
+        persister = WriteBehindPersister(sessions, flush_interval=60)
+        states = [FakeGameState(f"s{i}") for i in range(20)]
+
+        for game_state in states:
+            persister.enqueue(game_state)
+        persister.flush()
+        for game_state in states:
+            game_state.play()
+            persister.enqueue(game_state)
+        persister.flush()
+
+        assert sessions.opened == 2
+        assert saved_turns(engine) == {f"s{i}": 1 for i in range(20)}
+        persister.shutdown()
+
+    def test_real_game_state_is_written_and_restores(self, engine):
+        persister = WriteBehindPersister(CountingSessions(engine), flush_interval=60)
+        game_state = GameState(session_id="real")
+        game_state.player.gold = 77
+        game_state.mark_dirty()
+
+        assert persister.enqueue(game_state)
+        assert persister.flush() == 1
+        assert game_state.db_id is not None
+
+        with Session(engine) as session:
+            row = session.exec(select(GameStatePersistence)).one()
+            data = {"id": row.id, "session_id": row.session_id, "game_data": row.game_data}
+        restored = GameState.from_persistence_data(data)
+        assert restored.session_id == "real"
+        assert restored.player.gold == 77
+        persister.shutdown()
+
+    def test_batch_size_wakes_the_flush_thread(self, engine):
+        persister = WriteBehindPersister(
+            CountingSessions(engine), flush_interval=60, batch_size=3
+        )
+
+        for i in range(3):
+            persister.enqueue(FakeGameState(f"s{i}"))
+        deadline = time.time() + 5
+        while persister.get_stats()["batches"] == 0 and time.time() < deadline:
+            time.sleep(0.01)
+
+        assert persister.get_stats()["rows_written"] == 3
+        assert len(saved_turns(engine)) == 3
+        persister.shutdown()
+
+    def test_failed_batch_is_retried_without_clobbering_newer_snapshots(self, engine):
+        sessions = CountingSessions(engine)
+        persister = WriteBehindPersister(sessions, flush_interval=60)
+        game_state = FakeGameState("s1")
+        persister.enqueue(game_state)
+
+        sessions.fail = True
+        assert persister.flush() == 0
+        assert persister.pending_count() == 1
+
+        game_state.play()
+        persister.enqueue(game_state)
+        sessions.fail = False
+        persister.flush()
+
+        assert saved_turns(engine) == {"s1": 1}
+        assert persister.get_stats()["failed_batches"] == 1
+        persister.shutdown()
+
+    def test_bad_record_is_dropped_without_blocking_other_sessions(self, engine):
+        persister = WriteBehindPersister(
+            CountingSessions(engine), flush_interval=60, max_attempts=2
+        )
+        bad = FakeGameState("bad")
+        bad.broken = True
+        persister.enqueue(bad)
+        persister.enqueue(FakeGameState("good"))
+
+        assert persister.flush() == 1
+        assert saved_turns(engine) == {"good": 0}
+        assert persister.pending_count() == 1
+
+        assert persister.flush() == 0
+        assert persister.pending_count() == 0
+        assert persister.get_stats()["dropped_records"] == 1
+        assert bad.needs_save()
+        persister.shutdown()
+
+    def test_shutdown_flushes_pending_saves(self, engine):
+        persister = WriteBehindPersister(CountingSessions(engine), flush_interval=60)
+        persister.enqueue(FakeGameState("s1"))
+
+        assert persister.shutdown() == 1
+        assert saved_turns(engine) == {"s1": 0}
+        assert not persister.get_stats()["running"]
+
+
+class TestEngineOptions:
+    """Test the connection settings used for the game database."""
+
+    def test_file_sqlite_uses_wal_and_a_connection_pool(self, tmp_path):
+        url = f"sqlite:///{tmp_path / 'taverna.db'}"
+        engine = create_engine(url, **engine_options(url))
+        configure_sqlite(engine)
+
+        with engine.connect() as connection:
+            mode = connection.exec_driver_sql("PRAGMA journal_mode").scalar()
+
+        assert mode == "wal"
+        assert engine.pool.size() == engine_options(url)["pool_size"]
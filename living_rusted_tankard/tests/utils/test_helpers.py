@@ -1,6 +1,7 @@
 """General test helper utilities."""
 import asyncio
 import json
+import time
 import tempfile
 import os
 from typing import Any, Dict, List, Optional, Callable
@@ -124,7 +125,7 @@ class EventCollector:
             {
                 "type": event_type,
                 "data": event_data,
-                "timestamp": asyncio.get_event_loop().time(),
+                "timestamp": time.monotonic(),
             }
         )
 